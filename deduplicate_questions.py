@@ -2,78 +2,125 @@
 """
 Script to remove duplicate questions from CSV files.
 Deduplicates based on question text + correct answer combination.
+
+New scrapes are deduplicated at ingest (see src/utils/dedup.py); this script
+cleans legacy files with the same signature. Files are streamed in chunks
+with vectorized normalization, so large files never need to fit in memory.
+
+With --near-duplicates the files are left untouched; questions are instead
+clustered by MinHash/LSH similarity (see src/utils/near_dedup.py) and the
+clusters are written to a report for review.
 """
 
-import pandas as pd
+import argparse
 import os
+import re
+import sys
 from pathlib import Path
-import hashlib
 
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+from utils.dedup import signature_series
+from utils.near_dedup import NearDuplicateIndex
+
+CSV_FILES = [
+    "multiple_choice.csv",
+    "true_false.csv",
+    "sound.csv"
+]
 
-def create_question_signature(row):
-    """Create a unique signature for a question based on text and correct answer."""
-    question = str(row.get('Question', '')).strip().lower()
-    answer = str(row.get('CorrectAnswer', '')).strip().lower()
-    
-    # Create a hash of question + answer for deduplication
-    signature = f"{question}|{answer}"
-    return hashlib.md5(signature.encode()).hexdigest()
+# Meta information removed from descriptions
+DESCRIPTION_META_PATTERNS = [
+    re.compile(r'Question by player \w+\.?', re.IGNORECASE),
+    re.compile(r'Submitted by \w+\.?', re.IGNORECASE)
+]
 
 
-def deduplicate_csv_file(csv_path: Path):
-    """Remove duplicates from a single CSV file."""
+def clean_descriptions(chunk: pd.DataFrame) -> int:
+    """Clean up meta information from the descriptions of a chunk in place."""
+    if 'Description' not in chunk.columns:
+        return 0
+
+    original = chunk['Description']
+    cleaned = original
+    for pattern in DESCRIPTION_META_PATTERNS:
+        cleaned = cleaned.str.replace(pattern, '', regex=True)
+    # Remove extra whitespace
+    cleaned = cleaned.str.split().str.join(' ').fillna('')
+
+    changed = cleaned != original
+    chunk['Description'] = cleaned
+    return int(changed.sum())
+
+
+def deduplicate_csv_file(csv_path: Path, chunksize: int = 50000):
+    """Remove duplicates from a single CSV file in one streaming pass."""
     if not csv_path.exists():
         print(f"📂 {csv_path.name} does not exist - skipping")
         return
-    
-    # Read CSV
-    df = pd.read_csv(csv_path)
-    original_count = len(df)
-    
+
+    temp_path = csv_path.with_suffix('.dedup.tmp')
+    seen = set()
+    original_count = 0
+    final_count = 0
+    cleaned_count = 0
+    examples = []
+
+    # dtype=str / keep_default_na=False keep values exactly as written,
+    # so signatures match the ones computed at ingest
+    reader = pd.read_csv(csv_path, chunksize=chunksize, dtype=str, keep_default_na=False)
+    with open(temp_path, 'w', newline='', encoding='utf-8') as out:
+        for chunk_number, chunk in enumerate(reader):
+            original_count += len(chunk)
+
+            questions = chunk['Question'] if 'Question' in chunk.columns else pd.Series('', index=chunk.index)
+            answers = chunk['CorrectAnswer'] if 'CorrectAnswer' in chunk.columns else pd.Series('', index=chunk.index)
+            signatures = pd.Series(signature_series(questions, answers), index=chunk.index)
+
+            # Keep the first occurrence across the whole file
+            keep = ~signatures.duplicated(keep='first') & ~signatures.isin(seen)
+            seen.update(signatures[keep])
+
+            if len(examples) < 3 and not keep.all():
+                for question in questions[~keep].head(3 - len(examples)):
+                    examples.append(question)
+
+            kept = chunk[keep].copy()
+            cleaned_count += clean_descriptions(kept)
+            kept.to_csv(out, index=False, header=(chunk_number == 0))
+            final_count += len(kept)
+
     if original_count == 0:
+        temp_path.unlink()
         print(f"📄 {csv_path.name}: Empty file - skipping")
         return
-    
-    print(f"📄 Processing {csv_path.name}: {original_count} questions")
-    
-    # Create signatures for deduplication
-    df['_signature'] = df.apply(create_question_signature, axis=1)
-    
-    # Find duplicates
-    duplicates = df[df.duplicated(subset=['_signature'], keep=False)]
-    
-    if len(duplicates) > 0:
-        print(f"  🔍 Found {len(duplicates)} duplicate entries")
-        
-        # Show some examples
-        unique_duplicates = duplicates['_signature'].unique()[:3]
-        for sig in unique_duplicates:
-            dup_group = duplicates[duplicates['_signature'] == sig]
-            example = dup_group.iloc[0]
-            print(f"    📋 Duplicate: \"{example['Question'][:60]}...\" ({len(dup_group)} copies)")
-    
-    # Remove duplicates (keep first occurrence)
-    df_deduplicated = df.drop_duplicates(subset=['_signature'], keep='first')
-    
-    # Remove the signature column
-    df_deduplicated = df_deduplicated.drop(columns=['_signature'])
-    
-    final_count = len(df_deduplicated)
+
+    print(f"📄 Processed {csv_path.name}: {original_count} questions")
     removed_count = original_count - final_count
-    
+
     if removed_count > 0:
-        # Create backup
+        print(f"  🔍 Found {removed_count} duplicate entries")
+        for question in examples:
+            print(f"    📋 Duplicate: \"{question[:60]}...\"")
+
+        # Keep the original as backup and move the deduplicated version into place
         backup_path = csv_path.with_suffix('.before_dedup.csv')
-        df.drop(columns=['_signature']).to_csv(backup_path, index=False)
+        os.replace(csv_path, backup_path)
+        os.replace(temp_path, csv_path)
         print(f"  💾 Created backup: {backup_path.name}")
-        
-        # Save deduplicated version
-        df_deduplicated.to_csv(csv_path, index=False)
         print(f"  ✅ Removed {removed_count} duplicates")
         print(f"  📊 Final count: {final_count} questions")
+    elif cleaned_count > 0:
+        os.replace(temp_path, csv_path)
+        print(f"  ✅ No duplicates found")
     else:
+        temp_path.unlink()
         print(f"  ✅ No duplicates found")
-    
+
+    if cleaned_count > 0:
+        print(f"  🧹 Cleaned {cleaned_count} descriptions")
+
     return {
         'original_count': original_count,
         'final_count': final_count,
@@ -81,86 +128,88 @@ def deduplicate_csv_file(csv_path: Path):
     }
 
 
-def clean_descriptions(csv_path: Path):
-    """Clean up meta information from descriptions."""
-    if not csv_path.exists():
-        return
-    
-    df = pd.read_csv(csv_path)
-    
-    if 'Description' not in df.columns:
-        return
-    
-    cleaned_count = 0
-    
-    # Clean meta information patterns
-    for idx, desc in enumerate(df['Description']):
-        if pd.isna(desc):
-            continue
-            
-        original_desc = str(desc)
-        cleaned_desc = original_desc
-        
-        # Remove "Question by player X" patterns
-        import re
-        cleaned_desc = re.sub(r'Question by player \w+\.?', '', cleaned_desc, flags=re.IGNORECASE)
-        cleaned_desc = re.sub(r'Submitted by \w+\.?', '', cleaned_desc, flags=re.IGNORECASE)
-        
-        # Remove extra whitespace
-        cleaned_desc = ' '.join(cleaned_desc.split())
-        cleaned_desc = cleaned_desc.strip()
-        
-        if cleaned_desc != original_desc:
-            df.at[idx, 'Description'] = cleaned_desc
-            cleaned_count += 1
-    
-    if cleaned_count > 0:
-        df.to_csv(csv_path, index=False)
-        print(f"  🧹 Cleaned {cleaned_count} descriptions")
-    
-    return cleaned_count
+def cluster_near_duplicates(output_dir: Path, threshold: float = 0.7, chunksize: int = 50000) -> int:
+    """
+    Cluster near-duplicate questions across all CSV files into a report.
+
+    Returns:
+        Number of clusters found
+    """
+    csv_paths = [output_dir / csv_file for csv_file in CSV_FILES if (output_dir / csv_file).exists()]
+    index = NearDuplicateIndex(threshold=threshold)
+    indexed = index.load_csv_files([str(path) for path in csv_paths], chunksize=chunksize)
+    print(f"📄 Indexed {indexed} questions from {len(csv_paths)} files")
+
+    clusters = index.clusters()
+    cluster_of = {key: cluster_id for cluster_id, keys in enumerate(clusters, 1) for key in keys}
+    report_path = output_dir / 'near_duplicate_clusters.csv'
+    report = []
+    # Second pass picks up the question text of clustered keys only
+    for csv_path in csv_paths:
+        for chunk in pd.read_csv(csv_path, chunksize=chunksize, dtype=str, keep_default_na=False):
+            clustered = chunk[chunk['Key'].isin(cluster_of)]
+            if clustered.empty:
+                continue
+            report.append(pd.DataFrame({
+                'ClusterId': clustered['Key'].map(cluster_of),
+                'File': csv_path.name,
+                'Key': clustered['Key'],
+                'Question': clustered.get('Question', ''),
+                'CorrectAnswer': clustered.get('CorrectAnswer', '')
+            }))
+
+    if report:
+        pd.concat(report).sort_values(['ClusterId', 'Key']).to_csv(report_path, index=False)
+        print(f"🔍 Found {len(clusters)} clusters covering {len(cluster_of)} questions")
+        print(f"💾 Report written to {report_path}")
+    else:
+        print("✅ No near duplicates found")
+    return len(clusters)
 
 
 def main():
     """Main deduplication process."""
+    parser = argparse.ArgumentParser(description='Remove duplicate questions from the CSV files')
+    parser.add_argument('--output-dir', default='output', help='Directory containing the CSV files')
+    parser.add_argument('--chunksize', type=int, default=50000, help='Rows processed per chunk')
+    parser.add_argument('--near-duplicates', action='store_true',
+                        help='Report clusters of near-duplicate questions instead of removing exact duplicates')
+    parser.add_argument('--threshold', type=float, default=0.7,
+                        help='Estimated similarity at which questions count as near duplicates')
+    args = parser.parse_args()
+
     print("🔄 Starting question deduplication process")
     print("=" * 50)
-    
-    output_dir = Path("output")
-    
+
+    output_dir = Path(args.output_dir)
+
     if not output_dir.exists():
         print(f"❌ Output directory {output_dir} does not exist")
         return
-    
-    csv_files = [
-        "multiple_choice.csv",
-        "true_false.csv",
-        "sound.csv"
-    ]
-    
+
+    if args.near_duplicates:
+        cluster_near_duplicates(output_dir, threshold=args.threshold, chunksize=args.chunksize)
+        return
+
     total_stats = {
         'original_total': 0,
         'final_total': 0,
         'removed_total': 0
     }
-    
-    for csv_file in csv_files:
+
+    for csv_file in CSV_FILES:
         csv_path = output_dir / csv_file
         print(f"\n📁 Processing {csv_file}")
         print("-" * 30)
-        
-        # Deduplicate
-        stats = deduplicate_csv_file(csv_path)
-        
+
+        # Deduplicate and clean descriptions in a single pass
+        stats = deduplicate_csv_file(csv_path, chunksize=args.chunksize)
+
         if stats:
             total_stats['original_total'] += stats['original_count']
             total_stats['final_total'] += stats['final_count']
             total_stats['removed_total'] += stats['removed_count']
-        
-        # Clean descriptions
-        if csv_path.exists():
-            clean_descriptions(csv_path)
-    
+
     # Summary
     print("\n" + "=" * 50)
     print("📊 DEDUPLICATION SUMMARY")
@@ -168,7 +217,7 @@ def main():
     print(f"Original questions: {total_stats['original_total']}")
     print(f"Final questions: {total_stats['final_total']}")
     print(f"Duplicates removed: {total_stats['removed_total']}")
-    
+
     if total_stats['removed_total'] > 0:
         percentage = (total_stats['removed_total'] / total_stats['original_total']) * 100
         print(f"Reduction: {percentage:.1f}%")
@@ -179,4 +228,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+End-to-end throughput benchmark against a local mock of FunTrivia.
+
+Starts the mock site (src/utils/mock_site.py) on 127.0.0.1. FunTriviaScraper
+then runs against it once per speed profile, covering the whole pipeline:
+browser, rate limiter, delays, results parsing, media downloads and
+incremental saving. For each profile it reports:
+
+- quizzes/min and questions/min (timed after the browser has started)
+- per-stage latency (p50/p95/p99) of the scraper steps in TIMED_STAGES
+- peak resident memory of Python and of its child processes (browser, parse workers)
+- requests served and errors injected by the mock site
+
+Every profile runs in its own scratch directory with a copy of config/. Its
+CSVs, indices, logs and media never touch the real output/. The mock runs
+in the same event loop as the scraper, so its (small) CPU cost is included.
+
+With --serve, only the mock site is started. Point a normal run at it with:
+    python src/main.py --base-url http://127.0.0.1:8765 --max-questions 20
+
+Usage (from the repository root):
+    python scripts/benchmark_end_to_end.py
+    python scripts/benchmark_end_to_end.py --profiles normal fast --max-questions 50
+    python scripts/benchmark_end_to_end.py --latency-ms 200 --jitter-ms 100 --error-rate 0.02
+    python scripts/benchmark_end_to_end.py --json output/end_to_end_benchmark.json
+    python scripts/benchmark_end_to_end.py --serve --port 8765
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add the src directory to the path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from scraper.funtrivia import FunTriviaScraper
+from utils.benchmark import LatencyRecorder, MemorySampler
+from utils.mock_site import MockFunTriviaSite
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# Scraper method -> stage name. Stages nest: 'quiz' contains the steps below it.
+TIMED_STAGES = {
+    '_get_categories': 'categories',
+    '_get_quiz_links': 'category_page',
+    '_scrape_quiz': 'quiz',
+    '_optimized_page_goto': 'page_load',
+    '_extract_quiz_metadata': 'metadata',
+    '_submit_all_quiz_answers': 'answer_selection',
+    '_fast_radio_button_interaction': 'answer_selection',
+    '_submit_quiz_to_results': 'submit_and_wait',
+    '_extract_complete_results': 'results_extraction',
+    '_parallel_media_download': 'media',
+    '_save_questions_incrementally': 'save',
+    '_random_delay': 'delay',
+}
+
+
+def instrument(scraper: FunTriviaScraper, recorder: LatencyRecorder, quizzes: Counter) -> None:
+    """
+    Time the scraper steps in TIMED_STAGES and count quiz outcomes.
+
+    Calls cancelled when the question limit stops the run are not recorded,
+    so they cannot skew the percentiles.
+    """
+    for method_name, stage in TIMED_STAGES.items():
+        original = getattr(scraper, method_name)
+
+        async def timed(*args, _original=original, _stage=stage, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = await _original(*args, **kwargs)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                recorder.record(_stage, time.perf_counter() - start)
+                raise
+            recorder.record(_stage, time.perf_counter() - start)
+            if _stage == 'quiz':
+                quizzes['completed'] += 1
+                quizzes['with_questions' if result else 'empty'] += 1
+            return result
+
+        setattr(scraper, method_name, timed)
+
+
+def prepare_workspace(root: Path, profile: str, config_path: str, verbose: bool) -> Path:
+    """Scratch directory with config/ for one profile; relative output paths land inside it."""
+    workspace = root / profile
+    (workspace / 'config').mkdir(parents=True)
+    for name in ('mappings.json', 'speed_profiles.json'):
+        shutil.copy(REPO_ROOT / 'config' / name, workspace / 'config' / name)
+
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    config['logging']['level'] = 'INFO' if verbose else 'WARNING'
+    config['google_sheets']['enabled'] = False
+    with open(workspace / 'config' / 'settings.json', 'w', encoding='utf-8') as f:
+        json.dump(config, f, indent=2)
+    return workspace
+
+
+def site_from_args(args, port: int = 0) -> MockFunTriviaSite:
+    return MockFunTriviaSite(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        page_padding_kb=args.page_kb,
+        categories=args.categories,
+        quizzes_per_category=args.quizzes_per_category,
+        questions_per_quiz=args.questions_per_quiz,
+        seed=args.seed,
+        port=port,
+    )
+
+
+async def run_profile(profile: str, args, workspace: Path) -> Dict[str, Any]:
+    """Scrape max_questions questions from a fresh mock site with one speed profile."""
+    recorder = LatencyRecorder()
+    memory = MemorySampler()
+    quizzes: Counter = Counter()
+    questions = 0
+    previous_cwd = os.getcwd()
+    os.chdir(workspace)
+    try:
+        async with site_from_args(args) as site:
+            scraper = FunTriviaScraper('config/settings.json', speed_profile=profile, base_url=site.base_url)
+            # The logger is shared by all scrapers of a process; the first config's level would stick
+            scraper.logger.setLevel(logging.INFO if args.verbose else logging.WARNING)
+            instrument(scraper, recorder, quizzes)
+
+            sampler = asyncio.create_task(memory.sample_forever())
+            try:
+                await scraper.initialize()
+                start = time.perf_counter()
+                async for _ in scraper.iter_questions(max_questions=args.max_questions):
+                    questions += 1
+                await scraper.flush_writes()
+                elapsed = time.perf_counter() - start
+            finally:
+                await scraper.close()
+                memory.sample()
+                sampler.cancel()
+                try:
+                    await sampler
+                except asyncio.CancelledError:
+                    pass
+            site_stats = site.get_stats()
+    finally:
+        os.chdir(previous_cwd)
+
+    minutes = elapsed / 60
+    return {
+        'profile': profile,
+        'seconds': round(elapsed, 2),
+        'questions': questions,
+        'quizzes': {'completed': quizzes['completed'], 'with_questions': quizzes['with_questions'],
+                    'empty': quizzes['empty']},
+        'quizzes_per_minute': round(quizzes['with_questions'] / minutes, 2) if minutes else 0.0,
+        'questions_per_minute': round(questions / minutes, 2) if minutes else 0.0,
+        'latency': recorder.summary(),
+        'memory': memory.summary(),
+        'site': site_stats,
+    }
+
+
+async def run_benchmark(args) -> Dict[str, Any]:
+    root = Path(tempfile.mkdtemp(prefix='e2e_benchmark_'))
+    results = []
+    try:
+        for profile in args.profiles:
+            print(f"🚀 Running {profile} profile ({args.max_questions} questions)...")
+            workspace = prepare_workspace(root, profile, args.config, args.verbose)
+            result = await run_profile(profile, args, workspace)
+            print(f"   {result['questions']} questions in {result['seconds']:.1f}s "
+                  f"({result['questions_per_minute']:.1f} questions/min)")
+            results.append(result)
+    finally:
+        if args.keep_workspace:
+            print(f"📁 Scraper output kept in {root}")
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+
+    return {
+        'max_questions': args.max_questions,
+        'site': {
+            'latency_ms': args.latency_ms,
+            'jitter_ms': args.jitter_ms,
+            'error_rate': args.error_rate,
+            'page_kb': args.page_kb,
+            'categories': args.categories,
+            'quizzes_per_category': args.quizzes_per_category,
+            'questions_per_quiz': args.questions_per_quiz,
+            'seed': args.seed,
+        },
+        'profiles': results,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    site = report['site']
+    print("\n📊 END-TO-END BENCHMARK (mock site)")
+    print("=" * 78)
+    print(f"Site: {site['latency_ms']:.0f}±{site['jitter_ms']:.0f} ms latency, "
+          f"{site['error_rate'] * 100:.1f}% errors, +{site['page_kb']} KB per page")
+    print(f"Target: {report['max_questions']} questions per profile")
+
+    print(f"\n⚡ Throughput and memory")
+    print(f"  {'profile':<14}{'seconds':>9}{'quizzes':>9}{'quiz/min':>10}{'q/min':>9}"
+          f"{'requests':>10}{'errors':>8}{'rss MB':>9}{'child MB':>10}")
+    for result in report['profiles']:
+        print(f"  {result['profile']:<14}{result['seconds']:>9.1f}{result['quizzes']['with_questions']:>9}"
+              f"{result['quizzes_per_minute']:>10.1f}{result['questions_per_minute']:>9.1f}"
+              f"{result['site']['requests']:>10}{result['site']['errors_injected']:>8}"
+              f"{result['memory']['peak_rss_mb']:>9.0f}{result['memory']['peak_children_rss_mb']:>10.0f}")
+
+    stages = list(dict.fromkeys(stage for stage in TIMED_STAGES.values()
+                                if any(stage in result['latency'] for result in report['profiles'])))
+    print(f"\n⏱️ Stage latency p50 / p95 / p99 (ms)")
+    print(f"  {'stage':<20}" + ''.join(f"{result['profile']:>24}" for result in report['profiles']))
+    for stage in stages:
+        row = f"  {stage:<20}"
+        for result in report['profiles']:
+            stats = result['latency'].get(stage)
+            cell = f"{stats['p50_ms']:.0f} / {stats['p95_ms']:.0f} / {stats['p99_ms']:.0f}" if stats else '-'
+            row += f"{cell:>24}"
+        print(row)
+
+
+async def serve(args) -> None:
+    """Run the mock site until interrupted."""
+    async with site_from_args(args, port=args.port) as site:
+        print(f"🌐 Mock FunTrivia site at {site.base_url} "
+              f"({len(site.quiz_ids())} quizzes, {args.latency_ms:.0f}±{args.jitter_ms:.0f} ms latency)")
+        print(f"   python src/main.py --base-url {site.base_url} --max-questions 20")
+        print("   Press Ctrl+C to stop")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            print(f"\n📈 Served: {site.get_stats()}")
+
+
+def load_profile_names() -> List[str]:
+    with open(REPO_ROOT / 'config' / 'speed_profiles.json', 'r', encoding='utf-8') as f:
+        return list(json.load(f)['speed_profiles'])
+
+
+def main():
+    profile_names = load_profile_names()
+    parser = argparse.ArgumentParser(description='Benchmark FunTriviaScraper end to end against a local mock site')
+    parser.add_argument('--profiles', nargs='*', choices=profile_names, default=profile_names,
+                        help='Speed profiles to run (default: all)')
+    parser.add_argument('--max-questions', type=int, default=30, help='Questions to scrape per profile')
+    parser.add_argument('--latency-ms', type=float, default=50.0, help='Mean response delay of the mock site')
+    parser.add_argument('--jitter-ms', type=float, default=25.0, help='Response delay varies by up to this much')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 503')
+    parser.add_argument('--page-kb', type=int, default=32, help='Hidden filler added to every page')
+    parser.add_argument('--categories', type=int, default=16, help='Categories on the mock site')
+    parser.add_argument('--quizzes-per-category', type=int, default=5, help='Quizzes per category')
+    parser.add_argument('--questions-per-quiz', type=int, default=10, help='Questions per quiz')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for site content, latency and errors')
+    parser.add_argument('--config', default=str(REPO_ROOT / 'config' / 'settings.json'),
+                        help='Scraper configuration to copy into each scratch directory')
+    parser.add_argument('--keep-workspace', action='store_true', help='Keep the scratch directories for inspection')
+    parser.add_argument('--json', help='Write the report as JSON to this file')
+    parser.add_argument('--serve', action='store_true', help='Only run the mock site')
+    parser.add_argument('--port', type=int, default=8765, help='Port for --serve')
+    parser.add_argument('--verbose', action='store_true', help='Show scraper log output')
+    args = parser.parse_args()
+
+    if args.serve:
+        try:
+            asyncio.run(serve(args))
+        except KeyboardInterrupt:
+            pass
+        return
+
+    report = asyncio.run(run_benchmark(args))
+    print_report(report)
+
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📝 Report written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Offline extraction benchmark over the golden page corpus.
+
+Renders every saved quiz and results page of tests/fixtures/extraction in
+headless Chromium with all network requests blocked. The scraper's own
+extraction code runs on each page and its output is scored against the
+labels in the corpus manifest:
+
+- quiz type detection and question extraction on every quiz page
+- each results strategy on its own (1: full page text, 2: structured
+  result blocks, 3: text lines) and the strategy chain the scraper runs
+- pages/sec, per-stage latency (p50/p95/p99) and correct answer and
+  description accuracy
+
+Results strategies get the labelled questions as input, so their accuracy
+does not depend on question extraction.
+
+With --baseline, accuracy is compared with an earlier --json report and
+the script exits with status 1 if anything got less accurate. Use it to
+show that a parser speedup is safe.
+
+Usage (from the repository root):
+    python scripts/benchmark_extraction.py
+    python scripts/benchmark_extraction.py --rounds 5 --fixtures standard photo
+    python scripts/benchmark_extraction.py --json output/extraction_benchmark.json
+    python scripts/benchmark_extraction.py --baseline output/extraction_benchmark.json --parse-workers 2
+"""
+
+import argparse
+import asyncio
+import copy
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add the src directory to the path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from playwright.async_api import async_playwright # type: ignore
+from scraper.funtrivia import FunTriviaScraper
+from utils.benchmark import LatencyRecorder
+from utils.explanation_parser import ResultsParsePool
+from utils.extraction_corpus import DEFAULT_CORPUS_DIR, load_corpus, score_questions, score_results
+
+# Question extractor per detected quiz type (anything else uses _extract_questions_robust)
+QUESTION_EXTRACTORS = {
+    'Photo Quiz': '_extract_photo_quiz_questions',
+    'Audio Quiz': '_extract_audio_quiz_questions',
+}
+
+# Results stages and the scraper method each one runs
+RESULTS_STAGES = {
+    'strategy_1': '_extract_from_full_page_text',
+    'strategy_2': '_extract_from_result_blocks',
+    'strategy_3': '_extract_from_text_results',
+    'chain': '_extract_complete_results',
+}
+
+
+def labelled_questions(fixture: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """The fixture's labels in the shape the question extractors return."""
+    return [{'question': label['question'], 'options': list(label['options']), 'questionNumber': label['number']}
+            for label in fixture['questions']]
+
+
+async def run_fixture(scraper: FunTriviaScraper, context, fixture: Dict[str, Any],
+                      recorder: LatencyRecorder) -> Dict[str, Any]:
+    """Run all extraction stages on one fixture and score them."""
+    page = await context.new_page()
+    try:
+        detected_types = []
+        questions = []
+        for html in fixture['quiz_html']:
+            with recorder.measure('load_page'):
+                await page.set_content(html, wait_until='domcontentloaded')
+            with recorder.measure('detect_type'):
+                quiz_type = await scraper._detect_quiz_type(page)
+            detected_types.append(quiz_type)
+            extractor = getattr(scraper, QUESTION_EXTRACTORS.get(quiz_type, '_extract_questions_robust'))
+            with recorder.measure('questions'):
+                questions.extend(await extractor(page))
+
+        result = {
+            'pages': len(fixture['quiz_html']),
+            'detected_types': detected_types,
+            'type_correct': None if fixture.get('quiz_type') is None
+                            else all(quiz_type == fixture['quiz_type'] for quiz_type in detected_types),
+            'questions': score_questions(questions, fixture['questions']),
+            'results': {}
+        }
+
+        if fixture['results_html'] and fixture['questions']:
+            with recorder.measure('load_page'):
+                await page.set_content(fixture['results_html'], wait_until='domcontentloaded')
+            result['pages'] += 1
+            for stage, method in RESULTS_STAGES.items():
+                with recorder.measure(stage):
+                    enhanced = await getattr(scraper, method)(page, copy.deepcopy(labelled_questions(fixture)))
+                result['results'][stage] = score_results(enhanced, fixture['questions'])
+        return result
+    finally:
+        await page.close()
+
+
+async def run_benchmark(args) -> Dict[str, Any]:
+    fixtures = load_corpus(args.corpus, args.fixtures or None)
+
+    scraper = FunTriviaScraper(args.config)
+    scraper.logger.setLevel(logging.INFO if args.verbose else logging.ERROR)
+    scraper.layout_cache = None  # Every run of the chain goes through the full strategy search
+    scraper.parse_pool.close()
+    scraper.parse_pool = ResultsParsePool(workers=args.parse_workers)
+
+    recorder = LatencyRecorder()
+    accuracy: Dict[str, Any] = {}
+    pages = 0
+    elapsed = 0.0
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True)
+        try:
+            context = await browser.new_context()
+            # Offline: scripts, images and audio of the saved pages are never fetched
+            await context.route('**/*', lambda route: route.abort())
+
+            for _ in range(args.warmup):
+                for fixture in fixtures:
+                    await run_fixture(scraper, context, fixture, LatencyRecorder())
+
+            for round_number in range(args.rounds):
+                start = time.perf_counter()
+                for fixture in fixtures:
+                    result = await run_fixture(scraper, context, fixture, recorder)
+                    pages += result.pop('pages')
+                    # Extraction is deterministic; keep the first round's scores
+                    accuracy.setdefault(fixture['name'], result)
+                elapsed += time.perf_counter() - start
+        finally:
+            await browser.close()
+            scraper.parse_pool.close()
+
+    return {
+        'corpus': str(args.corpus),
+        'rounds': args.rounds,
+        'parse_workers': args.parse_workers,
+        'fixtures': [fixture['name'] for fixture in fixtures],
+        'pages': pages,
+        'seconds': round(elapsed, 3),
+        'pages_per_second': round(pages / elapsed, 2) if elapsed else 0.0,
+        'latency': recorder.summary(),
+        'accuracy': accuracy,
+        'parse_pool': scraper.parse_pool.get_stats(),
+    }
+
+
+def _ratio(correct: int, total: int) -> str:
+    return f"{correct}/{total}" if total else "-"
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print("\n📊 OFFLINE EXTRACTION BENCHMARK")
+    print("=" * 78)
+    print(f"Fixtures: {', '.join(report['fixtures'])}")
+    print(f"Rounds: {report['rounds']}, parse workers: {report['parse_workers']}")
+    print(f"Pages: {report['pages']} in {report['seconds']:.2f}s ({report['pages_per_second']:.1f} pages/sec)")
+
+    print(f"\n⏱️ Latency per stage (ms)")
+    print(f"  {'stage':<14}{'count':>7}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    for stage, stats in report['latency'].items():
+        print(f"  {stage:<14}{stats['count']:>7}{stats['mean_ms']:>10.2f}{stats['p50_ms']:>10.2f}"
+              f"{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}{stats['max_ms']:>10.2f}")
+
+    print(f"\n🎯 Accuracy (answers / descriptions)")
+    print(f"  {'fixture':<12}{'type':>6}{'questions':>14}" + ''.join(f"{stage:>16}" for stage in RESULTS_STAGES))
+    totals = {stage: [0, 0, 0, 0] for stage in RESULTS_STAGES}
+    for name, result in report['accuracy'].items():
+        type_mark = '-' if result['type_correct'] is None else ('✅' if result['type_correct'] else '❌')
+        questions = result['questions']
+        question_cell = f"{questions['matched']}/{questions['expected']} ({questions['extracted']})"
+        row = f"  {name:<12}{type_mark:>6}{question_cell:>14}"
+        for stage in RESULTS_STAGES:
+            scores = result['results'].get(stage)
+            if scores is None:
+                row += f"{'-':>16}"
+                continue
+            totals[stage][0] += scores['answers_correct']
+            totals[stage][1] += scores['descriptions_correct']
+            totals[stage][2] += scores['questions']
+            totals[stage][3] += scores.get('answers_missing', 0)
+            cell = f"{_ratio(scores['answers_correct'], scores['questions'])} / " \
+                   f"{_ratio(scores['descriptions_correct'], scores['questions'])}"
+            row += f"{cell:>16}"
+        print(row)
+
+    print(f"\n  {'overall':<32}" + ''.join(
+        f"{(f'{answers / total * 100:.0f}% / {descriptions / total * 100:.0f}%' if total else '-'):>16}"
+        for answers, descriptions, total, _ in totals.values()))
+    print(f"  {'answers missing':<32}" + ''.join(f"{missing:>16}" for *_, missing in totals.values()))
+    print("  questions: matched/labelled (extracted); answers are scored before the first-option fallback")
+
+
+def compare_with_baseline(report: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Accuracy regressions of report against baseline, and print p50 latency changes."""
+    regressions = []
+    for name, result in report['accuracy'].items():
+        previous = baseline.get('accuracy', {}).get(name)
+        if previous is None:
+            continue
+        if previous['type_correct'] and not result['type_correct']:
+            regressions.append(f"{name}: quiz type no longer detected")
+        if result['questions']['matched'] < previous['questions']['matched']:
+            regressions.append(f"{name}: questions {previous['questions']['matched']} -> {result['questions']['matched']}")
+        for stage, scores in result['results'].items():
+            before = previous.get('results', {}).get(stage)
+            if before is None:
+                continue
+            for key in ('answers_correct', 'descriptions_correct'):
+                if scores[key] < before[key]:
+                    regressions.append(f"{name} {stage}: {key} {before[key]} -> {scores[key]}")
+
+    print(f"\n🔁 Compared with baseline ({baseline.get('pages_per_second', 0):.1f} pages/sec "
+          f"-> {report['pages_per_second']:.1f} pages/sec)")
+    for stage, stats in report['latency'].items():
+        before = baseline.get('latency', {}).get(stage)
+        if before and before['p50_ms']:
+            change = (stats['p50_ms'] - before['p50_ms']) / before['p50_ms'] * 100
+            print(f"  {stage:<14} p50 {before['p50_ms']:.2f} -> {stats['p50_ms']:.2f} ms ({change:+.0f}%)")
+    for regression in regressions:
+        print(f"  ❌ {regression}")
+    if not regressions:
+        print("  ✅ No accuracy regressions")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark quiz and results extraction on saved pages')
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS_DIR, help='Corpus directory with manifest.json')
+    parser.add_argument('--fixtures', nargs='*', help='Only run these fixtures (default: all)')
+    parser.add_argument('--rounds', type=int, default=3, help='Timed passes over the corpus')
+    parser.add_argument('--warmup', type=int, default=1, help='Untimed passes before measuring')
+    parser.add_argument('--parse-workers', type=int, default=0,
+                        help='Worker processes for results parsing (0 parses inline)')
+    parser.add_argument('--config', default='config/settings.json', help='Scraper configuration file')
+    parser.add_argument('--json', help='Write the report as JSON to this file')
+    parser.add_argument('--baseline', help='Earlier --json report to compare accuracy and latency with')
+    parser.add_argument('--verbose', action='store_true', help='Show scraper log output')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR,
+                        format='%(levelname)s %(name)s: %(message)s')
+
+    # Read the baseline first; --json may overwrite the same file
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    report = asyncio.run(run_benchmark(args))
+    print_report(report)
+
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📝 Report written to {args.json}")
+
+    if baseline is not None and compare_with_baseline(report, baseline):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
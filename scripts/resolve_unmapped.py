@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Bulk-resolve unmapped domain, topic and difficulty values.
+
+Looks up every value that is missing from config/mappings.json in the
+trigram index and prints the closest standard category with its similarity
+score. Values can be given on the command line, taken from the
+all_categories.json written by collect_categories.py, or read from the
+Domain/Topic/Difficulty columns of existing question CSVs.
+
+Usage:
+    python scripts/resolve_unmapped.py --kind topic Comics Hobbies "Video Game"
+    python scripts/resolve_unmapped.py --categories output/all_categories.json
+    python scripts/resolve_unmapped.py --csv output/multiple_choice.csv --threshold 0.7 \\
+        --write-suggestions output/mapping_suggestions.json
+"""
+
+import argparse
+import csv
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Dict
+
+# Add the src directory to the path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from scraper.config import ScraperConfig, MAPPING_SECTIONS
+from utils.fuzzy_index import DEFAULT_FUZZY_THRESHOLD
+
+# Keys of collect_categories.py output and CSV columns per mapping kind
+CATEGORY_KEYS = {'domain': 'raw_domains', 'topic': 'raw_topics', 'difficulty': 'raw_difficulties'}
+CSV_COLUMNS = {'domain': 'Domain', 'topic': 'Topic', 'difficulty': 'Difficulty'}
+
+
+def collect_values(args) -> Dict[str, Counter]:
+    """Gather candidate values per kind with how often they were seen."""
+    values = {kind: Counter() for kind in MAPPING_SECTIONS}
+
+    for value in args.values:
+        values[args.kind][value] += 1
+
+    for path in args.categories:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for kind, key in CATEGORY_KEYS.items():
+            for value, count in data.get(key, {}).items():
+                values[kind][value] += count
+
+    for path in args.csv:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                for kind, column in CSV_COLUMNS.items():
+                    if row.get(column):
+                        values[kind][row[column]] += 1
+
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Suggest mappings for values missing from mappings.json')
+    parser.add_argument('values', nargs='*', help='Raw values to resolve (see --kind)')
+    parser.add_argument('--kind', choices=list(MAPPING_SECTIONS), default='topic',
+                        help='Mapping kind of the values given on the command line')
+    parser.add_argument('--categories', action='append', default=[],
+                        help='all_categories.json written by collect_categories.py')
+    parser.add_argument('--csv', action='append', default=[],
+                        help='Question CSV with Domain/Topic/Difficulty columns')
+    parser.add_argument('--mappings', default='config/mappings.json', help='Path to the mappings file')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_FUZZY_THRESHOLD,
+                        help='Minimum similarity (0-1) for a suggestion to be accepted')
+    parser.add_argument('--write-suggestions',
+                        help='Write accepted suggestions as mappings.json sections to this file')
+    args = parser.parse_args()
+
+    if not (args.values or args.categories or args.csv):
+        parser.error('give values, --categories or --csv')
+
+    config = ScraperConfig(args.mappings)
+    values = collect_values(args)
+
+    suggestions = {section: {} for section in MAPPING_SECTIONS.values()}
+    accepted = rejected = 0
+
+    print("🔎 UNMAPPED VALUE RESOLUTION")
+    print("=" * 60)
+    for kind, counter in values.items():
+        unmapped = [value for value in counter if not config.is_mapped(kind, value)]
+        if not unmapped:
+            continue
+
+        print(f"\n{kind.upper()} ({len(unmapped)} unmapped):")
+        for value in sorted(unmapped, key=lambda v: (-counter[v], v)):
+            match = config.suggest(kind, value)
+            if match is not None and match.score >= args.threshold:
+                accepted += 1
+                suggestions[MAPPING_SECTIONS[kind]].setdefault(match.value, []).append(value.lower())
+                print(f"  ✅ '{value}' -> '{match.value}' (closest to '{match.synonym}', score {match.score:.2f})")
+            elif match is not None:
+                rejected += 1
+                print(f"  ❔ '{value}' -> '{match.value}'? (closest to '{match.synonym}', "
+                      f"score {match.score:.2f} below {args.threshold:.2f})")
+            else:
+                rejected += 1
+                print(f"  ❌ '{value}': no similar synonym")
+
+    print("\n" + "=" * 60)
+    print(f"Accepted: {accepted}, needs review: {rejected}")
+
+    if args.write_suggestions:
+        suggestions = {section: mapping for section, mapping in suggestions.items() if mapping}
+        with open(args.write_suggestions, 'w', encoding='utf-8') as f:
+            json.dump(suggestions, f, indent=2, ensure_ascii=False)
+        print(f"📝 Suggestions written to {args.write_suggestions}; review and merge into {args.mappings}")
+
+
+if __name__ == '__main__':
+    main()
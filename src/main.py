@@ -1,7 +1,6 @@
 import asyncio
 import argparse
 import json
-import pandas as pd # type: ignore
 from pathlib import Path
 import logging
 import os
@@ -12,7 +11,13 @@ from utils.sheets import GoogleSheetsUploader
 from utils.rate_limiter import RateLimiter
 from utils.csv_handler import CSVHandler
 from utils.indexing import QuestionIndexer
-from utils.validation import validate_scraped_data, print_validation_report, validate_csv_files
+from utils.question_writer import QuestionWriter
+from utils.parquet_exporter import ParquetExporter
+from utils.answer_matcher import match_answer
+from utils.validation import (
+    DataValidator, create_validation_summary, update_validation_summary,
+    print_validation_report, validate_csv_files
+)
 from utils.monitoring import ScrapingMetrics, HealthMonitor
 from utils.compliance import run_compliance_check, EthicalScraper
 
@@ -131,35 +136,26 @@ def format_question_data_enhanced(question: Dict[str, Any]) -> Dict[str, Any]:
 
     # Enhanced correct answer validation
     if formatted['CorrectAnswer']:
-        # Clean up the correct answer
+        # Answers already resolved by the scraper are exact option matches
         correct_answer = formatted['CorrectAnswer'].strip()
-        
-        # Try to match with exact options first
-        for option in options:
-            if option.strip().lower() == correct_answer.lower():
-                formatted['CorrectAnswer'] = option.strip()
-                break
+        match = match_answer(options, correct_answer)
+        if match.option is not None:
+            formatted['CorrectAnswer'] = match.option
         else:
-            # If no exact match, try partial matching
-            for option in options:
-                if correct_answer.lower() in option.lower() or option.lower() in correct_answer.lower():
-                    formatted['CorrectAnswer'] = option.strip()
-                    break
-            else:
-                # Enhanced debugging before defaulting to first option
-                logging.getLogger(__name__).warning(
-                    f"Could not match correct answer '{correct_answer}' with options {options}"
-                )
+            # Enhanced debugging before defaulting to first option
+            logging.getLogger(__name__).warning(
+                f"Could not match correct answer '{correct_answer}' with options {options}"
+            )
+            logging.getLogger(__name__).warning(
+                f"Question: {question.get('question', 'Unknown')[:100]}..."
+            )
+            
+            # If still no match and we have options, default to first option
+            if options:
+                formatted['CorrectAnswer'] = options[0].strip()
                 logging.getLogger(__name__).warning(
-                    f"Question: {question.get('question', 'Unknown')[:100]}..."
+                    f"Using first option as fallback: '{options[0].strip()}'"
                 )
-                
-                # If still no match and we have options, default to first option
-                if options:
-                    formatted['CorrectAnswer'] = options[0].strip()
-                    logging.getLogger(__name__).warning(
-                        f"Using first option as fallback: '{options[0].strip()}'"
-                    )
 
     # Ensure we have a correct answer
     if not formatted['CorrectAnswer'] and options:
@@ -205,6 +201,18 @@ def print_csv_statistics(csv_handler: CSVHandler, config: Dict[str, Any]) -> Non
         if stats['sample_keys']:
             print(f"  Sample keys: {', '.join(stats['sample_keys'])}")
 
+def export_parquet_dataset(config: Dict[str, Any], store=None, run_id: int = None) -> Dict[str, int]:
+    """
+    Append questions not yet in the Parquet dataset.
+    
+    Reads from the question store when one is given (optionally only one run's
+    questions), otherwise from the CSV files.
+    """
+    exporter = ParquetExporter.from_config(config)
+    if store is not None:
+        return exporter.export_store(store, config['storage']['csv_files'], run_id=run_id)
+    return exporter.export_csv_files(config['storage']['output_dir'], config['storage']['csv_files'])
+
 def run_pre_scrape_checks(config: Dict[str, Any], logger) -> bool:
     """Run pre-scraping validation checks."""
     logger.info("Running pre-scrape validation checks")
@@ -291,13 +299,24 @@ async def main():
     parser.add_argument('--max-delay', type=float, help='Maximum delay between requests in seconds (default: 3)')
     parser.add_argument('--categories', type=str, help='Comma-separated list of categories to scrape')
     parser.add_argument('--config', type=str, default='config/settings.json', help='Path to configuration file')
+    parser.add_argument('--base-url', type=str,
+                       help='Site root to scrape instead of scraper.base_url, e.g. a local mock site '
+                            '(python scripts/benchmark_end_to_end.py --serve)')
     parser.add_argument('--append', action='store_true', default=True, help='Append to existing CSV files (default)')
     parser.add_argument('--overwrite', action='store_true', help='Overwrite existing CSV files')
     parser.add_argument('--backup', action='store_true', help='Create backup before overwriting')
     parser.add_argument('--reset-indices', action='store_true', help='Reset question indices to 0')
     parser.add_argument('--validate-only', action='store_true', help='Only validate existing CSV files')
+    parser.add_argument('--export-csv', action='store_true',
+                       help='Export the SQLite question store to the configured CSV files and exit')
+    parser.add_argument('--export-parquet', action='store_true',
+                       help='Append questions to the partitioned Parquet dataset and exit (requires pyarrow)')
     parser.add_argument('--skip-validation', action='store_true', help='Skip data validation')
     parser.add_argument('--dry-run', action='store_true', help='Simulate scraping without saving data')
+    parser.add_argument('--refresh-media', action='store_true',
+                       help='Download media again even if the media manifest says it is already present')
+    parser.add_argument('--process-media', action='store_true',
+                       help='Post-process downloaded media (normalize, thumbnails, audio checks) and exit')
     
     # New category collection arguments
     parser.add_argument('--dump-categories-only', action='store_true', 
@@ -470,6 +489,8 @@ async def main():
         config['scraper']['delays']['max'] = args.max_delay
     if args.strict_mapping:
         config['scraper']['strict_mapping'] = True
+    if args.base_url:
+        config['scraper']['base_url'] = args.base_url.rstrip('/')
 
     # Validate delay configuration
     delay_config = config['scraper'].get('delays', {})
@@ -519,6 +540,54 @@ async def main():
         print(f"\nValidation {'✅ PASSED' if all_valid else '❌ FAILED'}")
         return
 
+    # Handle CSV export from the question store
+    if args.export_csv:
+        from utils.storage import QuestionStore
+        store = QuestionStore.from_config(config)
+        try:
+            logger.info(f"Exporting question store {store.db_path} to CSV")
+            counts = store.export_all(config['storage']['output_dir'], config['storage']['csv_files'])
+        finally:
+            store.close()
+        for question_type, count in counts.items():
+            print(f"  {question_type}: {count} questions -> {config['storage']['csv_files'][question_type]}")
+        return
+
+    # Handle Parquet export
+    if args.export_parquet:
+        if not ParquetExporter.is_available():
+            print("❌ Parquet export requires pyarrow - install it with: pip install pyarrow")
+            return 1
+        store = None
+        if config['storage'].get('backend', 'csv') == 'sqlite':
+            from utils.storage import QuestionStore
+            store = QuestionStore.from_config(config)
+        try:
+            counts = export_parquet_dataset(config, store=store)
+        finally:
+            if store is not None:
+                store.close()
+        for question_type, count in counts.items():
+            print(f"  {question_type}: {count} new questions appended to the Parquet dataset")
+        return
+
+    # Handle media post-processing of files already downloaded
+    if args.process_media:
+        from utils.media_processor import MediaProcessor, iter_media_files
+        processor = MediaProcessor.from_config(config)
+        if not MediaProcessor.is_available():
+            print("⚠️  Pillow is not installed - images are skipped (pip install Pillow)")
+        files = iter_media_files({'image': config['storage']['images_dir'],
+                                  'audio': config['storage']['audio_dir']})
+        logger.info(f"Post-processing {len(files)} media files with {processor.workers} workers")
+        try:
+            stats = await processor.process_files(files)
+        finally:
+            await processor.close()
+        print(f"  Processed: {stats['processed']}, failed: {stats['failed']}, "
+              f"skipped: {stats['skipped']}, already done: {stats['already_done']}")
+        return
+
     # Handle index reset if requested
     if args.reset_indices:
         logger.warning("Resetting question indices to 0")
@@ -541,28 +610,167 @@ async def main():
     logger.info(f"Mode: {'Dry Run' if args.dry_run else 'Append' if not args.overwrite else 'Overwrite'}")
 
     # Initialize scraper with speed profile
-    scraper = FunTriviaScraper(args.config, speed_profile=args.speed_profile)
+    scraper = FunTriviaScraper(args.config, speed_profile=args.speed_profile, metrics=metrics,
+                               base_url=args.base_url)
+    if args.dry_run:
+        # Nothing may be written in a dry run, including the scraper's incremental saves
+        scraper.incremental_save = False
+    if args.refresh_media:
+        scraper.media_handler.refresh = True
+        logger.info("Refreshing media - files already on disk will be downloaded again")
     
     try:
         await scraper.initialize()
         logger.info("Scraper initialized successfully")
         
-        # Scrape questions
-        logger.info("Starting question scraping")
-        questions = await scraper.scrape_questions(
-            max_questions=config['scraper']['max_questions_per_run']
-        )
-        logger.info(f"Scraped {len(questions)} questions total")
+        # Handle dry run mode
+        if args.dry_run:
+            logger.info("DRY RUN MODE - No data will be saved")
+            print("\n🧪 DRY RUN MODE - No data will be saved")
+
+        # Create backups and reset files before scraping when overwriting, since
+        # questions are written to the CSV files as they stream in
+        if args.overwrite and not args.dry_run:
+            backup_failed = set()
+            if args.backup:
+                logger.info("Creating backups of existing CSV files")
+                backup_count = 0
+                for question_type, csv_file in config['storage']['csv_files'].items():
+                    try:
+                        backed_up = csv_handler.backup_csv(csv_file)  # False (and logged) on failure
+                    except Exception as e:
+                        backed_up = False
+                        logger.error(f"Failed to create backup for {csv_file}: {e}")
+                    if backed_up:
+                        backup_count += 1
+                        logger.debug(f"Created backup for {csv_file}")
+                    else:
+                        backup_failed.add(csv_file)
+                logger.info(f"Created {backup_count} CSV backups")
+            
+            # With the SQLite backend the CSV files are regenerated from the store after the run
+            csv_reset_types = {} if config['storage'].get('backend', 'csv') == 'sqlite' else config['storage']['csv_files']
+            reset_files = []
+            for question_type, csv_file in csv_reset_types.items():
+                if csv_file in backup_failed:
+                    # Never empty a file that has no backup - new questions are appended instead
+                    logger.error(f"Not overwriting {csv_file} because its backup failed - appending to it instead")
+                    continue
+                try:
+                    logger.info(f"Overwriting {csv_file} - starting with an empty file")
+                    csv_handler.reset_csv(csv_file, question_type)
+                    reset_files.append(csv_file)
+                except Exception as e:
+                    logger.error(f"Failed to reset {csv_file} for overwrite: {e}")
+            
+            # The indexes described the old file contents: forget them, or rebuild
+            # them from the files that were kept when only some were reset
+            kept_files = [csv_file for csv_file in csv_reset_types.values() if csv_file not in reset_files]
+            csv_paths = [os.path.join(config['storage']['output_dir'], csv_file)
+                         for csv_file in csv_reset_types.values()]
+            if reset_files and scraper.signature_index is not None:
+                if kept_files:
+                    scraper.signature_index.rebuild(csv_paths)
+                else:
+                    scraper.signature_index.clear()
+            if reset_files and scraper.near_duplicate_index is not None:
+                scraper.near_duplicate_index.clear()
+                if kept_files:
+                    scraper.near_duplicate_index.load_csv_files(csv_paths)
+
+        # Stream questions: validate and format each one as it arrives instead of
+        # holding the whole run in memory. Rows are written by a background
+        # QuestionWriter - the scraper's own when incremental saving is on,
+        # otherwise one owned by this run.
+        logger.info("Starting question scraping (streaming)")
+        writer = scraper.question_writer
+        owns_writer = writer is None and not args.dry_run
+        if owns_writer:
+            writer = QuestionWriter.from_config(csv_handler, config, metrics=metrics,
+                                                signature_index=scraper.signature_index,
+                                                near_duplicate_index=scraper.near_duplicate_index)
+            await writer.start()
+        
+        scraped_by_type = {
+            'multiple_choice': 0,
+            'true_false': 0,
+            'sound': 0
+        }
+        total_scraped = 0
+        total_new_questions = 0
+        validator = DataValidator()
+        validation_summary = create_validation_summary()
 
-        if not questions:
+        try:
+            async for question in scraper.iter_questions(
+                max_questions=config['scraper']['max_questions_per_run']
+            ):
+                total_scraped += 1
+                
+                # Validate scraped data unless skipped
+                if not args.skip_validation:
+                    update_validation_summary(validation_summary, validator, question, max_messages=100)
+                
+                try:
+                    question_type = question.get('type', 'multiple_choice')
+                    if owns_writer:
+                        formatted_question = format_question_data_enhanced(question)
+                        await writer.put(question_type, [formatted_question])
+                    scraped_by_type[question_type] += 1
+                    
+                    # Record metrics
+                    metrics.record_question_scraped(question_type)
+                except Exception as e:
+                    logger.error(f"Error formatting question {question.get('id', 'unknown')}: {e}")
+                    logger.debug("Question formatting error details:", exc_info=True)
+                    # Continue with next question instead of failing
+                    continue
+
+            # Make sure everything queued so far is on disk before reporting
+            writer_stats = await writer.flush() if writer else {}
+        finally:
+            if owns_writer:
+                writer_stats = await writer.close()
+
+        total_new_questions = writer_stats.get('rows_written', 0)
+        
+        # The question store is the source of truth - regenerate the CSV files from it.
+        # In overwrite mode the CSV files only hold this run's questions.
+        if scraper.question_store:
+            export_run_id = scraper.run_id if args.overwrite else None
+            logger.info("Exporting question store to CSV files")
+            await asyncio.to_thread(
+                scraper.question_store.export_all,
+                config['storage']['output_dir'], config['storage']['csv_files'], export_run_id
+            )
+        
+        # Append this run's questions to the Parquet dataset
+        if config['storage'].get('parquet', {}).get('enabled', False) and total_new_questions > 0:
+            if ParquetExporter.is_available():
+                try:
+                    parquet_counts = await asyncio.to_thread(
+                        export_parquet_dataset, config, scraper.question_store, scraper.run_id
+                    )
+                    logger.info(f"Parquet dataset: {sum(parquet_counts.values())} questions appended")
+                except Exception as e:
+                    logger.error(f"Parquet export failed: {e}")
+                    logger.debug("Parquet export error details:", exc_info=True)
+            else:
+                logger.warning("Parquet export enabled but pyarrow is not installed - skipping")
+        
+        csv_files = {
+            question_type: str(Path(config['storage']['output_dir']) / csv_file)
+            for question_type, csv_file in config['storage']['csv_files'].items()
+            if scraped_by_type.get(question_type)
+        }
+
+        logger.info(f"Scraped {total_scraped} questions total")
+
+        if not total_scraped:
             logger.warning("No questions were scraped!")
             return
 
-        # Validate scraped data unless skipped
         if not args.skip_validation:
-            logger.info("Starting data validation")
-            logger.debug(f"Validating {len(questions)} questions...")
-            validation_summary = validate_scraped_data(questions)
             print_validation_report(validation_summary)
             
             # Record validation metrics
@@ -572,118 +780,37 @@ async def main():
                 validation_summary['questions_with_warnings']
             )
             
-            # Filter out invalid questions
             if validation_summary['invalid_questions'] > 0:
-                logger.warning(f"Removing {validation_summary['invalid_questions']} invalid questions")
+                logger.warning(f"{validation_summary['invalid_questions']} invalid questions were scraped")
                 # Note: In a real implementation, you'd filter out invalid questions here
                 # For now, we'll proceed with all questions
             
             logger.info(f"Validation completed: {validation_summary['valid_questions']} valid, {validation_summary['invalid_questions']} invalid, {validation_summary['questions_with_warnings']} with warnings")
 
-        # Group questions by type
-        logger.info("Grouping questions by type")
-        questions_by_type = {
-            'multiple_choice': [],
-            'true_false': [],
-            'sound': []
-        }
-
-        for question in questions:
-            try:
-                formatted_question = format_question_data_enhanced(question)
-                question_type = question.get('type', 'multiple_choice')
-                questions_by_type[question_type].append(formatted_question)
-                
-                # Record metrics
-                metrics.record_question_scraped(question_type)
-            except Exception as e:
-                logger.error(f"Error formatting question {question.get('id', 'unknown')}: {e}")
-                logger.debug("Question formatting error details:", exc_info=True)
-                # Continue with next question instead of failing
-                continue
-
         # Log question distribution
         logger.info("Question type distribution:")
-        for qtype, qlist in questions_by_type.items():
-            logger.info(f"  {qtype}: {len(qlist)} questions")
+        for qtype, count in scraped_by_type.items():
+            logger.info(f"  {qtype}: {count} questions")
 
-        # Handle dry run mode
         if args.dry_run:
-            logger.info("DRY RUN MODE - No data will be saved")
-            print("\n🧪 DRY RUN MODE - No data will be saved")
             print("Question summary:")
-            for qtype, qlist in questions_by_type.items():
-                print(f"  {qtype}: {len(qlist)} questions")
+            for qtype, count in scraped_by_type.items():
+                print(f"  {qtype}: {count} questions")
             logger.info("Dry run completed successfully")
             return
 
-        # Create backups if requested and overwriting
-        if args.overwrite and args.backup:
-            logger.info("Creating backups of existing CSV files")
-            backup_count = 0
-            for question_type, csv_file in config['storage']['csv_files'].items():
-                try:
-                    csv_handler.backup_csv(csv_file)
-                    backup_count += 1
-                    logger.debug(f"Created backup for {csv_file}")
-                except Exception as e:
-                    logger.error(f"Failed to create backup for {csv_file}: {e}")
-            logger.info(f"Created {backup_count} CSV backups")
-
-        # Save questions to CSV files
-        logger.info("Starting CSV file operations")
-        csv_files = {}
-        total_new_questions = 0
-        csv_operation_stats = {'successful': 0, 'failed': 0, 'skipped': 0}
-        
-        for question_type, type_questions in questions_by_type.items():
-            if not type_questions:
-                logger.info(f"No {question_type} questions to save - skipping")
-                csv_operation_stats['skipped'] += 1
-                continue
-
-            csv_file = config['storage']['csv_files'][question_type]
-            csv_files[question_type] = str(Path(config['storage']['output_dir']) / csv_file)
-
-            try:
-                if args.overwrite:
-                    # Overwrite mode - use pandas directly
-                    logger.info(f"Overwriting {csv_file} with {len(type_questions)} questions")
-                    df = pd.DataFrame(type_questions)
-                    df = csv_handler.ensure_csv_structure(df, question_type)
-                    df.to_csv(csv_files[question_type], index=False)
-                    new_count = len(type_questions)
-                    logger.info(f"Successfully overwrote {csv_file} with {new_count} {question_type} questions")
-                else:
-                    # Append mode - use CSV handler
-                    logger.info(f"Appending {len(type_questions)} questions to {csv_file}")
-                    new_count = csv_handler.append_to_csv(type_questions, csv_file, question_type)
-                    logger.info(f"Successfully added {new_count} new {question_type} questions to {csv_file}")
-                
-                total_new_questions += new_count
-                csv_operation_stats['successful'] += 1
-                
-                # Log sample of saved data for verification
-                if type_questions:
-                    sample_question = type_questions[0]
-                    logger.debug(f"Sample {question_type} question saved:")
-                    logger.debug(f"  Key: {sample_question.get('Key')}")
-                    logger.debug(f"  Question: {sample_question.get('Question', '')[:100]}...")
-                    logger.debug(f"  Correct Answer: {sample_question.get('CorrectAnswer')}")
-                    logger.debug(f"  Media: {sample_question.get('ImagePath') or sample_question.get('AudioPath') or 'None'}")
-            
-            except Exception as e:
-                csv_operation_stats['failed'] += 1
-                logger.error(f"Failed to save {question_type} questions to {csv_file}: {e}")
-                logger.debug(f"CSV save error details for {question_type}:", exc_info=True)
-                # Continue with other question types instead of failing entirely
-
         # Log CSV operation summary
         logger.info("CSV operation summary:")
-        logger.info(f"  Successful: {csv_operation_stats['successful']} files")
-        logger.info(f"  Failed: {csv_operation_stats['failed']} files")
-        logger.info(f"  Skipped: {csv_operation_stats['skipped']} files")
+        logger.info(f"  Successful: {writer_stats.get('batches_written', 0)} batches")
+        logger.info(f"  Failed: {writer_stats.get('batches_failed', 0)} batches ({writer_stats.get('rows_failed', 0)} rows)")
+        logger.info(f"  Skipped: {sum(1 for count in scraped_by_type.values() if not count)} files")
         logger.info(f"  Total new questions saved: {total_new_questions}")
+        logger.info(f"  Duplicate content skipped: {writer_stats.get('duplicates_skipped', 0)}")
+        logger.info(f"  Near duplicates found: {writer_stats.get('near_duplicates', 0)}")
+        logger.info(f"  Write time: avg {writer_stats.get('avg_write_seconds', 0):.3f}s, "
+                    f"max {writer_stats.get('max_write_seconds', 0):.3f}s per batch")
+        logger.info(f"  Producer stalls: {writer_stats.get('backpressure_waits', 0)} "
+                    f"({writer_stats.get('backpressure_seconds', 0):.1f}s waiting on the writer)")
 
         # Validate saved CSV files
         if total_new_questions > 0 and not args.skip_validation:
@@ -756,7 +883,7 @@ async def main():
                         # Only upload files that have new questions
                         files_to_upload = {}
                         for question_type, file_path in csv_files.items():
-                            if question_type in questions_by_type and questions_by_type[question_type]:
+                            if scraped_by_type.get(question_type):
                                 files_to_upload[question_type] = file_path
                                 logger.debug(f"Will upload {question_type}: {file_path}")
                         
@@ -835,26 +962,35 @@ async def main():
                         
                 print(f"\nTo add these mappings, edit config/mappings.json and add the")
                 print(f"unmapped values to the appropriate mapping categories.")
+                print(f"For suggested categories, run: python scripts/resolve_unmapped.py --kind <type> <values>")
                 print("="*60)
             else:
                 logger.info("All values were successfully mapped")
+            
+            fuzzy_matches = scraper.get_fuzzy_matches()
+            if any(fuzzy_matches.values()):
+                print("\nFuzzy-mapped values (consider adding them to config/mappings.json):")
+                for mapping_type, matches in fuzzy_matches.items():
+                    for value, match in sorted(matches.items()):
+                        print(f"  {mapping_type}: '{value}' -> '{match.value}' "
+                              f"(closest to '{match.synonym}', score {match.score:.2f})")
         except Exception as e:
             logger.error(f"Error checking unmapped values: {e}")
             logger.debug("Unmapped values check error details:", exc_info=True)
 
         # Print final summary
-        final_indices = indexer.get_all_indices()
+        final_indices = scraper.indexer.get_all_indices()
         
         logger.info("="*60)
         logger.info("SCRAPING SESSION COMPLETED SUCCESSFULLY")
         logger.info("="*60)
         logger.info(f"Total new questions scraped: {total_new_questions}")
         
-        for qtype, qlist in questions_by_type.items():
-            if qlist:
+        for qtype, count in scraped_by_type.items():
+            if count:
                 csv_file = config['storage']['csv_files'][qtype]
                 stats = csv_handler.get_csv_stats(csv_file)
-                logger.info(f"  {qtype.replace('_', ' ').title()}: {len(qlist)} new, {stats['total_questions']} total")
+                logger.info(f"  {qtype.replace('_', ' ').title()}: {count} new, {stats['total_questions']} total")
         
         logger.info(f"Question indices after run:")
         for qtype, count in final_indices.items():
@@ -887,11 +1023,11 @@ async def main():
         print("="*60)
         print(f"Total new questions scraped: {total_new_questions}")
         
-        for qtype, qlist in questions_by_type.items():
-            if qlist:
+        for qtype, count in scraped_by_type.items():
+            if count:
                 csv_file = config['storage']['csv_files'][qtype]
                 stats = csv_handler.get_csv_stats(csv_file)
-                print(f"  {qtype.replace('_', ' ').title()}: {len(qlist)} new, {stats['total_questions']} total")
+                print(f"  {qtype.replace('_', ' ').title()}: {count} new, {stats['total_questions']} total")
         
         print(f"\nQuestion indices after run:")
         for qtype, count in final_indices.items():
@@ -922,7 +1058,7 @@ async def main():
         print(f"Mode: {'Overwrite' if args.overwrite else 'Append'}")
         
         # Print validation summary if not skipped
-        if not args.skip_validation and 'validation_summary' in locals():
+        if not args.skip_validation:
             print(f"\nData Quality:")
             print(f"  Valid questions: {validation_summary['valid_questions']}")
             print(f"  Invalid questions: {validation_summary['invalid_questions']}")
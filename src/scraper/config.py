@@ -7,9 +7,53 @@ consistency across the codebase and provide proper fallback behavior.
 
 import json
 import logging
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, List, Optional
 from pathlib import Path
 
+from utils.fuzzy_index import TrigramIndex, FuzzyMatch, DEFAULT_FUZZY_THRESHOLD
+
+# Mapping kinds and the configuration section each one is read from
+MAPPING_SECTIONS = {
+    'difficulty': 'difficulty_mapping',
+    'domain': 'domain_mapping',
+    'topic': 'topic_mapping'
+}
+
+# Maximum number of memoized fallback results kept per configuration
+FALLBACK_MEMO_SIZE = 4096
+
+
+def build_mapping_index(mappings: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+    """
+    Compile mapping sections into lowercase reverse dictionaries (raw -> standard).
+
+    When a raw value is listed under several standard values, the first one
+    in file order wins, as with the original linear scan.
+    """
+    index = {}
+    for kind, section in MAPPING_SECTIONS.items():
+        reverse = {}
+        for std_value, raw_values in mappings.get(section, {}).items():
+            if not isinstance(raw_values, list):
+                continue
+            for raw_value in raw_values:
+                reverse.setdefault(str(raw_value).lower(), std_value)
+        index[kind] = reverse
+    return index
+
+
+def build_fuzzy_index(mappings: Dict[str, Any], index: Dict[str, Dict[str, str]],
+                      threshold: float = DEFAULT_FUZZY_THRESHOLD) -> Dict[str, TrigramIndex]:
+    """Trigram indexes over every synonym and standard value, per kind."""
+    fuzzy = {}
+    for kind, section in MAPPING_SECTIONS.items():
+        synonyms = dict(index[kind])
+        for std_value in mappings.get(section, {}):
+            synonyms.setdefault(std_value.lower(), std_value)
+        fuzzy[kind] = TrigramIndex(synonyms, threshold)
+    return fuzzy
+
 
 class ScraperConfig:
     """
@@ -19,17 +63,32 @@ class ScraperConfig:
     configuration file, providing a unified interface for mapping operations.
     """
     
-    def __init__(self, mappings_file: str = "config/mappings.json"):
+    def __init__(self, mappings_file: str = "config/mappings.json", fuzzy_threshold: Optional[float] = None):
         """
         Initialize the configuration handler.
         
         Args:
             mappings_file: Path to the JSON file containing all mapping definitions
+            fuzzy_threshold: Minimum similarity for resolving values that miss the
+                mappings to the closest known synonym; None disables fuzzy resolution
         """
         self.logger = logging.getLogger(__name__)
         self.mappings_file = mappings_file
+        self.fuzzy_threshold = fuzzy_threshold
         self.mappings = self._load_mappings()
         
+        # Lowercase raw -> standard index per kind, an LRU memo of (kind, raw value)
+        # -> result for values missing from the index, and the trigram indexes.
+        # Replaced as one tuple on reload so lookups never mix old and new state.
+        self._lookup = self._build_lookup(self.mappings)
+        
+        # Values resolved by fuzzy matching, for review
+        self._fuzzy_matches = {
+            'difficulty': {},
+            'domain': {},
+            'topic': {}
+        }
+        
         # Store original unmapped values for fallback behavior
         self._unmapped_values = {
             'difficulty': set(),
@@ -37,6 +96,11 @@ class ScraperConfig:
             'topic': set()
         }
     
+    def _build_lookup(self, mappings: Dict[str, Any]) -> tuple:
+        index = build_mapping_index(mappings)
+        fuzzy = build_fuzzy_index(mappings, index, self.fuzzy_threshold or DEFAULT_FUZZY_THRESHOLD)
+        return index, OrderedDict(), fuzzy
+    
     def _load_mappings(self) -> Dict[str, Any]:
         """
         Load all mapping dictionaries from the configuration file.
@@ -86,20 +150,7 @@ class ScraperConfig:
         Returns:
             Standardized difficulty level (e.g., "Easy", "Normal", "Hard") or original value
         """
-        # Mapping lookup - check all standardized difficulties against raw values
-        for std_difficulty, raw_values in self.mappings['difficulty_mapping'].items():
-            if raw_difficulty.lower() in [v.lower() for v in raw_values]:
-                self.logger.debug(f"Mapped difficulty '{raw_difficulty}' -> '{std_difficulty}'")
-                return std_difficulty
-        
-        # Fallback behavior - log warning and use original value
-        if raw_difficulty not in self._unmapped_values['difficulty']:
-            self.logger.warning(f"Unknown difficulty level: '{raw_difficulty}'. "
-                              f"Using original value as fallback. "
-                              f"Consider adding to difficulty_mapping in {self.mappings_file}")
-            self._unmapped_values['difficulty'].add(raw_difficulty)
-        
-        return raw_difficulty
+        return self._map('difficulty', raw_difficulty)
     
     def map_domain(self, raw_domain: str) -> str:
         """
@@ -114,20 +165,7 @@ class ScraperConfig:
         Returns:
             Standardized domain category (e.g., "Culture", "Science", "Nature") or original value
         """
-        # Mapping lookup - check all standardized domains against raw values
-        for std_domain, raw_values in self.mappings['domain_mapping'].items():
-            if raw_domain.lower() in [v.lower() for v in raw_values]:
-                self.logger.debug(f"Mapped domain '{raw_domain}' -> '{std_domain}'")
-                return std_domain
-        
-        # Fallback behavior - log warning and use original value
-        if raw_domain not in self._unmapped_values['domain']:
-            self.logger.warning(f"Unknown domain: '{raw_domain}'. "
-                              f"Using original value as fallback. "
-                              f"Consider adding to domain_mapping in {self.mappings_file}")
-            self._unmapped_values['domain'].add(raw_domain)
-        
-        return raw_domain
+        return self._map('domain', raw_domain)
     
     def map_topic(self, raw_topic: str) -> str:
         """
@@ -142,20 +180,101 @@ class ScraperConfig:
         Returns:
             Standardized topic category (e.g., "Movies", "Animals", "General") or original value
         """
-        # Mapping lookup - check all standardized topics against raw values
-        for std_topic, raw_values in self.mappings['topic_mapping'].items():
-            if raw_topic.lower() in [v.lower() for v in raw_values]:
-                self.logger.debug(f"Mapped topic '{raw_topic}' -> '{std_topic}'")
-                return std_topic
+        return self._map('topic', raw_topic)
+    
+    def _map(self, kind: str, raw_value: str) -> str:
+        """Look up a raw value in the index, falling back to the memoized fallback."""
+        index, memo, fuzzy = self._lookup
+        std_value = index[kind].get(raw_value.lower())
+        if std_value is not None:
+            self.logger.debug(f"Mapped {kind} '{raw_value}' -> '{std_value}'")
+            return std_value
+        
+        key = (kind, raw_value)
+        if key in memo:
+            memo.move_to_end(key)
+            return memo[key]
+        
+        result = self._fallback(kind, raw_value, fuzzy[kind] if self.fuzzy_threshold is not None else None)
+        memo[key] = result
+        if len(memo) > FALLBACK_MEMO_SIZE:
+            memo.popitem(last=False)
+        return result
+    
+    def _fallback(self, kind: str, raw_value: str, fuzzy: Optional[TrigramIndex] = None) -> str:
+        """Fuzzy resolution if enabled, else log warning and use original value."""
+        if fuzzy is not None:
+            match = fuzzy.resolve(raw_value)
+            if match is not None:
+                self.logger.info(f"Fuzzy-mapped {kind} '{raw_value}' -> '{match.value}' "
+                                 f"(closest to '{match.synonym}', score {match.score:.2f})")
+                self._fuzzy_matches[kind][raw_value] = match
+                return match.value
         
-        # Fallback behavior - log warning and use original value
-        if raw_topic not in self._unmapped_values['topic']:
-            self.logger.warning(f"Unknown topic: '{raw_topic}'. "
+        if raw_value not in self._unmapped_values[kind]:
+            label = 'difficulty level' if kind == 'difficulty' else kind
+            self.logger.warning(f"Unknown {label}: '{raw_value}'. "
                               f"Using original value as fallback. "
-                              f"Consider adding to topic_mapping in {self.mappings_file}")
-            self._unmapped_values['topic'].add(raw_topic)
+                              f"Consider adding to {MAPPING_SECTIONS[kind]} in {self.mappings_file}")
+            self._unmapped_values[kind].add(raw_value)
         
-        return raw_topic
+        return raw_value
+    
+    def map_many(self, kind: str, raw_values: Iterable[str]) -> Any:
+        """
+        Map many raw values of one kind, e.g. a column of an existing CSV.
+        
+        Each distinct value is looked up once. A pandas Series is mapped to a
+        Series with the same index; any other iterable gives a list.
+        
+        Args:
+            kind: 'difficulty', 'domain' or 'topic'
+            raw_values: Raw values to map
+            
+        Returns:
+            Mapped values in input order
+        """
+        if kind not in MAPPING_SECTIONS:
+            raise ValueError(f"Unknown mapping kind: '{kind}'. Expected one of {list(MAPPING_SECTIONS)}")
+        
+        if hasattr(raw_values, 'unique') and hasattr(raw_values, 'map'):
+            lookup = {value: self._map(kind, value) for value in raw_values.unique() if isinstance(value, str)}
+            return raw_values.map(lambda value: lookup.get(value, value))
+        
+        lookup: Dict[str, str] = {}
+        mapped: List[str] = []
+        for value in raw_values:
+            if value not in lookup:
+                lookup[value] = self._map(kind, value) if isinstance(value, str) else value
+            mapped.append(lookup[value])
+        return mapped
+    
+    def is_mapped(self, kind: str, raw_value: str) -> bool:
+        """Whether a raw value is listed in the mappings (exact, case-insensitive)."""
+        return raw_value.lower() in self._lookup[0][kind]
+    
+    def suggest(self, kind: str, raw_value: str) -> Optional[FuzzyMatch]:
+        """
+        Closest known synonym for a raw value, ignoring the fuzzy threshold.
+        
+        Args:
+            kind: 'difficulty', 'domain' or 'topic'
+            raw_value: Raw value to look up
+            
+        Returns:
+            FuzzyMatch with the standard value, the synonym it is closest to and
+            the similarity score, or None if no synonym shares a trigram with it
+        """
+        return self._lookup[2][kind].best(raw_value)
+    
+    def get_fuzzy_matches(self) -> Dict[str, Dict[str, FuzzyMatch]]:
+        """
+        Get the values that were resolved by fuzzy matching since the last reload.
+        
+        Returns:
+            Dictionary with 'difficulty', 'domain', and 'topic' keys mapping raw values to their FuzzyMatch
+        """
+        return {kind: dict(matches) for kind, matches in self._fuzzy_matches.items()}
     
     def get_unmapped_values(self) -> Dict[str, set]:
         """
@@ -179,7 +298,19 @@ class ScraperConfig:
         Useful for picking up changes to the mappings file without restarting the application.
         """
         self.logger.info("Reloading mappings from configuration file")
-        self.mappings = self._load_mappings()
+        
+        # Build the new index first so a failed load leaves the current mappings
+        # in place, then swap the lookup state in a single assignment
+        mappings = self._load_mappings()
+        lookup = self._build_lookup(mappings)
+        
+        self.mappings = mappings
+        self._lookup = lookup
+        self._fuzzy_matches = {
+            'difficulty': {},
+            'domain': {},
+            'topic': {}
+        }
         
         # Clear unmapped values cache to re-evaluate with new mappings
         self._unmapped_values = {
@@ -1,8 +1,7 @@
 import asyncio
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
 from pathlib import Path
 import json
-import re
 import logging
 import random
 import sys
@@ -15,16 +14,28 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from scraper.base import BaseScraper
 from scraper.config import ScraperConfig
-from scraper.media import MediaHandler, MediaReference
+from scraper.media import MediaHandler, MediaReference, MediaCapture
 from utils.rate_limiter import RateLimiter
 from utils.indexing import QuestionIndexer
 from utils.question_classifier import QuestionClassifier
 from utils.text_processor import TextProcessor
+from utils.patterns import BLOCK_ANSWER_RES
+from utils.results_parser import tokenize_results
+from utils.answer_matcher import match_answer, LOW_CONFIDENCE
+from utils.explanation_parser import (
+    ResultsParsePool, parse_full_page_text, parse_text_results,
+    extract_description_from_page_text, extract_correct_answer_from_page_text,
+    extract_funtrivia_explanation, clean_explanation_text
+)
+from utils.layout_cache import LayoutCache, layout_fingerprint
 from constants import (
     TIMEOUTS, USER_AGENTS, DESCRIPTION_SELECTORS, 
     THRESHOLDS, DEFAULT_PATHS
 )
 
+# Sentinel placed on the stream queue once all category workers have finished
+_STREAM_END = object()
+
 
 class FunTriviaScraper(BaseScraper):
     """
@@ -32,20 +43,27 @@ class FunTriviaScraper(BaseScraper):
     description extraction, and organized modular structure.
     """
     
-    def __init__(self, config_path: str = None, speed_profile: str = "normal"):
+    def __init__(self, config_path: str = None, speed_profile: str = "normal", metrics=None,
+                 base_url: Optional[str] = None):
         config_path = config_path or DEFAULT_PATHS['config_file']
         super().__init__(config_path)
         
+        # Site root override, e.g. a local mock site (utils/mock_site.py) for benchmarks
+        if base_url:
+            self.config['scraper']['base_url'] = base_url.rstrip('/')
+        
         # Initialize centralized configuration and mapping handler
         # This replaces the old _load_mappings approach with centralized config management
         mappings_file = DEFAULT_PATHS['mappings_file']
-        self.scraper_config = ScraperConfig(mappings_file)
+        fuzzy_settings = self.config.get('scraper', {}).get('fuzzy_mapping', {})
+        fuzzy_threshold = fuzzy_settings.get('threshold', 0.75) if fuzzy_settings.get('enabled', False) else None
+        self.scraper_config = ScraperConfig(mappings_file, fuzzy_threshold=fuzzy_threshold)
         
         # Initialize media handler for proper file management
-        self.media_handler = MediaHandler(self.config)
+        self.media_handler = MediaHandler(self.config, metrics=metrics)
         
         # Initialize other components
-        self.indexer = QuestionIndexer()
+        self.indexer = QuestionIndexer(block_size=self.config.get('scraper', {}).get('id_block_size', 100))
         self.rate_limiter = RateLimiter(
             self.config['scraper']['rate_limit']['requests_per_minute']
         )
@@ -58,6 +76,17 @@ class FunTriviaScraper(BaseScraper):
         # Initialize incremental saving - this will save questions immediately after each quiz
         self.incremental_save = True  # Enable incremental saving by default
         self.csv_handler = None  # Will be initialized when needed
+        self.question_writer = None  # Background writer, started in initialize()
+        self.question_store = None  # SQLite store when storage.backend is "sqlite"
+        self.run_id = None  # Run id in the question store
+        self.signature_index = None  # Content signatures of stored questions, for ingest-time dedup
+        self.near_duplicate_index = None  # MinHash/LSH index of stored questions, for near-duplicate detection
+        self.metrics = metrics  # Optional ScrapingMetrics for writer timings
+        self.layout_cache = LayoutCache.from_config(self.config)  # Extraction strategy per page layout, None if disabled
+        self.parse_pool = ResultsParsePool.from_config(self.config)  # Results page parsing off the event loop
+        
+        # Streaming: max processed questions buffered between category workers and the consumer
+        self.stream_queue_size = self.config.get('scraper', {}).get('stream_queue_size', 100)
         
         # SPEED OPTIMIZATION: Load speed profile
         self.speed_profile = speed_profile
@@ -130,10 +159,42 @@ class FunTriviaScraper(BaseScraper):
             self.browser = await playwright.chromium.launch(headless=True)
             self._ensure_directories()
             
+            # Pooled HTTP session shared by all media downloads
+            await self.media_handler.open()
+            
             # Initialize CSV handler for incremental saving
             if self.incremental_save:
                 from utils.csv_handler import CSVHandler
+                from utils.question_writer import QuestionWriter
                 self.csv_handler = CSVHandler(self.config['storage']['output_dir'])
+                if self.config['storage'].get('backend', 'csv') == 'sqlite':
+                    from utils.storage import QuestionStore
+                    self.question_store = QuestionStore.from_config(self.config)
+                    self.run_id = self.question_store.start_run(self.speed_profile)
+                    self.logger.info(f"Saving to question store {self.question_store.db_path} (run {self.run_id})")
+                if self.config['storage'].get('dedup', {}).get('enabled', True):
+                    from utils.dedup import SignatureIndex
+                    self.signature_index = SignatureIndex.from_config(self.config, store=self.question_store)
+                    csv_paths = [os.path.join(self.config['storage']['output_dir'], csv_file)
+                                 for csv_file in self.config['storage']['csv_files'].values()]
+                    await asyncio.to_thread(self.signature_index.load, csv_paths, self.question_store)
+                if self.config['storage'].get('near_duplicates', {}).get('enabled', False):
+                    from utils.near_dedup import NearDuplicateIndex
+                    self.near_duplicate_index = NearDuplicateIndex.from_config(self.config)
+                    if self.question_store is not None:
+                        await asyncio.to_thread(self.near_duplicate_index.load_store, self.question_store,
+                                                list(self.config['storage']['csv_files']))
+                    else:
+                        await asyncio.to_thread(self.near_duplicate_index.load_csv_files,
+                                                [os.path.join(self.config['storage']['output_dir'], csv_file)
+                                                 for csv_file in self.config['storage']['csv_files'].values()])
+                self.question_writer = QuestionWriter.from_config(
+                    self.csv_handler, self.config, metrics=self.metrics,
+                    store=self.question_store, run_id=self.run_id,
+                    signature_index=self.signature_index,
+                    near_duplicate_index=self.near_duplicate_index
+                )
+                await self.question_writer.start()
                 self.logger.info("Incremental saving enabled - questions will be saved after each quiz")
             
             self.logger.info("Scraper initialized successfully")
@@ -142,8 +203,50 @@ class FunTriviaScraper(BaseScraper):
             self.logger.error(f"Failed to initialize scraper: {e}")
             raise
 
+    async def flush_writes(self) -> Dict[str, Any]:
+        """
+        Wait until all questions queued for incremental saving are on disk.
+        
+        Returns:
+            Writer statistics, or an empty dict if incremental saving is disabled
+        """
+        if not self.question_writer:
+            return {}
+        return await self.question_writer.flush()
+
     async def close(self) -> None:
-        """Close the browser instance."""
+        """Drain pending writes and close the browser instance."""
+        if self.question_writer:
+            try:
+                await self.question_writer.close()
+            except Exception as e:
+                self.logger.error(f"Error closing question writer: {e}")
+            self.question_writer = None
+        
+        if self.question_store:
+            try:
+                self.question_store.finish_run(self.run_id)
+                self.question_store.close()
+            except Exception as e:
+                self.logger.error(f"Error closing question store: {e}")
+            self.question_store = None
+        
+        # Hand unused reserved question IDs back so normal runs leave no gaps
+        self.indexer.release()
+        
+        if self.layout_cache:
+            try:
+                self.layout_cache.save()
+            except Exception as e:
+                self.logger.error(f"Error saving layout cache: {e}")
+        
+        try:
+            await self.media_handler.close()
+        except Exception as e:
+            self.logger.error(f"Error closing media session: {e}")
+        
+        self.parse_pool.close()
+        
         if self.browser:
             try:
                 await self.browser.close()
@@ -153,11 +256,39 @@ class FunTriviaScraper(BaseScraper):
                 self.logger.error(f"Error closing browser: {e}")
 
     async def scrape_questions(self, max_questions: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Scrape questions from FunTrivia.com with comprehensive logging and incremental saving."""
+        """
+        Scrape questions from FunTrivia.com and return them as a list.
+        
+        Thin wrapper around iter_questions() for callers that want the whole
+        result set at once. Prefer iter_questions() for large runs, since this
+        keeps every processed question in memory until scraping finishes.
+        """
+        questions = []
+        async for question in self.iter_questions(max_questions=max_questions):
+            questions.append(question)
+        return questions
+
+    async def iter_questions(self, max_questions: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Scrape questions from FunTrivia.com, yielding each processed question as its quiz finishes.
+        
+        STREAMING PIPELINE:
+        ==================
+        Category workers push processed questions onto a bounded asyncio.Queue
+        and this generator drains it. When the consumer falls behind, workers
+        block on the full queue, so memory stays bounded by the queue size
+        (scraper.stream_queue_size) regardless of how many questions a run produces.
+        
+        Usage:
+            async for question in scraper.iter_questions(max_questions=100):
+                ...
+        
+        Stopping iteration early (break, max_questions reached, or an exception
+        in the consumer) cancels the remaining category workers.
+        """
         if not self.browser:
             await self.initialize()
 
-        questions = []  # This will track all questions for summary, but they're saved incrementally
         scraping_stats = {
             'categories_processed': 0,
             'categories_failed': 0,
@@ -165,11 +296,17 @@ class FunTriviaScraper(BaseScraper):
             'quizzes_failed': 0,
             'questions_extracted': 0,
             'questions_saved': 0,  # Track questions actually saved to files
+            'questions_emitted': 0,  # Track questions handed to the stream consumer
             'questions_by_type': {'multiple_choice': 0, 'true_false': 0, 'sound': 0},
             'media_downloads': {'attempted': 0, 'successful': 0, 'failed': 0},
-            'mapping_issues': {'domain': set(), 'topic': set(), 'difficulty': set()}
+            'mapping_issues': {'domain': set(), 'topic': set(), 'difficulty': set()},
+            'answer_matching': {'matched': 0, 'low_confidence': 0, 'unmatched': 0}
         }
         
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.stream_queue_size)
+        producer = None
+        yielded = 0
+        
         try:
             self.logger.info("="*60)
             self.logger.info("STARTING FUNTIVIA SCRAPING SESSION")
@@ -181,6 +318,7 @@ class FunTriviaScraper(BaseScraper):
             self.logger.info(f"Rate limit: {self.config['scraper']['rate_limit']['requests_per_minute']} requests/minute")
             self.logger.info(f"Network wait: {'ENABLED' if self.wait_for_networkidle else 'DISABLED (faster)'}")
             self.logger.info(f"Incremental saving: {'ENABLED' if self.incremental_save else 'DISABLED'} - questions {'will be saved immediately' if self.incremental_save else 'saved at end'}")
+            self.logger.info(f"Streaming: questions are yielded as quizzes finish (queue size {self.stream_queue_size})")
             
             # Start performance tracking
             import time
@@ -189,42 +327,70 @@ class FunTriviaScraper(BaseScraper):
             categories = await self._get_categories()
             self.logger.info(f"Discovered {len(categories)} categories for processing")
             
-            # Process categories concurrently with detailed logging
-            questions = await self._process_categories_concurrently(categories, max_questions, scraping_stats)
-            
-            # Log final statistics
-            self._log_scraping_summary(scraping_stats, questions)
+            # Process categories concurrently in the background, streaming results through the queue
+            producer = asyncio.create_task(
+                self._process_categories_concurrently(categories, max_questions, scraping_stats, queue)
+            )
             
-            return questions
+            while True:
+                question = await queue.get()
+                if question is _STREAM_END:
+                    break
+                
+                yield question
+                yielded += 1
+                
+                if max_questions and yielded >= max_questions:
+                    self.logger.info(f"Reached maximum questions limit ({max_questions}), stopping stream")
+                    break
             
         except Exception as e:
             self.logger.error(f"Fatal error during question scraping: {e}")
             self.logger.error("Stack trace:", exc_info=True)
             # Log partial results before re-raising
-            if questions:
-                self.logger.warning(f"Partial results available: {len(questions)} questions scraped before error")
-                self._log_scraping_summary(scraping_stats, questions)
+            if yielded:
+                self.logger.warning(f"Partial results available: {yielded} questions scraped before error")
             raise
+        finally:
+            if producer is not None:
+                if not producer.done():
+                    producer.cancel()
+                try:
+                    await producer
+                except asyncio.CancelledError:
+                    self.logger.debug("Category workers cancelled after stream stopped")
+                except Exception as e:
+                    self.logger.error(f"Category processing failed: {e}")
+            
+            # Log final statistics
+            self._log_scraping_summary(scraping_stats, yielded)
 
-    async def _process_categories_concurrently(self, categories: List[str], max_questions: Optional[int], stats: Dict) -> List[Dict[str, Any]]:
-        """Process categories concurrently with detailed logging and error handling."""
-        questions = []
-        semaphore = asyncio.Semaphore(self.config['scraper']['concurrency'])
+    async def _process_categories_concurrently(self, categories: List[str], max_questions: Optional[int], stats: Dict, queue: asyncio.Queue) -> None:
+        """
+        Process categories concurrently, pushing each processed question onto the stream queue.
+        
+        Always puts the _STREAM_END sentinel on the queue when done, even on failure,
+        so the consuming generator never waits forever.
+        """
+        def limit_reached() -> bool:
+            return bool(max_questions) and stats['questions_emitted'] >= max_questions
         
-        async def scrape_category(category: str) -> List[Dict[str, Any]]:
+        async def scrape_category(category: str) -> None:
             async with semaphore:
                 category_stats = {'quizzes_attempted': 0, 'quizzes_successful': 0, 'questions_found': 0}
                 
                 try:
+                    if limit_reached():
+                        return
+                    
                     self.logger.info(f"Processing category: {category}")
                     stats['categories_processed'] += 1
                     
                     quiz_links = await self._get_quiz_links(category)
                     self.logger.info(f"Found {len(quiz_links)} quizzes in category {category}")
                     
-                    category_questions = []
                     for quiz_link in quiz_links:
-                        if max_questions and len(questions) >= max_questions:
+                        if limit_reached():
                             self.logger.info(f"Reached maximum questions limit ({max_questions}), stopping category processing")
                             break
                         
@@ -235,7 +401,6 @@ class FunTriviaScraper(BaseScraper):
                             async with self.rate_limiter:
                                 quiz_questions = await self._scrape_quiz(quiz_link, stats)
                                 if quiz_questions:
-                                    category_questions.extend(quiz_questions)
                                     category_stats['quizzes_successful'] += 1
                                     category_stats['questions_found'] += len(quiz_questions)
                                     
@@ -246,9 +411,18 @@ class FunTriviaScraper(BaseScraper):
                                     self.logger.debug(f"Quiz successful: {len(quiz_questions)} questions from {quiz_link}")
                                 else:
                                     self.logger.warning(f"No questions extracted from quiz: {quiz_link}")
-                                
-                                await self._random_delay()
+                            
+                            # Hand questions to the consumer; blocks when the queue is full (backpressure)
+                            for question in quiz_questions or []:
+                                if limit_reached():
+                                    break
+                                await queue.put(question)
+                                stats['questions_emitted'] += 1
+                            
+                            await self._random_delay()
                         
+                        except asyncio.CancelledError:
+                            raise
                         except Exception as quiz_error:
                             stats['quizzes_failed'] += 1
                             self.logger.error(f"Failed to scrape quiz {quiz_link}: {quiz_error}")
@@ -260,34 +434,34 @@ class FunTriviaScraper(BaseScraper):
                     success_rate = (category_stats['quizzes_successful'] / category_stats['quizzes_attempted']) * 100 if category_stats['quizzes_attempted'] > 0 else 0
                     self.logger.info(f"Category '{category}' completed: {category_stats['questions_found']} questions from {category_stats['quizzes_successful']}/{category_stats['quizzes_attempted']} quizzes ({success_rate:.1f}% success rate)")
                     
-                    return category_questions
-                    
+                except asyncio.CancelledError:
+                    raise
                 except Exception as e:
                     stats['categories_failed'] += 1
                     self.logger.error(f"Category processing failed for {category}: {e}")
                     self.logger.debug("Category processing error details:", exc_info=True)
-                    return []
 
-        # Execute concurrent scraping with progress logging
-        self.logger.info(f"Starting concurrent processing of {len(categories)} categories with {self.config['scraper']['concurrency']} workers")
-        
-        tasks = [scrape_category(category) for category in categories]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Process results and handle any exceptions
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                self.logger.error(f"Category {i+1} failed with exception: {result}")
-                self.logger.debug("Category exception details:", exc_info=True)
-                continue
+        cancelled = False
+        try:
+            semaphore = asyncio.Semaphore(self.config['scraper']['concurrency'])
             
-            questions.extend(result)
-            if max_questions and len(questions) >= max_questions:
-                questions = questions[:max_questions]
-                self.logger.info(f"Trimmed results to maximum {max_questions} questions")
-                break
-
-        return questions
+            # Execute concurrent scraping with progress logging
+            self.logger.info(f"Starting concurrent processing of {len(categories)} categories with {self.config['scraper']['concurrency']} workers")
+            tasks = [scrape_category(category) for category in categories]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # Log any exceptions that escaped the per-category handler
+            for i, result in enumerate(results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Category {i+1} failed with exception: {result}")
+                    self.logger.debug("Category exception details:", exc_info=True)
+        except asyncio.CancelledError:
+            # The consumer stopped reading and cancelled us - no sentinel needed
+            cancelled = True
+            raise
+        finally:
+            if not cancelled:
+                await queue.put(_STREAM_END)
 
     @retry(
         stop=stop_after_attempt(2),
@@ -303,6 +477,12 @@ class FunTriviaScraper(BaseScraper):
         
         quiz_log_id = quiz_url.split('/')[-1][:30]  # Short identifier for logging
         
+        # Optionally keep the media the quiz page loads, so it is not downloaded a second time
+        media_capture = None
+        if self.config['storage'].get('media', {}).get('capture_from_browser', False):
+            media_capture = MediaCapture.from_config(self.config)
+            media_capture.attach(page)
+        
         try:
             self.logger.debug(f"[{quiz_log_id}] Starting quiz scraping process")
             
@@ -344,13 +524,15 @@ class FunTriviaScraper(BaseScraper):
 
             # Step 6: Process questions through existing pipeline for proper formatting
             processed_questions = await self._process_extracted_questions(
-                questions_with_results, {}, quiz_metadata, stats, quiz_log_id, quiz_url
+                questions_with_results, {}, quiz_metadata, stats, quiz_log_id, quiz_url,
+                media_capture=media_capture
             )
             
             # Step 6b: Apply parallel media downloads if enabled and questions exist
             if self.parallel_media_downloads and processed_questions:
                 self.logger.debug(f"[{quiz_log_id}] Starting parallel media downloads for {len(processed_questions)} questions")
-                processed_questions = await self._parallel_media_download(processed_questions, quiz_log_id)
+                processed_questions = await self._parallel_media_download(processed_questions, quiz_log_id,
+                                                                          media_capture=media_capture)
                 
             if processed_questions:
                 self.logger.info(f"[{quiz_log_id}] Successfully processed {len(processed_questions)} questions")
@@ -358,10 +540,10 @@ class FunTriviaScraper(BaseScraper):
                     stats['questions_extracted'] += len(processed_questions)
                 
                 # Step 7: INCREMENTAL SAVE - Save questions immediately after processing
-                if self.incremental_save and self.csv_handler:
+                if self.incremental_save and self.question_writer:
                     saved_count = await self._save_questions_incrementally(processed_questions, quiz_log_id)
                     if saved_count > 0:
-                        self.logger.info(f"[{quiz_log_id}] 🎉 QUIZ COMPLETE: {saved_count} questions saved to CSV files!")
+                        self.logger.info(f"[{quiz_log_id}] 🎉 QUIZ COMPLETE: {saved_count} questions queued for CSV files!")
                     else:
                         self.logger.warning(f"[{quiz_log_id}] ⚠️ Quiz processed but no questions were saved")
             else:
@@ -381,13 +563,15 @@ class FunTriviaScraper(BaseScraper):
                 stats['quizzes_failed'] += 1
             return []
         finally:
+            if media_capture is not None:
+                await media_capture.close()
             try:
                 await context.close()
                 self.logger.debug(f"[{quiz_log_id}] Browser context closed")
             except Exception as e:
                 self.logger.debug(f"[{quiz_log_id}] Error closing context: {e}")
 
-    async def _process_extracted_questions(self, questions: List[Dict[str, Any]], descriptions: Dict[str, str], metadata: Dict[str, str], stats: Dict = None, quiz_log_id: str = "", quiz_url: str = "") -> List[Dict[str, Any]]:
+    async def _process_extracted_questions(self, questions: List[Dict[str, Any]], descriptions: Dict[str, str], metadata: Dict[str, str], stats: Dict = None, quiz_log_id: str = "", quiz_url: str = "", media_capture: Optional[MediaCapture] = None) -> List[Dict[str, Any]]:
         """Process and enhance extracted questions with comprehensive logging and error handling."""
         processed_questions = []
         
@@ -495,7 +679,8 @@ class FunTriviaScraper(BaseScraper):
                                 url=audio_url,
                                 question_id=question_id,
                                 media_type='audio',
-                                user_agent=self._get_random_user_agent()
+                                user_agent=self._get_random_user_agent(),
+                                capture=media_capture
                             )
                             
                             if media_filename:
@@ -519,7 +704,8 @@ class FunTriviaScraper(BaseScraper):
                                 url=image_url,
                                 question_id=question_id,
                                 media_type='image',
-                                user_agent=self._get_random_user_agent()
+                                user_agent=self._get_random_user_agent(),
+                                capture=media_capture
                             )
                             
                             if media_filename:
@@ -544,7 +730,7 @@ class FunTriviaScraper(BaseScraper):
                     "difficulty": mapped_difficulty,
                     "domain": mapped_domain,
                     "topic": mapped_topic,
-                    "correct_answer": question_data.get('correct_answer', options[0] if options else ''),
+                    "correct_answer": self._match_correct_answer(question_data, options, stats, quiz_log_id),
                     "description": cleaned_description,
                     "media_filename": media_filename,
                     "source_url": quiz_url
@@ -568,7 +754,43 @@ class FunTriviaScraper(BaseScraper):
         self.logger.info(f"[{quiz_log_id}] Processed {len(processed_questions)}/{len(questions)} questions successfully")
         return processed_questions
 
-    def _log_scraping_summary(self, stats: Dict, questions: List[Dict[str, Any]]) -> None:
+    def _match_correct_answer(self, question_data: Dict[str, Any], options: List[str],
+                              stats: Dict = None, quiz_log_id: str = "") -> str:
+        """
+        Resolve the extracted correct answer to the text of one of the options.
+        
+        Stores the match confidence as 'answer_confidence' on the question and
+        counts the outcome in stats['answer_matching']. Unmatched answers fall
+        back to the first option, as the CSV writer always did. This is the
+        only place that fallback happens: extractors leave 'correct_answer'
+        empty when the results page has none, so those count as unmatched.
+        """
+        raw_answer = question_data.get('correct_answer') or ''
+        match = match_answer(options, raw_answer)
+        question_data['answer_confidence'] = match.confidence
+        
+        counters = stats.get('answer_matching') if stats else None
+        if match.option is not None:
+            if counters is not None:
+                counters['matched'] += 1
+                if match.confidence < LOW_CONFIDENCE:
+                    counters['low_confidence'] += 1
+            if match.method != 'exact':
+                self.logger.debug(f"[{quiz_log_id}] Matched answer '{raw_answer}' -> '{match.option}' "
+                                  f"({match.method}, confidence {match.confidence:.2f})")
+            return match.option
+        
+        if counters is not None:
+            counters['unmatched'] += 1
+        if raw_answer:
+            self.logger.warning(f"[{quiz_log_id}] Could not match correct answer '{raw_answer}' with options {options}; "
+                                f"using first option")
+        else:
+            self.logger.warning(f"[{quiz_log_id}] No correct answer extracted for question "
+                                f"{question_data.get('questionNumber', '?')}; using first option")
+        return options[0].strip() if options else raw_answer
+
+    def _log_scraping_summary(self, stats: Dict, total_questions: int) -> None:
         """Log comprehensive scraping session summary."""
         
         self.logger.info("="*60)
@@ -578,15 +800,20 @@ class FunTriviaScraper(BaseScraper):
         # Overall statistics
         self.logger.info(f"Categories: {stats['categories_processed']} processed, {stats['categories_failed']} failed")
         self.logger.info(f"Quizzes: {stats['quizzes_processed']} processed, {stats['quizzes_failed']} failed")
-        self.logger.info(f"Questions: {stats['questions_extracted']} extracted, {len(questions)} total")
+        self.logger.info(f"Questions: {stats['questions_extracted']} extracted, {total_questions} total")
         
         # Incremental saving info
         if self.incremental_save:
             saved_count = stats.get('questions_saved', 0)
             self.logger.info(f"💾 INCREMENTAL SAVING: {saved_count} questions saved to CSV files during scraping")
             self.logger.info(f"📁 CSV files location: {self.config['storage']['output_dir']}")
-            if saved_count != len(questions):
-                self.logger.warning(f"⚠️ Mismatch: {len(questions)} extracted but {saved_count} saved")
+            if self.question_writer:
+                writer_stats = self.question_writer.get_stats()
+                self.logger.info(f"✍️ Writer: {writer_stats['batches_written']} batches, "
+                                 f"avg {writer_stats['avg_write_seconds']:.3f}s, max {writer_stats['max_write_seconds']:.3f}s per write, "
+                                 f"{writer_stats['backpressure_waits']} producer stalls ({writer_stats['backpressure_seconds']:.1f}s)")
+            if saved_count != total_questions:
+                self.logger.warning(f"⚠️ Mismatch: {total_questions} extracted but {saved_count} saved")
         
         # Success rates
         category_success_rate = (stats['categories_processed'] / (stats['categories_processed'] + stats['categories_failed'])) * 100 if (stats['categories_processed'] + stats['categories_failed']) > 0 else 0
@@ -603,9 +830,34 @@ class FunTriviaScraper(BaseScraper):
         if stats['media_downloads']['attempted'] > 0:
             media_success_rate = (stats['media_downloads']['successful'] / stats['media_downloads']['attempted']) * 100
             self.logger.info(f"Media downloads: {stats['media_downloads']['successful']}/{stats['media_downloads']['attempted']} successful ({media_success_rate:.1f}%)")
+            download_stats = self.media_handler.get_download_stats()
+            self.logger.info(f"Media transfer: {download_stats['bytes'] / (1024 * 1024):.1f} MB, "
+                             f"avg {download_stats['avg_seconds']:.2f}s, max {download_stats['max_seconds']:.2f}s per download")
         else:
             self.logger.info("Media downloads: No media files processed")
         
+        # Learned page layouts
+        if self.layout_cache:
+            for kind, layout_stats in self.layout_cache.get_stats().items():
+                self.logger.info(f"Layout cache ({kind}): {layout_stats['hit_rate'] * 100:.1f}% hit rate, "
+                                 f"{layout_stats['learned']} learned, {layout_stats['expired']} expired")
+        
+        # Results parsing off the event loop
+        parse_stats = self.parse_pool.get_stats()
+        if any(parse_stats.values()):
+            self.logger.info(f"Results parsing: {parse_stats['offloaded']} in worker processes "
+                             f"({self.parse_pool.workers} workers), {parse_stats['inline']} inline, "
+                             f"{parse_stats['fallbacks']} fallbacks")
+        
+        # Correct answers resolved to option text
+        answer_stats = stats.get('answer_matching', {})
+        answers_seen = answer_stats.get('matched', 0) + answer_stats.get('unmatched', 0)
+        if answers_seen:
+            mismatch_rate = answer_stats['unmatched'] / answers_seen * 100
+            self.logger.info(f"Answer matching: {answer_stats['matched']}/{answers_seen} matched to an option "
+                             f"({answer_stats['low_confidence']} low confidence), "
+                             f"{mismatch_rate:.1f}% unmatched fell back to the first option")
+        
         # Mapping issues
         unmapped_count = sum(len(values) for values in stats['mapping_issues'].values())
         if unmapped_count > 0:
@@ -1715,6 +1967,65 @@ class FunTriviaScraper(BaseScraper):
             self.logger.debug(f"Radio button interaction failed for pattern {pattern}: {e}")
             return False
 
+    async def _resolve_submit_button(self, page: Page, selectors: List[str]) -> Tuple[Any, Optional[str], Optional[str]]:
+        """
+        Find the visible, enabled submit button in one page round-trip.
+        
+        A single evaluate checks the first match of every selector (the same
+        element query_selector would return) and reads the layout markers of
+        the quiz page. Selectors are ranked with the one that last worked on
+        this layout first; only the winner is then queried for its handle.
+        Falls back to checking selectors one by one if the evaluate fails.
+        
+        Returns:
+            (element handle or None, selector used, layout fingerprint or None)
+        """
+        try:
+            result = await page.evaluate("""(selectors) => {
+                const firstMatch = (selector) => {
+                    const hasText = selector.match(/^([a-z]+):has-text\\("(.*)"\\)$/i);
+                    if (!hasText) return document.querySelector(selector);
+                    const text = hasText[2].toLowerCase();
+                    return Array.from(document.querySelectorAll(hasText[1]))
+                        .find((el) => (el.textContent || '').toLowerCase().includes(text)) || null;
+                };
+                const usable = (el) => {
+                    if (!el) return false;
+                    const rect = el.getBoundingClientRect();
+                    return rect.width > 0 && rect.height > 0 &&
+                        getComputedStyle(el).visibility !== 'hidden' &&
+                        !el.disabled && !el.closest('fieldset[disabled]');
+                };
+                const has = (selector) => document.querySelector(selector) !== null;
+                return {
+                    usable: selectors.map((selector) => { try { return usable(firstMatch(selector)); } catch (e) { return false; } }),
+                    markers: [['form', 'input[type="submit"]', 'button[type="submit"]', '.submit-button',
+                               '.finish-button', 'input[type="radio"]'].map(has), document.forms.length]
+                };
+            }""", selectors)
+        except Exception as e:
+            self.logger.debug(f"Combined submit button lookup failed ({e}) - checking selectors one by one")
+            for selector in selectors:
+                try:
+                    submit_btn = await page.query_selector(selector)
+                    if submit_btn and await submit_btn.is_visible() and await submit_btn.is_enabled():
+                        self.logger.debug(f"Found submit button with selector: {selector}")
+                        return submit_btn, selector, None
+                except Exception:
+                    continue
+            return None, None, None
+        
+        fingerprint = layout_fingerprint(result['markers']) if self.layout_cache else None
+        usable = dict(zip(selectors, result['usable']))
+        ranked = self.layout_cache.rank('submit', fingerprint, selectors) if self.layout_cache else selectors
+        for selector in ranked:
+            if usable.get(selector):
+                submit_btn = await page.query_selector(selector)
+                if submit_btn:
+                    self.logger.debug(f"Found submit button with selector: {selector}")
+                    return submit_btn, selector, fingerprint
+        return None, None, fingerprint
+
     async def _submit_quiz_to_results(self, page: Page) -> bool:
         """
         Submit the completed quiz and navigate to the results page.
@@ -1739,20 +2050,7 @@ class FunTriviaScraper(BaseScraper):
                 'form input[type="submit"]'
             ]
             
-            submit_btn = None
-            for selector in submit_selectors:
-                try:
-                    submit_btn = await page.query_selector(selector)
-                    if submit_btn:
-                        is_visible = await submit_btn.is_visible()
-                        is_enabled = await submit_btn.is_enabled()
-                        if is_visible and is_enabled:
-                            self.logger.debug(f"Found submit button with selector: {selector}")
-                            break
-                        else:
-                            submit_btn = None
-                except Exception:
-                    continue
+            submit_btn, selector, fingerprint = await self._resolve_submit_button(page, submit_selectors)
             
             if not submit_btn:
                 self.logger.error("No submit button found - cannot complete quiz")
@@ -1765,6 +2063,14 @@ class FunTriviaScraper(BaseScraper):
             # Wait for results page with multiple strategies
             results_loaded = await self._wait_for_results_page(page)
             
+            if self.layout_cache:
+                self.layout_cache.record_selector('submit', selector, results_loaded)
+                if fingerprint:
+                    if results_loaded:
+                        self.layout_cache.record_success('submit', fingerprint, {'selector': selector})
+                    else:
+                        self.layout_cache.record_failure('submit', fingerprint)
+            
             if results_loaded:
                 self.logger.info("Successfully reached results page")
                 return True
@@ -1884,7 +2190,67 @@ class FunTriviaScraper(BaseScraper):
                 self.logger.debug("Adding extra wait for description extraction (fast profile)")
                 await asyncio.sleep(2)
             
-            # Strategy 1: Try full page text extraction (primary method)
+            # Fast path: the strategy (and selector) that worked on this page layout before
+            fingerprint = await self._results_layout_fingerprint(page) if self.layout_cache else None
+            cached = self.layout_cache.lookup('results', fingerprint) if fingerprint else None
+            if cached:
+                self.logger.info(f"Known results layout {fingerprint} - trying Strategy {cached['strategy']} first")
+                enhanced_questions = await self._run_results_strategy(cached['strategy'], page, original_questions, cached)
+                if enhanced_questions:
+                    self.layout_cache.record_success('results', fingerprint, cached)
+                    return enhanced_questions
+                self.layout_cache.record_failure('results', fingerprint)
+            
+            # Strategies 1-3 in order: full page text, structured result blocks, text-based extraction
+            for strategy in (1, 2, 3):
+                if cached and cached['strategy'] == strategy:
+                    continue  # Just failed on this page (a cached selector only reorders strategy 2's list)
+                choice = {'strategy': strategy}
+                enhanced_questions = await self._run_results_strategy(strategy, page, original_questions, choice)
+                if enhanced_questions:
+                    if fingerprint:
+                        self.layout_cache.record_success('results', fingerprint, choice)
+                    return enhanced_questions
+                self.logger.warning(f"Strategy {strategy} failed")
+            
+            # Strategy 4: Last resort - use original questions with minimal enhancement
+            self.logger.warning("All extraction strategies failed - using basic enhancement (Strategy 4)")
+            return await self._enhance_questions_basic(original_questions)
+            
+        except Exception as e:
+            self.logger.error(f"Error in comprehensive results extraction: {e}")
+            return await self._enhance_questions_basic(original_questions)
+
+    async def _results_layout_fingerprint(self, page: Page) -> Optional[str]:
+        """Fingerprint of the results page layout from a few structural markers (one evaluate)."""
+        try:
+            markers = await page.evaluate("""() => {
+                const has = (selector) => document.querySelector(selector) !== null;
+                const text = document.body ? document.body.textContent : '';
+                return [
+                    ['.questionReview', '.questionTable', '.result-item', '.question-result', '.quiz-result-item',
+                     'tr[class*="question"]', 'div[class*="question"]', '.question-block', 'table'].map(has),
+                    /The correct answer was/i.test(text),
+                    /Interesting Information/i.test(text)
+                ];
+            }""")
+            return layout_fingerprint(markers)
+        except Exception as e:
+            self.logger.debug(f"Could not fingerprint results layout: {e}")
+            return None
+
+    async def _run_results_strategy(self, strategy: int, page: Page, original_questions: List[Dict[str, Any]],
+                                    choice: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Run one results extraction strategy (1-3) and check its results.
+        
+        choice is the layout cache entry being tried or learned; strategy 2
+        tries its 'selector' first and records the selector that worked.
+        
+        Returns:
+            The enhanced questions if the strategy succeeded, otherwise []
+        """
+        if strategy == 1:
             self.logger.info("Attempting Strategy 1: Full page text extraction")
             enhanced_questions = await self._extract_from_full_page_text(page, original_questions)
             if enhanced_questions and len(enhanced_questions) == len(original_questions):
@@ -1897,25 +2263,12 @@ class FunTriviaScraper(BaseScraper):
                 # Accept if we got either good descriptions or correct answers (or both)
                 if descriptions_found > 0 or correct_answers_found > len(enhanced_questions) * 0.5:
                     self.logger.info("Strategy 1 successful - using full page text extraction results")
-                    # Ensure correct answers are properly matched with options to prevent CSV formatting issues
-                    for question in enhanced_questions:
-                        if question.get('correct_answer') and question.get('options'):
-                            answer = question['correct_answer']
-                            options = question['options']
-                            # If answer doesn't exactly match any option, try to find best match
-                            if answer not in options:
-                                for opt in options:
-                                    if (opt.lower().strip() == answer.lower().strip() or
-                                        opt.lower().strip() in answer.lower().strip() or
-                                        answer.lower().strip() in opt.lower().strip()):
-                                        question['correct_answer'] = opt  # Use exact option text
-                                        self.logger.debug(f"Corrected answer match: '{answer}' -> '{opt}'")
-                                        break
+                    # Answers are matched to option text in _process_extracted_questions
                     return enhanced_questions
-            
-            # Strategy 2: Look for structured result blocks (fallback)
-            self.logger.warning("Strategy 1 failed - trying Strategy 2: Structured result blocks")
-            enhanced_questions = await self._extract_from_result_blocks(page, original_questions)
+        
+        elif strategy == 2:
+            self.logger.info("Attempting Strategy 2: Structured result blocks")
+            enhanced_questions = await self._extract_from_result_blocks(page, original_questions, layout=choice)
             if enhanced_questions and len(enhanced_questions) == len(original_questions):
                 descriptions_found = sum(1 for q in enhanced_questions if q.get('description'))
                 correct_answers_found = sum(1 for q in enhanced_questions if q.get('correct_answer'))
@@ -1925,24 +2278,19 @@ class FunTriviaScraper(BaseScraper):
                 if descriptions_found > 0 or correct_answers_found > 0:
                     self.logger.info("Strategy 2 successful - using structured result blocks")
                     return enhanced_questions
-            
-            # Strategy 3: Parse results from text-based format (fallback)
-            self.logger.warning("Strategy 2 failed - trying Strategy 3: Text-based extraction")
+        
+        elif strategy == 3:
+            self.logger.info("Attempting Strategy 3: Text-based extraction")
             enhanced_questions = await self._extract_from_text_results(page, original_questions)
             if enhanced_questions:
                 descriptions_found = sum(1 for q in enhanced_questions if q.get('description'))
-                self.logger.info(f"Strategy 3 results: {descriptions_found}/{len(enhanced_questions)} descriptions")
-                if descriptions_found > 0:
+                correct_answers_found = sum(1 for q in enhanced_questions if q.get('correct_answer'))
+                self.logger.info(f"Strategy 3 results: {descriptions_found}/{len(enhanced_questions)} descriptions, {correct_answers_found}/{len(enhanced_questions)} correct answers")
+                if descriptions_found > 0 or correct_answers_found > 0:
                     self.logger.info("Strategy 3 successful - using text-based extraction")
                     return enhanced_questions
-            
-            # Strategy 4: Last resort - use original questions with minimal enhancement
-            self.logger.warning("All extraction strategies failed - using basic enhancement (Strategy 4)")
-            return await self._enhance_questions_basic(original_questions)
-            
-        except Exception as e:
-            self.logger.error(f"Error in comprehensive results extraction: {e}")
-            return await self._enhance_questions_basic(original_questions)
+        
+        return []
 
     async def _extract_from_full_page_text(self, page: Page, original_questions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -1950,6 +2298,7 @@ class FunTriviaScraper(BaseScraper):
         
         This method gets the entire page text and uses regex patterns to extract
         descriptions that appear after "The correct answer was..." for each question.
+        The text snapshot is parsed in the results parse pool.
         """
         try:
             self.logger.info("Attempting full page text extraction for descriptions")
@@ -1962,38 +2311,8 @@ class FunTriviaScraper(BaseScraper):
             
             self.logger.debug(f"Full page text length: {len(page_text)} characters")
             
-            # Split the page text into sections for each question
-            enhanced_questions = []
-            
-            for i, question in enumerate(original_questions):
-                question_num = question.get('questionNumber', str(i+1))
-                
-                try:
-                    # Look for this question's result in the page text
-                    description = self._extract_description_from_page_text(page_text, question_num, question)
-                    
-                    # Create enhanced question
-                    enhanced_question = question.copy()
-                    enhanced_question['description'] = description or ''
-                    
-                    # Try to extract correct answer as well
-                    correct_answer = self._extract_correct_answer_from_page_text(page_text, question_num, question)
-                    enhanced_question['correct_answer'] = correct_answer or question.get('options', ['Unknown'])[0]
-                    
-                    enhanced_questions.append(enhanced_question)
-                    
-                    if description:
-                        self.logger.debug(f"Found description for Q{question_num}: {len(description)} characters")
-                    else:
-                        self.logger.debug(f"No description found for Q{question_num}")
-                        
-                except Exception as e:
-                    self.logger.warning(f"Error processing question {question_num} in full page text: {e}")
-                    # Add question with minimal enhancement on error
-                    enhanced_question = question.copy()
-                    enhanced_question['correct_answer'] = question.get('options', ['Unknown'])[0]
-                    enhanced_question['description'] = ''
-                    enhanced_questions.append(enhanced_question)
+            # Parse the text snapshot in a worker process so other pages keep running
+            enhanced_questions = await self.parse_pool.run(parse_full_page_text, page_text, original_questions)
             
             descriptions_found = sum(1 for q in enhanced_questions if q.get('description'))
             self.logger.info(f"Full page text extraction completed: {descriptions_found}/{len(enhanced_questions)} descriptions found")
@@ -2004,146 +2323,30 @@ class FunTriviaScraper(BaseScraper):
             self.logger.error(f"Error in full page text extraction: {e}")
             return []
 
-    def _extract_description_from_page_text(self, page_text: str, question_num: str, question: Dict[str, Any]) -> Optional[str]:
-        """Extract description for a specific question from the full page text."""
-        try:
-            # Split the page text to find sections for each question
-            question_sections = self._split_page_text_by_questions(page_text)
-            
-            # Try to find the section for this specific question
-            if question_num in question_sections:
-                section_text = question_sections[question_num]
-                description = self._extract_funtrivia_explanation(section_text)
-                if description:
-                    return description
-            
-            # Fallback: try to find question-specific content by looking for the question text
-            question_text = question.get('question', '').strip()
-            if question_text:
-                description = self._extract_description_near_question(page_text, question_text)
-                if description:
-                    return description
-            
-            return None
-            
-        except Exception as e:
-            self.logger.debug(f"Error extracting description for Q{question_num}: {e}")
-            return None
+    def _extract_description_from_page_text(self, page_text: str, question_num: str, question: Dict[str, Any],
+                                            sections: Optional[Dict[str, Dict[str, Any]]] = None) -> Optional[str]:
+        """
+        Extract description for a specific question from the full page text.
+        
+        sections are the tokenize_results() records of page_text; they are
+        computed here when not given.
+        """
+        return extract_description_from_page_text(page_text, question_num, question, sections)
+
+    def _extract_correct_answer_from_page_text(self, page_text: str, question_num: str, question: Dict[str, Any],
+                                               sections: Optional[Dict[str, Dict[str, Any]]] = None) -> Optional[str]:
+        """
+        Extract correct answer for a specific question from the full page text.
+        
+        sections are the tokenize_results() records of page_text; they are
+        computed here when not given.
+        """
+        return extract_correct_answer_from_page_text(page_text, question_num, question, sections)
 
-    def _extract_correct_answer_from_page_text(self, page_text: str, question_num: str, question: Dict[str, Any]) -> Optional[str]:
-        """Extract correct answer for a specific question from the full page text."""
-        try:
-            # Get question options to validate against
-            question_options = question.get('options', [])
-            
-            # Split page text into sections by question
-            question_sections = self._split_page_text_by_questions(page_text)
-            
-            # Look for correct answer in the specific question's section
-            if question_num in question_sections:
-                section_text = question_sections[question_num]
-                
-                # Enhanced patterns to find correct answers
-                patterns = [
-                    r'The correct answer was\s+([^.\n\r]+)',
-                    r'Correct answer was\s+([^.\n\r]+)', 
-                    r'correct answer:\s*([^.\n\r]+)',
-                    r'The correct answer is\s+([^.\n\r]+)',
-                    r'Answer:\s*([^.\n\r]+)',
-                ]
-                
-                for pattern in patterns:
-                    matches = re.findall(pattern, section_text, re.IGNORECASE | re.DOTALL)
-                    for match in matches:
-                        answer_text = match.strip()
-                        
-                        # Try to match with actual question options
-                        for option in question_options:
-                            option_clean = option.strip()
-                            # Exact match
-                            if option_clean.lower() == answer_text.lower():
-                                self.logger.debug(f"Found exact correct answer for Q{question_num}: {option_clean}")
-                                return option_clean
-                            # Partial match (answer contains option or vice versa)
-                            elif (option_clean.lower() in answer_text.lower() or 
-                                  answer_text.lower() in option_clean.lower()):
-                                self.logger.debug(f"Found partial correct answer for Q{question_num}: {option_clean}")
-                                return option_clean
-                        
-                        # If no option match, return the raw answer (might be formatted differently)
-                        if answer_text and len(answer_text) > 1:
-                            self.logger.debug(f"Found raw correct answer for Q{question_num}: {answer_text}")
-                            return answer_text
-            
-            # Fallback: try to find answer by question context in full page
-            # Look for patterns like "1. Your Answer: [No Answer] The correct answer was..."
-            question_context_patterns = [
-                rf'{question_num}\.\s+.*?The correct answer was\s+([^.\n\r]+)',
-                rf'Question {question_num}.*?The correct answer was\s+([^.\n\r]+)',
-                rf'{question_num}\.\s+.*?correct answer:\s*([^.\n\r]+)',
-            ]
-            
-            for pattern in question_context_patterns:
-                matches = re.findall(pattern, page_text, re.IGNORECASE | re.DOTALL)
-                for match in matches:
-                    answer_text = match.strip()
-                    
-                    # Validate against question options
-                    for option in question_options:
-                        option_clean = option.strip()
-                        if (option_clean.lower() == answer_text.lower() or
-                            option_clean.lower() in answer_text.lower() or 
-                            answer_text.lower() in option_clean.lower()):
-                            self.logger.debug(f"Found contextual correct answer for Q{question_num}: {option_clean}")
-                            return option_clean
-                    
-                    # Return raw answer if no option match
-                    if answer_text and len(answer_text) > 1:
-                        self.logger.debug(f"Found contextual raw answer for Q{question_num}: {answer_text}")
-                        return answer_text
-            
-            self.logger.debug(f"No correct answer found for Q{question_num}")
-            return None
-            
-        except Exception as e:
-            self.logger.debug(f"Error extracting correct answer for Q{question_num}: {e}")
-            return None
-    
     def _split_page_text_by_questions(self, page_text: str) -> Dict[str, str]:
-        """Split the page text into sections for each question with improved boundary detection."""
+        """Split the page text into sections for each question (see tokenize_results)."""
         try:
-            sections = {}
-            
-            # Look for question number patterns like "Question 1", "1.", etc.
-            import re
-            question_pattern = r'(\d+)\.\s+'
-            
-            matches = list(re.finditer(question_pattern, page_text, re.MULTILINE | re.IGNORECASE))
-            
-            for i, match in enumerate(matches):
-                # Get question number from the capture group
-                question_num = match.group(1)
-                if not question_num:
-                    continue
-                
-                # Get the start position of this question's content
-                start_pos = match.start()
-                
-                # Get the end position (start of next question or end of text)
-                if i + 1 < len(matches):
-                    end_pos = matches[i + 1].start()
-                else:
-                    end_pos = len(page_text)
-                
-                # Extract the section text for this question
-                raw_section = page_text[start_pos:end_pos].strip()
-                
-                # Clean up the section to remove cross-contamination
-                cleaned_section = self._clean_question_section(raw_section, question_num)
-                
-                if cleaned_section:
-                    sections[question_num] = cleaned_section
-                
+            sections = {number: record['text'] for number, record in tokenize_results(page_text).items()}
             self.logger.debug(f"Split page text into {len(sections)} question sections")
             return sections
             
@@ -2151,78 +2354,8 @@ class FunTriviaScraper(BaseScraper):
             self.logger.debug(f"Error splitting page text by questions: {e}")
             return {}
     
-    def _clean_question_section(self, section_text: str, question_num: str) -> str:
-        """Clean a question section to prevent cross-contamination from adjacent questions."""
-        try:
-            lines = section_text.split('\n')
-            cleaned_lines = []
-            found_answer = False
-            
-            for line in lines:
-                line_stripped = line.strip()
-                
-                # Skip empty lines
-                if not line_stripped:
-                    continue
-                
-                # Stop if we hit another question number (except our own)
-                other_question_match = re.match(r'^(\d+)\.\s+', line_stripped)
-                if other_question_match and other_question_match.group(1) != question_num:
-                    break
-                
-                # Stop at navigation elements that indicate end of question content
-                if any(marker in line_stripped.lower() for marker in [
-                    'next quiz', 'previous quiz', 'back to', 'home page', 'quiz menu',
-                    'browse quizzes', 'quiz categories', 'more quizzes'
-                ]):
-                    break
-                
-                # Include lines that contain answer patterns
-                if 'the correct answer was' in line_stripped.lower():
-                    found_answer = True
-                    cleaned_lines.append(line)
-                    # Continue for a few more lines to capture the explanation
-                    continue
-                
-                # If we found an answer, include next few lines (likely explanation)
-                if found_answer and len(cleaned_lines) < 20:  # Reasonable limit
-                    cleaned_lines.append(line)
-                elif not found_answer:
-                    # Before finding answer, include all relevant lines
-                    cleaned_lines.append(line)
-                else:
-                    # After collecting explanation lines, stop
-                    break
-            
-            return '\n'.join(cleaned_lines).strip()
-            
-        except Exception as e:
-            self.logger.debug(f"Error cleaning question section {question_num}: {e}")
-            return section_text
-    
-    def _extract_description_near_question(self, page_text: str, question_text: str) -> Optional[str]:
-        """Find description text near a specific question in the page text."""
-        try:
-            # Find the question text in the page
-            question_pos = page_text.lower().find(question_text.lower())
-            if question_pos == -1:
-                return None
-            
-            # Look for description patterns within a reasonable distance after the question
-            # Typical distance: 500-2000 characters after the question
-            search_start = question_pos
-            search_end = min(question_pos + 2000, len(page_text))
-            search_section = page_text[search_start:search_end]
-            
-            # Extract description from this localized section
-            description = self._extract_funtrivia_explanation(search_section)
-            return description
-            
-        except Exception as e:
-            self.logger.debug(f"Error extracting description near question: {e}")
-            return None
-
-    async def _extract_from_result_blocks(self, page: Page, original_questions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def _extract_from_result_blocks(self, page: Page, original_questions: List[Dict[str, Any]],
+                                          layout: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Extract results from structured result blocks on the results page.
         
@@ -2259,6 +2392,10 @@ class FunTriviaScraper(BaseScraper):
         - Captures explanations that span multiple DOM elements
         - Preserves paragraph structure while cleaning formatting
         - Handles various FunTrivia explanation layouts and styles
+        
+        LAYOUT CACHE:
+        - layout['selector'], if given, is tried before the selector list
+        - the selector that worked is stored back into layout['selector']
         """
         try:
             # Try multiple selectors to find result blocks for questions
@@ -2284,6 +2421,10 @@ class FunTriviaScraper(BaseScraper):
             
             result_blocks = []
             successful_selector = None
+            if layout and layout.get('selector') in result_selectors:
+                # Selector that worked on this layout before
+                result_selectors.remove(layout['selector'])
+                result_selectors.insert(0, layout['selector'])
             
             # Find the best selector that gives us enough result blocks
             for selector in result_selectors:
@@ -2301,6 +2442,8 @@ class FunTriviaScraper(BaseScraper):
                 return []
             
             self.logger.info(f"Extracting results from {len(result_blocks)} structured blocks using selector: {successful_selector}")
+            if layout is not None:
+                layout['selector'] = successful_selector
             
             enhanced_questions = []
             extraction_stats = {'correct_answers_found': 0, 'explanations_found': 0, 'explanations_missing': 0}
@@ -2327,7 +2470,7 @@ class FunTriviaScraper(BaseScraper):
                     
                     # Create enhanced question with extracted data
                     enhanced_question = question.copy()
-                    enhanced_question['correct_answer'] = correct_answer or question.get('options', ['Unknown'])[0]
+                    enhanced_question['correct_answer'] = correct_answer or ''
                     enhanced_question['hint'] = explanation or ''
                     enhanced_question['description'] = explanation or ''  # Store in both fields for compatibility
                     
@@ -2337,7 +2480,7 @@ class FunTriviaScraper(BaseScraper):
                     self.logger.error(f"Error processing result block {i} for question {question.get('questionNumber', i+1)}: {e}")
                     # Add question with minimal enhancement on error
                     enhanced_question = question.copy()
-                    enhanced_question['correct_answer'] = question.get('options', ['Unknown'])[0]
+                    enhanced_question['correct_answer'] = ''
                     enhanced_question['hint'] = ''
                     enhanced_question['description'] = ''
                     enhanced_questions.append(enhanced_question)
@@ -2371,44 +2514,13 @@ class FunTriviaScraper(BaseScraper):
             
             # Get all text content from the results page
             page_text = await page.evaluate('document.body.innerText')
-            lines = [line.strip() for line in page_text.split('\n') if line.strip()]
             
-            enhanced_questions = []
-            extraction_stats = {'correct_answers_found': 0, 'explanations_found': 0}
+            # Parse the text snapshot in a worker process so other pages keep running
+            enhanced_questions, extraction_stats = await self.parse_pool.run(
+                parse_text_results, page_text, original_questions)
             
-            for i, question in enumerate(original_questions):
-                question_num = question.get('questionNumber', str(i+1))
-                
-                try:
-                    # Look for this question's results in the text
-                    correct_answer = self._find_correct_answer_in_text(lines, question_num, question)
-                    explanation = self._find_explanation_in_text(lines, question_num)
-                    
-                    if correct_answer:
-                        extraction_stats['correct_answers_found'] += 1
-                    
-                    if explanation:
-                        extraction_stats['explanations_found'] += 1
-                        self.logger.debug(f"Found text-based explanation for Q{question_num}: {len(explanation)} characters")
-                    else:
-                        self.logger.warning(f"No explanation found in text for question {question_num}")
-                    
-                    # Create enhanced question
-                    enhanced_question = question.copy()
-                    enhanced_question['correct_answer'] = correct_answer or question.get('options', ['Unknown'])[0]
-                    enhanced_question['hint'] = explanation or ''
-                    enhanced_question['description'] = explanation or ''
-                    
-                    enhanced_questions.append(enhanced_question)
-                    
-                except Exception as e:
-                    self.logger.error(f"Error processing text results for question {question_num}: {e}")
-                    # Add question with minimal enhancement on error
-                    enhanced_question = question.copy()
-                    enhanced_question['correct_answer'] = question.get('options', ['Unknown'])[0]
-                    enhanced_question['hint'] = ''
-                    enhanced_question['description'] = ''
-                    enhanced_questions.append(enhanced_question)
+            for question_num in extraction_stats['missing_explanations']:
+                self.logger.warning(f"No explanation found in text for question {question_num}")
             
             self.logger.info(f"Text extraction stats: {extraction_stats['correct_answers_found']}/{len(original_questions)} correct answers, "
                            f"{extraction_stats['explanations_found']}/{len(original_questions)} explanations found")
@@ -2420,265 +2532,12 @@ class FunTriviaScraper(BaseScraper):
             self.logger.debug("Text results extraction error details:", exc_info=True)
             return []
 
-    def _find_correct_answer_in_text(self, lines: List[str], question_num: str, question: Dict[str, Any]) -> Optional[str]:
-        """
-        Find the correct answer for a specific question in the text lines.
-        
-        Looks for patterns like:
-        - "Question X: Correct Answer: [answer]"
-        - "1. [answer]" (in results context)
-        - Answer options that match the question's options
-        """
-        try:
-            question_options = question.get('options', [])
-            
-            # Look for explicit correct answer patterns
-            for i, line in enumerate(lines):
-                line_lower = line.lower()
-                
-                # Pattern 1: "Question X" followed by correct answer
-                if f"question {question_num}" in line_lower or f"{question_num}." in line:
-                    # Look in current line and next few lines for answer patterns
-                    search_lines = lines[i:i+5]
-                    for search_line in search_lines:
-                        search_lower = search_line.lower()
-                        
-                        if any(keyword in search_lower for keyword in ['correct answer:', 'answer:', 'correct:']):
-                            # Extract answer after the keyword
-                            for keyword in ['correct answer:', 'answer:', 'correct:']:
-                                if keyword in search_lower:
-                                    potential_answer = search_line[search_lower.index(keyword) + len(keyword):].strip()
-                                    # Validate against question options
-                                    for option in question_options:
-                                        if option.lower() in potential_answer.lower() or potential_answer.lower() in option.lower():
-                                            return option
-                                    return potential_answer
-                
-                # Pattern 2: Direct option match in results context
-                if f"{question_num}." in line and any(opt.lower() in line_lower for opt in question_options):
-                    for option in question_options:
-                        if option.lower() in line_lower:
-                            return option
-            
-            return None
-            
-        except Exception as e:
-            self.logger.debug(f"Error finding correct answer in text for question {question_num}: {e}")
-            return None
-
-    def _find_explanation_in_text(self, lines: List[str], question_num: str) -> Optional[str]:
-        """
-        Find the explanation/description for a specific question in the text lines.
-        
-        TEXT-BASED EXPLANATION EXTRACTION (FALLBACK METHOD):
-        ===================================================
-        When structured result blocks are not available, this method parses raw page text
-        to find explanations for individual questions on the results page.
-        
-        EXPLANATION LOCATIONS IN TEXT:
-        - "Interesting Information:" sections after each question result
-        - "Explanation:" blocks following correct answers
-        - Multi-paragraph descriptions that span several lines
-        - Educational text blocks positioned after question numbers
-        
-        FILTERING STRATEGY:
-        - Excludes navigation menus, quiz links, and page elements
-        - Focuses on actual educational content related to the question
-        - Filters out numbered lists that are clearly navigation
-        - Validates content quality before accepting as explanation
-        """
-        try:
-            explanation_parts = []
-            in_explanation = False
-            explanation_started = False
-            
-            for i, line in enumerate(lines):
-                line_lower = line.lower().strip()
-                line_stripped = line.strip()
-                
-                # Skip empty lines and very short lines
-                if len(line_stripped) < 3:
-                    continue
-                
-                # STEP 1: LOCATE THE TARGET QUESTION
-                # Find the specific question we're looking for explanations about
-                if f"question {question_num}" in line_lower or (f"{question_num}." in line and len(line) < 80):
-                    explanation_started = True
-                    self.logger.debug(f"Located question {question_num} in text for explanation search")
-                    continue
-                
-                if not explanation_started:
-                    continue
-                
-                # STEP 2: ENHANCED FILTERING OF NON-EXPLANATION CONTENT
-                # Filter out navigation, menus, and other page elements
-                navigation_patterns = [
-                    r'^\d+\.\s+.+\s+(easy|normal|hard|average|difficult)',  # Quiz list items
-                    r'^\d+\.\s+[A-Z][a-z]+.*?trivia',                      # Trivia category links
-                    r'funtrivia\s+homepage',                               # Site navigation
-                    r'copyright\s+funtrivia',                              # Copyright text
-                    r'terms\s+&\s+conditions',                            # Legal text
-                    r'explore\s+other\s+quizzes',                          # Quiz navigation
-                    r'more\s+.*?\s+quizzes',                               # More quiz links
-                    r'go\s+to\s+.*?\s+quizzes',                           # Navigation links
-                    r'other\s+destinations',                               # Site navigation
-                    r'referenced\s+topics',                               # Topic references
-                    r'adopted\s+quizzes',                                  # Quiz adoption info
-                    r'^\d+\.\s+[A-Z][^.]{10,50}\s+(easy|normal|hard)',    # Numbered quiz titles
-                    r'u\.s\.\s+government\s+quizzes',                     # Category navigation
-                    r'zip\s+codes\s+average',                             # Quiz title patterns
-                    r'collect\s+the\s+century',                           # Quiz title patterns
-                ]
-                
-                # Check if line matches navigation patterns
-                is_navigation = any(re.search(pattern, line_lower, re.IGNORECASE) for pattern in navigation_patterns)
-                
-                if is_navigation:
-                    self.logger.debug(f"Filtered out navigation element for Q{question_num}: {line_stripped[:40]}...")
-                    continue
-                
-                # Additional content filtering
-                if (line_stripped.startswith(('Home', 'Quiz', 'Browse', 'Search', 'Login', 'Register')) or
-                    'click here' in line_lower or
-                    'more information' in line_lower or
-                    'visit' in line_lower or
-                    line_lower.endswith(('quiz', 'quizzes', 'trivia', 'game', 'games')) or
-                    re.match(r'^\d+\.\s+[A-Z].*?Average$', line_stripped) or  # Quiz rating patterns
-                    re.match(r'^\d+\.\s+.*?\s+(Average|Easy|Normal|Hard)$', line_stripped)):  # Quiz difficulty patterns
-                    
-                    self.logger.debug(f"Filtered out site element for Q{question_num}: {line_stripped[:40]}...")
-                    continue
-                
-                # STEP 3: FIND EXPLANATION MARKERS
-                # Look for various labels that indicate start of explanation content
-                explanation_markers = [
-                    'interesting information:',   # FunTrivia's standard label
-                    'interesting info:',         # Abbreviated version
-                    'explanation:',              # Generic explanation label
-                    'additional information:',   # Extended info blocks
-                    'did you know:',            # Educational facts
-                    'fun fact:',                # Interesting facts
-                    'background:',              # Context information
-                    'note:',                    # Important notes
-                    'trivia:',                  # Trivia fact sections (when followed by colon)
-                ]
-                
-                if any(marker in line_lower for marker in explanation_markers):
-                    in_explanation = True
-                    self.logger.debug(f"Found explanation marker in text for Q{question_num}: {line_stripped[:50]}...")
-                    
-                    # Extract content after the marker
-                    for marker in explanation_markers:
-                        if marker in line_lower:
-                            marker_index = line_lower.index(marker)
-                            text_after_marker = line[marker_index + len(marker):].strip(' :')
-                            if text_after_marker and len(text_after_marker) > 10:  # Ensure substantial content
-                                explanation_parts.append(text_after_marker)
-                            break
-                    continue
-                
-                # STEP 4: COLLECT EXPLANATION CONTENT
-                # Gather all explanation text until we hit a stopping condition
-                if in_explanation:
-                    # Define stopping conditions that indicate end of explanation
-                    stop_conditions = [
-                        line_lower.startswith('question'),              # Next question started
-                        'your score' in line_lower,                     # Score section reached
-                        'quiz complete' in line_lower,                  # Quiz completion section
-                        'quiz results' in line_lower,                   # Results summary section
-                        line_lower.startswith('correct answer:'),       # Another question's answer
-                        len(line_stripped) < 10 and line_stripped.isdigit(),  # Standalone question number
-                        'submit' in line_lower and 'quiz' in line_lower, # Submit buttons/forms
-                        line_lower.startswith('total score'),           # Score summary
-                        line_lower.startswith('final score'),           # Final results
-                        'next question' in line_lower,                  # Question navigation
-                        'previous question' in line_lower,              # Question navigation
-                    ]
-                    
-                    if any(condition for condition in stop_conditions):
-                        self.logger.debug(f"Hit stop condition for Q{question_num} explanation: {line_stripped[:30]}...")
-                        break
-                    
-                    # ENHANCED CONTENT VALIDATION
-                    # Only collect lines that appear to be actual explanation content
-                    if (len(line_stripped) > 15 and  # Ensure substantial content
-                        not line_lower.startswith(('a)', 'b)', 'c)', 'd)', 'a.', 'b.', 'c.', 'd.')) and  # Skip answer options
-                        not line_lower.startswith('question') and              # Skip question headers
-                        'correct answer' not in line_lower and                 # Skip answer declarations
-                        not line_lower.startswith(('next', 'previous', 'submit', 'back', 'home')) and  # Skip navigation
-                        not re.match(r'^\d+\.\s+', line_stripped) and         # Skip numbered lists
-                        not line_lower.endswith(('average', 'easy', 'normal', 'hard', 'difficult')) and  # Skip quiz ratings
-                        'funtrivia' not in line_lower and                     # Skip site references
-                        'quiz' not in line_lower.split()[-3:] and             # Skip if 'quiz' in last 3 words
-                        not re.search(r'\b(browse|search|login|register)\b', line_lower)):  # Skip site actions
-                        
-                        # Additional quality check: ensure it's educational content
-                        educational_indicators = [
-                            'because', 'this is', 'the reason', 'actually', 'in fact', 'however',
-                            'therefore', 'although', 'since', 'according to', 'research shows',
-                            'studies', 'scientists', 'experts', 'discovered', 'found that',
-                            'evidence', 'data', 'statistics', 'history', 'historical',
-                            'originated', 'invented', 'created', 'established', 'founded'
-                        ]
-                        
-                        # Accept if it contains educational language OR is substantial content
-                        if (any(indicator in line_lower for indicator in educational_indicators) or 
-                            len(line_stripped) > 50):  # Accept longer content even without indicators
-                            
-                            explanation_parts.append(line_stripped)
-                            self.logger.debug(f"Collected explanation line for Q{question_num}: {line_stripped[:50]}...")
-                
-                # STEP 5: DETECT NEXT QUESTION BOUNDARY
-                # Stop collection if we've moved to the next question
-                try:
-                    next_question_num = str(int(question_num) + 1)
-                    if (f"question {next_question_num}" in line_lower or 
-                        (f"{next_question_num}." in line and len(line) < 80)):
-                        self.logger.debug(f"Reached next question ({next_question_num}) - stopping explanation collection for Q{question_num}")
-                        break
-                except ValueError:
-                    # Handle non-numeric question numbers gracefully
-                    pass
-            
-            # STEP 6: PROCESS AND VALIDATE COLLECTED EXPLANATION
-            # Join collected parts and validate content quality
-            if explanation_parts:
-                # Join explanation parts with proper spacing for readability
-                explanation = ' '.join(explanation_parts).strip()
-                
-                # Clean up excessive whitespace while preserving structure
-                explanation = ' '.join(explanation.split())
-                
-                # Final quality validation
-                if (len(explanation) > 30 and  # Minimum meaningful length
-                    not re.match(r'^\d+\.\s+', explanation) and  # Not a numbered list item
-                    'average' not in explanation.lower().split()[-2:]):  # Doesn't end with quiz rating terms
-                    
-                    self.logger.debug(f"Successfully extracted text-based explanation for Q{question_num}: {len(explanation)} chars")
-                    return explanation
-                else:
-                    self.logger.debug(f"Explanation failed quality check for Q{question_num}: {explanation[:100]}...")
-            
-            # NO EXPLANATION FOUND
-            self.logger.debug(f"No text-based explanation found for question {question_num}")
-            return None
-            
-        except Exception as e:
-            self.logger.debug(f"Error finding explanation in text for question {question_num}: {e}")
-            return None
-
     async def _extract_correct_answer_from_block(self, result_block) -> Optional[str]:
         """Extract correct answer from a result block."""
         try:
             text = await result_block.inner_text()
-            patterns = [
-                r'Correct Answer:\s*(.+?)(?:\n|$)',
-                r'Answer:\s*(.+?)(?:\n|$)',
-                r'Correct:\s*(.+?)(?:\n|$)'
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
+            for pattern in BLOCK_ANSWER_RES:
+                match = pattern.search(text)
                 if match:
                     return match.group(1).strip()
                     
@@ -2704,10 +2563,10 @@ class FunTriviaScraper(BaseScraper):
                 return None
             
             # Primary strategy: Extract text after "The correct answer was..." until statistics
-            explanation = self._extract_funtrivia_explanation(block_text)
+            explanation = extract_funtrivia_explanation(block_text)
             if explanation:
                 self.logger.debug(f"Found explanation for Q{question_num}: {len(explanation)} characters")
-                return self._clean_explanation_text(explanation)
+                return clean_explanation_text(explanation)
             
             self.logger.debug(f"No explanation found in result block for Q{question_num}")
             return None
@@ -2716,285 +2575,6 @@ class FunTriviaScraper(BaseScraper):
             self.logger.debug(f"Error extracting explanation from block for Q{question_num}: {e}")
             return None
 
-    def _extract_funtrivia_explanation(self, text: str) -> Optional[str]:
-        """
-        Extract explanation text from FunTrivia results using the actual structure.
-        
-        FunTrivia structure:
-        - Question text
-        - Your Answer: [answer]  
-        - The correct answer was [answer]
-        - [Explanation paragraphs] <- Extract this
-        - X% of players have answered correctly
-        """
-        try:
-            # Clean and normalize the text
-            text = ' '.join(text.split())
-            
-            # Primary patterns to match FunTrivia's actual structure
-            patterns = [
-                # Main pattern: Extract text after "The correct answer was..." until statistics
-                r'The correct answer was\s+[^.]+\.\s*(.+?)(?=\d+%\s+of\s+players|I see an error|Your Answer:|Question \d+|\Z)',
-                # Alternative patterns for different answer formats
-                r'Correct answer was\s+[^.]+\.\s*(.+?)(?=\d+%\s+of\s+players|I see an error|Your Answer:|Question \d+|\Z)',
-                r'correct answer:\s*[^.]+\.\s*(.+?)(?=\d+%\s+of\s+players|I see an error|Your Answer:|Question \d+|\Z)',
-                # Pattern for when answer is in quotes
-                r'The correct answer was\s+"[^"]+"\s*(.+?)(?=\d+%\s+of\s+players|I see an error|Your Answer:|Question \d+|\Z)',
-                # More flexible pattern for single word answers
-                r'The correct answer was\s+\w+\s*(.+?)(?=\d+%\s+of\s+players|I see an error|Your Answer:|Question \d+|\Z)',
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, text, re.MULTILINE | re.DOTALL | re.IGNORECASE)
-                if match:
-                    explanation = match.group(1).strip()
-                    # Clean up the explanation
-                    explanation = re.sub(r'\s+', ' ', explanation)  # Normalize whitespace
-                    explanation = explanation.strip()
-                    
-                    # Filter out obvious non-explanations
-                    if self._is_valid_explanation(explanation):
-                        return explanation
-            
-            # Fallback: line-by-line analysis for edge cases
-            return self._extract_explanation_line_by_line(text)
-            
-        except Exception as e:
-            self.logger.debug(f"Error in _extract_funtrivia_explanation: {e}")
-            return None
-
-    def _extract_explanation_line_by_line(self, text: str) -> Optional[str]:
-        """
-        Fallback method to extract explanations by analyzing line by line.
-        """
-        try:
-            lines = [line.strip() for line in text.split('\n') if line.strip()]
-            explanation_lines = []
-            found_answer = False
-            
-            for line in lines:
-                # Skip until we find the correct answer line
-                if re.search(r'The correct answer was|correct answer:', line, re.IGNORECASE):
-                    found_answer = True
-                    continue
-                
-                # If we found the answer, start collecting explanation lines
-                if found_answer:
-                    # Stop at statistics or navigation
-                    if re.search(r'\d+%\s+of\s+players|I see an error|Your Answer:|Question \d+', line, re.IGNORECASE):
-                        break
-                    # Collect substantial lines (likely part of explanation)
-                    if len(line) > 20 and not self._is_navigation_line(line):
-                        explanation_lines.append(line)
-            
-            if explanation_lines:
-                explanation = ' '.join(explanation_lines).strip()
-                if self._is_valid_explanation(explanation):
-                    return explanation
-            
-            return None
-            
-        except Exception as e:
-            self.logger.debug(f"Error in line-by-line extraction: {e}")
-            return None
-
-    def _is_valid_explanation(self, text: str) -> bool:
-        """Check if extracted text is a valid explanation."""
-        if not text or len(text.strip()) < 30:
-            return False
-        
-        text_lower = text.lower().strip()
-        
-        # Reject obvious non-explanations
-        invalid_indicators = [
-            'funtrivia', 'homepage', 'browse quizzes', 'click here',
-            'visit our', 'explore other', 'more quizzes'
-        ]
-        
-        if any(indicator in text_lower for indicator in invalid_indicators):
-            return False
-        
-        # Must have reasonable length and educational content
-        return len(text) >= 30 and len(text.split()) >= 8
-
-    def _is_navigation_line(self, line: str) -> bool:
-        """Check if a line is navigation/menu content."""
-        line_lower = line.lower()
-        nav_indicators = [
-            'funtrivia', 'homepage', 'browse', 'click here', 'visit',
-            'explore', 'more quizzes', 'trivia quiz', 'average quiz'
-        ]
-        return any(indicator in line_lower for indicator in nav_indicators)
-    
-    def _validate_explanation_quality(self, text: str) -> bool:
-        """
-        Validate that extracted text is actually an explanation, not navigation.
-        
-        EXPLANATION QUALITY VALIDATION:
-        =============================
-        This function ensures extracted text is educational content rather than
-        navigation menus, quiz lists, or other page elements.
-        """
-        if not text or len(text.strip()) < 30:
-            return False
-        
-        text_lower = text.lower().strip()
-        
-        # Reject if it looks like navigation or quiz lists
-        navigation_indicators = [
-            r'^\d+\.\s+.+\s+(average|easy|normal|hard|difficult)$',  # Quiz ratings
-            r'^\d+\.\s+[A-Z][a-z]+.*?trivia',                       # Trivia categories
-            r'funtrivia\s+homepage',                                # Site navigation
-            r'browse\s+quizzes',                                    # Quiz browsing
-            r'more\s+.*?\s+quizzes',                               # More quiz links
-            r'explore\s+other\s+quizzes',                          # Quiz exploration
-            r'click\s+here\s+to',                                  # Click instructions
-            r'visit\s+our',                                        # Site promotion
-        ]
-        
-        if any(re.search(pattern, text_lower, re.IGNORECASE) for pattern in navigation_indicators):
-            return False
-        
-        # Reject if it's just quiz titles or category lists
-        if (text_lower.endswith(('quiz', 'quizzes', 'trivia', 'average', 'easy', 'normal', 'hard')) or
-            re.match(r'^\d+\.\s+', text.strip()) or  # Starts with number
-            'funtrivia' in text_lower or
-            len(text.split()) < 8):  # Too short to be meaningful explanation
-            return False
-        
-        # Accept if it contains educational language
-        educational_indicators = [
-            'because', 'this is', 'the reason', 'actually', 'in fact', 'however',
-            'therefore', 'although', 'since', 'according to', 'research shows',
-            'studies', 'scientists', 'experts', 'discovered', 'found that',
-            'evidence', 'data', 'statistics', 'history', 'historical',
-            'originated', 'invented', 'created', 'established', 'founded',
-            'named after', 'known for', 'famous for', 'designed by', 'built in'
-        ]
-        
-        return any(indicator in text_lower for indicator in educational_indicators)
-
-    def _extract_interesting_information(self, text: str) -> Optional[str]:
-        """
-        Extract text from "Interesting Information" sections.
-        
-        FUNTIVIA'S STANDARD EXPLANATION FORMAT:
-        ====================================== 
-        FunTrivia commonly uses "Interesting Information:" as the label for
-        question explanations. This method finds and extracts that content.
-        
-        MULTI-PARAGRAPH SUPPORT:
-        - Captures content that spans multiple lines/paragraphs
-        - Handles various formatting styles (with/without colons, spacing)
-        - Preserves meaningful text structure while cleaning formatting artifacts
-        
-        PATTERN MATCHING:
-        - Case-insensitive matching for flexibility
-        - Multiple regex patterns to handle formatting variations
-        - Stops at logical boundaries (next question, score sections, etc.)
-        """
-        try:
-            # Enhanced patterns for multi-paragraph "Interesting Information" extraction
-            patterns = [
-                # Standard format with colon - multi-paragraph capture
-                r'Interesting Information:\s*(.+?)(?:\n\n|\n(?=Question|\d+\.|\Z|Your Score|Quiz Complete))',
-                # Alternative format without colon
-                r'Interesting Information\s+(.+?)(?:\n\n|\n(?=Question|\d+\.|\Z|Your Score|Quiz Complete))',
-                # Abbreviated format
-                r'Interesting Info:\s*(.+?)(?:\n\n|\n(?=Question|\d+\.|\Z|Your Score|Quiz Complete))',
-                # Block format (starts on new line after label)
-                r'(?:^|\n)Interesting Information[:\s]*\n(.+?)(?:\n\n|\n(?=Question|\d+\.|\Z|Your Score|Quiz Complete))',
-                # Extended pattern to capture longer explanations
-                r'Interesting Information[:\s]*(.+?)(?=\n(?:Question \d+|Your Score|Quiz Results|Submit|Next Question)|\Z)',
-                # More flexible patterns for FunTrivia variations
-                r'(?i)interesting[:\s]*(.+?)(?:\n\n|\n(?=Question|\d+\.|\Z|Your Score|Quiz Complete))',
-                r'(?i)info[:\s]*(.+?)(?:\n\n|\n(?=Question|\d+\.|\Z|Your Score|Quiz Complete))',
-                r'(?i)trivia[:\s]*(.+?)(?:\n\n|\n(?=Question|\d+\.|\Z|Your Score|Quiz Complete))',
-                # Capture any substantive paragraph after correct answer indicators
-                r'(?i)correct[:\s]+[^.]+\.(.+?)(?:\n\n|\n(?=Question|\d+\.|\Z|Your Score|Quiz Complete))',
-                r'(?i)answer[:\s]+[^.]+\.(.+?)(?:\n\n|\n(?=Question|\d+\.|\Z|Your Score|Quiz Complete))'
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-                if match:
-                    explanation = match.group(1).strip()
-                    
-                    # Enhanced cleaning for multi-paragraph content
-                    explanation = self._clean_explanation_text(explanation)
-                    
-                    # Validation: ensure meaningful content length
-                    if len(explanation) > 20:  # Minimum meaningful length
-                        self.logger.debug(f"Extracted Interesting Information: {len(explanation)} chars")
-                        return explanation
-            
-            return None
-            
-        except Exception as e:
-            self.logger.debug(f"Error extracting interesting information: {e}")
-            return None
-
-    def _extract_generic_explanation(self, text: str) -> Optional[str]:
-        """
-        Extract explanations using generic markers like "Explanation:", "Info:", etc.
-        
-        ALTERNATIVE EXPLANATION FORMATS:
-        ===============================
-        Handles cases where FunTrivia uses different labels for explanations:
-        - "Explanation:" - Direct explanation blocks
-        - "Additional Information:" - Supplementary details  
-        - "Fun Fact:" - Interesting trivia related to the answer
-        - "Background:" - Contextual information
-        - "Did you know?" - Educational facts
-        
-        MULTI-PARAGRAPH EXTRACTION:
-        - Captures complete explanation blocks even when spanning multiple paragraphs
-        - Handles various separators and formatting styles
-        - Maintains readability while normalizing for CSV storage
-        """
-        try:
-            # Enhanced patterns for multi-paragraph generic explanation extraction
-            patterns = [
-                # Standard explanation formats with enhanced multi-paragraph capture
-                r'Explanation:\s*(.+?)(?:\n\n|\n(?=Question|\d+\.|\Z|Your Score|Quiz Complete))',
-                r'Info:\s*(.+?)(?:\n\n|\n(?=Question|\d+\.|\Z|Your Score|Quiz Complete))',
-                r'Additional Information:\s*(.+?)(?:\n\n|\n(?=Question|\d+\.|\Z|Your Score|Quiz Complete))',
-                r'Details:\s*(.+?)(?:\n\n|\n(?=Question|\d+\.|\Z|Your Score|Quiz Complete))',
-                r'Trivia:\s*(.+?)(?:\n\n|\n(?=Question|\d+\.|\Z|Your Score|Quiz Complete))',
-                
-                # Question-style explanation patterns
-                r'Did you know[?:]?\s*(.+?)(?:\n\n|\n(?=Question|\d+\.|\Z|Your Score|Quiz Complete))',
-                r'Fun fact[?:]?\s*(.+?)(?:\n\n|\n(?=Question|\d+\.|\Z|Your Score|Quiz Complete))',
-                r'Fun Fact[?:]?\s*(.+?)(?:\n\n|\n(?=Question|\d+\.|\Z|Your Score|Quiz Complete))',
-                
-                # Contextual information patterns
-                r'Background:\s*(.+?)(?:\n\n|\n(?=Question|\d+\.|\Z|Your Score|Quiz Complete))',
-                r'Context:\s*(.+?)(?:\n\n|\n(?=Question|\d+\.|\Z|Your Score|Quiz Complete))',
-                r'More Info:\s*(.+?)(?:\n\n|\n(?=Question|\d+\.|\Z|Your Score|Quiz Complete))',
-                
-                # Extended patterns for longer explanations
-                r'(?:Explanation|Additional Information|Details)[:\s]*(.+?)(?=\n(?:Question \d+|Your Score|Quiz Results|Submit|Next Question)|\Z)'
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-                if match:
-                    explanation = match.group(1).strip()
-                    
-                    # Enhanced cleaning for multi-paragraph content
-                    explanation = self._clean_explanation_text(explanation)
-                    
-                    # Validation for meaningful content
-                    if len(explanation) > 20:
-                        self.logger.debug(f"Extracted generic explanation: {len(explanation)} chars")
-                        return explanation
-            
-            return None
-            
-        except Exception as e:
-            self.logger.debug(f"Error extracting generic explanation: {e}")
-            return None
-
     async def _extract_explanation_from_html_structure(self, result_block) -> Optional[str]:
         """
         Extract explanation by analyzing the HTML structure of the result block.
@@ -3060,7 +2640,7 @@ class FunTriviaScraper(BaseScraper):
                         if explanation_parts:
                             # Join multiple paragraphs with proper spacing
                             combined_explanation = ' '.join(explanation_parts)
-                            cleaned_explanation = self._clean_explanation_text(combined_explanation)
+                            cleaned_explanation = clean_explanation_text(combined_explanation)
                             if len(cleaned_explanation) > 20:
                                 self.logger.debug(f"Found structured explanation via selector '{selector}': {len(cleaned_explanation)} chars")
                                 return cleaned_explanation
@@ -3099,7 +2679,7 @@ class FunTriviaScraper(BaseScraper):
                 # Process collected explanation candidates
                 if explanation_candidates:
                     combined_explanation = ' '.join(explanation_candidates)
-                    cleaned_explanation = self._clean_explanation_text(combined_explanation)
+                    cleaned_explanation = clean_explanation_text(combined_explanation)
                     if len(cleaned_explanation) > 20:
                         self.logger.debug(f"Found positional explanation: {len(cleaned_explanation)} chars")
                         return cleaned_explanation
@@ -3113,203 +2693,19 @@ class FunTriviaScraper(BaseScraper):
             self.logger.debug(f"Error extracting explanation from HTML structure: {e}")
             return None
 
-    def _extract_heuristic_explanation(self, text: str) -> Optional[str]:
-        """
-        Extract explanation using heuristic methods when explicit markers are not found.
-        
-        This method looks for substantial text blocks that likely contain explanations
-        based on their position and content characteristics.
-        """
-        try:
-            lines = [line.strip() for line in text.split('\n') if line.strip()]
-            
-            # STRATEGY 1: Look for text after correct answer indicators
-            explanation_candidates = []
-            found_correct_answer = False
-            
-            for line in lines:
-                line_lower = line.lower()
-                
-                # Mark when we pass the correct answer line
-                if any(phrase in line_lower for phrase in [
-                    'correct answer', 'answer:', 'correct:', 'the answer is', 'solution:'
-                ]):
-                    found_correct_answer = True
-                    continue
-                
-                # Skip question headers and short lines
-                if (line_lower.startswith(('question', 'q.')) or 
-                    len(line) < 25 or
-                    line_lower.startswith(('your score', 'submit', 'next question'))):
-                    continue
-                
-                # Collect substantial text that comes after the correct answer
-                if (found_correct_answer and 
-                    len(line) > 30 and
-                    not line.lower().startswith(('a)', 'b)', 'c)', 'd)')) and  # Not answer options
-                    not line.isdigit()):  # Not just numbers
-                    
-                    explanation_candidates.append(line)
-            
-            # Join explanation candidates and validate
-            if explanation_candidates:
-                explanation = ' '.join(explanation_candidates)
-                explanation = self._clean_explanation_text(explanation)
-                
-                # Validate that this looks like an explanation (not just random text)
-                if (len(explanation) > 50 and 
-                    not explanation.lower().startswith('question') and
-                    ' ' in explanation):  # Contains spaces (not just a single word)
-                    return explanation
-            
-            # STRATEGY 2: Look for any substantial educational content
-            for line in lines:
-                line_lower = line.lower()
-                
-                # Skip navigation and short content
-                if (len(line) < 40 or
-                    any(skip_word in line_lower for skip_word in [
-                        'funtrivia', 'quiz', 'homepage', 'browse', 'click here',
-                        'visit our', 'more quizzes', 'explore other', 'return to',
-                        'submit', 'next question', 'previous question'
-                    ])):
-                    continue
-                
-                # Look for educational indicators
-                if any(indicator in line_lower for indicator in [
-                    'because', 'this is', 'actually', 'in fact', 'the reason',
-                    'according to', 'research', 'studies', 'scientists', 'experts',
-                    'discovered', 'evidence', 'history', 'historical', 'originated',
-                    'invented', 'created', 'established', 'founded', 'named after',
-                    'known for', 'famous for', 'designed by', 'built in', 'located in',
-                    'during', 'when', 'where', 'why', 'how', 'first', 'originally',
-                    'also known as', 'called', 'means', 'refers to', 'comes from'
-                ]):
-                    cleaned = self._clean_explanation_text(line)
-                    if len(cleaned) > 50:
-                        return cleaned
-            
-            # STRATEGY 3: Look for any substantive paragraph (last resort)
-            for line in lines:
-                line_lower = line.lower()
-                
-                # Must be substantial and not navigation
-                if (len(line) > 80 and  # Longer text more likely to be explanation
-                    not any(skip_pattern in line_lower for skip_pattern in [
-                        'funtrivia', 'quiz', 'homepage', 'browse', 'click here',
-                        'visit our', 'more quizzes', 'explore other', 'return to',
-                        'submit', 'next question', 'previous question', 'score'
-                    ]) and
-                    # Must look like descriptive text (has common words)
-                    sum(1 for word in ['the', 'a', 'an', 'is', 'was', 'are', 'were', 'has', 'have']
-                        if word in line_lower.split()) >= 2):
-                    
-                    cleaned = self._clean_explanation_text(line)
-                    if len(cleaned) > 60:
-                        return cleaned
-            
-            return None
-            
-        except Exception as e:
-            self.logger.debug(f"Error extracting heuristic explanation: {e}")
-            return None
-
     async def _enhance_questions_basic(self, original_questions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Basic enhancement of questions when results page extraction fails."""
+        """Basic enhancement of questions when results page extraction fails (no answers or explanations)."""
         enhanced_questions = []
         
         for question in original_questions:
             enhanced_question = question.copy()
-            enhanced_question['correct_answer'] = question.get('options', ['Unknown'])[0]
+            enhanced_question['correct_answer'] = ''
             enhanced_question['hint'] = ''
             enhanced_question['description'] = ''
             enhanced_questions.append(enhanced_question)
         
         return enhanced_questions
 
-    def _clean_explanation_text(self, text: str) -> str:
-        """
-        Clean and normalize explanation text for CSV storage.
-        
-        EXPLANATION TEXT CLEANING PROCESS:
-        =================================
-        This function processes raw explanation text extracted from results pages
-        to ensure clean, consistent formatting suitable for CSV storage.
-        
-        CLEANING OPERATIONS:
-        1. WHITESPACE NORMALIZATION:
-           - Removes excessive whitespace and normalizes line breaks
-           - Converts multiple spaces to single spaces
-           - Trims leading/trailing whitespace and punctuation
-        
-        2. FORMATTING ARTIFACT REMOVAL:
-           - Removes common HTML/web formatting remnants
-           - Cleans up duplicate spacing from DOM text extraction
-           - Handles line break artifacts from page parsing
-        
-        3. LABEL PREFIX REMOVAL:
-           - Strips explanation labels that may have been included in extraction
-           - Removes markers like "Interesting Information:", "Explanation:", etc.
-           - Ensures only the actual explanation content remains
-        
-        4. CSV COMPATIBILITY:
-           - Ensures text is safe for CSV storage (no problematic characters)
-           - Maintains readability while being storage-friendly
-           - Preserves meaningful content structure
-        
-        MULTI-PARAGRAPH PRESERVATION:
-        - Maintains logical flow of multi-paragraph explanations
-        - Joins paragraphs with appropriate spacing
-        - Preserves sentence structure and readability
-        """
-        if not text:
-            return ""
-        
-        # STEP 1: WHITESPACE NORMALIZATION
-        # Remove excessive whitespace and normalize line breaks to single spaces
-        text = ' '.join(text.split())
-        
-        # STEP 2: FORMATTING ARTIFACT REMOVAL  
-        # Clean up common formatting issues from DOM text extraction
-        text = text.replace('  ', ' ')  # Remove double spaces
-        text = text.strip(' .,;:')      # Remove leading/trailing punctuation and spaces
-        
-        # STEP 3: EXPLANATION LABEL PREFIX REMOVAL
-        # Remove explanation markers that may have been captured during extraction
-        prefixes_to_remove = [
-            'Interesting Information:',
-            'Interesting Info:',
-            'Explanation:',
-            'Info:',
-            'Additional Information:',
-            'Details:',
-            'Trivia:',
-            'Did you know:',
-            'Did you know?',
-            'Fun fact:',
-            'Fun Fact:',
-            'Background:',
-            'Context:',
-            'More Info:'
-        ]
-        
-        # Remove any of these prefixes if they appear at the start of the text
-        for prefix in prefixes_to_remove:
-            if text.startswith(prefix):
-                text = text[len(prefix):].strip()
-                self.logger.debug(f"Removed explanation prefix: {prefix}")
-                break
-        
-        # STEP 4: FINAL CLEANUP AND VALIDATION
-        # Ensure the cleaned text is properly formatted for CSV storage
-        cleaned_text = text.strip()
-        
-        # Log cleaning results for debugging
-        if len(cleaned_text) != len(text.strip()):
-            self.logger.debug(f"Explanation cleaning: {len(text.strip())} -> {len(cleaned_text)} chars")
-        
-        return cleaned_text
-
     def _extract_audio_url(self, question_data: Dict[str, Any]) -> Optional[str]:
         """
         Extract audio URL from question data using various possible keys.
@@ -3350,6 +2746,16 @@ class FunTriviaScraper(BaseScraper):
         """
         return self.scraper_config.get_unmapped_values()
     
+    def get_fuzzy_matches(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get values that missed the mappings but were resolved by fuzzy matching.
+        
+        Returns:
+            Dictionary with 'difficulty', 'domain', and 'topic' keys mapping raw
+            values to their FuzzyMatch (value, synonym, score)
+        """
+        return self.scraper_config.get_fuzzy_matches()
+    
     def get_mapping_stats(self) -> Dict[str, Dict[str, int]]:
         """Get statistics about mapping usage."""
         return self.scraper_config.get_mapping_stats()
@@ -3753,30 +3159,31 @@ class FunTriviaScraper(BaseScraper):
 
     async def _save_questions_incrementally(self, questions: List[Dict[str, Any]], quiz_log_id: str = "") -> int:
         """
-        Save questions immediately after processing each quiz.
+        Hand questions to the background writer immediately after processing each quiz.
         
         INCREMENTAL SAVING STRATEGY:
         ===========================
-        This function saves questions to CSV files immediately after each quiz is completed,
-        preventing data loss if the scraper is interrupted or encounters errors.
+        Questions are formatted and queued on the QuestionWriter as soon as a quiz is
+        completed. The writer batches rows per question type and writes them to the CSV
+        files in a worker thread, so scraping never waits on disk I/O.
         
         Benefits:
         - Progress is preserved even if scraper is interrupted
         - Reduces memory usage by not accumulating all questions
-        - Provides immediate feedback on successful saves
-        - Prevents loss of work due to network issues or timeouts
+        - File writes happen off the event loop driving the browser pages
+        - Bounded queue applies backpressure if storage falls behind
         
         Args:
             questions: List of processed questions from a single quiz
             quiz_log_id: Quiz identifier for logging
             
         Returns:
-            Number of questions successfully saved
+            Number of questions queued for saving
         """
-        if not questions or not self.csv_handler:
+        if not questions or not self.question_writer:
             return 0
         
-        saved_count = 0
+        queued_count = 0
         
         try:
             # Import formatting function
@@ -3805,37 +3212,17 @@ class FunTriviaScraper(BaseScraper):
                     self.logger.error(f"[{quiz_log_id}] Error formatting question {question.get('id', 'unknown')}: {e}")
                     continue
             
-            # Save each question type to its respective CSV file
-            csv_files = self.config['storage']['csv_files']
-            
+            # Queue each question type for the writer (blocks if the writer is behind)
             for question_type, type_questions in questions_by_type.items():
-                if not type_questions:
-                    continue
-                
-                try:
-                    csv_file = csv_files[question_type]
-                    new_count = self.csv_handler.append_to_csv(type_questions, csv_file, question_type)
-                    saved_count += new_count
-                    
-                    if new_count > 0:
-                        self.logger.info(f"[{quiz_log_id}] ✅ Saved {new_count} {question_type} questions to {csv_file}")
-                        
-                        # Log sample for verification including description status
-                        sample = type_questions[0]
-                        description_length = len(sample.get('Description', ''))
-                        self.logger.debug(f"[{quiz_log_id}] Sample saved: Key={sample.get('Key')}, Question={sample.get('Question', '')[:50]}...")
-                        self.logger.debug(f"[{quiz_log_id}] Sample description: {description_length} chars")
-                    
-                except Exception as e:
-                    self.logger.error(f"[{quiz_log_id}] ❌ Failed to save {question_type} questions: {e}")
-                    continue
+                if type_questions:
+                    queued_count += await self.question_writer.put(question_type, type_questions)
             
-            if saved_count > 0:
-                self.logger.info(f"[{quiz_log_id}] 💾 INCREMENTAL SAVE COMPLETE: {saved_count} questions saved to CSV files")
+            if queued_count > 0:
+                self.logger.info(f"[{quiz_log_id}] 💾 INCREMENTAL SAVE: {queued_count} questions queued for writing")
             else:
-                self.logger.warning(f"[{quiz_log_id}] ⚠️ No questions were saved from this quiz")
+                self.logger.warning(f"[{quiz_log_id}] ⚠️ No questions were queued from this quiz")
                 
-            return saved_count
+            return queued_count
             
         except Exception as e:
             self.logger.error(f"[{quiz_log_id}] Error in incremental save: {e}")
@@ -3971,7 +3358,8 @@ class FunTriviaScraper(BaseScraper):
             await self._submit_all_quiz_answers(page, questions)
             return len(questions)
 
-    async def _parallel_media_download(self, questions: List[Dict[str, Any]], quiz_log_id: str) -> List[Dict[str, Any]]:
+    async def _parallel_media_download(self, questions: List[Dict[str, Any]], quiz_log_id: str,
+                                       media_capture: Optional[MediaCapture] = None) -> List[Dict[str, Any]]:
         """
         Download media files in parallel for better performance.
         
@@ -3981,6 +3369,7 @@ class FunTriviaScraper(BaseScraper):
         - Group by media type for efficient processing
         - Handle failures gracefully without blocking other downloads
         - Update questions with downloaded media filenames
+        - Use bodies the quiz page already loaded (media_capture) before downloading
         """
         if not self.parallel_media_downloads:
             return questions  # Use original sequential method
@@ -3994,7 +3383,7 @@ class FunTriviaScraper(BaseScraper):
             if question.get('type') == 'sound':
                 audio_url = self._extract_audio_url(question)
                 if audio_url:
-                    task = self._download_media_async(audio_url, question.get('id'), 'audio')
+                    task = self._download_media_async(audio_url, question.get('id'), 'audio', media_capture)
                     download_tasks.append(task)
                     task_to_question_map[len(download_tasks) - 1] = (question, 'audio')
             
@@ -4002,7 +3391,7 @@ class FunTriviaScraper(BaseScraper):
             elif question.get('isPhotoQuiz') or question.get('imageUrl'):
                 image_url = question.get('imageUrl')
                 if image_url:
-                    task = self._download_media_async(image_url, question.get('id'), 'image')
+                    task = self._download_media_async(image_url, question.get('id'), 'image', media_capture)
                     download_tasks.append(task)
                     task_to_question_map[len(download_tasks) - 1] = (question, 'image')
         
@@ -4026,11 +3415,13 @@ class FunTriviaScraper(BaseScraper):
         
         return questions
 
-    async def _download_media_async(self, url: str, question_id: str, media_type: str) -> str:
+    async def _download_media_async(self, url: str, question_id: str, media_type: str,
+                                    media_capture: Optional[MediaCapture] = None) -> str:
         """Async wrapper for media downloads."""
         return await self.media_handler.download_media(
             url=url,
             question_id=question_id,
             media_type=media_type,
-            user_agent=self._get_random_user_agent()
+            user_agent=self._get_random_user_agent(),
+            capture=media_capture
         )
\ No newline at end of file
@@ -6,13 +6,25 @@ with proper filename formatting and directory structure management.
 """
 
 import os
+import asyncio
+import hashlib
 import logging
+import time
+from collections import deque
 import aiohttp # type: ignore
 from pathlib import Path
 from urllib.parse import urlparse
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 from tenacity import retry, stop_after_attempt, wait_exponential # type: ignore
 
+from utils.media_store import MediaBlobStore, MediaManifest
+from utils.media_processor import MediaProcessor
+
+
+class MediaTooLargeError(Exception):
+    """Raised when a media download exceeds the configured size limit."""
+    pass
+
 
 class MediaHandler:
     """
@@ -23,20 +35,158 @@ class MediaHandler:
     - Files are saved to correct directories (assets/images, assets/audio)
     - Only filenames (not paths) are referenced in CSV files
     - Proper error handling and retry logic
+    - All downloads share one pooled HTTP session (keep-alive, DNS cache,
+      connection limits) opened with open() and released with close()
+    - Responses are streamed in chunks to a temp file written from a worker
+      thread, checksummed on the way, and renamed into place atomically
+    - With storage.media.content_addressed, each distinct file is kept once
+      in a MediaBlobStore and per-question filenames are hardlinks to it;
+      URLs already fetched (or being fetched) are not downloaded again
+    - Bodies captured from the quiz page by a MediaCapture are saved
+      directly; only media the browser did not load is downloaded
+    - Every saved file is recorded in a MediaManifest; files already on disk
+      for the same URL are skipped unless refresh is set (--refresh-media)
+    - With storage.media.processing.enabled, saved files are handed to a
+      MediaProcessor (process pool) for normalizing, thumbnails and audio
+      checks; close() waits for it to finish
     """
     
-    def __init__(self, config: Dict[str, Any]):
+    # Per-download records kept for get_download_stats()
+    RECENT_DOWNLOADS = 100
+    
+    def __init__(self, config: Dict[str, Any], metrics=None, refresh: bool = False):
         """
         Initialize the media handler.
         
         Args:
             config: Configuration dictionary containing storage paths
+            metrics: Optional ScrapingMetrics instance to record downloads into
+            refresh: Download media again even if the manifest says it is present
         """
         self.logger = logging.getLogger(__name__)
         self.config = config
+        self.metrics = metrics
+        self.refresh = refresh
+        self.session: Optional[aiohttp.ClientSession] = None
+        
+        self.download_stats = {
+            'downloads': 0,
+            'failures': 0,
+            'captured': 0,  # Files taken from the browser's own responses
+            'skipped': 0,  # Files already present according to the manifest
+            'bytes': 0,
+            'total_seconds': 0.0,
+            'max_seconds': 0.0
+        }
+        self.recent_downloads = deque(maxlen=self.RECENT_DOWNLOADS)
         
         # Ensure media directories exist
         self._ensure_media_directories()
+        
+        # One stored copy per distinct file; downloads of the same URL in progress
+        self.blob_store: Optional[MediaBlobStore] = None
+        if config['storage'].get('media', {}).get('content_addressed', True):
+            self.blob_store = MediaBlobStore.from_config(config)
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        
+        # Record of saved media files; seeded once from the directories when first created
+        self.manifest = MediaManifest.from_config(config)
+        if not os.path.exists(self.manifest.manifest_file):
+            self.manifest.bootstrap({'image': config['storage']['images_dir'],
+                                     'audio': config['storage']['audio_dir']})
+        
+        # Optional post-processing stage with its own process pool
+        self.processor: Optional[MediaProcessor] = None
+        if config['storage'].get('media', {}).get('processing', {}).get('enabled', False):
+            self.processor = MediaProcessor.from_config(config)
+    
+    async def open(self) -> aiohttp.ClientSession:
+        """
+        Open the shared HTTP session used for all downloads.
+        
+        Connection pool size, per-host cap, DNS cache lifetime and timeouts
+        come from the storage.media section of the configuration.
+        """
+        if self.session is not None and not self.session.closed:
+            return self.session
+        
+        settings = self.config['storage'].get('media', {})
+        timeouts = settings.get('timeouts', {})
+        connector = aiohttp.TCPConnector(
+            limit=settings.get('connection_limit', 10),
+            limit_per_host=settings.get('per_host_limit', 4),
+            ttl_dns_cache=settings.get('dns_cache_seconds', 300)
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(
+                total=timeouts.get('total', 60),
+                connect=timeouts.get('connect', 10),
+                sock_read=timeouts.get('read', 30)
+            )
+        )
+        self.logger.debug(f"Opened media download session (limit {connector.limit}, "
+                          f"per host {connector.limit_per_host})")
+        return self.session
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session and its pooled connections, and finish post-processing."""
+        if self.processor is not None:
+            await self.processor.close()
+        if self.session is not None:
+            if not self.session.closed:
+                await self.session.close()
+            self.session = None
+            stats = self.get_download_stats()
+            self.logger.info(f"Media session closed: {stats['downloads']} downloads, "
+                             f"{stats['bytes'] / (1024 * 1024):.1f} MB, "
+                             f"avg {stats['avg_seconds']:.2f}s, {stats['failures']} failed")
+            if self.blob_store is not None:
+                blob_stats = self.blob_store.get_stats()
+                self.logger.info(f"Media store: {blob_stats['url_hits']} reused URLs, "
+                                 f"{blob_stats['content_hits']} duplicate downloads, "
+                                 f"{blob_stats['bytes_saved'] / (1024 * 1024):.1f} MB saved")
+    
+    def _record_download(self, question_id: str, media_type: str, url: str,
+                         size: int, elapsed: float, success: bool, checksum: Optional[str] = None,
+                         source: str = 'http') -> None:
+        """Record latency and size of one download attempt."""
+        if success:
+            self.download_stats['downloads'] += 1
+            self.download_stats['bytes'] += size
+            if source == 'browser':
+                self.download_stats['captured'] += 1
+        else:
+            self.download_stats['failures'] += 1
+        self.download_stats['total_seconds'] += elapsed
+        self.download_stats['max_seconds'] = max(self.download_stats['max_seconds'], elapsed)
+        self.recent_downloads.append({
+            'question_id': question_id,
+            'media_type': media_type,
+            'url': url,
+            'bytes': size,
+            'seconds': round(elapsed, 3),
+            'success': success,
+            'checksum': checksum,
+            'source': source
+        })
+        if success and self.metrics:
+            self.metrics.record_media_download(media_type, size, elapsed)
+    
+    def get_download_stats(self) -> Dict[str, Any]:
+        """
+        Get download statistics.
+        
+        Returns:
+            Totals, average latency and the most recent per-download records
+            (question_id, media_type, url, bytes, seconds, success, checksum,
+            source - 'http' or 'browser')
+        """
+        stats = self.download_stats.copy()
+        attempts = stats['downloads'] + stats['failures']
+        stats['avg_seconds'] = stats['total_seconds'] / attempts if attempts else 0.0
+        stats['recent'] = list(self.recent_downloads)
+        return stats
     
     def _ensure_media_directories(self) -> None:
         """Create media directories if they don't exist."""
@@ -112,12 +262,89 @@ class MediaHandler:
         """
         return self.get_media_filename(question_id, media_type, source_url)
     
+    async def _stream_to_file(self, response, filepath: str) -> Tuple[int, str]:
+        """
+        Stream a response body to filepath without buffering it in memory.
+        
+        Chunks are written to a temp file (cleaned up by cleanup_temp_files
+        if the process dies mid-download) from a worker thread, so other
+        scrapers keep running during disk I/O. The temp file is renamed over
+        filepath only once the whole body has arrived.
+        
+        Returns:
+            (size in bytes, hex checksum of the content)
+        
+        Raises:
+            MediaTooLargeError: If the body exceeds storage.media.max_file_size_mb
+        """
+        settings = self.config['storage'].get('media', {})
+        max_mb = settings.get('max_file_size_mb')
+        max_bytes = int(max_mb * 1024 * 1024) if max_mb else None
+        chunk_size = settings.get('chunk_size', 64 * 1024)
+        digest = hashlib.new(settings.get('checksum_algorithm', 'sha256'))
+        
+        if max_bytes and response.content_length and response.content_length > max_bytes:
+            raise MediaTooLargeError(f"Content-Length {response.content_length} exceeds limit of {max_bytes} bytes")
+        
+        directory, filename = os.path.split(filepath)
+        temp_path = os.path.join(directory, f"temp_{filename}")
+        size = 0
+        f = await asyncio.to_thread(open, temp_path, 'wb')
+        try:
+            try:
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    size += len(chunk)
+                    if max_bytes and size > max_bytes:
+                        raise MediaTooLargeError(f"Download exceeds limit of {max_bytes} bytes")
+                    digest.update(chunk)
+                    await asyncio.to_thread(f.write, chunk)
+            finally:
+                await asyncio.to_thread(f.close)
+            await asyncio.to_thread(os.replace, temp_path, filepath)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+        
+        return size, digest.hexdigest()
+    
+    def _write_content(self, content: bytes, filepath: str) -> Tuple[int, str]:
+        """
+        Save already fetched bytes like _stream_to_file() does (run in a worker thread).
+        
+        Returns:
+            (size in bytes, hex checksum of the content)
+        """
+        settings = self.config['storage'].get('media', {})
+        max_mb = settings.get('max_file_size_mb')
+        if max_mb and len(content) > max_mb * 1024 * 1024:
+            raise MediaTooLargeError(f"Captured body of {len(content)} bytes exceeds limit of {max_mb} MB")
+        
+        directory, filename = os.path.split(filepath)
+        temp_path = os.path.join(directory, f"temp_{filename}")
+        with open(temp_path, 'wb') as f:
+            f.write(content)
+        os.replace(temp_path, filepath)
+        return len(content), hashlib.new(settings.get('checksum_algorithm', 'sha256'), content).hexdigest()
+    
+    async def _find_stored(self, url: str) -> Optional[Tuple[str, str]]:
+        """Blob (hash, extension) for a URL that is stored or being downloaded by another worker."""
+        in_flight = self._in_flight.get(url)
+        if in_flight is not None:
+            stored = await asyncio.shield(in_flight)
+            if stored:
+                self.blob_store.stats['url_hits'] += 1
+            return stored
+        return self.blob_store.lookup_url(url)
+    
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10)
     )
     async def download_media(self, url: str, question_id: str, media_type: str, 
-                           user_agent: str = None) -> Optional[str]:
+                           user_agent: str = None, capture: Optional['MediaCapture'] = None) -> Optional[str]:
         """
         Download media file and save with proper localization key filename.
         
@@ -126,6 +353,8 @@ class MediaHandler:
             question_id: Question localization key (e.g., Question_MQ_Parsed_Culture_Easy_0001)
             media_type: Type of media ('image' or 'audio')
             user_agent: User agent string for HTTP requests
+            capture: Optional MediaCapture of the quiz page; a body the browser
+                already loaded is saved instead of downloading it again
             
         Returns:
             Filename of downloaded file (for CSV reference) or None if failed
@@ -138,31 +367,97 @@ class MediaHandler:
             # Get proper file path and filename
             filepath = self.get_media_filepath(question_id, media_type, url)
             filename = self.get_csv_reference(question_id, media_type, url)
+            ext = os.path.splitext(filename)[1].lstrip('.')
             
-            # Set up HTTP headers
-            headers = {}
-            if user_agent:
-                headers['User-Agent'] = user_agent
+            if not self.refresh and await asyncio.to_thread(self.manifest.is_present, filename, url, filepath):
+                self.download_stats['skipped'] += 1
+                self.logger.debug(f"{media_type} for {question_id} already present: {filename}")
+                if self.processor is not None:
+                    self.processor.schedule(filepath, media_type)
+                return filename
             
-            # Download the file
-            self.logger.debug(f"Downloading {media_type} from {url} to {filepath}")
+            in_flight = None
+            if self.blob_store is not None:
+                # Reuse an asset already fetched for another question - no network
+                stored = None if self.refresh else await self._find_stored(url)
+                if stored:
+                    await asyncio.to_thread(self.blob_store.link, *stored, filepath)
+                    await asyncio.to_thread(self.manifest.record, filename, url, media_type,
+                                            os.path.getsize(filepath), stored[0])
+                    self.logger.info(f"Reused stored {media_type} for {question_id}: {filename}")
+                    if self.processor is not None:
+                        self.processor.schedule(filepath, media_type)
+                    return filename
+                in_flight = asyncio.get_running_loop().create_future()
+                self._in_flight[url] = in_flight
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        # Write file to disk
-                        with open(filepath, 'wb') as f:
-                            f.write(await response.read())
-                        
-                        self.logger.info(f"Successfully downloaded {media_type} for {question_id}: {filename}")
-                        return filename  # Return just filename for CSV
-                    else:
-                        raise Exception(f"HTTP {response.status}: Failed to download {media_type}")
+            stored = None
+            try:
+                target = self.blob_store.staging_path() if self.blob_store is not None else filepath
+                start_time = time.perf_counter()
+                content = await capture.get(url) if capture is not None else None
+                if content is not None:
+                    # The browser fetched it already - no second request
+                    try:
+                        size, checksum = await asyncio.to_thread(self._write_content, content, target)
+                    except Exception:
+                        self._record_download(question_id, media_type, url, 0, time.perf_counter() - start_time,
+                                              False, source='browser')
+                        raise
+                    self._record_download(question_id, media_type, url, size, time.perf_counter() - start_time,
+                                          True, checksum, source='browser')
+                else:
+                    size, checksum = await self._fetch(url, media_type, question_id, target, user_agent)
+                
+                if self.blob_store is not None:
+                    # Keep one copy per content hash and link the question's filename to it
+                    await asyncio.to_thread(self.blob_store.add, target, checksum, ext, url)
+                    await asyncio.to_thread(self.blob_store.link, checksum, ext, filepath)
+                    stored = (checksum, ext)
+                await asyncio.to_thread(self.manifest.record, filename, url, media_type, size, checksum)
+            finally:
+                if in_flight is not None:
+                    self._in_flight.pop(url, None)
+                    in_flight.set_result(stored)
+            
+            self.logger.info(f"Successfully downloaded {media_type} for {question_id}: {filename}")
+            if self.processor is not None:
+                self.processor.schedule(filepath, media_type)
+            return filename  # Return just filename for CSV
                         
         except Exception as e:
             self.logger.error(f"Failed to download {media_type} for {question_id}: {e}")
             return None
     
+    async def _fetch(self, url: str, media_type: str, question_id: str, target: str,
+                     user_agent: Optional[str] = None) -> Tuple[int, str]:
+        """
+        Download url over the shared session and stream it to target.
+        
+        Returns:
+            (size in bytes, hex checksum of the content)
+        """
+        headers = {}
+        if user_agent:
+            headers['User-Agent'] = user_agent
+        
+        # Download the file over the shared session (opened on first use)
+        self.logger.debug(f"Downloading {media_type} from {url} to {target}")
+        session = await self.open()
+        
+        start_time = time.perf_counter()
+        try:
+            async with session.get(url, headers=headers) as response:
+                if response.status != 200:
+                    raise Exception(f"HTTP {response.status}: Failed to download {media_type}")
+                # Stream to disk off the event loop
+                size, checksum = await self._stream_to_file(response, target)
+        except Exception:
+            self._record_download(question_id, media_type, url, 0, time.perf_counter() - start_time, False)
+            raise
+        self._record_download(question_id, media_type, url, size, time.perf_counter() - start_time, True, checksum)
+        return size, checksum
+    
     def validate_media_file(self, question_id: str, media_type: str, source_url: str) -> bool:
         """
         Check if media file exists and is valid.
@@ -195,6 +490,8 @@ class MediaHandler:
         """
         Get statistics about downloaded media files.
         
+        Read from the media manifest, so no directory scan is needed.
+        
         Returns:
             Dictionary with statistics for images and audio files
         """
@@ -203,36 +500,32 @@ class MediaHandler:
             'audio': {'count': 0, 'total_size_mb': 0, 'directory': self.config['storage']['audio_dir']}
         }
         
-        # Count images
-        images_dir = Path(self.config['storage']['images_dir'])
-        if images_dir.exists():
-            image_files = list(images_dir.glob('*'))
-            stats['images']['count'] = len(image_files)
-            stats['images']['total_size_mb'] = sum(f.stat().st_size for f in image_files if f.is_file()) / (1024*1024)
-        
-        # Count audio files
-        audio_dir = Path(self.config['storage']['audio_dir'])
-        if audio_dir.exists():
-            audio_files = list(audio_dir.glob('*'))
-            stats['audio']['count'] = len(audio_files)
-            stats['audio']['total_size_mb'] = sum(f.stat().st_size for f in audio_files if f.is_file()) / (1024*1024)
+        for media_type, key in (('image', 'images'), ('audio', 'audio')):
+            sizes = [entry['size'] for entry in self.manifest.iter_entries(media_type)]
+            stats[key]['count'] = len(sizes)
+            stats[key]['total_size_mb'] = sum(sizes) / (1024*1024)
         
         return stats
     
     def cleanup_temp_files(self) -> int:
         """
-        Remove temporary media files (files with 'temp_' prefix).
+        Remove temporary media files (files with 'temp_' prefix, and
+        unfinished 'incoming_' downloads in the blob store).
         
         Returns:
             Number of files cleaned up
         """
         cleaned_count = 0
         
-        for directory in [self.config['storage']['images_dir'], self.config['storage']['audio_dir']]:
+        directories = [self.config['storage']['images_dir'], self.config['storage']['audio_dir']]
+        if self.blob_store is not None:
+            directories.append(self.blob_store.blob_dir)
+        
+        for directory in directories:
             try:
                 dir_path = Path(directory)
                 if dir_path.exists():
-                    temp_files = list(dir_path.glob('temp_*'))
+                    temp_files = list(dir_path.glob('temp_*')) + list(dir_path.glob('incoming_*'))
                     for temp_file in temp_files:
                         try:
                             temp_file.unlink()
@@ -249,6 +542,88 @@ class MediaHandler:
         return cleaned_count
 
 
+class MediaCapture:
+    """
+    Keeps the bodies of media responses a browser page loads itself.
+    
+    Photo and audio quiz pages already make Chromium fetch their images and
+    clips. Attached to a quiz page, this listens to its responses and holds
+    the bodies of complete (HTTP 200) image and media responses, so
+    MediaHandler can save them instead of fetching each URL a second time.
+    Partial (range) responses are ignored and fall back to a download.
+    """
+    
+    RESOURCE_TYPES = ('image', 'media')
+    
+    def __init__(self, max_bytes: int = 100 * 1024 * 1024):
+        """
+        Args:
+            max_bytes: Upper bound on captured bytes held per page
+        """
+        self.logger = logging.getLogger(__name__)
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.bodies: Dict[str, bytes] = {}
+        self._pending: Dict[str, asyncio.Task] = {}
+        self._page = None
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'MediaCapture':
+        """Create a capture using the storage.media section of the scraper configuration."""
+        max_mb = config['storage'].get('media', {}).get('capture_max_mb', 100)
+        return cls(max_bytes=int(max_mb * 1024 * 1024))
+    
+    def attach(self, page) -> None:
+        """Start capturing media responses of a page (before navigating it)."""
+        self._page = page
+        page.on('response', self._on_response)
+    
+    def _on_response(self, response) -> None:
+        if response.status != 200 or response.request.resource_type not in self.RESOURCE_TYPES:
+            return
+        url = response.url
+        if url in self.bodies or url in self._pending:
+            return
+        # Bodies must be read while the page is alive; do it in the background
+        self._pending[url] = asyncio.ensure_future(self._read_body(url, response))
+    
+    async def _read_body(self, url: str, response) -> Optional[bytes]:
+        try:
+            body = await response.body()
+        except Exception as e:
+            self.logger.debug(f"Could not capture media body for {url}: {e}")
+            return None
+        finally:
+            self._pending.pop(url, None)
+        
+        if self.total_bytes + len(body) > self.max_bytes:
+            self.logger.debug(f"Capture limit reached - not keeping {url}")
+            return None
+        self.bodies[url] = body
+        self.total_bytes += len(body)
+        return body
+    
+    async def get(self, url: str) -> Optional[bytes]:
+        """Body of a captured URL (waiting for it if still being read), or None if not seen."""
+        if url in self.bodies:
+            return self.bodies[url]
+        pending = self._pending.get(url)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        return None
+    
+    async def close(self) -> None:
+        """Stop capturing and release held bodies."""
+        if self._page is not None:
+            self._page.remove_listener('response', self._on_response)
+            self._page = None
+        for task in list(self._pending.values()):
+            task.cancel()
+        self._pending.clear()
+        self.bodies.clear()
+        self.total_bytes = 0
+
+
 class MediaReference:
     """
     Helper class for managing media references in question data.
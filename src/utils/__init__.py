@@ -4,7 +4,14 @@ Utility modules for the FunTrivia scraper.
 This package contains utility classes and functions for:
 - Question type classification
 - Text processing and cleaning  
+- Precompiled regex patterns
 - CSV file handling
+- SQLite question storage
+- Parquet export
+- Content-signature deduplication
+- Near-duplicate (MinHash/LSH) detection
+- Content-addressed media storage
+- Background question writing
 - Rate limiting
 - Question indexing
 """
@@ -14,6 +21,12 @@ from .text_processor import TextProcessor, clean_question_text, clean_descriptio
 from .csv_handler import CSVHandler
 from .rate_limiter import RateLimiter
 from .indexing import QuestionIndexer
+from .question_writer import QuestionWriter
+from .storage import QuestionStore
+from .parquet_exporter import ParquetExporter
+from .dedup import SignatureIndex, question_signature
+from .near_dedup import NearDuplicateIndex
+from .media_store import MediaBlobStore
 
 __all__ = [
     'QuestionClassifier',
@@ -21,7 +34,14 @@ __all__ = [
     'CSVHandler',
     'RateLimiter',
     'QuestionIndexer',
+    'QuestionWriter',
+    'QuestionStore',
+    'ParquetExporter',
+    'SignatureIndex',
+    'NearDuplicateIndex',
+    'MediaBlobStore',
     'detect_question_type',
+    'question_signature',
     'clean_question_text',
     'clean_description_text'
 ] 
\ No newline at end of file
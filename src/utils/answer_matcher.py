@@ -0,0 +1,135 @@
+"""
+Answer-to-Option Matching
+
+Correct answers read from a results page rarely match the option text
+exactly ("The Beatles" vs "Beatles", "Pokémon" vs "Pokemon", "Mars." vs
+"Mars"). An OptionIndex normalizes a question's options once (casefolded,
+accents, punctuation and articles removed, token sets) and ranks every
+option against an answer:
+
+    exact       1.0         same text after stripping whitespace
+    normalized  0.95        same normalized text
+    contains    0.6 - 0.9   one normalized text contains the other as whole
+                            words; more of the longer text covered scores higher
+    tokens      0.5 - 0.7   at least half of the combined tokens shared
+
+The best-scoring option wins, ties going to the earlier option, so results
+are deterministic. Indexes are cached per option list, so the extraction
+pass and the CSV formatting pass share one.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+ARTICLES = frozenset({'a', 'an', 'the'})
+
+# Matches below this confidence are counted as low-confidence
+LOW_CONFIDENCE = 0.75
+
+_THOUSANDS_RE = re.compile(r'(?<=\d),(?=\d{3}\b)')
+_NON_WORD_RE = re.compile(r'[^\w\s]|_')
+
+
+class AnswerMatch(NamedTuple):
+    """Option chosen for an answer; option is None and index -1 when nothing matched."""
+    option: Optional[str]
+    index: int
+    confidence: float
+    method: str
+
+
+NO_MATCH = AnswerMatch(option=None, index=-1, confidence=0.0, method='none')
+
+
+def answer_tokens(text: str) -> Tuple[str, ...]:
+    """Casefolded, accent- and punctuation-free tokens with articles removed."""
+    text = unicodedata.normalize('NFKD', str(text or ''))
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch)).casefold()
+    text = _NON_WORD_RE.sub(' ', _THOUSANDS_RE.sub('', text))
+    tokens = text.split()
+    # Keep the articles when the text is nothing but an article ("A" as an option)
+    return tuple(token for token in tokens if token not in ARTICLES) or tuple(tokens)
+
+
+def normalize_answer(text: str) -> str:
+    """Normalized form of an answer or option used for comparisons."""
+    return ' '.join(answer_tokens(text))
+
+
+class OptionIndex:
+    """
+    Normalized view of a question's options for ranking answers against them.
+
+    Use OptionIndex.for_options() to share one index per option list.
+    """
+
+    def __init__(self, options: Iterable[str]):
+        self.options: List[str] = [str(option).strip() for option in options]
+        self._exact = {}
+        self._normalized = {}
+        self._padded: List[str] = []
+        self._tokens: List[frozenset] = []
+        for i, option in enumerate(self.options):
+            normalized = normalize_answer(option)
+            self._exact.setdefault(option, i)
+            if normalized:
+                self._normalized.setdefault(normalized, i)
+            self._padded.append(f" {normalized} ")
+            self._tokens.append(frozenset(normalized.split()))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _cached(options: Tuple[str, ...]) -> 'OptionIndex':
+        return OptionIndex(options)
+
+    @classmethod
+    def for_options(cls, options: Iterable[str]) -> 'OptionIndex':
+        """Index for an option list, built once per distinct list."""
+        return cls._cached(tuple(str(option) for option in options))
+
+    def _result(self, index: int, confidence: float, method: str) -> AnswerMatch:
+        return AnswerMatch(option=self.options[index], index=index, confidence=round(confidence, 3), method=method)
+
+    def match(self, answer: str) -> AnswerMatch:
+        """Best option for an answer, with its confidence (NO_MATCH if none qualifies)."""
+        answer = str(answer or '').strip()
+        if not answer or not self.options:
+            return NO_MATCH
+
+        if answer in self._exact:
+            return self._result(self._exact[answer], 1.0, 'exact')
+
+        normalized = normalize_answer(answer)
+        if not normalized:
+            return NO_MATCH
+        if normalized in self._normalized:
+            return self._result(self._normalized[normalized], 0.95, 'normalized')
+
+        padded = f" {normalized} "
+        tokens = frozenset(normalized.split())
+        best_index, best_confidence, best_method = -1, 0.0, 'none'
+        for i, option_padded in enumerate(self._padded):
+            if option_padded.strip() == '':
+                continue
+            if option_padded in padded or padded in option_padded:
+                shorter, longer = sorted((len(option_padded), len(padded)))
+                confidence, method = 0.6 + 0.3 * (shorter - 2) / (longer - 2), 'contains'
+            else:
+                option_tokens = self._tokens[i]
+                overlap = len(tokens & option_tokens) / len(tokens | option_tokens)
+                if overlap < 0.5:
+                    continue
+                confidence, method = 0.3 + 0.4 * overlap, 'tokens'
+            if confidence > best_confidence:
+                best_index, best_confidence, best_method = i, confidence, method
+
+        if best_index < 0:
+            return NO_MATCH
+        return self._result(best_index, best_confidence, best_method)
+
+
+def match_answer(options: Iterable[str], answer: str) -> AnswerMatch:
+    """Rank an answer against a question's options using the shared option index."""
+    return OptionIndex.for_options(options).match(answer)
@@ -0,0 +1,107 @@
+"""
+Latency and memory bookkeeping for the benchmarks.
+
+A LatencyRecorder collects wall-clock samples per named stage ("detect_type",
+"strategy_1", ...) and summarizes them as count, mean, p50, p95, p99 and max
+in milliseconds. Percentiles use the nearest-rank method, so every reported
+value is a latency that was actually observed.
+
+A MemorySampler polls the resident memory of this process and of its child
+processes (the browser, parse workers) and keeps the peaks.
+"""
+
+import asyncio
+import math
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence
+
+import psutil
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values (0.0 for no values)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class LatencyRecorder:
+    """
+    Per-stage latency samples.
+
+    - record() adds a sample in seconds
+    - measure() times the body of a with block
+    - summary() reports milliseconds per stage
+    """
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+
+    def record(self, stage: str, seconds: float) -> None:
+        self.samples[stage].append(seconds)
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """Record how long the with block took, also when it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """count, mean_ms, p50_ms, p95_ms, p99_ms and max_ms per stage, in recording order."""
+        report = {}
+        for stage, samples in self.samples.items():
+            ordered = sorted(samples)
+            report[stage] = {
+                'count': len(ordered),
+                'mean_ms': round(sum(ordered) / len(ordered) * 1000, 3) if ordered else 0.0,
+                'p50_ms': round(percentile(ordered, 0.50) * 1000, 3),
+                'p95_ms': round(percentile(ordered, 0.95) * 1000, 3),
+                'p99_ms': round(percentile(ordered, 0.99) * 1000, 3),
+                'max_ms': round(ordered[-1] * 1000, 3) if ordered else 0.0,
+            }
+        return report
+
+
+class MemorySampler:
+    """
+    Peak resident memory of this process and its children, sampled in the background.
+
+    Run sample_forever() as a task for the duration of the measurement and
+    cancel it afterwards; summary() reports the peaks in MB.
+    """
+
+    def __init__(self, interval: float = 0.25):
+        self.interval = interval
+        self.process = psutil.Process()
+        self.peak_rss = 0
+        self.peak_children_rss = 0
+        self.samples = 0
+
+    def sample(self) -> None:
+        self.peak_rss = max(self.peak_rss, self.process.memory_info().rss)
+        children_rss = 0
+        for child in self.process.children(recursive=True):
+            try:
+                children_rss += child.memory_info().rss
+            except psutil.Error:
+                continue  # Exited between listing and reading
+        self.peak_children_rss = max(self.peak_children_rss, children_rss)
+        self.samples += 1
+
+    async def sample_forever(self) -> None:
+        while True:
+            self.sample()
+            await asyncio.sleep(self.interval)
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            'samples': self.samples,
+            'peak_rss_mb': round(self.peak_rss / 1048576, 1),
+            'peak_children_rss_mb': round(self.peak_children_rss / 1048576, 1),
+        }
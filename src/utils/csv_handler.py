@@ -1,6 +1,8 @@
 import pandas as pd
+import csv
 import os
-from typing import List, Dict, Any, Set
+import threading
+from typing import List, Dict, Any, Set, Optional, Tuple
 import logging
 from pathlib import Path
 import sys
@@ -14,44 +16,81 @@ except ImportError:
     from constants import CSV_COLUMNS
 
 class CSVHandler:
-    """Handles CSV operations with appending capability and duplicate prevention."""
+    """
+    Handles CSV operations with appending capability and duplicate prevention.
+    
+    Files are treated as append-only: the question keys of each file are read
+    once into an in-memory set, and new rows are appended with the csv module
+    instead of re-reading and rewriting the whole file, so saving a batch
+    costs O(batch) rather than O(rows in file).
+    """
     
     def __init__(self, output_dir: str = "output"):
         self.logger = logging.getLogger(__name__)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # csv_file -> set of keys already stored in that file
+        self._key_index: Dict[str, Set[str]] = {}
+        # csv_file -> (mtime_ns, size) of the file when the index was last in sync,
+        # so files changed behind our back are re-indexed
+        self._index_signature: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._lock = threading.Lock()
     
-    def get_existing_keys(self, csv_file: str) -> Set[str]:
-        """Get existing question keys from a CSV file to prevent duplicates."""
+    def _file_signature(self, csv_path: Path) -> Optional[Tuple[int, int]]:
+        """Get a cheap signature of a file for detecting external modifications."""
+        try:
+            stat = csv_path.stat()
+            return (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            return None
+    
+    def _load_key_index(self, csv_file: str) -> Set[str]:
+        """Return the key index for a CSV file, reading the file only if it changed since last indexed."""
         csv_path = self.output_dir / csv_file
-        existing_keys = set()
+        signature = self._file_signature(csv_path)
         
-        if csv_path.exists():
+        if csv_file in self._key_index and self._index_signature.get(csv_file) == signature:
+            return self._key_index[csv_file]
+        
+        keys = set()
+        if signature is not None:
             try:
-                df = pd.read_csv(csv_path)
-                if 'Key' in df.columns:
-                    existing_keys = set(df['Key'].dropna().astype(str))
-                    self.logger.info(f"Found {len(existing_keys)} existing keys in {csv_file}")
+                with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+                    reader = csv.DictReader(f)
+                    if reader.fieldnames and 'Key' in reader.fieldnames:
+                        for row in reader:
+                            key = row.get('Key')
+                            if key:
+                                keys.add(key)
+                self.logger.info(f"Found {len(keys)} existing keys in {csv_file}")
             except Exception as e:
                 self.logger.error(f"Error reading existing CSV {csv_file}: {e}")
         
-        return existing_keys
+        self._key_index[csv_file] = keys
+        self._index_signature[csv_file] = signature
+        return keys
+    
+    def get_existing_keys(self, csv_file: str) -> Set[str]:
+        """Get existing question keys from a CSV file to prevent duplicates."""
+        return set(self._load_key_index(csv_file))
     
     def filter_new_questions(self, questions: List[Dict[str, Any]], csv_file: str) -> List[Dict[str, Any]]:
-        """Filter out questions that already exist in the CSV file."""
-        existing_keys = self.get_existing_keys(csv_file)
-        
-        if not existing_keys:
-            return questions
+        """Filter out questions that already exist in the CSV file or repeat within the batch."""
+        existing_keys = self._load_key_index(csv_file)
         
         new_questions = []
+        batch_keys = set()
         for question in questions:
-            if question.get('Key') not in existing_keys:
-                new_questions.append(question)
-            else:
-                self.logger.debug(f"Skipping duplicate question: {question.get('Key')}")
-        
-        self.logger.info(f"Filtered {len(questions)} questions to {len(new_questions)} new questions")
+            key = str(question.get('Key', ''))
+            if key in existing_keys or key in batch_keys:
+                self.logger.debug(f"Skipping duplicate question: {key}")
+                continue
+            batch_keys.add(key)
+            new_questions.append(question)
+        
+        if len(new_questions) != len(questions):
+            self.logger.info(f"Filtered {len(questions)} questions to {len(new_questions)} new questions")
         return new_questions
     
     def get_csv_columns(self, question_type: str) -> List[str]:
@@ -72,47 +111,92 @@ class CSVHandler:
         
         return df
     
+    def _read_header(self, csv_path: Path) -> List[str]:
+        """Read the header row of an existing CSV file (empty list if the file is empty)."""
+        with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+            return next(csv.reader(f), [])
+    
+    def _ends_with_newline(self, csv_path: Path) -> bool:
+        """Check whether a non-empty file ends with a newline, so appended rows start on a fresh line."""
+        with open(csv_path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) in (b'\n', b'\r')
+    
     def append_to_csv(self, questions: List[Dict[str, Any]], csv_file: str, question_type: str) -> int:
-        """Append new questions to existing CSV file or create new one."""
-        if not questions:
-            self.logger.info(f"No questions to append to {csv_file}")
-            return 0
+        """
+        Append new questions to an existing CSV file or create a new one.
         
-        csv_path = self.output_dir / csv_file
+        Only the new rows are written; the header is written only when the
+        file is new or empty. Rows follow the column order of the existing
+        header so files created with an older layout stay consistent.
         
-        # Filter out duplicates
-        new_questions = self.filter_new_questions(questions, csv_file)
+        Returns:
+            Number of rows written (0 if all were already present)
         
-        if not new_questions:
-            self.logger.info(f"No new questions to add to {csv_file}")
+        Raises:
+            OSError: If the file cannot be read or written
+        """
+        if not questions:
+            self.logger.info(f"No questions to append to {csv_file}")
             return 0
         
-        # Convert to DataFrame and ensure proper structure
-        new_df = pd.DataFrame(new_questions)
-        new_df = self.ensure_csv_structure(new_df, question_type)
+        csv_path = self.output_dir / csv_file
         
-        try:
-            if csv_path.exists():
-                # Read existing CSV and append new data
-                existing_df = pd.read_csv(csv_path)
-                existing_df = self.ensure_csv_structure(existing_df, question_type)
-                
-                # Combine and save
-                combined_df = pd.concat([existing_df, new_df], ignore_index=True)
-                combined_df.to_csv(csv_path, index=False)
-                
-                self.logger.info(f"Appended {len(new_questions)} questions to existing {csv_file}")
-                self.logger.info(f"Total questions in {csv_file}: {len(combined_df)}")
-            else:
-                # Create new CSV file
-                new_df.to_csv(csv_path, index=False)
-                self.logger.info(f"Created new {csv_file} with {len(new_questions)} questions")
+        with self._lock:
+            # Filter out duplicates
+            new_questions = self.filter_new_questions(questions, csv_file)
             
-            return len(new_questions)
+            if not new_questions:
+                self.logger.info(f"No new questions to add to {csv_file}")
+                return 0
             
-        except Exception as e:
-            self.logger.error(f"Error writing to CSV {csv_file}: {e}")
-            return 0
+            try:
+                is_new_file = not csv_path.exists() or csv_path.stat().st_size == 0
+                if is_new_file:
+                    fieldnames = self.get_csv_columns(question_type)
+                else:
+                    fieldnames = self._read_header(csv_path)
+                    missing = [col for col in self.get_csv_columns(question_type) if col not in fieldnames]
+                    if missing:
+                        self.logger.warning(f"{csv_file} is missing columns {missing} - values for them will not be saved")
+                
+                needs_newline = not is_new_file and not self._ends_with_newline(csv_path)
+                
+                with open(csv_path, 'a', newline='', encoding='utf-8') as f:
+                    if needs_newline:
+                        f.write('\n')
+                    writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore', lineterminator='\n')
+                    if is_new_file:
+                        writer.writeheader()
+                    writer.writerows(new_questions)
+                
+                # Keep the key index in sync with what is now on disk
+                keys = self._key_index[csv_file]
+                keys.update(str(question.get('Key', '')) for question in new_questions)
+                self._index_signature[csv_file] = self._file_signature(csv_path)
+                
+                if is_new_file:
+                    self.logger.info(f"Created new {csv_file} with {len(new_questions)} questions")
+                else:
+                    self.logger.info(f"Appended {len(new_questions)} questions to existing {csv_file}")
+                self.logger.debug(f"Total questions in {csv_file}: {len(keys)}")
+                
+                return len(new_questions)
+                
+            except Exception as e:
+                self.logger.error(f"Error writing to CSV {csv_file}: {e}")
+                # The file may be partially written - re-index on next use
+                self._key_index.pop(csv_file, None)
+                raise
+    
+    def reset_csv(self, csv_file: str, question_type: str) -> None:
+        """Truncate a CSV file to just its header row."""
+        csv_path = self.output_dir / csv_file
+        with self._lock:
+            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+                csv.writer(f, lineterminator='\n').writerow(self.get_csv_columns(question_type))
+            self._key_index[csv_file] = set()
+            self._index_signature[csv_file] = self._file_signature(csv_path)
     
     def get_csv_stats(self, csv_file: str) -> Dict[str, Any]:
         """Get statistics about an existing CSV file."""
@@ -0,0 +1,187 @@
+"""
+Content-signature deduplication for scraped questions.
+
+Question keys are new for every run, so the same quiz scraped twice would
+otherwise produce duplicate rows. A signature is computed from the
+normalized question text and correct answer; the SignatureIndex keeps the
+signatures of everything already stored so duplicates are dropped before
+they reach disk. deduplicate_questions.py uses the same normalization for
+cleaning legacy files.
+"""
+
+import csv
+import hashlib
+import logging
+import os
+import re
+import threading
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
+
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_signature_text(text: Any) -> str:
+    """Lowercase, replace punctuation with spaces and collapse whitespace."""
+    text = _PUNCTUATION_RE.sub(' ', str(text or '').lower())
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+def question_signature(question: Any, correct_answer: Any) -> str:
+    """Signature of a question: md5 of its normalized text and correct answer."""
+    basis = f"{normalize_signature_text(question)}|{normalize_signature_text(correct_answer)}"
+    return hashlib.md5(basis.encode('utf-8')).hexdigest()
+
+
+def row_signature(row: Dict[str, Any]) -> str:
+    """Signature of a formatted (CSV-style) question row."""
+    return question_signature(row.get('Question'), row.get('CorrectAnswer'))
+
+
+def normalize_signature_series(series):
+    """Vectorized normalize_signature_text() for a pandas Series."""
+    return (series.fillna('').astype(str).str.lower()
+            .str.replace(_PUNCTUATION_RE.pattern, ' ', regex=True)
+            .str.replace(_WHITESPACE_RE.pattern, ' ', regex=True)
+            .str.strip())
+
+
+def signature_series(questions, answers) -> List[str]:
+    """
+    Vectorized signatures for pandas Series of question texts and answers.
+
+    Same normalization as question_signature(), applied column-wise; only
+    the final hashing is done per row.
+    """
+    basis = normalize_signature_series(questions) + '|' + normalize_signature_series(answers)
+    return [hashlib.md5(text.encode('utf-8')).hexdigest() for text in basis]
+
+
+class SignatureIndex:
+    """
+    Persistent set of signatures of stored questions.
+
+    With an index file, signatures are kept one per line and new ones are
+    appended after each successful write; a missing file is rebuilt from
+    the existing CSV files on load. Without a file (SQLite backend) the
+    index is loaded from the store, whose signature column persists it.
+    """
+
+    def __init__(self, index_file: Optional[str] = None):
+        self.logger = logging.getLogger(__name__)
+        self.index_file = index_file
+        self.signatures: Set[str] = set()
+        self._lock = threading.Lock()
+        self.loaded = False
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], store=None) -> 'SignatureIndex':
+        """Create an index from the storage.dedup section of the scraper configuration."""
+        if store is not None:
+            return cls()
+        storage = config['storage']
+        index_file = storage.get('dedup', {}).get('signature_file') or \
+            os.path.join(storage['output_dir'], 'question_signatures.txt')
+        return cls(index_file)
+
+    def load(self, csv_paths: Iterable[str] = (), store=None) -> int:
+        """
+        Load stored signatures.
+
+        Reads the index file if it exists; otherwise builds it from the
+        given CSV files (or from the store) so existing data is covered.
+
+        Returns:
+            Number of signatures loaded
+        """
+        csv_paths = list(csv_paths)
+        with self._lock:
+            if store is not None:
+                self.signatures = set(store.iter_signatures())
+            elif self.index_file and os.path.exists(self.index_file):
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    self.signatures = {line.strip() for line in f if line.strip()}
+            else:
+                self._build(csv_paths)
+            self.loaded = True
+            self.logger.info(f"Loaded {len(self.signatures)} question signatures")
+            return len(self.signatures)
+
+    def rebuild(self, csv_paths: Iterable[str]) -> int:
+        """
+        Rebuild the index from the given CSV files, ignoring the index file.
+
+        Used when only some of the CSV files were overwritten.
+
+        Returns:
+            Number of signatures loaded
+        """
+        with self._lock:
+            self._build(list(csv_paths))
+            self.loaded = True
+            return len(self.signatures)
+
+    def _build(self, csv_paths: List[str]) -> None:
+        self.signatures = set()
+        for csv_path in csv_paths:
+            if not os.path.exists(csv_path):
+                continue
+            with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+                self.signatures.update(row_signature(row) for row in csv.DictReader(f))
+        if self.index_file:
+            self._write_all()
+        self.logger.info(f"Built signature index from {len(csv_paths)} CSV files")
+
+    def _write_all(self) -> None:
+        """Rewrite the index file from memory (atomic rename)."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.index_file)), exist_ok=True)
+        temp_path = f"{self.index_file}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.writelines(f"{signature}\n" for signature in sorted(self.signatures))
+        os.replace(temp_path, self.index_file)
+
+    def clear(self) -> None:
+        """Forget all signatures (used when the CSV files are overwritten)."""
+        with self._lock:
+            self.signatures = set()
+            if self.index_file:
+                self._write_all()
+
+    def __contains__(self, signature: str) -> bool:
+        return signature in self.signatures
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def filter_new(self, rows: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Split off rows whose content is already stored or repeated in the batch.
+
+        Returns:
+            (rows to write, their signatures) - pass the signatures to
+            commit() once the rows are safely written
+        """
+        new_rows = []
+        new_signatures = []
+        batch_signatures = set()
+        with self._lock:
+            for row in rows:
+                signature = row_signature(row)
+                if signature in self.signatures or signature in batch_signatures:
+                    self.logger.debug(f"Skipping duplicate question content: {row.get('Key')}")
+                    continue
+                batch_signatures.add(signature)
+                new_rows.append(row)
+                new_signatures.append(signature)
+        return new_rows, new_signatures
+
+    def commit(self, signatures: List[str]) -> None:
+        """Record signatures of rows that were written."""
+        if not signatures:
+            return
+        with self._lock:
+            fresh = [signature for signature in signatures if signature not in self.signatures]
+            self.signatures.update(fresh)
+            if self.index_file and fresh:
+                with open(self.index_file, 'a', encoding='utf-8') as f:
+                    f.writelines(f"{signature}\n" for signature in fresh)
@@ -0,0 +1,930 @@
+"""
+Results Page Parsing
+
+Pure functions that turn a text snapshot of a results page into correct
+answers and explanations. They take strings and plain question dicts and
+never touch the browser, so a ResultsParsePool can run them in worker
+processes while the event loop keeps driving the other browser pages.
+
+- parse_full_page_text(): per-question descriptions and correct answers
+  from the page's inner text (results extraction strategy 1)
+- parse_text_results(): line-based answers and explanations (strategy 3)
+- extract_funtrivia_explanation() and the other helpers work on single
+  result blocks as well
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import sys
+import os
+
+# Handle imports whether running as module or directly
+try:
+    from .patterns import (
+        NUMBERED_LINE_RE, QUIZ_RATING_LINE_RES, SITE_ACTION_RE, ANSWER_LINE_RE,
+        RESULT_BOUNDARY_RE, WHITESPACE_RE, question_context_res,
+        FUNTRIVIA_EXPLANATION_RES, INTERESTING_INFORMATION_RES, GENERIC_EXPLANATION_RES,
+        NAVIGATION_LINE_RE, NAVIGATION_TEXT_RE, NAVIGATION_KEYWORD_RE, INVALID_EXPLANATION_RE,
+        EDUCATIONAL_LINE_RE, EDUCATIONAL_TEXT_RE
+    )
+    from .results_parser import tokenize_results
+    from .answer_matcher import match_answer
+except ImportError:
+    # Add parent directory to path for direct execution
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+    from utils.patterns import (
+        NUMBERED_LINE_RE, QUIZ_RATING_LINE_RES, SITE_ACTION_RE, ANSWER_LINE_RE,
+        RESULT_BOUNDARY_RE, WHITESPACE_RE, question_context_res,
+        FUNTRIVIA_EXPLANATION_RES, INTERESTING_INFORMATION_RES, GENERIC_EXPLANATION_RES,
+        NAVIGATION_LINE_RE, NAVIGATION_TEXT_RE, NAVIGATION_KEYWORD_RE, INVALID_EXPLANATION_RE,
+        EDUCATIONAL_LINE_RE, EDUCATIONAL_TEXT_RE
+    )
+    from utils.results_parser import tokenize_results
+    from utils.answer_matcher import match_answer
+
+logger = logging.getLogger(__name__)
+
+
+def clean_explanation_text(text: str) -> str:
+    """
+    Clean and normalize explanation text for CSV storage.
+
+    EXPLANATION TEXT CLEANING PROCESS:
+    =================================
+    This function processes raw explanation text extracted from results pages
+    to ensure clean, consistent formatting suitable for CSV storage.
+
+    CLEANING OPERATIONS:
+    1. WHITESPACE NORMALIZATION:
+       - Removes excessive whitespace and normalizes line breaks
+       - Converts multiple spaces to single spaces
+       - Trims leading/trailing whitespace and punctuation
+
+    2. FORMATTING ARTIFACT REMOVAL:
+       - Removes common HTML/web formatting remnants
+       - Cleans up duplicate spacing from DOM text extraction
+       - Handles line break artifacts from page parsing
+
+    3. LABEL PREFIX REMOVAL:
+       - Strips explanation labels that may have been included in extraction
+       - Removes markers like "Interesting Information:", "Explanation:", etc.
+       - Ensures only the actual explanation content remains
+
+    4. CSV COMPATIBILITY:
+       - Ensures text is safe for CSV storage (no problematic characters)
+       - Maintains readability while being storage-friendly
+       - Preserves meaningful content structure
+
+    MULTI-PARAGRAPH PRESERVATION:
+    - Maintains logical flow of multi-paragraph explanations
+    - Joins paragraphs with appropriate spacing
+    - Preserves sentence structure and readability
+    """
+    if not text:
+        return ""
+
+    # STEP 1: WHITESPACE NORMALIZATION
+    # Remove excessive whitespace and normalize line breaks to single spaces
+    text = ' '.join(text.split())
+
+    # STEP 2: FORMATTING ARTIFACT REMOVAL  
+    # Clean up common formatting issues from DOM text extraction
+    text = text.replace('  ', ' ')  # Remove double spaces
+    text = text.strip(' .,;:')      # Remove leading/trailing punctuation and spaces
+
+    # STEP 3: EXPLANATION LABEL PREFIX REMOVAL
+    # Remove explanation markers that may have been captured during extraction
+    prefixes_to_remove = [
+        'Interesting Information:',
+        'Interesting Info:',
+        'Explanation:',
+        'Info:',
+        'Additional Information:',
+        'Details:',
+        'Trivia:',
+        'Did you know:',
+        'Did you know?',
+        'Fun fact:',
+        'Fun Fact:',
+        'Background:',
+        'Context:',
+        'More Info:'
+    ]
+
+    # Remove any of these prefixes if they appear at the start of the text
+    for prefix in prefixes_to_remove:
+        if text.startswith(prefix):
+            text = text[len(prefix):].strip()
+            logger.debug(f"Removed explanation prefix: {prefix}")
+            break
+
+    # STEP 4: FINAL CLEANUP AND VALIDATION
+    # Ensure the cleaned text is properly formatted for CSV storage
+    cleaned_text = text.strip()
+
+    # Log cleaning results for debugging
+    if len(cleaned_text) != len(text.strip()):
+        logger.debug(f"Explanation cleaning: {len(text.strip())} -> {len(cleaned_text)} chars")
+
+    return cleaned_text
+
+
+def is_valid_explanation(text: str) -> bool:
+    """Check if extracted text is a valid explanation."""
+    if not text or len(text.strip()) < 30:
+        return False
+
+    text_lower = text.lower().strip()
+
+    # Reject obvious non-explanations
+    if INVALID_EXPLANATION_RE.search(text_lower):
+        return False
+
+    # Must have reasonable length and educational content
+    return len(text) >= 30 and len(text.split()) >= 8
+
+
+def is_navigation_line(line: str) -> bool:
+    """Check if a line is navigation/menu content."""
+    return NAVIGATION_KEYWORD_RE.search(line.lower()) is not None
+
+
+def validate_explanation_quality(text: str) -> bool:
+    """
+    Validate that extracted text is actually an explanation, not navigation.
+
+    EXPLANATION QUALITY VALIDATION:
+    =============================
+    This function ensures extracted text is educational content rather than
+    navigation menus, quiz lists, or other page elements.
+    """
+    if not text or len(text.strip()) < 30:
+        return False
+
+    text_lower = text.lower().strip()
+
+    # Reject if it looks like navigation or quiz lists
+    if NAVIGATION_TEXT_RE.search(text_lower):
+        return False
+
+    # Reject if it's just quiz titles or category lists
+    if (text_lower.endswith(('quiz', 'quizzes', 'trivia', 'average', 'easy', 'normal', 'hard')) or
+        NUMBERED_LINE_RE.match(text.strip()) or  # Starts with number
+        'funtrivia' in text_lower or
+        len(text.split()) < 8):  # Too short to be meaningful explanation
+        return False
+
+    # Accept if it contains educational language
+    return EDUCATIONAL_TEXT_RE.search(text_lower) is not None
+
+
+def extract_funtrivia_explanation(text: str) -> Optional[str]:
+    """
+    Extract explanation text from FunTrivia results using the actual structure.
+
+    FunTrivia structure:
+    - Question text
+    - Your Answer: [answer]  
+    - The correct answer was [answer]
+    - [Explanation paragraphs] <- Extract this
+    - X% of players have answered correctly
+    """
+    try:
+        # Clean and normalize the text
+        text = ' '.join(text.split())
+
+        # Primary patterns to match FunTrivia's actual structure (see utils.patterns)
+        for pattern in FUNTRIVIA_EXPLANATION_RES:
+            match = pattern.search(text)
+            if match:
+                explanation = match.group(1).strip()
+                # Clean up the explanation
+                explanation = WHITESPACE_RE.sub(' ', explanation)  # Normalize whitespace
+                explanation = explanation.strip()
+
+                # Filter out obvious non-explanations
+                if is_valid_explanation(explanation):
+                    return explanation
+
+        # Fallback: line-by-line analysis for edge cases
+        return extract_explanation_line_by_line(text)
+
+    except Exception as e:
+        logger.debug(f"Error in _extract_funtrivia_explanation: {e}")
+        return None
+
+
+def extract_explanation_line_by_line(text: str) -> Optional[str]:
+    """
+    Fallback method to extract explanations by analyzing line by line.
+    """
+    try:
+        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        explanation_lines = []
+        found_answer = False
+
+        for line in lines:
+            # Skip until we find the correct answer line
+            if ANSWER_LINE_RE.search(line):
+                found_answer = True
+                continue
+
+            # If we found the answer, start collecting explanation lines
+            if found_answer:
+                # Stop at statistics or navigation
+                if RESULT_BOUNDARY_RE.search(line):
+                    break
+                # Collect substantial lines (likely part of explanation)
+                if len(line) > 20 and not is_navigation_line(line):
+                    explanation_lines.append(line)
+
+        if explanation_lines:
+            explanation = ' '.join(explanation_lines).strip()
+            if is_valid_explanation(explanation):
+                return explanation
+
+        return None
+
+    except Exception as e:
+        logger.debug(f"Error in line-by-line extraction: {e}")
+        return None
+
+
+def extract_interesting_information(text: str) -> Optional[str]:
+    """
+    Extract text from "Interesting Information" sections.
+
+    FUNTIVIA'S STANDARD EXPLANATION FORMAT:
+    ====================================== 
+    FunTrivia commonly uses "Interesting Information:" as the label for
+    question explanations. This method finds and extracts that content.
+
+    MULTI-PARAGRAPH SUPPORT:
+    - Captures content that spans multiple lines/paragraphs
+    - Handles various formatting styles (with/without colons, spacing)
+    - Preserves meaningful text structure while cleaning formatting artifacts
+
+    PATTERN MATCHING:
+    - Case-insensitive matching for flexibility
+    - Multiple regex patterns to handle formatting variations
+    - Stops at logical boundaries (next question, score sections, etc.)
+    """
+    try:
+        # Enhanced patterns for multi-paragraph "Interesting Information" extraction
+        for pattern in INTERESTING_INFORMATION_RES:
+            match = pattern.search(text)
+            if match:
+                explanation = match.group(1).strip()
+
+                # Enhanced cleaning for multi-paragraph content
+                explanation = clean_explanation_text(explanation)
+
+                # Validation: ensure meaningful content length
+                if len(explanation) > 20:  # Minimum meaningful length
+                    logger.debug(f"Extracted Interesting Information: {len(explanation)} chars")
+                    return explanation
+
+        return None
+
+    except Exception as e:
+        logger.debug(f"Error extracting interesting information: {e}")
+        return None
+
+
+def extract_generic_explanation(text: str) -> Optional[str]:
+    """
+    Extract explanations using generic markers like "Explanation:", "Info:", etc.
+
+    ALTERNATIVE EXPLANATION FORMATS:
+    ===============================
+    Handles cases where FunTrivia uses different labels for explanations:
+    - "Explanation:" - Direct explanation blocks
+    - "Additional Information:" - Supplementary details  
+    - "Fun Fact:" - Interesting trivia related to the answer
+    - "Background:" - Contextual information
+    - "Did you know?" - Educational facts
+
+    MULTI-PARAGRAPH EXTRACTION:
+    - Captures complete explanation blocks even when spanning multiple paragraphs
+    - Handles various separators and formatting styles
+    - Maintains readability while normalizing for CSV storage
+    """
+    try:
+        # Enhanced patterns for multi-paragraph generic explanation extraction
+        for pattern in GENERIC_EXPLANATION_RES:
+            match = pattern.search(text)
+            if match:
+                explanation = match.group(1).strip()
+
+                # Enhanced cleaning for multi-paragraph content
+                explanation = clean_explanation_text(explanation)
+
+                # Validation for meaningful content
+                if len(explanation) > 20:
+                    logger.debug(f"Extracted generic explanation: {len(explanation)} chars")
+                    return explanation
+
+        return None
+
+    except Exception as e:
+        logger.debug(f"Error extracting generic explanation: {e}")
+        return None
+
+
+def extract_heuristic_explanation(text: str) -> Optional[str]:
+    """
+    Extract explanation using heuristic methods when explicit markers are not found.
+
+    This method looks for substantial text blocks that likely contain explanations
+    based on their position and content characteristics.
+    """
+    try:
+        lines = [line.strip() for line in text.split('\n') if line.strip()]
+
+        # STRATEGY 1: Look for text after correct answer indicators
+        explanation_candidates = []
+        found_correct_answer = False
+
+        for line in lines:
+            line_lower = line.lower()
+
+            # Mark when we pass the correct answer line
+            if any(phrase in line_lower for phrase in [
+                'correct answer', 'answer:', 'correct:', 'the answer is', 'solution:'
+            ]):
+                found_correct_answer = True
+                continue
+
+            # Skip question headers and short lines
+            if (line_lower.startswith(('question', 'q.')) or 
+                len(line) < 25 or
+                line_lower.startswith(('your score', 'submit', 'next question'))):
+                continue
+
+            # Collect substantial text that comes after the correct answer
+            if (found_correct_answer and 
+                len(line) > 30 and
+                not line.lower().startswith(('a)', 'b)', 'c)', 'd)')) and  # Not answer options
+                not line.isdigit()):  # Not just numbers
+
+                explanation_candidates.append(line)
+
+        # Join explanation candidates and validate
+        if explanation_candidates:
+            explanation = ' '.join(explanation_candidates)
+            explanation = clean_explanation_text(explanation)
+
+            # Validate that this looks like an explanation (not just random text)
+            if (len(explanation) > 50 and 
+                not explanation.lower().startswith('question') and
+                ' ' in explanation):  # Contains spaces (not just a single word)
+                return explanation
+
+        # STRATEGY 2: Look for any substantial educational content
+        for line in lines:
+            line_lower = line.lower()
+
+            # Skip navigation and short content
+            if (len(line) < 40 or
+                any(skip_word in line_lower for skip_word in [
+                    'funtrivia', 'quiz', 'homepage', 'browse', 'click here',
+                    'visit our', 'more quizzes', 'explore other', 'return to',
+                    'submit', 'next question', 'previous question'
+                ])):
+                continue
+
+            # Look for educational indicators
+            if any(indicator in line_lower for indicator in [
+                'because', 'this is', 'actually', 'in fact', 'the reason',
+                'according to', 'research', 'studies', 'scientists', 'experts',
+                'discovered', 'evidence', 'history', 'historical', 'originated',
+                'invented', 'created', 'established', 'founded', 'named after',
+                'known for', 'famous for', 'designed by', 'built in', 'located in',
+                'during', 'when', 'where', 'why', 'how', 'first', 'originally',
+                'also known as', 'called', 'means', 'refers to', 'comes from'
+            ]):
+                cleaned = clean_explanation_text(line)
+                if len(cleaned) > 50:
+                    return cleaned
+
+        # STRATEGY 3: Look for any substantive paragraph (last resort)
+        for line in lines:
+            line_lower = line.lower()
+
+            # Must be substantial and not navigation
+            if (len(line) > 80 and  # Longer text more likely to be explanation
+                not any(skip_pattern in line_lower for skip_pattern in [
+                    'funtrivia', 'quiz', 'homepage', 'browse', 'click here',
+                    'visit our', 'more quizzes', 'explore other', 'return to',
+                    'submit', 'next question', 'previous question', 'score'
+                ]) and
+                # Must look like descriptive text (has common words)
+                sum(1 for word in ['the', 'a', 'an', 'is', 'was', 'are', 'were', 'has', 'have']
+                    if word in line_lower.split()) >= 2):
+
+                cleaned = clean_explanation_text(line)
+                if len(cleaned) > 60:
+                    return cleaned
+
+        return None
+
+    except Exception as e:
+        logger.debug(f"Error extracting heuristic explanation: {e}")
+        return None
+
+
+def extract_description_near_question(page_text: str, question_text: str) -> Optional[str]:
+    """Find description text near a specific question in the page text."""
+    try:
+        # Find the question text in the page
+        question_pos = page_text.lower().find(question_text.lower())
+        if question_pos == -1:
+            return None
+
+        # Look for description patterns within a reasonable distance after the question
+        # Typical distance: 500-2000 characters after the question
+        search_start = question_pos
+        search_end = min(question_pos + 2000, len(page_text))
+        search_section = page_text[search_start:search_end]
+
+        # Extract description from this localized section
+        description = extract_funtrivia_explanation(search_section)
+        return description
+
+    except Exception as e:
+        logger.debug(f"Error extracting description near question: {e}")
+        return None
+
+
+def extract_description_from_page_text(page_text: str, question_num: str, question: Dict[str, Any],
+                                       sections: Optional[Dict[str, Dict[str, Any]]] = None) -> Optional[str]:
+    """
+    Extract description for a specific question from the full page text.
+
+    sections are the tokenize_results() records of page_text; they are
+    computed here when not given.
+    """
+    try:
+        if sections is None:
+            sections = tokenize_results(page_text)
+
+        # Try to find the section for this specific question
+        if question_num in sections:
+            description = extract_funtrivia_explanation(sections[question_num]['text'])
+            if description:
+                return description
+
+        # Fallback: try to find question-specific content by looking for the question text
+        question_text = question.get('question', '').strip()
+        if question_text:
+            description = extract_description_near_question(page_text, question_text)
+            if description:
+                return description
+
+        return None
+
+    except Exception as e:
+        logger.debug(f"Error extracting description for Q{question_num}: {e}")
+        return None
+
+
+def extract_correct_answer_from_page_text(page_text: str, question_num: str, question: Dict[str, Any],
+                                          sections: Optional[Dict[str, Dict[str, Any]]] = None) -> Optional[str]:
+    """
+    Extract correct answer for a specific question from the full page text.
+
+    sections are the tokenize_results() records of page_text; they are
+    computed here when not given.
+    """
+    try:
+        # Get question options to validate against
+        question_options = question.get('options', [])
+
+        if sections is None:
+            sections = tokenize_results(page_text)
+
+        # Candidate answers found in the specific question's section, best first
+        if question_num in sections:
+            for answer_text in sections[question_num]['answers']:
+                # Try to match with actual question options
+                match = match_answer(question_options, answer_text)
+                if match.option is not None:
+                    logger.debug(f"Found {match.method} correct answer for Q{question_num}: {match.option} "
+                                 f"(confidence {match.confidence:.2f})")
+                    return match.option
+
+                # If no option match, return the raw answer (might be formatted differently)
+                if len(answer_text) > 1:
+                    logger.debug(f"Found raw correct answer for Q{question_num}: {answer_text}")
+                    return answer_text
+
+        # Fallback: try to find answer by question context in full page
+        # Look for patterns like "1. Your Answer: [No Answer] The correct answer was..."
+        for pattern in question_context_res(question_num):
+            matches = pattern.findall(page_text)
+            for match in matches:
+                answer_text = match.strip()
+
+                # Validate against question options
+                match = match_answer(question_options, answer_text)
+                if match.option is not None:
+                    logger.debug(f"Found contextual correct answer for Q{question_num}: {match.option}")
+                    return match.option
+
+                # Return raw answer if no option match
+                if answer_text and len(answer_text) > 1:
+                    logger.debug(f"Found contextual raw answer for Q{question_num}: {answer_text}")
+                    return answer_text
+
+        logger.debug(f"No correct answer found for Q{question_num}")
+        return None
+
+    except Exception as e:
+        logger.debug(f"Error extracting correct answer for Q{question_num}: {e}")
+        return None
+
+
+# Answer line markers for find_correct_answer_in_text, most specific first
+TEXT_ANSWER_KEYWORDS = ['correct answer was', 'correct answer:', 'answer:', 'correct:']
+
+
+def find_correct_answer_in_text(lines: List[str], question_num: str, question: Dict[str, Any]) -> Optional[str]:
+    """
+    Find the correct answer for a specific question in the text lines.
+
+    Looks for patterns like:
+    - "The correct answer was [answer]."
+    - "Question X: Correct Answer: [answer]"
+    - "1. [answer]" (in results context)
+    - Answer options that match the question's options
+    """
+    try:
+        question_options = question.get('options', [])
+
+        # Look for explicit correct answer patterns
+        for i, line in enumerate(lines):
+            line_lower = line.lower()
+
+            # Pattern 1: "Question X" followed by correct answer
+            if f"question {question_num}" in line_lower or f"{question_num}." in line:
+                # Look in current line and next few lines for answer patterns
+                search_lines = lines[i:i+5]
+                for search_line in search_lines:
+                    search_lower = search_line.lower()
+                    if search_lower.startswith('your answer'):
+                        continue  # The option the scraper picked, not the correct one
+
+                    if any(keyword in search_lower for keyword in TEXT_ANSWER_KEYWORDS):
+                        # Extract answer after the keyword
+                        for keyword in TEXT_ANSWER_KEYWORDS:
+                            if keyword in search_lower:
+                                potential_answer = search_line[search_lower.index(keyword) + len(keyword):].strip()
+                                if keyword == 'correct answer was':
+                                    potential_answer = potential_answer.split('.')[0].strip()
+                                # Validate against question options
+                                match = match_answer(question_options, potential_answer)
+                                return match.option if match.option is not None else potential_answer
+
+            # Pattern 2: Direct option match in results context
+            if f"{question_num}." in line and any(opt.lower() in line_lower for opt in question_options):
+                for option in question_options:
+                    if option.lower() in line_lower:
+                        return option
+
+        return None
+
+    except Exception as e:
+        logger.debug(f"Error finding correct answer in text for question {question_num}: {e}")
+        return None
+
+
+def find_explanation_in_text(lines: List[str], question_num: str) -> Optional[str]:
+    """
+    Find the explanation/description for a specific question in the text lines.
+
+    TEXT-BASED EXPLANATION EXTRACTION (FALLBACK METHOD):
+    ===================================================
+    When structured result blocks are not available, this method parses raw page text
+    to find explanations for individual questions on the results page.
+
+    EXPLANATION LOCATIONS IN TEXT:
+    - "Interesting Information:" sections after each question result
+    - "Explanation:" blocks following correct answers
+    - Multi-paragraph descriptions that span several lines
+    - Educational text blocks positioned after question numbers
+
+    FILTERING STRATEGY:
+    - Excludes navigation menus, quiz links, and page elements
+    - Focuses on actual educational content related to the question
+    - Filters out numbered lists that are clearly navigation
+    - Validates content quality before accepting as explanation
+    """
+    try:
+        explanation_parts = []
+        in_explanation = False
+        explanation_started = False
+
+        for i, line in enumerate(lines):
+            line_lower = line.lower().strip()
+            line_stripped = line.strip()
+
+            # Skip empty lines and very short lines
+            if len(line_stripped) < 3:
+                continue
+
+            # STEP 1: LOCATE THE TARGET QUESTION
+            # Find the specific question we're looking for explanations about
+            if f"question {question_num}" in line_lower or (f"{question_num}." in line and len(line) < 80):
+                explanation_started = True
+                logger.debug(f"Located question {question_num} in text for explanation search")
+                continue
+
+            if not explanation_started:
+                continue
+
+            # STEP 2: ENHANCED FILTERING OF NON-EXPLANATION CONTENT
+            # Filter out navigation, menus, and other page elements
+            is_navigation = NAVIGATION_LINE_RE.search(line_lower) is not None
+
+            if is_navigation:
+                logger.debug(f"Filtered out navigation element for Q{question_num}: {line_stripped[:40]}...")
+                continue
+
+            # Additional content filtering
+            if (line_stripped.startswith(('Home', 'Quiz', 'Browse', 'Search', 'Login', 'Register')) or
+                'click here' in line_lower or
+                'more information' in line_lower or
+                'visit' in line_lower or
+                line_lower.endswith(('quiz', 'quizzes', 'trivia', 'game', 'games')) or
+                any(pattern.match(line_stripped) for pattern in QUIZ_RATING_LINE_RES)):  # Quiz rating/difficulty patterns
+
+                logger.debug(f"Filtered out site element for Q{question_num}: {line_stripped[:40]}...")
+                continue
+
+            # STEP 3: FIND EXPLANATION MARKERS
+            # Look for various labels that indicate start of explanation content
+            explanation_markers = [
+                'interesting information:',   # FunTrivia's standard label
+                'interesting info:',         # Abbreviated version
+                'explanation:',              # Generic explanation label
+                'additional information:',   # Extended info blocks
+                'did you know:',            # Educational facts
+                'fun fact:',                # Interesting facts
+                'background:',              # Context information
+                'note:',                    # Important notes
+                'trivia:',                  # Trivia fact sections (when followed by colon)
+            ]
+
+            if any(marker in line_lower for marker in explanation_markers):
+                in_explanation = True
+                logger.debug(f"Found explanation marker in text for Q{question_num}: {line_stripped[:50]}...")
+
+                # Extract content after the marker
+                for marker in explanation_markers:
+                    if marker in line_lower:
+                        marker_index = line_lower.index(marker)
+                        text_after_marker = line[marker_index + len(marker):].strip(' :')
+                        if text_after_marker and len(text_after_marker) > 10:  # Ensure substantial content
+                            explanation_parts.append(text_after_marker)
+                        break
+                continue
+
+            # STEP 4: COLLECT EXPLANATION CONTENT
+            # Gather all explanation text until we hit a stopping condition
+            if in_explanation:
+                # Define stopping conditions that indicate end of explanation
+                stop_conditions = [
+                    line_lower.startswith('question'),              # Next question started
+                    'your score' in line_lower,                     # Score section reached
+                    'quiz complete' in line_lower,                  # Quiz completion section
+                    'quiz results' in line_lower,                   # Results summary section
+                    line_lower.startswith('correct answer:'),       # Another question's answer
+                    len(line_stripped) < 10 and line_stripped.isdigit(),  # Standalone question number
+                    'submit' in line_lower and 'quiz' in line_lower, # Submit buttons/forms
+                    line_lower.startswith('total score'),           # Score summary
+                    line_lower.startswith('final score'),           # Final results
+                    'next question' in line_lower,                  # Question navigation
+                    'previous question' in line_lower,              # Question navigation
+                ]
+
+                if any(condition for condition in stop_conditions):
+                    logger.debug(f"Hit stop condition for Q{question_num} explanation: {line_stripped[:30]}...")
+                    break
+
+                # ENHANCED CONTENT VALIDATION
+                # Only collect lines that appear to be actual explanation content
+                if (len(line_stripped) > 15 and  # Ensure substantial content
+                    not line_lower.startswith(('a)', 'b)', 'c)', 'd)', 'a.', 'b.', 'c.', 'd.')) and  # Skip answer options
+                    not line_lower.startswith('question') and              # Skip question headers
+                    'correct answer' not in line_lower and                 # Skip answer declarations
+                    not line_lower.startswith(('next', 'previous', 'submit', 'back', 'home')) and  # Skip navigation
+                    not NUMBERED_LINE_RE.match(line_stripped) and         # Skip numbered lists
+                    not line_lower.endswith(('average', 'easy', 'normal', 'hard', 'difficult')) and  # Skip quiz ratings
+                    'funtrivia' not in line_lower and                     # Skip site references
+                    'quiz' not in line_lower.split()[-3:] and             # Skip if 'quiz' in last 3 words
+                    not SITE_ACTION_RE.search(line_lower)):  # Skip site actions
+
+                    # Additional quality check: ensure it's educational content
+                    # Accept if it contains educational language OR is substantial content
+                    if (EDUCATIONAL_LINE_RE.search(line_lower) or 
+                        len(line_stripped) > 50):  # Accept longer content even without indicators
+
+                        explanation_parts.append(line_stripped)
+                        logger.debug(f"Collected explanation line for Q{question_num}: {line_stripped[:50]}...")
+
+            # STEP 5: DETECT NEXT QUESTION BOUNDARY
+            # Stop collection if we've moved to the next question
+            try:
+                next_question_num = str(int(question_num) + 1)
+                if (f"question {next_question_num}" in line_lower or 
+                    (f"{next_question_num}." in line and len(line) < 80)):
+                    logger.debug(f"Reached next question ({next_question_num}) - stopping explanation collection for Q{question_num}")
+                    break
+            except ValueError:
+                # Handle non-numeric question numbers gracefully
+                pass
+
+        # STEP 6: PROCESS AND VALIDATE COLLECTED EXPLANATION
+        # Join collected parts and validate content quality
+        if explanation_parts:
+            # Join explanation parts with proper spacing for readability
+            explanation = ' '.join(explanation_parts).strip()
+
+            # Clean up excessive whitespace while preserving structure
+            explanation = ' '.join(explanation.split())
+
+            # Final quality validation
+            if (len(explanation) > 30 and  # Minimum meaningful length
+                not NUMBERED_LINE_RE.match(explanation) and  # Not a numbered list item
+                'average' not in explanation.lower().split()[-2:]):  # Doesn't end with quiz rating terms
+
+                logger.debug(f"Successfully extracted text-based explanation for Q{question_num}: {len(explanation)} chars")
+                return explanation
+            else:
+                logger.debug(f"Explanation failed quality check for Q{question_num}: {explanation[:100]}...")
+
+        # NO EXPLANATION FOUND
+        logger.debug(f"No text-based explanation found for question {question_num}")
+        return None
+
+    except Exception as e:
+        logger.debug(f"Error finding explanation in text for question {question_num}: {e}")
+        return None
+
+
+def parse_full_page_text(page_text: str, questions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Descriptions and correct answers for every question from the full page text.
+
+    Args:
+        page_text: inner text of the results page
+        questions: questions as extracted from the quiz page
+
+    Returns:
+        Copies of the questions with 'description' and 'correct_answer' set
+        ('' where the page has none; the option fallback is applied and
+        counted when answers are matched)
+    """
+    # Split the page text into per-question records once for all questions
+    sections = tokenize_results(page_text)
+    logger.debug(f"Split page text into {len(sections)} question sections")
+    enhanced_questions = []
+
+    for i, question in enumerate(questions):
+        question_num = question.get('questionNumber', str(i+1))
+
+        try:
+            # Look for this question's result in the page text
+            description = extract_description_from_page_text(page_text, question_num, question, sections)
+
+            # Create enhanced question
+            enhanced_question = question.copy()
+            enhanced_question['description'] = description or ''
+
+            # Try to extract correct answer as well
+            correct_answer = extract_correct_answer_from_page_text(page_text, question_num, question, sections)
+            enhanced_question['correct_answer'] = correct_answer or ''
+
+            enhanced_questions.append(enhanced_question)
+
+        except Exception as e:
+            logger.warning(f"Error processing question {question_num} in full page text: {e}")
+            # Add question with minimal enhancement on error
+            enhanced_question = question.copy()
+            enhanced_question['correct_answer'] = ''
+            enhanced_question['description'] = ''
+            enhanced_questions.append(enhanced_question)
+
+    return enhanced_questions
+
+
+def parse_text_results(page_text: str, questions: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Correct answers and explanations for every question from the page's text lines.
+
+    Args:
+        page_text: inner text of the results page
+        questions: questions as extracted from the quiz page
+
+    Returns:
+        Copies of the questions with 'correct_answer', 'hint' and 'description'
+        set ('' where the page has none), and extraction stats (counts plus the question numbers without an
+        explanation)
+    """
+    lines = [line.strip() for line in page_text.split('\n') if line.strip()]
+
+    enhanced_questions = []
+    extraction_stats = {'correct_answers_found': 0, 'explanations_found': 0, 'missing_explanations': []}
+
+    for i, question in enumerate(questions):
+        question_num = question.get('questionNumber', str(i+1))
+
+        try:
+            # Look for this question's results in the text
+            correct_answer = find_correct_answer_in_text(lines, question_num, question)
+            explanation = find_explanation_in_text(lines, question_num)
+
+            if correct_answer:
+                extraction_stats['correct_answers_found'] += 1
+
+            if explanation:
+                extraction_stats['explanations_found'] += 1
+            else:
+                extraction_stats['missing_explanations'].append(question_num)
+
+            # Create enhanced question
+            enhanced_question = question.copy()
+            enhanced_question['correct_answer'] = correct_answer or ''
+            enhanced_question['hint'] = explanation or ''
+            enhanced_question['description'] = explanation or ''
+
+            enhanced_questions.append(enhanced_question)
+
+        except Exception as e:
+            logger.error(f"Error processing text results for question {question_num}: {e}")
+            # Add question with minimal enhancement on error
+            enhanced_question = question.copy()
+            enhanced_question['correct_answer'] = ''
+            enhanced_question['hint'] = ''
+            enhanced_question['description'] = ''
+            enhanced_questions.append(enhanced_question)
+
+    return enhanced_questions, extraction_stats
+
+
+class ResultsParsePool:
+    """
+    Runs results parsing functions in a process pool of `workers` processes.
+
+    The pool size is independent of browser concurrency. With workers=0 the
+    functions run inline; if the pool breaks, parsing falls back to inline
+    for the rest of the run. Workers are spawned rather than forked: the
+    pool is created lazily, after the browser, its threads and the event
+    loop exist, and forking that process is unsafe.
+    """
+
+    def __init__(self, workers: int = 2):
+        self.logger = logging.getLogger(__name__)
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.stats = {'offloaded': 0, 'inline': 0, 'fallbacks': 0}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'ResultsParsePool':
+        """Create a pool from the scraper.parse_pool section (workers=0 when disabled)."""
+        settings = config.get('scraper', {}).get('parse_pool', {})
+        return cls(workers=settings.get('workers', 2) if settings.get('enabled', True) else 0)
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run func(*args) in the pool (inline when disabled) and return its result."""
+        if self.workers > 0:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                     mp_context=multiprocessing.get_context('spawn'))
+            try:
+                result = await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+                self.stats['offloaded'] += 1
+                return result
+            except Exception as e:
+                self.stats['fallbacks'] += 1
+                self.logger.warning(f"Parsing in worker process failed ({type(e).__name__}: {e}) - parsing inline")
+                if isinstance(e, BrokenProcessPool):
+                    self.close()
+                    self.workers = 0
+
+        self.stats['inline'] += 1
+        return func(*args)
+
+    def close(self) -> None:
+        """Shut the worker processes down."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get a copy of the offload statistics."""
+        return self.stats.copy()
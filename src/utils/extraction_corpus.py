@@ -0,0 +1,145 @@
+"""
+Golden Quiz and Results Page Corpus
+
+Saved quiz and results pages with hand-checked labels. The offline
+benchmark (scripts/benchmark_extraction.py) uses them to measure
+extraction speed and accuracy without touching the live site.
+manifest.json in the corpus directory lists the fixtures:
+
+    name, layout    fixture id and page layout (standard, photo, audio,
+                    multi-page, login-wall)
+    quiz_type       expected _detect_quiz_type() result, null to skip the check
+    quiz_pages      quiz page HTML files in page order
+    results_page    results page HTML file, null when there is none
+    questions       expected questions: number, question, options,
+                    correct_answer and description. description is text the
+                    extracted description must contain; it is "" when the
+                    page has no explanation.
+
+Scoring treats extraction output the way the pipeline uses it. Correct
+answers are resolved to option text with the answer matcher before they
+are compared.
+"""
+
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+# Handle imports whether running as module or directly
+try:
+    from .answer_matcher import match_answer, normalize_answer
+except ImportError:
+    # Add parent directory to path for direct execution
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+    from utils.answer_matcher import match_answer, normalize_answer
+
+DEFAULT_CORPUS_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'tests', 'fixtures', 'extraction'))
+
+REQUIRED_FIXTURE_KEYS = ('name', 'layout', 'quiz_pages', 'questions')
+REQUIRED_QUESTION_KEYS = ('number', 'question', 'options', 'correct_answer', 'description')
+
+
+def _read_page(corpus_dir: str, filename: str) -> str:
+    with open(os.path.join(corpus_dir, filename), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def load_corpus(corpus_dir: str = DEFAULT_CORPUS_DIR, names: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Load the fixtures of a corpus with their page HTML.
+
+    Each fixture is its manifest entry plus 'quiz_html' (list of page
+    sources) and 'results_html' (page source or None).
+
+    Args:
+        corpus_dir: Directory containing manifest.json and the pages
+        names: Only load these fixtures (all when None)
+
+    Raises:
+        ValueError: If the manifest is malformed or names an unknown fixture
+    """
+    with open(os.path.join(corpus_dir, 'manifest.json'), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    fixtures = []
+    for entry in manifest.get('fixtures', []):
+        missing = [key for key in REQUIRED_FIXTURE_KEYS if key not in entry]
+        if missing:
+            raise ValueError(f"Fixture {entry.get('name', '?')} is missing {missing}")
+        for question in entry['questions']:
+            missing = [key for key in REQUIRED_QUESTION_KEYS if key not in question]
+            if missing:
+                raise ValueError(f"Fixture {entry['name']} question {question.get('number', '?')} is missing {missing}")
+
+        if names and entry['name'] not in names:
+            continue
+        fixture = dict(entry)
+        fixture['quiz_html'] = [_read_page(corpus_dir, page) for page in entry['quiz_pages']]
+        fixture['results_html'] = _read_page(corpus_dir, entry['results_page']) if entry.get('results_page') else None
+        fixtures.append(fixture)
+
+    if names:
+        unknown = set(names) - {fixture['name'] for fixture in fixtures}
+        if unknown:
+            raise ValueError(f"Unknown fixtures: {sorted(unknown)}")
+    return fixtures
+
+
+def _by_number(questions: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """First question per question number."""
+    indexed = {}
+    for question in questions:
+        indexed.setdefault(str(question.get('questionNumber', question.get('number', ''))), question)
+    return indexed
+
+
+def score_questions(extracted: List[Dict[str, Any]], expected: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Compare questions extracted from the quiz pages with the labels.
+
+    A labelled question counts as matched when a question with its number
+    has the same (normalized) text and the same options in the same order.
+    """
+    found = _by_number(extracted)
+    matched = 0
+    for label in expected:
+        question = found.get(label['number'])
+        if question is None:
+            continue
+        same_text = normalize_answer(question.get('question', '')) == normalize_answer(label['question'])
+        same_options = [str(option).strip() for option in question.get('options', [])] == label['options']
+        if same_text and same_options:
+            matched += 1
+    return {'expected': len(expected), 'extracted': len(extracted), 'matched': matched}
+
+
+def score_results(enhanced: List[Dict[str, Any]], expected: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Compare the correct answers and descriptions of a results strategy with the labels.
+
+    The raw extracted answer is scored, before the scraper's first-option
+    fallback: it is right when it resolves to the labelled option, and an
+    empty answer is counted as missing, never as correct (even when the
+    labelled answer is the first option). The description is right when it
+    contains the labelled text, or is empty when the label is empty.
+    """
+    found = _by_number(enhanced)
+    answers_correct = answers_missing = descriptions_correct = 0
+    for label in expected:
+        question = found.get(label['number'])
+        if question is None:
+            answers_missing += 1
+            continue
+        raw_answer = (question.get('correct_answer') or '').strip()
+        if not raw_answer:
+            answers_missing += 1
+        elif match_answer(label['options'], raw_answer).option == label['correct_answer']:
+            answers_correct += 1
+        description = normalize_answer(question.get('description') or '')
+        expected_description = normalize_answer(label['description'])
+        if (expected_description in description) if expected_description else not description:
+            descriptions_correct += 1
+    return {'questions': len(expected), 'answers_correct': answers_correct,
+            'answers_missing': answers_missing, 'descriptions_correct': descriptions_correct}
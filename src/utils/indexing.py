@@ -1,14 +1,40 @@
 import json
 import os
-from typing import Dict
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
 import logging
 
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:
+    # Windows
+    fcntl = None
+    import msvcrt
+
 class QuestionIndexer:
-    """Manages persistent question indexing to avoid duplicates across runs."""
+    """
+    Manages persistent question indexing to avoid duplicates across runs.
+    
+    IDs are reserved from the index file in blocks (block_size IDs at a time)
+    and handed out from memory, so issuing an ID normally does no disk I/O.
+    Each reservation re-reads the file under an inter-process lock and
+    persists the new high-water mark with an atomic write-and-rename, so
+    concurrent runs and shards never receive the same ID. IDs left in a
+    block when the process dies are skipped, never reused; release() hands
+    an unused tail back when no other process has reserved after it.
+    """
     
-    def __init__(self, index_file: str = "question_indices.json"):
+    def __init__(self, index_file: str = "question_indices.json", block_size: int = 100):
         self.logger = logging.getLogger(__name__)
         self.index_file = index_file
+        self.lock_file = f"{index_file}.lock"
+        self.block_size = max(1, block_size)
+        self._thread_lock = threading.Lock()
+        # question_type -> [next_id, last_reserved_id] of the block held by this process
+        self._blocks: Dict[str, List[int]] = {}
         self.indices = self._load_indices()
     
     def _load_indices(self) -> Dict[str, int]:
@@ -31,14 +57,96 @@ class QuestionIndexer:
         self.logger.info("Using default indices (starting from 0)")
         return default_indices
     
-    def _save_indices(self) -> None:
-        """Save current indices to file."""
+    def _read_indices_file(self) -> Dict[str, int]:
+        """Read the persisted high-water marks (caller holds the file lock)."""
+        if not os.path.exists(self.index_file):
+            return {}
+        with open(self.index_file, 'r') as f:
+            return json.load(f)
+    
+    def _save_indices(self, indices: Dict[str, int] = None) -> None:
+        """Atomically persist indices: write a temp file, fsync, then rename over the index file."""
+        indices = self.indices if indices is None else indices
+        directory = os.path.dirname(os.path.abspath(self.index_file))
+        fd, temp_path = tempfile.mkstemp(prefix='.question_indices.', suffix='.tmp', dir=directory)
         try:
-            with open(self.index_file, 'w') as f:
-                json.dump(self.indices, f, indent=2)
-            self.logger.info(f"Saved indices: {self.indices}")
-        except Exception as e:
-            self.logger.error(f"Error saving indices file: {e}")
+            with os.fdopen(fd, 'w') as f:
+                json.dump(indices, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.index_file)
+            self.logger.debug(f"Saved indices: {indices}")
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold an exclusive inter-process lock on the index file."""
+        with open(self.lock_file, 'a+') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            elif msvcrt is not None:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+                elif msvcrt is not None:
+                    lock.seek(0)
+                    msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+    
+    def _reserve_block(self, question_type: str) -> List[int]:
+        """Reserve the next block of IDs for a question type (caller holds the thread lock)."""
+        with self._file_lock():
+            persisted = self._read_indices_file()
+            # Never go below what this process already issued, in case the file was removed
+            start = max(persisted.get(question_type, 0), self.indices.get(question_type, 0)) + 1
+            end = start + self.block_size - 1
+            persisted[question_type] = end
+            self._save_indices(persisted)
+        
+        self._blocks[question_type] = [start, end]
+        self.logger.info(f"Reserved {question_type} IDs {start}-{end}")
+        return self._blocks[question_type]
+    
+    def _allocate(self, question_type: str) -> int:
+        """Take the next ID from this process's block, reserving a new block when needed."""
+        with self._thread_lock:
+            block = self._blocks.get(question_type)
+            if block is None or block[0] > block[1]:
+                block = self._reserve_block(question_type)
+            current_id = block[0]
+            block[0] += 1
+            self.indices[question_type] = current_id
+            return current_id
+    
+    def release(self) -> None:
+        """
+        Hand unused reserved IDs back to the index file.
+        
+        Only possible for a type whose block is still the latest reservation;
+        otherwise the unused IDs are simply skipped.
+        """
+        with self._thread_lock:
+            if not self._blocks:
+                return
+            try:
+                with self._file_lock():
+                    persisted = self._read_indices_file()
+                    changed = False
+                    for question_type, (next_id, end) in self._blocks.items():
+                        if next_id <= end and persisted.get(question_type) == end:
+                            persisted[question_type] = next_id - 1
+                            changed = True
+                    if changed:
+                        self._save_indices(persisted)
+            except Exception as e:
+                self.logger.error(f"Error releasing reserved indices: {e}")
+            self._blocks = {}
     
     def get_next_id(self, question_type: str, domain: str = None, difficulty: str = None) -> str:
         """
@@ -58,14 +166,7 @@ class QuestionIndexer:
         Returns:
             Formatted question ID string following the new localization key format
         """
-        if question_type not in self.indices:
-            self.indices[question_type] = 0
-        
-        self.indices[question_type] += 1
-        current_id = self.indices[question_type]
-        
-        # Save immediately to prevent loss on crashes
-        self._save_indices()
+        current_id = self._allocate(question_type)
         
         # Map question type to prefix for the new localization key format
         type_prefix = {
@@ -94,12 +195,15 @@ class QuestionIndexer:
     
     def reset_indices(self) -> None:
         """Reset all indices to 0 (use with caution)."""
-        self.indices = {
-            "multiple_choice": 0,
-            "true_false": 0,
-            "sound": 0
-        }
-        self._save_indices()
+        with self._thread_lock:
+            self.indices = {
+                "multiple_choice": 0,
+                "true_false": 0,
+                "sound": 0
+            }
+            self._blocks = {}
+            with self._file_lock():
+                self._save_indices()
         self.logger.warning("All indices have been reset to 0")
     
     def get_all_indices(self) -> Dict[str, int]:
@@ -0,0 +1,146 @@
+"""
+Layout fingerprints and a learned cache of what works per page layout.
+
+FunTrivia serves a handful of page layouts. Instead of trying every
+extraction strategy and selector on every quiz, a cheap fingerprint of the
+page's structural markers maps to the choice (strategy, selector) that
+succeeded on that layout last time. Entries are persisted across runs and
+expire as soon as they fail, so a site change costs one slow page.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Any, Iterable, List, Optional
+
+
+def layout_fingerprint(markers: Iterable[Any]) -> str:
+    """Short stable hash of a page's structural markers."""
+    return hashlib.md5(json.dumps(list(markers)).encode('utf-8')).hexdigest()[:12]
+
+
+class LayoutCache:
+    """
+    Persistent mapping of (kind, layout fingerprint) to the choice that worked.
+
+    - lookup() returns the cached choice for a layout, if any
+    - record_success() stores or confirms a choice
+    - record_failure() expires the entry so the full search runs again
+    - rank() orders candidate selectors with the layout's cached one first
+    - record_selector() counts uses and failures per selector
+    - get_stats() reports hits, misses and expirations per kind
+    """
+
+    def __init__(self, cache_file: str):
+        self.logger = logging.getLogger(__name__)
+        self.cache_file = cache_file
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self.selector_stats: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._load()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional['LayoutCache']:
+        """Create a cache from the scraper.layout_cache section, or None if disabled."""
+        settings = config.get('scraper', {}).get('layout_cache', {})
+        if not settings.get('enabled', True):
+            return None
+        cache_file = settings.get('cache_file') or \
+            os.path.join(config.get('storage', {}).get('output_dir', 'output'), 'layout_cache.json')
+        return cls(cache_file)
+
+    def _load(self) -> None:
+        if not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+            self.logger.debug(f"Loaded {len(self.entries)} layout cache entries from {self.cache_file}")
+        except (ValueError, OSError) as e:
+            self.logger.warning(f"Ignoring unreadable layout cache {self.cache_file}: {e}")
+            self.entries = {}
+
+    def _count(self, kind: str, event: str) -> None:
+        counters = self.stats.setdefault(kind, {'hits': 0, 'misses': 0, 'expired': 0, 'learned': 0})
+        counters[event] += 1
+
+    def lookup(self, kind: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Cached choice for a layout (a copy), or None."""
+        with self._lock:
+            entry = self.entries.get(f"{kind}:{fingerprint}")
+            self._count(kind, 'hits' if entry else 'misses')
+            return dict(entry['choice']) if entry else None
+
+    def record_success(self, kind: str, fingerprint: str, choice: Dict[str, Any]) -> None:
+        """Remember the choice that worked for a layout."""
+        key = f"{kind}:{fingerprint}"
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None or entry['choice'] != choice:
+                entry = {'choice': dict(choice), 'successes': 0, 'failures': 0}
+                self.entries[key] = entry
+                self._count(kind, 'learned')
+                self.logger.debug(f"Learned {kind} layout {fingerprint}: {choice}")
+            entry['successes'] += 1
+            entry['last_used'] = time.time()
+            self._dirty = True
+
+    def record_failure(self, kind: str, fingerprint: str) -> None:
+        """Expire the cached choice for a layout after it failed."""
+        with self._lock:
+            if self.entries.pop(f"{kind}:{fingerprint}", None) is not None:
+                self._count(kind, 'expired')
+                self._dirty = True
+                self.logger.debug(f"Expired {kind} layout {fingerprint}")
+
+    def rank(self, kind: str, fingerprint: Optional[str], selectors: List[str]) -> List[str]:
+        """Candidate selectors with the one that last worked on this layout first."""
+        choice = self.lookup(kind, fingerprint) if fingerprint else None
+        best = choice.get('selector') if choice else None
+        if best not in selectors:
+            return list(selectors)
+        return [best] + [selector for selector in selectors if selector != best]
+
+    def record_selector(self, kind: str, selector: str, success: bool) -> None:
+        """Count a use of a selector and whether it led where it should."""
+        with self._lock:
+            counters = self.selector_stats.setdefault(kind, {}).setdefault(selector, {'used': 0, 'failed': 0})
+            counters['used'] += 1
+            if not success:
+                counters['failed'] += 1
+
+    def save(self) -> None:
+        """Persist the cache if it changed (atomic rename)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            directory = os.path.dirname(os.path.abspath(self.cache_file))
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(prefix='.layout_cache.', suffix='.tmp', dir=directory)
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(self.entries, f, indent=2)
+                os.replace(temp_path, self.cache_file)
+                self._dirty = False
+            except Exception:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-kind counters with the hit rate of lookups and per-selector counters."""
+        with self._lock:
+            report = {}
+            for kind, counters in self.stats.items():
+                lookups = counters['hits'] + counters['misses']
+                report[kind] = dict(counters, hit_rate=counters['hits'] / lookups if lookups else 0.0)
+                if kind in self.selector_stats:
+                    report[kind]['selectors'] = {selector: dict(counts)
+                                                 for selector, counts in self.selector_stats[kind].items()}
+            return report
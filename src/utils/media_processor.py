@@ -0,0 +1,332 @@
+"""
+Post-download processing of media files in a process pool.
+
+Downloaded images and audio are kept as-is for the CSV references; this
+stage prepares them for the game pipeline in parallel with scraping:
+
+- images are normalized (format, maximum size) and thumbnailed into
+  ``<output_dir>/images`` and ``<output_dir>/thumbnails``
+- audio is checked to decode (ffmpeg when installed, otherwise a WAV /
+  MP3 frame-level check)
+
+Work runs in a ProcessPoolExecutor with its own concurrency limit, so CPU
+heavy re-encoding never competes with the scraper's event loop. Workers
+are spawned, not forked, since the pool starts inside a running scraper
+(event loop, browser threads). Each finished file is recorded in a
+done-marker file (keyed by filename, size, modification time and the
+processing settings), so nothing is processed twice across runs.
+
+Pillow is an optional dependency for image processing: ``pip install Pillow``.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import subprocess
+import threading
+import wave
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+AUDIO_EXTENSIONS = ('mp3', 'wav', 'ogg', 'm4a')
+
+# MPEG audio bitrates (kbps) by [version is MPEG-1][layer index]; index 0 and 15 are invalid
+_MP3_BITRATES = {
+    (True, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (True, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (True, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (False, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (False, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    (False, 3): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+_MP3_SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+
+
+def _mp3_frame_length(header: bytes) -> int:
+    """Length in bytes of the MPEG audio frame starting with header, or 0 if invalid."""
+    if len(header) < 4 or header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+        return 0
+    version = (header[1] >> 3) & 0x03
+    layer = 4 - ((header[1] >> 1) & 0x03)
+    bitrate_index = header[2] >> 4
+    rate_index = (header[2] >> 2) & 0x03
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        return 0
+    bitrate = _MP3_BITRATES[(version == 3, layer)][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    padding = (header[2] >> 1) & 0x01
+    if layer == 1:
+        return (12 * bitrate // sample_rate + padding) * 4
+    samples = 1152 if layer == 2 or version == 3 else 576
+    return samples // 8 * bitrate // sample_rate + padding
+
+
+def _check_mp3(path: str, frames_required: int = 3) -> Tuple[bool, str]:
+    """Check that an MP3 file contains a run of consecutive valid frames."""
+    with open(path, 'rb') as f:
+        data = f.read(256 * 1024)
+    offset = 0
+    if data[:3] == b'ID3' and len(data) >= 10:
+        # Skip the ID3v2 tag (syncsafe size)
+        offset = 10 + ((data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9])
+    while offset < len(data) - 4:
+        length = _mp3_frame_length(data[offset:offset + 4])
+        if length:
+            position, frames = offset, 0
+            while frames < frames_required and position < len(data) - 4:
+                frame_length = _mp3_frame_length(data[position:position + 4])
+                if not frame_length:
+                    break
+                position += frame_length
+                frames += 1
+            if frames >= frames_required or position >= len(data) - 4:
+                return True, f"MPEG audio frames found at offset {offset}"
+        offset += 1
+    return False, "No valid MPEG audio frames"
+
+
+def verify_audio(path: str) -> Dict[str, Any]:
+    """
+    Check that an audio file decodes (runs in a worker process).
+
+    Uses a full ffmpeg decode when ffmpeg is installed; otherwise WAV files
+    are opened with the wave module and MP3 files are checked frame by frame.
+    """
+    ext = os.path.splitext(path)[1].lstrip('.').lower()
+    if shutil.which('ffmpeg'):
+        result = subprocess.run(['ffmpeg', '-v', 'error', '-i', path, '-f', 'null', '-'],
+                                capture_output=True, text=True, timeout=300)
+        ok = result.returncode == 0 and not result.stderr.strip()
+        return {'status': 'ok' if ok else 'failed', 'detail': result.stderr.strip()[:200] or 'ffmpeg decode'}
+
+    try:
+        if ext == 'wav':
+            with wave.open(path, 'rb') as audio:
+                frames = audio.getnframes()
+                audio.readframes(min(frames, 1024))
+            ok, detail = frames > 0, f"{frames} frames"
+        elif ext == 'mp3':
+            ok, detail = _check_mp3(path)
+        else:
+            return {'status': 'skipped', 'detail': f"No decoder for .{ext} without ffmpeg"}
+    except (wave.Error, EOFError, OSError) as e:
+        ok, detail = False, str(e)
+    return {'status': 'ok' if ok else 'failed', 'detail': detail}
+
+
+def process_image(path: str, output_dir: str, image_format: str = 'JPEG',
+                  max_size: int = 1024, thumbnail_size: int = 256) -> Dict[str, Any]:
+    """
+    Write a normalized copy and a thumbnail of an image (runs in a worker process).
+
+    The normalized copy is converted to image_format and scaled down to fit
+    max_size x max_size; the thumbnail fits thumbnail_size.
+    """
+    if Image is None:
+        return {'status': 'skipped', 'detail': 'Pillow is not installed'}
+
+    stem = os.path.splitext(os.path.basename(path))[0]
+    ext = 'jpg' if image_format.upper() == 'JPEG' else image_format.lower()
+    normalized_path = os.path.join(output_dir, 'images', f"{stem}.{ext}")
+    thumbnail_path = os.path.join(output_dir, 'thumbnails', f"{stem}.{ext}")
+    os.makedirs(os.path.dirname(normalized_path), exist_ok=True)
+    os.makedirs(os.path.dirname(thumbnail_path), exist_ok=True)
+
+    try:
+        with Image.open(path) as image:
+            image.load()
+            if image_format.upper() == 'JPEG' and image.mode not in ('RGB', 'L'):
+                image = image.convert('RGB')
+            normalized = image.copy()
+            normalized.thumbnail((max_size, max_size))
+            normalized.save(normalized_path, image_format)
+            thumbnail = image.copy()
+            thumbnail.thumbnail((thumbnail_size, thumbnail_size))
+            thumbnail.save(thumbnail_path, image_format)
+            size = normalized.size
+    except OSError as e:
+        return {'status': 'failed', 'detail': str(e)}
+    return {'status': 'ok', 'detail': f"{size[0]}x{size[1]}", 'outputs': [normalized_path, thumbnail_path]}
+
+
+def process_file(path: str, media_type: str, settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Process one media file according to its type (runs in a worker process)."""
+    if media_type == 'audio':
+        if not settings.get('verify_audio', True):
+            return {'status': 'skipped', 'detail': 'Audio verification disabled'}
+        return verify_audio(path)
+    return process_image(path, settings['output_dir'],
+                         image_format=settings.get('image_format', 'JPEG'),
+                         max_size=settings.get('max_image_size', 1024),
+                         thumbnail_size=settings.get('thumbnail_size', 256))
+
+
+class MediaProcessor:
+    """
+    Runs media post-processing in a process pool, at most `workers` files at a time.
+
+    - schedule() queues a file without waiting (used right after downloads)
+    - drain() waits for scheduled work; close() also shuts the pool down
+    - process_files() processes a batch of existing files
+    """
+
+    DONE_FILENAME = 'processed.jsonl'
+
+    def __init__(self, output_dir: str, workers: int = 2, image_format: str = 'JPEG',
+                 max_image_size: int = 1024, thumbnail_size: int = 256, verify_audio: bool = True):
+        self.logger = logging.getLogger(__name__)
+        self.output_dir = output_dir
+        self.workers = workers
+        self.settings = {
+            'output_dir': output_dir,
+            'image_format': image_format,
+            'max_image_size': max_image_size,
+            'thumbnail_size': thumbnail_size,
+            'verify_audio': verify_audio
+        }
+        # Changing the settings invalidates earlier results
+        self._settings_tag = hashlib.md5(json.dumps(self.settings, sort_keys=True).encode()).hexdigest()[:8]
+
+        self.done_file = os.path.join(output_dir, self.DONE_FILENAME)
+        self._done: Dict[str, Dict[str, Any]] = {}
+        self._done_lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: set = set()
+        self.stats = {'processed': 0, 'failed': 0, 'skipped': 0, 'already_done': 0}
+
+        os.makedirs(output_dir, exist_ok=True)
+        self._load_done()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'MediaProcessor':
+        """Create a processor from the storage.media.processing section of the scraper configuration."""
+        storage = config['storage']
+        settings = storage.get('media', {}).get('processing', {})
+        output_dir = settings.get('output_dir') or \
+            os.path.join(os.path.dirname(os.path.normpath(storage['images_dir'])), 'processed')
+        return cls(
+            output_dir,
+            workers=settings.get('workers', 2),
+            image_format=settings.get('image_format', 'JPEG'),
+            max_image_size=settings.get('max_image_size', 1024),
+            thumbnail_size=settings.get('thumbnail_size', 256),
+            verify_audio=settings.get('verify_audio', True)
+        )
+
+    @staticmethod
+    def is_available() -> bool:
+        """Whether image processing is possible (Pillow installed)."""
+        return Image is not None
+
+    def _load_done(self) -> None:
+        if not os.path.exists(self.done_file):
+            return
+        with open(self.done_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    self._done[record['marker']] = record
+                except (ValueError, KeyError):
+                    continue
+
+    def _marker(self, path: str) -> Optional[str]:
+        """Done-marker of a file: changes when the file or the settings change."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns}:{self._settings_tag}"
+
+    def is_done(self, path: str) -> bool:
+        marker = self._marker(path)
+        return marker is not None and marker in self._done
+
+    def _mark_done(self, marker: str, path: str, media_type: str, result: Dict[str, Any]) -> None:
+        record = {'marker': marker, 'file': os.path.basename(path), 'media_type': media_type,
+                  'status': result['status'], 'detail': result.get('detail', '')}
+        with self._done_lock:
+            self._done[marker] = record
+            with open(self.done_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record) + '\n')
+
+    async def process(self, path: str, media_type: str) -> Optional[Dict[str, Any]]:
+        """Process one file in the pool unless it is already done; returns the result."""
+        marker = self._marker(path)
+        if marker is None:
+            return None
+        if marker in self._done:
+            self.stats['already_done'] += 1
+            return self._done[marker]
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                 mp_context=multiprocessing.get_context('spawn'))
+            self._semaphore = asyncio.Semaphore(self.workers)
+
+        async with self._semaphore:
+            try:
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._executor, process_file, path, media_type, self.settings)
+            except Exception as e:
+                result = {'status': 'failed', 'detail': str(e)}
+
+        status = result['status']
+        self.stats['processed' if status == 'ok' else status] += 1
+        if status == 'failed':
+            self.logger.warning(f"Media post-processing failed for {os.path.basename(path)}: {result.get('detail')}")
+        if status != 'skipped':
+            # Skipped files (missing optional tools) are retried once the tools are available
+            self._mark_done(marker, path, media_type, result)
+        return result
+
+    def schedule(self, path: str, media_type: str) -> None:
+        """Queue a file for processing without waiting for it."""
+        task = asyncio.ensure_future(self.process(path, media_type))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def drain(self) -> None:
+        """Wait for all scheduled files."""
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def process_files(self, files: Iterable[Tuple[str, str]]) -> Dict[str, int]:
+        """Process (path, media_type) pairs, at most `workers` at a time; returns the stats."""
+        await asyncio.gather(*(self.process(path, media_type) for path, media_type in files))
+        return self.get_stats()
+
+    async def close(self) -> None:
+        """Finish scheduled work and shut the pool down."""
+        await self.drain()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self.logger.info(f"Media post-processing: {self.stats['processed']} processed, "
+                             f"{self.stats['failed']} failed, {self.stats['already_done']} already done")
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get a copy of the processing statistics."""
+        return self.stats.copy()
+
+
+def iter_media_files(directories: Dict[str, str]) -> List[Tuple[str, str]]:
+    """(path, media_type) for every media file in the given {media_type: directory} mapping."""
+    files = []
+    for media_type, directory in directories.items():
+        if not os.path.isdir(directory):
+            continue
+        with os.scandir(directory) as scan:
+            for item in scan:
+                if item.is_file() and not item.name.startswith('temp_'):
+                    files.append((item.path, media_type))
+    return files
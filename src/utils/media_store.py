@@ -0,0 +1,278 @@
+"""
+Content-addressed blob store and manifest for downloaded media.
+
+Photo and audio questions often reuse the same asset. Instead of keeping a
+separate copy per question, every distinct file is stored once under its
+content hash and the per-question filenames (Question_..._0001.jpg) are
+hardlinks to that blob. A URL index remembers which blob each source URL
+resolved to, so an already-fetched URL never touches the network again.
+
+Layout:
+    <blob_dir>/ab/abcdef....jpg   one file per distinct content hash
+    <blob_dir>/url_index.jsonl    append-only {"url", "hash", "ext"} records
+
+The MediaManifest records every per-question media file (URL, filename,
+size, hash, time), so re-runs can skip files already on disk and media
+statistics never have to scan the media directories.
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+
+class MediaBlobStore:
+    """
+    Stores media once per content hash and links it to per-question names.
+
+    - lookup_url() returns the blob hash a URL was stored under, if the
+      blob still exists
+    - add() moves a freshly downloaded file into the store (or discards it
+      when identical content is already stored) and records its URL
+    - link() exposes a blob under a per-question path as a hardlink,
+      falling back to a copy where hardlinks are not supported
+    """
+
+    INDEX_FILENAME = 'url_index.jsonl'
+
+    def __init__(self, blob_dir: str):
+        self.logger = logging.getLogger(__name__)
+        self.blob_dir = blob_dir
+        self.index_file = os.path.join(blob_dir, self.INDEX_FILENAME)
+        self._urls: Dict[str, Tuple[str, str]] = {}  # url -> (hash, extension)
+        self._lock = threading.Lock()
+        self.stats = {
+            'blobs_added': 0,
+            'content_hits': 0,  # Downloads whose content was already stored
+            'url_hits': 0,  # Lookups answered without downloading
+            'bytes_saved': 0,
+            'copies': 0  # Links that fell back to copying
+        }
+        os.makedirs(blob_dir, exist_ok=True)
+        self._load_index()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'MediaBlobStore':
+        """Create a store from the storage.media section of the scraper configuration."""
+        storage = config['storage']
+        blob_dir = storage.get('media', {}).get('blob_dir') or \
+            os.path.join(os.path.dirname(os.path.normpath(storage['images_dir'])), 'blobs')
+        return cls(blob_dir)
+
+    def _load_index(self) -> None:
+        """Read the URL index; later records win."""
+        if not os.path.exists(self.index_file):
+            return
+        with open(self.index_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    self._urls[record['url']] = (record['hash'], record['ext'])
+                except (ValueError, KeyError):
+                    # Torn last line from an interrupted run
+                    continue
+        self.logger.debug(f"Loaded {len(self._urls)} media URLs from {self.index_file}")
+
+    def blob_path(self, content_hash: str, ext: str) -> str:
+        """Path of the blob for a content hash."""
+        return os.path.join(self.blob_dir, content_hash[:2], f"{content_hash}.{ext}")
+
+    def staging_path(self) -> str:
+        """Unique path in the store's directory to download into before add()."""
+        return os.path.join(self.blob_dir, f"incoming_{uuid.uuid4().hex}")
+
+    def lookup_url(self, url: str) -> Optional[Tuple[str, str]]:
+        """
+        Find the blob a URL was stored under.
+
+        Returns:
+            (content hash, extension) or None if the URL is unknown or its
+            blob has been removed
+        """
+        with self._lock:
+            entry = self._urls.get(url)
+        if entry and os.path.exists(self.blob_path(*entry)):
+            self.stats['url_hits'] += 1
+            return entry
+        return None
+
+    def add(self, source_path: str, content_hash: str, ext: str, url: Optional[str] = None) -> str:
+        """
+        Move a downloaded file into the store.
+
+        If a blob with the same content hash exists, source_path is discarded.
+
+        Returns:
+            Path of the blob
+        """
+        blob = self.blob_path(content_hash, ext)
+        if os.path.exists(blob):
+            self.stats['content_hits'] += 1
+            self.stats['bytes_saved'] += os.path.getsize(source_path)
+            os.remove(source_path)
+        else:
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            os.replace(source_path, blob)
+            self.stats['blobs_added'] += 1
+
+        if url:
+            with self._lock:
+                if self._urls.get(url) != (content_hash, ext):
+                    self._urls[url] = (content_hash, ext)
+                    with open(self.index_file, 'a', encoding='utf-8') as f:
+                        f.write(json.dumps({'url': url, 'hash': content_hash, 'ext': ext}) + '\n')
+        return blob
+
+    def link(self, content_hash: str, ext: str, target_path: str) -> None:
+        """Make target_path refer to a blob (hardlink, or copy if linking fails)."""
+        blob = self.blob_path(content_hash, ext)
+        if os.path.exists(target_path) and os.path.samefile(blob, target_path):
+            return
+
+        # Link under a temp name and rename, so target_path is replaced atomically
+        temp_path = os.path.join(os.path.dirname(target_path), f"temp_{uuid.uuid4().hex}")
+        try:
+            os.link(blob, temp_path)
+        except OSError:
+            shutil.copy2(blob, temp_path)
+            self.stats['copies'] += 1
+        os.replace(temp_path, target_path)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get a copy of the store statistics."""
+        stats = self.stats.copy()
+        stats['urls'] = len(self._urls)
+        return stats
+
+
+class MediaManifest:
+    """
+    Append-only record of saved media files, keyed by filename.
+
+    Each line is {"filename", "url", "media_type", "size", "hash",
+    "timestamp"}; later lines for a filename replace earlier ones. The file
+    is compacted on load when superseded lines outnumber live entries.
+    """
+
+    def __init__(self, manifest_file: str):
+        self.logger = logging.getLogger(__name__)
+        self.manifest_file = manifest_file
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(manifest_file)), exist_ok=True)
+        self._load()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'MediaManifest':
+        """Create a manifest from the storage.media section of the scraper configuration."""
+        storage = config['storage']
+        manifest_file = storage.get('media', {}).get('manifest_file') or \
+            os.path.join(os.path.dirname(os.path.normpath(storage['images_dir'])), 'media_manifest.jsonl')
+        return cls(manifest_file)
+
+    def _load(self) -> None:
+        if not os.path.exists(self.manifest_file):
+            return
+        lines = 0
+        with open(self.manifest_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                lines += 1
+                try:
+                    entry = json.loads(line)
+                    self.entries[entry['filename']] = entry
+                except (ValueError, KeyError):
+                    # Torn last line from an interrupted run
+                    continue
+        if lines > 2 * len(self.entries) + 100:
+            self._compact()
+        self.logger.debug(f"Loaded {len(self.entries)} media manifest entries")
+
+    def _compact(self) -> None:
+        """Rewrite the manifest with live entries only (atomic rename)."""
+        temp_path = f"{self.manifest_file}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps(entry) + '\n' for entry in self.entries.values())
+        os.replace(temp_path, self.manifest_file)
+
+    def get(self, filename: str) -> Optional[Dict[str, Any]]:
+        """Manifest entry for a media filename, if recorded."""
+        return self.entries.get(filename)
+
+    def record(self, filename: str, url: str, media_type: str, size: int,
+               content_hash: Optional[str] = None) -> None:
+        """Record a saved media file."""
+        entry = {
+            'filename': filename,
+            'url': url,
+            'media_type': media_type,
+            'size': size,
+            'hash': content_hash,
+            'timestamp': time.time()
+        }
+        with self._lock:
+            self.entries[filename] = entry
+            with open(self.manifest_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+
+    def is_present(self, filename: str, url: str, filepath: str) -> bool:
+        """
+        Whether filepath already holds the file recorded for url.
+
+        Only a single stat is needed: the file must exist with the size
+        recorded when it was saved from the same URL. Entries recorded by
+        bootstrap() have no URL; since filenames are derived from the
+        question and URL, a non-empty file under the same name is accepted
+        and its URL is filled in (one appended line).
+        """
+        entry = self.entries.get(filename)
+        if not entry or entry.get('url') not in (url, None):
+            return False
+        try:
+            present = os.path.getsize(filepath) == entry['size'] > 0
+        except OSError:
+            return False
+        if present and entry.get('url') is None:
+            self.record(filename, url, entry['media_type'], entry['size'], entry.get('hash'))
+        return present
+
+    def bootstrap(self, directories: Dict[str, str]) -> int:
+        """
+        Record media files saved before the manifest existed (one scan).
+
+        Args:
+            directories: Mapping of media type to directory
+
+        Returns:
+            Number of files recorded
+        """
+        count = 0
+        with self._lock:
+            for media_type, directory in directories.items():
+                if not os.path.isdir(directory):
+                    continue
+                with os.scandir(directory) as scan:
+                    for item in scan:
+                        if item.is_file() and not item.name.startswith('temp_'):
+                            self.entries[item.name] = {
+                                'filename': item.name,
+                                'url': None,
+                                'media_type': media_type,
+                                'size': item.stat().st_size,
+                                'hash': None,
+                                'timestamp': item.stat().st_mtime
+                            }
+                            count += 1
+            self._compact()
+        self.logger.info(f"Recorded {count} existing media files in {self.manifest_file}")
+        return count
+
+    def iter_entries(self, media_type: Optional[str] = None) -> Iterable[Dict[str, Any]]:
+        """Recorded entries, optionally of one media type."""
+        for entry in list(self.entries.values()):
+            if media_type is None or entry.get('media_type') == media_type:
+                yield entry
@@ -0,0 +1,367 @@
+"""
+Local Mock of the FunTrivia Site
+
+Serves synthetic category, quiz and results pages from 127.0.0.1, so that
+end-to-end runs can measure the scraper's own throughput. This is
+reproducible and never touches the live site.
+scripts/benchmark_end_to_end.py runs FunTriviaScraper against it. The
+same server can also be used with src/main.py --base-url.
+
+    GET  /quizzes/                              category index
+    GET  /quizzes/<category>/                   quiz links of one category
+    GET  /quiz/<category>/<slug>-<id>.html      quiz page (multiple choice, photo or audio)
+    POST /submitquiz.cfm                        results page with answers and explanations
+    GET  /quizimages/<id>_<n>.jpg               question photo
+    GET  /quizaudio/<id>_<n>.mp3                question audio clip
+    GET  /robots.txt
+
+Pages use the markup of the extraction corpus (tests/fixtures/extraction).
+Quiz content is a pure function of the seed, so every run sees the same
+site and question texts never repeat across quizzes.
+
+Each response is delayed by latency_ms +/- jitter_ms. A fraction
+error_rate of requests fails with 503. page_padding_kb of hidden filler
+brings every page up to a realistic size.
+"""
+
+import asyncio
+import html
+import random
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+CATEGORIES = [
+    ('Geography', ['World', 'Countries', 'Cities']),
+    ('Science', ['Physics', 'Chemistry', 'Astronomy']),
+    ('History', ['Ancient', 'Medieval', 'Wars']),
+    ('Sports', ['Football', 'Olympics', 'Tennis']),
+    ('Nature', ['Animals', 'Birds', 'Plants']),
+    ('Music', ['Rock', 'Classical', 'Bands']),
+    ('Movies', ['Actors', 'Directors', 'Hollywood']),
+    ('Literature', ['Novels', 'Poetry', 'Authors']),
+    ('Television', ['Shows', 'Series', 'Cartoons']),
+    ('Religion', ['Christianity', 'Islam', 'Buddhism']),
+    ('Education', ['School', 'University', 'Learning']),
+    ('Culture', ['Art', 'Food', 'Festivals']),
+]
+
+DIFFICULTIES = ['Easy', 'Average', 'Tough', 'Difficult']
+
+SYLLABLES = ['ka', 'lo', 'mi', 'ra', 'ten', 'vo', 'sul', 'dri', 'ane', 'bor', 'qui', 'zel', 'mar', 'os', 'pen',
+             'thu', 'gal', 'ri', 'nes', 'cor', 'el', 'fa', 'ho', 'ju', 'tra', 'wen', 'yl', 'ix']
+
+SUBJECTS = ['city', 'river', 'scientist', 'battle', 'composer', 'painter', 'island', 'emperor', 'novel',
+            'mountain', 'team', 'element', 'festival', 'species', 'album', 'inventor']
+
+# Smallest files that still start with the right magic bytes
+JPEG_BYTES = b'\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00' + b'\x00' * 2048 + b'\xff\xd9'
+MP3_BYTES = b'ID3\x03\x00\x00\x00\x00\x00\x00' + b'\xff\xfb\x90\x00' * 512
+
+PAGE_HEAD = '''<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+</head>
+<body>
+<div class="header"><a href="/">Fun Trivia</a> | <a href="/login.cfm">Log In</a> | <a href="/join.cfm">New Player</a></div>
+'''
+
+PAGE_FOOT = '''<div class="footer"><a href="/privacy.cfm">Privacy</a> | <a href="/contact.cfm">Contact Us</a></div>
+{padding}</body>
+</html>
+'''
+
+
+def slugify(text: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+
+class MockFunTriviaSite:
+    """
+    aiohttp application serving a deterministic synthetic FunTrivia.
+
+    - start() / stop() (or async with) run it on host:port (port 0 picks a free port)
+    - base_url is the value for scraper.base_url once started
+    - quiz() returns the content of one quiz, for checking scraper output
+    - get_stats() reports requests per route, injected errors and bytes sent
+    """
+
+    def __init__(self, latency_ms: float = 50.0, jitter_ms: float = 25.0, error_rate: float = 0.0,
+                 page_padding_kb: int = 32, categories: int = 12, quizzes_per_category: int = 5,
+                 questions_per_quiz: int = 10, photo_rate: float = 0.15, audio_rate: float = 0.1,
+                 seed: int = 0, host: str = '127.0.0.1', port: int = 0):
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError(f"error_rate must be between 0 and 1, got {error_rate}")
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.page_padding_kb = page_padding_kb
+        self.questions_per_quiz = questions_per_quiz
+        self.photo_rate = photo_rate
+        self.audio_rate = audio_rate
+        self.seed = seed
+        self.host = host
+        self.port = port
+
+        # Latency and error injection; content uses its own per-quiz generators
+        self.random = random.Random(seed)
+        self.category_list = self._build_categories(categories, quizzes_per_category)
+        self._categories_by_slug = {category['slug']: category for category in self.category_list}
+        self._quizzes: Dict[int, Dict[str, Any]] = {}
+        self._padding = self._build_padding(page_padding_kb)
+
+        self.requests: Counter = Counter()
+        self.stats = {'requests': 0, 'errors_injected': 0, 'bytes_sent': 0}
+
+        self.app = web.Application(middlewares=[self._middleware])
+        self.app.add_routes([
+            web.get('/robots.txt', self._robots, name='robots'),
+            web.get('/quizzes/', self._category_index, name='category_index'),
+            web.get('/quizzes/{category}/', self._category_page, name='category'),
+            web.get(r'/quiz/{category}/{slug}-{qid:\d+}.html', self._quiz_page, name='quiz'),
+            web.post('/submitquiz.cfm', self._results_page, name='results'),
+            web.get(r'/quizimages/{qid:\d+}_{number:\d+}.jpg', self._image, name='image'),
+            web.get(r'/quizaudio/{qid:\d+}_{number:\d+}.mp3', self._audio, name='audio'),
+        ])
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> str:
+        """Start serving and return the base URL."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        self.port = self._runner.addresses[0][1]
+        return self.base_url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> 'MockFunTriviaSite':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats, by_route=dict(self.requests))
+
+    def quiz_ids(self) -> List[int]:
+        return [qid for category in self.category_list for qid in category['quiz_ids']]
+
+    # ---- content -------------------------------------------------------
+
+    def _build_categories(self, count: int, quizzes_per_category: int) -> List[Dict[str, Any]]:
+        categories = []
+        for index in range(count):
+            name, topics = CATEGORIES[index % len(CATEGORIES)]
+            if index >= len(CATEGORIES):
+                name = f"{name} {index // len(CATEGORIES) + 1}"
+            categories.append({
+                'name': name,
+                'slug': slugify(name),
+                'topics': topics,
+                'quiz_ids': [100000 + index * 1000 + number for number in range(quizzes_per_category)],
+            })
+        return categories
+
+    @staticmethod
+    def _build_padding(size_kb: int) -> str:
+        if size_kb <= 0:
+            return ''
+        line = '<p>Related quizzes, member comments and site news that the scraper never reads.</p>\n'
+        return '<div class="sidebar" hidden>\n' + line * (size_kb * 1024 // len(line) + 1) + '</div>\n'
+
+    def _word(self, rng: random.Random) -> str:
+        return ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+
+    def quiz(self, qid: int) -> Dict[str, Any]:
+        """
+        Content of one quiz: title, category, topic, difficulty, quiz type and questions.
+
+        Each question has number, question, options, correct_answer and explanation.
+
+        Raises:
+            KeyError: If the site has no quiz with this id
+        """
+        if qid in self._quizzes:
+            return self._quizzes[qid]
+        category = self.category_list[(qid - 100000) // 1000]
+        if qid not in category['quiz_ids']:
+            raise KeyError(qid)
+
+        rng = random.Random(f"{self.seed}:{qid}")
+        roll = rng.random()
+        quiz_type = 'Photo Quiz' if roll < self.photo_rate else \
+                    'Audio Quiz' if roll < self.photo_rate + self.audio_rate else 'Multiple Choice'
+        topic = rng.choice(category['topics'])
+        difficulty = rng.choice(DIFFICULTIES)
+
+        questions = []
+        for number in range(1, self.questions_per_quiz + 1):
+            subject = rng.choice(SUBJECTS)
+            if quiz_type == 'Multiple Choice' and rng.random() < 0.1:
+                options = ['True', 'False']
+                text = f"{self._word(rng)} was the first {subject} recorded in the {topic} archive {qid}-{number}."
+            else:
+                options = []
+                while len(options) < 4:
+                    word = self._word(rng)
+                    if word not in options:
+                        options.append(word)
+                if quiz_type == 'Photo Quiz':
+                    text = f"Which {subject} is shown in photo {number} of set {qid}?"
+                elif quiz_type == 'Audio Quiz':
+                    text = f"Listen to clip {number} of set {qid}. Which {subject} is it about?"
+                else:
+                    text = f"Which {subject} is known from {topic.lower()} record {qid}-{number}?"
+            correct_answer = rng.choice(options)
+            explanation = (f"{correct_answer} is the {subject} in question. "
+                           f"It appears in record {qid}-{number} of the {category['name']} {topic} collection, "
+                           f"which has been part of the archive since {rng.randint(1850, 2020)}.")
+            questions.append({'number': str(number), 'question': text, 'options': options,
+                              'correct_answer': correct_answer, 'explanation': explanation,
+                              'percent': rng.randint(20, 95)})
+
+        title = f"{topic} {self._word(rng)} {difficulty}"
+        quiz = {
+            'qid': qid,
+            'title': title,
+            'url': f"/quiz/{category['slug']}/{slugify(title)}-{qid}.html",
+            'category': category,
+            'topic': topic,
+            'difficulty': difficulty,
+            'quiz_type': quiz_type,
+            'questions': questions,
+        }
+        self._quizzes[qid] = quiz
+        return quiz
+
+    # ---- rendering -----------------------------------------------------
+
+    def _page(self, title: str, body: str) -> web.Response:
+        text = PAGE_HEAD.format(title=html.escape(title)) + body + PAGE_FOOT.format(padding=self._padding)
+        return web.Response(text=text, content_type='text/html')
+
+    def _quiz_header(self, quiz: Dict[str, Any]) -> str:
+        category = quiz['category']
+        blurbs = {
+            'Photo Quiz': 'A photo quiz: look at each picture and answer the question.',
+            'Audio Quiz': 'An audio quiz: listen to each clip and answer the question.',
+            'Multiple Choice': 'A multiple choice quiz.',
+        }
+        return (
+            f'<div class="breadcrumb"><a href="/">Home</a> &raquo; <a href="/quizzes/">Quizzes</a> &raquo; '
+            f'<a href="/quizzes/{category["slug"]}/">{html.escape(category["name"])}</a> &raquo; '
+            f'<a href="/quizzes/{category["slug"]}/">{html.escape(quiz["topic"])}</a></div>\n'
+            f'<h1>{html.escape(quiz["title"])}</h1>\n'
+            f'<p>{blurbs[quiz["quiz_type"]]}</p>\n'
+            f'<div class="quiz-info">Type: {quiz["quiz_type"]} | Difficulty: {quiz["difficulty"]}</div>\n'
+        )
+
+    def render_quiz_page(self, quiz: Dict[str, Any]) -> str:
+        out = [self._quiz_header(quiz),
+               f'<form method="POST" action="/submitquiz.cfm" id="quizform">\n'
+               f'<input name="qid" value="{quiz["qid"]}" type="hidden">\n']
+        for question in quiz['questions']:
+            number = question['number']
+            out.append(f'<div class="container" id="question{number}">\n'
+                       f'<div class="playquiz_qntxtbox"><b>{number}. {html.escape(question["question"])}</b></div>\n')
+            if quiz['quiz_type'] == 'Photo Quiz':
+                out.append(f'<div class="quizimage"><img src="/quizimages/{quiz["qid"]}_{number}.jpg" '
+                           f'width="320" height="240" alt="Question {number} photo"></div>\n')
+            elif quiz['quiz_type'] == 'Audio Quiz':
+                out.append(f'<div class="quizaudio"><audio controls src="/quizaudio/{quiz["qid"]}_{number}.mp3">'
+                           f'</audio></div>\n')
+            out.append('<div class="playquiz_anslist">\n')
+            for index, option in enumerate(question['options'], 1):
+                out.append(f'<div><input name="q{number}" value="{html.escape(option)}" type="radio" '
+                           f'id="radio{number}_{index}"> <label for="radio{number}_{index}">'
+                           f'{html.escape(option)}</label></div>\n')
+            out.append('</div>\n</div>\n')
+        out.append('<input type="submit" value="Finish and Score Quiz" class="submit-button">\n</form>\n')
+        return ''.join(out)
+
+    def render_results_page(self, quiz: Dict[str, Any], answers: Dict[str, str]) -> str:
+        questions = quiz['questions']
+        correct = sum(1 for question in questions if answers.get(question['number']) == question['correct_answer'])
+        out = [self._quiz_header(quiz),
+               f'<div class="quizheading">Quiz Results</div>\n'
+               f'<p class="score">Your Score: {correct} of {len(questions)}</p>\n']
+        for question in questions:
+            number = question['number']
+            out.append(f'<div class="questionReview">\n<b>{number}. {html.escape(question["question"])}</b><br>\n'
+                       f'Your Answer: [{html.escape(answers.get(number) or "No Answer")}]<br><br>\n'
+                       f'The correct answer was <b>{html.escape(question["correct_answer"])}</b>.<br><br>\n'
+                       f'{html.escape(question["explanation"])}<br><br>\n'
+                       f'{question["percent"]}% of players have answered correctly.\n</div>\n')
+        return ''.join(out)
+
+    # ---- handlers ------------------------------------------------------
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        self.stats['requests'] += 1
+        route = request.match_info.route.name or 'not_found'
+        self.requests[route] += 1
+
+        delay = self.latency_ms + self.random.uniform(-self.jitter_ms, self.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+        if route != 'robots' and self.error_rate and self.random.random() < self.error_rate:
+            self.stats['errors_injected'] += 1
+            return web.Response(status=503, text='Service temporarily unavailable')
+
+        response = await handler(request)
+        self.stats['bytes_sent'] += len(response.body or b'')
+        return response
+
+    async def _robots(self, request: web.Request) -> web.Response:
+        return web.Response(text='User-agent: *\nAllow: /\n')
+
+    async def _category_index(self, request: web.Request) -> web.Response:
+        links = ''.join(f'<li><a href="/quizzes/{category["slug"]}/">{html.escape(category["name"])} Trivia</a></li>\n'
+                        for category in self.category_list)
+        return self._page('Trivia Quiz Categories', f'<h1>Quiz Categories</h1>\n<ul class="categories">\n{links}</ul>\n')
+
+    async def _category_page(self, request: web.Request) -> web.Response:
+        category = self._categories_by_slug.get(request.match_info['category'])
+        if category is None:
+            raise web.HTTPNotFound()
+        links = ''.join(f'<li><a href="{quiz["url"]}">{html.escape(quiz["title"])}</a></li>\n'
+                        for quiz in (self.quiz(qid) for qid in category['quiz_ids']))
+        return self._page(f"{category['name']} Trivia Quizzes",
+                          f'<h1>{html.escape(category["name"])} Quizzes</h1>\n<ol class="quizlist">\n{links}</ol>\n')
+
+    def _quiz_or_404(self, qid: str) -> Dict[str, Any]:
+        try:
+            return self.quiz(int(qid))
+        except (KeyError, IndexError, ValueError):
+            raise web.HTTPNotFound()
+
+    async def _quiz_page(self, request: web.Request) -> web.Response:
+        quiz = self._quiz_or_404(request.match_info['qid'])
+        return self._page(quiz['title'], self.render_quiz_page(quiz))
+
+    async def _results_page(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        quiz = self._quiz_or_404(form.get('qid', ''))
+        answers = {question['number']: form.get(f"q{question['number']}") for question in quiz['questions']}
+        return self._page(f"{quiz['title']} - Results", self.render_results_page(quiz, answers))
+
+    async def _image(self, request: web.Request) -> web.Response:
+        return web.Response(body=JPEG_BYTES, content_type='image/jpeg')
+
+    async def _audio(self, request: web.Request) -> web.Response:
+        return web.Response(body=MP3_BYTES, content_type='audio/mpeg')
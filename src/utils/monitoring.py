@@ -23,6 +23,11 @@ class ScrapingMetrics:
             'questions_by_type': {'multiple_choice': 0, 'true_false': 0, 'sound': 0},
             'pages_visited': 0,
             'media_downloaded': {'images': 0, 'audio': 0},
+            'media': {
+                'bytes_downloaded': 0,
+                'total_download_time': 0,
+                'max_download_time': 0
+            },
             'errors': [],
             'warnings': [],
             'performance': {
@@ -39,6 +44,14 @@ class ScrapingMetrics:
                 'valid_questions': 0,
                 'invalid_questions': 0,
                 'warnings': 0
+            },
+            'storage': {
+                'batches_written': 0,
+                'rows_written': 0,
+                'total_write_time': 0,
+                'max_write_time': 0,
+                'backpressure_waits': 0,
+                'backpressure_time': 0
             }
         }
         self.page_load_times = []
@@ -59,10 +72,16 @@ class ScrapingMetrics:
             if self.page_load_times:
                 self.session_metrics['performance']['avg_page_load_time'] = sum(self.page_load_times) / len(self.page_load_times)
     
-    def record_media_download(self, media_type: str) -> None:
-        """Record a media file download."""
+    def record_media_download(self, media_type: str, size_bytes: int = 0, duration: float = 0) -> None:
+        """Record a media file download with its size and latency."""
+        if media_type == 'image':
+            media_type = 'images'
         if media_type in self.session_metrics['media_downloaded']:
             self.session_metrics['media_downloaded'][media_type] += 1
+        media = self.session_metrics['media']
+        media['bytes_downloaded'] += size_bytes
+        media['total_download_time'] += duration
+        media['max_download_time'] = max(media['max_download_time'], duration)
     
     def record_error(self, error_type: str, error_message: str) -> None:
         """Record an error occurrence."""
@@ -94,6 +113,19 @@ class ScrapingMetrics:
         self.session_metrics['validation']['invalid_questions'] += invalid
         self.session_metrics['validation']['warnings'] += warnings
     
+    def record_storage_write(self, rows: int, duration: float) -> None:
+        """Record a batch written by the background question writer."""
+        storage = self.session_metrics['storage']
+        storage['batches_written'] += 1
+        storage['rows_written'] += rows
+        storage['total_write_time'] += duration
+        storage['max_write_time'] = max(storage['max_write_time'], duration)
+    
+    def record_writer_backpressure(self, wait_seconds: float) -> None:
+        """Record time a scraper spent waiting for room in the writer queue."""
+        self.session_metrics['storage']['backpressure_waits'] += 1
+        self.session_metrics['storage']['backpressure_time'] += wait_seconds
+    
     def _update_performance_metrics(self) -> None:
         """Update performance metrics."""
         current_time = time.time()
@@ -171,6 +203,15 @@ class ScrapingMetrics:
         print(f"Pages visited: {stats['pages_visited']}")
         print(f"Rate: {stats['performance']['avg_questions_per_minute']:.1f} questions/min")
         print(f"Memory: {stats['performance']['peak_memory_mb']:.1f} MB")
+        if stats['storage']['batches_written']:
+            print(f"Writes: {stats['storage']['batches_written']} batches, "
+                  f"max {stats['storage']['max_write_time']:.2f}s, "
+                  f"{stats['storage']['backpressure_waits']} producer stalls")
+        media_count = sum(stats['media_downloaded'].values())
+        if media_count:
+            print(f"Media: {media_count} files, "
+                  f"{stats['media']['bytes_downloaded'] / (1024 * 1024):.1f} MB, "
+                  f"avg {stats['media']['total_download_time'] / media_count:.2f}s")
         
         if stats['errors']:
             print(f"Errors: {len(stats['errors'])}")
@@ -0,0 +1,357 @@
+"""
+Near-duplicate question detection with MinHash and LSH banding.
+
+Exact signatures (see dedup.py) miss paraphrased or lightly edited copies
+of a question. Here each question + correct answer is shingled into
+character n-grams and summarized by a MinHash signature; signatures are
+split into bands and bucketed, so only questions sharing a band bucket
+are compared instead of every pair.
+
+Shingling, MinHash and band hashing are vectorized with numpy over whole
+batches, so indexing hundreds of thousands of rows takes seconds.
+"""
+
+import csv
+import logging
+import os
+import sys
+import threading
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Handle imports whether running as module or directly
+try:
+    from .dedup import normalize_signature_series, normalize_signature_text
+except ImportError:
+    # Add parent directory to path for direct execution
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+    from utils.dedup import normalize_signature_series, normalize_signature_text
+
+# Upper bound on (permutations x shingles) hashed at once
+_BATCH_CELLS = 4_000_000
+
+
+def near_duplicate_text(row: Dict[str, Any]) -> str:
+    """Text compared for near duplicates: normalized question plus correct answer."""
+    return f"{normalize_signature_text(row.get('Question'))} | {normalize_signature_text(row.get('CorrectAnswer'))}"
+
+
+def near_duplicate_text_series(questions: pd.Series, answers: pd.Series) -> List[str]:
+    """Vectorized near_duplicate_text() for pandas Series of questions and answers."""
+    return (normalize_signature_series(questions) + ' | ' + normalize_signature_series(answers)).tolist()
+
+
+class MinHasher:
+    """Vectorized MinHash over character shingles."""
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 5, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.RandomState(seed)
+        # Random affine permutations of the 32-bit shingle hashes: a * x + b (mod 2^32), a odd
+        self._a = (rng.randint(0, 2 ** 31, size=num_perm).astype(np.uint32) * np.uint32(2) + np.uint32(1))
+        self._b = rng.randint(0, 2 ** 31, size=num_perm).astype(np.uint32)
+
+    def _shingles(self, texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Hash every character shingle of every text.
+
+        Returns:
+            (shingle hashes, start offset of each text's shingles)
+        """
+        k = self.shingle_size
+        encoded = [text.encode('utf-8').ljust(k) for text in texts]
+        lengths = np.fromiter((len(data) for data in encoded), dtype=np.int64, count=len(encoded))
+        buffer = np.frombuffer(b''.join(encoded), dtype=np.uint8).astype(np.uint32)
+
+        # Polynomial hash of every k-byte window in the concatenated buffer
+        window_count = len(buffer) - k + 1
+        window_hashes = np.zeros(window_count, dtype=np.uint32)
+        for offset in range(k):
+            window_hashes = window_hashes * np.uint32(1_000_003) + buffer[offset:offset + window_count]
+
+        # Keep only windows that lie inside a single text
+        text_starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        shingle_counts = lengths - k + 1
+        shingle_offsets = np.concatenate(([0], np.cumsum(shingle_counts)[:-1]))
+        positions = (np.repeat(text_starts - shingle_offsets, shingle_counts)
+                     + np.arange(int(shingle_counts.sum()), dtype=np.int64))
+        return window_hashes[positions], shingle_offsets
+
+    def signatures(self, texts: Sequence[str]) -> np.ndarray:
+        """MinHash signatures for a batch of texts, shape (len(texts), num_perm)."""
+        texts = list(texts)
+        result = np.empty((len(texts), self.num_perm), dtype=np.uint32)
+        if not texts:
+            return result
+
+        # Split into batches so the (permutation x shingle) matrix stays bounded
+        average_length = max(1, sum(len(text) for text in texts) // len(texts))
+        batch_size = max(1, _BATCH_CELLS // (self.num_perm * average_length))
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start:start + batch_size]
+            hashes, offsets = self._shingles(batch)
+            permuted = self._a[:, None] * hashes[None, :] + self._b[:, None]
+            result[start:start + len(batch)] = np.minimum.reduceat(permuted, offsets, axis=1).T
+        return result
+
+
+class NearDuplicateIndex:
+    """
+    Incremental LSH index of MinHash signatures.
+
+    Each band bucket remembers the first question that landed in it, so
+    memory stays proportional to the number of questions and a lookup
+    compares against at most one question per band. Estimated similarity
+    is the fraction of equal MinHash values.
+
+    The same question with a different correct answer usually scores above
+    the threshold too, so conflicting answers surface as near duplicates.
+
+    The policy tells writers what to do with a near duplicate: 'flag'
+    keeps it and records the match in the report file, 'drop' skips it.
+    """
+
+    POLICIES = ('flag', 'drop')
+
+    def __init__(self, threshold: float = 0.7, num_perm: int = 64, bands: int = 16, shingle_size: int = 5,
+                 policy: str = 'flag', report_file: Optional[str] = None):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown near-duplicate policy '{policy}' (expected one of {self.POLICIES})")
+        self.logger = logging.getLogger(__name__)
+        self.threshold = threshold
+        self.policy = policy
+        self.report_file = report_file
+        self._lock = threading.Lock()
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.hasher = MinHasher(num_perm=num_perm, shingle_size=shingle_size)
+        # Odd multipliers folding the rows of a band into one 64-bit bucket hash
+        self._band_mix = np.random.RandomState(2).randint(
+            0, 2 ** 62, size=self.rows_per_band, dtype=np.int64).astype(np.uint64) * np.uint64(2) + np.uint64(1)
+
+        self.clear()
+
+    def clear(self) -> None:
+        """Forget all indexed questions (used when the CSV files are overwritten)."""
+        self.keys: List[str] = []
+        self._signatures = np.empty((0, self.hasher.num_perm), dtype=np.uint32)
+        self._band_hashes = np.empty((0, self.bands), dtype=np.uint64)
+        self._buckets: List[Dict[int, int]] = [{} for _ in range(self.bands)]
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'NearDuplicateIndex':
+        """Create an index from the storage.near_duplicates section of the scraper configuration."""
+        storage = config['storage']
+        settings = storage.get('near_duplicates', {})
+        return cls(
+            threshold=settings.get('threshold', 0.7),
+            num_perm=settings.get('num_perm', 64),
+            bands=settings.get('bands', 16),
+            policy=settings.get('policy', 'flag'),
+            report_file=settings.get('report_file') or os.path.join(storage['output_dir'], 'near_duplicates.csv')
+        )
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _hash_bands(self, signatures: np.ndarray) -> np.ndarray:
+        """Bucket hash of every band, shape (len(signatures), bands)."""
+        rows = signatures.reshape(len(signatures), self.bands, self.rows_per_band).astype(np.uint64)
+        return (rows * self._band_mix).sum(axis=2)
+
+    def _append(self, keys: Sequence[str], signatures: np.ndarray, band_hashes: np.ndarray) -> None:
+        start = len(self.keys)
+        end = start + len(keys)
+        if end > len(self._signatures):
+            # Grow geometrically so single-row appends stay amortized O(1)
+            capacity = max(end, 2 * len(self._signatures), 1024)
+            self._signatures = np.resize(self._signatures, (capacity, self._signatures.shape[1]))
+            self._band_hashes = np.resize(self._band_hashes, (capacity, self.bands))
+        self._signatures[start:end] = signatures
+        self._band_hashes[start:end] = band_hashes
+        self.keys.extend(keys)
+
+        positions = range(end - 1, start - 1, -1)
+        for band, buckets in enumerate(self._buckets):
+            # Built in reverse so the first question of the batch wins each bucket;
+            # buckets already taken by earlier questions are left alone
+            fresh = dict(zip(reversed(band_hashes[:, band].tolist()), positions))
+            for taken in fresh.keys() & buckets.keys():
+                del fresh[taken]
+            buckets.update(fresh)
+
+    def _best_match(self, signature: np.ndarray, band_hashes: Sequence[int]) -> Tuple[int, float]:
+        """Most similar indexed question above the threshold as (position, similarity), or (-1, 0.0)."""
+        candidates = {buckets[band_hash] for buckets, band_hash in zip(self._buckets, band_hashes)
+                      if band_hash in buckets}
+        if not candidates:
+            return -1, 0.0
+        positions = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+        similarities = (self._signatures[positions] == signature).mean(axis=1)
+        best = int(similarities.argmax())
+        if similarities[best] < self.threshold:
+            return -1, 0.0
+        return int(positions[best]), float(similarities[best])
+
+    def add_many(self, keys: Sequence[str], texts: Sequence[str]) -> None:
+        """Index a batch of questions."""
+        signatures = self.hasher.signatures(texts)
+        with self._lock:
+            self._append(list(keys), signatures, self._hash_bands(signatures))
+
+    def query(self, text: str) -> List[Tuple[str, float]]:
+        """Find the indexed question most similar to text, as [(key, estimated similarity)] or []."""
+        signature = self.hasher.signatures([text])
+        position, similarity = self._best_match(signature[0], self._hash_bands(signature)[0].tolist())
+        return [(self.keys[position], similarity)] if position >= 0 else []
+
+    def load_rows(self, rows: Iterable[Dict[str, Any]], batch_size: int = 50000) -> int:
+        """Index formatted question rows in batches; returns the number indexed."""
+        keys, texts = [], []
+        count = 0
+        for row in rows:
+            keys.append(str(row.get('Key', '')))
+            texts.append(near_duplicate_text(row))
+            if len(keys) >= batch_size:
+                self.add_many(keys, texts)
+                count += len(keys)
+                keys, texts = [], []
+        if keys:
+            self.add_many(keys, texts)
+            count += len(keys)
+        return count
+
+    def load_csv_files(self, csv_paths: Iterable[str], chunksize: int = 50000) -> int:
+        """Index the questions of existing CSV files, streamed in chunks."""
+        count = 0
+        for csv_path in csv_paths:
+            if not os.path.exists(csv_path) or os.path.getsize(csv_path) == 0:
+                continue
+            reader = pd.read_csv(csv_path, chunksize=chunksize, dtype=str, keep_default_na=False,
+                                 usecols=lambda column: column in ('Key', 'Question', 'CorrectAnswer'))
+            for chunk in reader:
+                empty = pd.Series('', index=chunk.index)
+                self.add_many(chunk.get('Key', empty).tolist(),
+                              near_duplicate_text_series(chunk.get('Question', empty),
+                                                         chunk.get('CorrectAnswer', empty)))
+                count += len(chunk)
+        self.logger.info(f"Indexed {count} questions for near-duplicate detection")
+        return count
+
+    def load_store(self, store, question_types: Iterable[str]) -> int:
+        """Index the questions held in a QuestionStore."""
+        count = sum(self.load_rows(store.iter_rows(question_type)) for question_type in question_types)
+        self.logger.info(f"Indexed {count} stored questions for near-duplicate detection")
+        return count
+
+    def screen(self, rows: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], np.ndarray]:
+        """
+        Check a batch of rows against the index and each other, without indexing them.
+
+        Returns:
+            (rows without a near duplicate, matches as {'Key', 'MatchedKey',
+            'Similarity'} dicts for the others, MinHash signatures of all rows)
+            - pass the written rows and their signatures to commit() once
+            they are safely written
+        """
+        if not rows:
+            return [], [], np.empty((0, self.hasher.num_perm), dtype=np.uint32)
+        signatures = self.hasher.signatures([near_duplicate_text(row) for row in rows])
+        band_hashes = self._hash_bands(signatures)
+
+        # Earlier rows of the batch, bucketed like the index (first row wins each bucket)
+        batch_keys: List[str] = []
+        batch_buckets: List[Dict[int, int]] = [{} for _ in range(self.bands)]
+
+        unique_rows, matches = [], []
+        with self._lock:
+            for position, (row, signature, row_bands) in enumerate(zip(rows, signatures, band_hashes.tolist())):
+                key = str(row.get('Key', ''))
+                matched_key, similarity = None, 0.0
+                indexed, indexed_similarity = self._best_match(signature, row_bands)
+                if indexed >= 0 and self.keys[indexed] != key:
+                    matched_key, similarity = self.keys[indexed], indexed_similarity
+                candidates = {buckets[band_hash] for buckets, band_hash in zip(batch_buckets, row_bands)
+                              if band_hash in buckets}
+                for candidate in sorted(candidates):
+                    candidate_similarity = float((signatures[candidate] == signature).mean())
+                    if candidate_similarity >= self.threshold and candidate_similarity > similarity \
+                            and batch_keys[candidate] != key:
+                        matched_key, similarity = batch_keys[candidate], candidate_similarity
+
+                if matched_key is not None:
+                    matches.append({'Key': key, 'MatchedKey': matched_key,
+                                    'Similarity': round(similarity, 3), 'Question': row.get('Question', '')})
+                else:
+                    unique_rows.append(row)
+                batch_keys.append(key)
+                for buckets, band_hash in zip(batch_buckets, row_bands):
+                    buckets.setdefault(band_hash, position)
+        return unique_rows, matches, signatures
+
+    def commit(self, rows: List[Dict[str, Any]], signatures: np.ndarray) -> None:
+        """Index rows that were written, with the signatures screen() computed for them."""
+        if not rows:
+            return
+        with self._lock:
+            self._append([str(row.get('Key', '')) for row in rows], signatures, self._hash_bands(signatures))
+
+    def report(self, matches: List[Dict[str, Any]]) -> None:
+        """Append near-duplicate matches to the report file."""
+        if not matches or not self.report_file:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.report_file)), exist_ok=True)
+        with self._lock:
+            write_header = not os.path.exists(self.report_file) or os.path.getsize(self.report_file) == 0
+            with open(self.report_file, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=['Key', 'MatchedKey', 'Similarity', 'Policy', 'Question'],
+                                        extrasaction='ignore', lineterminator='\n')
+                if write_header:
+                    writer.writeheader()
+                writer.writerows(dict(match, Policy=self.policy) for match in matches)
+
+    def clusters(self) -> List[List[str]]:
+        """
+        Group all indexed questions into near-duplicate clusters.
+
+        Every band is sorted to find questions sharing a bucket; pairs above
+        the threshold are merged with union-find. Singletons are omitted.
+        """
+        count = len(self.keys)
+        parent = list(range(count))
+
+        def find(position: int) -> int:
+            while parent[position] != position:
+                parent[position] = parent[parent[position]]
+                position = parent[position]
+            return position
+
+        for band in range(self.bands):
+            column = self._band_hashes[:count, band]
+            order = np.argsort(column, kind='stable')
+            ordered = column[order]
+            # Pair every question with the first question of its bucket
+            group_starts = np.flatnonzero(np.concatenate(([True], ordered[1:] != ordered[:-1])))
+            group_sizes = np.diff(np.append(group_starts, len(ordered)))
+            heads = order[np.repeat(group_starts, group_sizes)]
+            members = order
+            paired = heads != members
+            heads, members = heads[paired], members[paired]
+            if not len(heads):
+                continue
+
+            similar = (self._signatures[heads] == self._signatures[members]).mean(axis=1) >= self.threshold
+            for head, member in zip(heads[similar].tolist(), members[similar].tolist()):
+                head_root, member_root = find(head), find(member)
+                if head_root != member_root:
+                    parent[member_root] = head_root
+
+        groups: Dict[int, List[str]] = {}
+        for position, key in enumerate(self.keys):
+            groups.setdefault(find(position), []).append(key)
+        return [keys for keys in groups.values() if len(keys) > 1]
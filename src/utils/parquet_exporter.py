@@ -0,0 +1,173 @@
+"""
+Columnar Parquet export of the question corpus.
+
+Writes a Hive-partitioned Parquet dataset next to the CSV files:
+
+    output/parquet/question_type=multiple_choice/Domain=Culture/run-<tag>-0.parquet
+
+Domain, Topic and Difficulty are dictionary-encoded, so they load as
+categoricals. Each export only writes questions whose Key is not already in
+the dataset, as new files, so repeated runs append row groups instead of
+rewriting the dataset.
+
+pyarrow is an optional dependency: install it with ``pip install pyarrow``.
+"""
+
+import csv
+import logging
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Set
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    ds = None
+    pq = None
+
+# Handle imports whether running as module or directly
+try:
+    from ..constants import CSV_COLUMNS
+except ImportError:
+    # Add parent directory to path for direct execution
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+    from constants import CSV_COLUMNS
+
+# Low-cardinality columns stored as dictionaries (categoricals when loaded)
+DICTIONARY_COLUMNS = ['Domain', 'Topic', 'Difficulty']
+PARTITION_COLUMNS = ['question_type', 'Domain']
+
+
+def iter_csv_rows(csv_path: str) -> Iterator[Dict[str, str]]:
+    """Stream rows of a question CSV file without loading it into memory."""
+    if not os.path.exists(csv_path):
+        return
+    with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+        yield from csv.DictReader(f)
+
+
+class ParquetExporter:
+    """Appends questions to a partitioned Parquet dataset."""
+
+    def __init__(self, dataset_dir: str = "output/parquet", row_group_size: int = 10000):
+        self.logger = logging.getLogger(__name__)
+        self.dataset_dir = Path(dataset_dir)
+        self.row_group_size = row_group_size
+
+    @staticmethod
+    def is_available() -> bool:
+        """Check whether pyarrow is installed."""
+        return pa is not None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'ParquetExporter':
+        """Create an exporter from the storage.parquet section of the scraper configuration."""
+        storage = config['storage']
+        parquet_config = storage.get('parquet', {})
+        return cls(
+            parquet_config.get('dataset_dir') or os.path.join(storage['output_dir'], 'parquet'),
+            row_group_size=parquet_config.get('row_group_size', 10000)
+        )
+
+    def _require_pyarrow(self) -> None:
+        if pa is None:
+            raise ImportError("Parquet export requires pyarrow - install it with: pip install pyarrow")
+
+    def schema(self, question_type: str) -> 'pa.Schema':
+        """Arrow schema for one question type (partition columns included)."""
+        self._require_pyarrow()
+        fields = []
+        for column in CSV_COLUMNS.get(question_type, CSV_COLUMNS['multiple_choice']):
+            if column in DICTIONARY_COLUMNS:
+                fields.append(pa.field(column, pa.dictionary(pa.int32(), pa.string())))
+            else:
+                fields.append(pa.field(column, pa.string()))
+        fields.append(pa.field('question_type', pa.string()))
+        return pa.schema(fields)
+
+    def existing_keys(self, question_type: str) -> Set[str]:
+        """Read the keys already exported for a question type (only the Key column is loaded)."""
+        self._require_pyarrow()
+        partition_dir = self.dataset_dir / f"question_type={question_type}"
+        if not partition_dir.exists():
+            return set()
+        dataset = ds.dataset(str(partition_dir), format='parquet', partitioning='hive')
+        return set(dataset.to_table(columns=['Key']).column('Key').to_pylist())
+
+    def append(self, question_type: str, rows: Iterable[Dict[str, Any]],
+               run_tag: Optional[str] = None) -> int:
+        """
+        Append rows whose Key is not yet in the dataset.
+
+        Rows are consumed lazily and written in chunks of row_group_size,
+        each chunk as new files in the affected partitions.
+
+        Returns:
+            Number of rows written
+        """
+        self._require_pyarrow()
+        run_tag = run_tag or datetime.now().strftime('%Y%m%d_%H%M%S')
+        schema = self.schema(question_type)
+        columns = [name for name in schema.names if name != 'question_type']
+        known_keys = self.existing_keys(question_type)
+
+        written = 0
+        chunk_index = 0
+        chunk: List[Dict[str, Any]] = []
+
+        def write_chunk() -> None:
+            table = pa.Table.from_pylist(chunk, schema=schema)
+            pq.write_to_dataset(
+                table,
+                root_path=str(self.dataset_dir),
+                partition_cols=PARTITION_COLUMNS,
+                basename_template=f"run-{run_tag}-{chunk_index}-{{i}}.parquet",
+                existing_data_behavior='overwrite_or_ignore',
+                row_group_size=self.row_group_size
+            )
+
+        for row in rows:
+            key = str(row.get('Key') or '')
+            if not key or key in known_keys:
+                continue
+            known_keys.add(key)
+
+            record = {column: str(row.get(column) or '') for column in columns}
+            record['Domain'] = record['Domain'] or 'Unknown'
+            record['question_type'] = question_type
+            chunk.append(record)
+
+            if len(chunk) >= self.row_group_size:
+                write_chunk()
+                written += len(chunk)
+                chunk_index += 1
+                chunk = []
+
+        if chunk:
+            write_chunk()
+            written += len(chunk)
+
+        if written:
+            self.logger.info(f"Appended {written} {question_type} questions to Parquet dataset {self.dataset_dir}")
+        return written
+
+    def export_csv_files(self, output_dir: str, csv_files: Dict[str, str],
+                         run_tag: Optional[str] = None) -> Dict[str, int]:
+        """Append new rows from the CSV files to the dataset."""
+        return {
+            question_type: self.append(question_type, iter_csv_rows(os.path.join(output_dir, csv_file)), run_tag)
+            for question_type, csv_file in csv_files.items()
+        }
+
+    def export_store(self, store, question_types: Iterable[str], run_id: Optional[int] = None,
+                     run_tag: Optional[str] = None) -> Dict[str, int]:
+        """Append new rows from a QuestionStore to the dataset (optionally only one run's rows)."""
+        return {
+            question_type: self.append(question_type, store.iter_rows(question_type, run_id=run_id), run_tag)
+            for question_type in question_types
+        }
@@ -0,0 +1,193 @@
+"""
+Precompiled Regular Expressions
+
+This module compiles every pattern used per question by the text processor,
+the question classifier and the results-page extraction once, at import time.
+
+Two kinds of pattern lists are kept:
+- indicator lists that are only checked with any() are merged into a single
+  alternation regex, so one search replaces a loop of searches
+- ordered lists where the first matching pattern wins are kept as tuples of
+  compiled patterns, preserving their priority
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, Pattern, Tuple
+import sys
+import os
+
+# Handle imports whether running as module or directly
+try:
+    from ..constants import QUESTION_PATTERNS, TEXT_CLEANUP_PATTERNS
+except ImportError:
+    # Add parent directory to path for direct execution
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+    from constants import QUESTION_PATTERNS, TEXT_CLEANUP_PATTERNS
+
+
+def compile_any(patterns: Iterable[str], flags: int = 0) -> Pattern:
+    """Merge regex patterns into one alternation that matches where any of them would."""
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), flags)
+
+
+def compile_ordered(patterns: Iterable[str], flags: int = 0) -> Tuple[Pattern, ...]:
+    """Compile patterns that are tried in order."""
+    return tuple(re.compile(pattern, flags) for pattern in patterns)
+
+
+def compile_keywords(keywords: Iterable[str], flags: int = 0) -> Pattern:
+    """One regex matching wherever any of the plain-text keywords occurs as a substring."""
+    # Longest first, so overlapping keywords report the longest match
+    return re.compile('|'.join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)), flags)
+
+
+# Question classification
+TRUE_FALSE_INDICATOR_RE = compile_any(QUESTION_PATTERNS['true_false_indicators'])
+FACTUAL_INDICATOR_RE = compile_any(QUESTION_PATTERNS['factual_indicators'])
+SOUND_INDICATOR_RE = compile_keywords(QUESTION_PATTERNS['sound_indicators'])
+
+# Text cleanup
+QUESTION_PREFIX_RES = compile_ordered(TEXT_CLEANUP_PATTERNS['question_prefixes'])
+OPTION_MARKER_RE = re.compile(r'^[a-d]\)?\s*', re.IGNORECASE)
+NUMBERED_OPTION_RE = re.compile(r'^[a-d][.)]\s*(.+)', re.IGNORECASE)
+LETTER_RE = re.compile(r'[a-zA-Z]')
+MEDIA_REFERENCE_RE = re.compile(r'\b\w+\.(jpg|jpeg|png|gif|mp3|wav|ogg|m4a)\b', re.IGNORECASE)
+NUMERIC_ENTITY_RE = re.compile(r'&#(\d+);')
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Results page structure
+NUMBERED_LINE_RE = re.compile(r'^(\d+)\.\s+')
+QUIZ_RATING_LINE_RES = compile_ordered([
+    r'^\d+\.\s+[A-Z].*?Average$',
+    r'^\d+\.\s+.*?\s+(Average|Easy|Normal|Hard)$',
+])
+SITE_ACTION_RE = re.compile(r'\b(browse|search|login|register)\b')
+ANSWER_LINE_RE = re.compile(r'The correct answer was|correct answer:', re.IGNORECASE)
+RESULT_BOUNDARY_RE = re.compile(r'\d+%\s+of\s+players|I see an error|Your Answer:|Question \d+', re.IGNORECASE)
+
+CORRECT_ANSWER_RES = compile_ordered([
+    r'The correct answer was\s+([^.\n\r]+)',
+    r'Correct answer was\s+([^.\n\r]+)',
+    r'correct answer:\s*([^.\n\r]+)',
+    r'The correct answer is\s+([^.\n\r]+)',
+    # Not "Your Answer:" - that is the option the scraper picked
+    r'(?<!your )Answer:\s*([^.\n\r]+)',
+], re.IGNORECASE | re.DOTALL)
+
+BLOCK_ANSWER_RES = compile_ordered([
+    r'The correct answer was\s+([^.\n\r]+)',
+    r'Correct Answer:\s*(.+?)(?:\n|$)',
+    r'(?<!your )Answer:\s*(.+?)(?:\n|$)',
+    r'Correct:\s*(.+?)(?:\n|$)'
+], re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def question_context_res(question_num: str) -> Tuple[Pattern, ...]:
+    """Patterns finding the correct answer for one question number in the full page text."""
+    return compile_ordered([
+        rf'{question_num}\.\s+.*?The correct answer was\s+([^.\n\r]+)',
+        rf'Question {question_num}.*?The correct answer was\s+([^.\n\r]+)',
+        rf'{question_num}\.\s+.*?correct answer:\s*([^.\n\r]+)',
+    ], re.IGNORECASE | re.DOTALL)
+
+
+# Explanation extraction: "The correct answer was X. <explanation> 42% of players..."
+_RESULT_END = r'(?=\d+%\s+of\s+players|I see an error|Your Answer:|Question \d+|\Z)'
+FUNTRIVIA_EXPLANATION_RES = compile_ordered([
+    rf'The correct answer was\s+[^.]+\.\s*(.+?){_RESULT_END}',
+    # Alternative answer formats
+    rf'Correct answer was\s+[^.]+\.\s*(.+?){_RESULT_END}',
+    rf'correct answer:\s*[^.]+\.\s*(.+?){_RESULT_END}',
+    # Answer in quotes, then single word answers
+    rf'The correct answer was\s+"[^"]+"\s*(.+?){_RESULT_END}',
+    rf'The correct answer was\s+\w+\s*(.+?){_RESULT_END}',
+], re.MULTILINE | re.DOTALL | re.IGNORECASE)
+
+_BLOCK_END = r'(?:\n\n|\n(?=Question|\d+\.|\Z|Your Score|Quiz Complete))'
+_SECTION_END = r'(?=\n(?:Question \d+|Your Score|Quiz Results|Submit|Next Question)|\Z)'
+INTERESTING_INFORMATION_RES = compile_ordered([
+    # Standard label with and without colon, abbreviated, block format
+    rf'Interesting Information:\s*(.+?){_BLOCK_END}',
+    rf'Interesting Information\s+(.+?){_BLOCK_END}',
+    rf'Interesting Info:\s*(.+?){_BLOCK_END}',
+    rf'(?:^|\n)Interesting Information[:\s]*\n(.+?){_BLOCK_END}',
+    # Longer explanations up to the next section
+    rf'Interesting Information[:\s]*(.+?){_SECTION_END}',
+    # Looser variations
+    rf'interesting[:\s]*(.+?){_BLOCK_END}',
+    rf'info[:\s]*(.+?){_BLOCK_END}',
+    rf'trivia[:\s]*(.+?){_BLOCK_END}',
+    # Any paragraph after a correct answer indicator
+    rf'correct[:\s]+[^.]+\.(.+?){_BLOCK_END}',
+    rf'answer[:\s]+[^.]+\.(.+?){_BLOCK_END}'
+], re.IGNORECASE | re.DOTALL)
+
+GENERIC_EXPLANATION_RES = compile_ordered([
+    # Explanation labels, question-style and contextual labels
+    rf'Explanation:\s*(.+?){_BLOCK_END}',
+    rf'Info:\s*(.+?){_BLOCK_END}',
+    rf'Additional Information:\s*(.+?){_BLOCK_END}',
+    rf'Details:\s*(.+?){_BLOCK_END}',
+    rf'Trivia:\s*(.+?){_BLOCK_END}',
+    rf'Did you know[?:]?\s*(.+?){_BLOCK_END}',
+    rf'Fun fact[?:]?\s*(.+?){_BLOCK_END}',
+    rf'Background:\s*(.+?){_BLOCK_END}',
+    rf'Context:\s*(.+?){_BLOCK_END}',
+    rf'More Info:\s*(.+?){_BLOCK_END}',
+    # Longer explanations up to the next section
+    rf'(?:Explanation|Additional Information|Details)[:\s]*(.+?){_SECTION_END}'
+], re.IGNORECASE | re.DOTALL)
+
+# Navigation and site furniture mixed into results text
+NAVIGATION_LINE_RE = compile_any([
+    r'^\d+\.\s+.+\s+(easy|normal|hard|average|difficult)',  # Quiz list items
+    r'^\d+\.\s+[A-Z][a-z]+.*?trivia',                      # Trivia category links
+    r'funtrivia\s+homepage',                               # Site navigation
+    r'copyright\s+funtrivia',                              # Copyright text
+    r'terms\s+&\s+conditions',                             # Legal text
+    r'explore\s+other\s+quizzes',                          # Quiz navigation
+    r'more\s+.*?\s+quizzes',                               # More quiz links
+    r'go\s+to\s+.*?\s+quizzes',                            # Navigation links
+    r'other\s+destinations',                               # Site navigation
+    r'referenced\s+topics',                                # Topic references
+    r'adopted\s+quizzes',                                  # Quiz adoption info
+    r'^\d+\.\s+[A-Z][^.]{10,50}\s+(easy|normal|hard)',     # Numbered quiz titles
+    r'u\.s\.\s+government\s+quizzes',                      # Category navigation
+    r'zip\s+codes\s+average',                              # Quiz title patterns
+    r'collect\s+the\s+century',                            # Quiz title patterns
+], re.IGNORECASE)
+
+NAVIGATION_TEXT_RE = compile_any([
+    r'^\d+\.\s+.+\s+(average|easy|normal|hard|difficult)$',  # Quiz ratings
+    r'^\d+\.\s+[A-Z][a-z]+.*?trivia',                       # Trivia categories
+    r'funtrivia\s+homepage',                                # Site navigation
+    r'browse\s+quizzes',                                    # Quiz browsing
+    r'more\s+.*?\s+quizzes',                                # More quiz links
+    r'explore\s+other\s+quizzes',                           # Quiz exploration
+    r'click\s+here\s+to',                                   # Click instructions
+    r'visit\s+our',                                         # Site promotion
+], re.IGNORECASE)
+
+NAVIGATION_KEYWORD_RE = compile_keywords([
+    'funtrivia', 'homepage', 'browse', 'click here', 'visit',
+    'explore', 'more quizzes', 'trivia quiz', 'average quiz'
+])
+INVALID_EXPLANATION_RE = compile_keywords([
+    'funtrivia', 'homepage', 'browse quizzes', 'click here',
+    'visit our', 'explore other', 'more quizzes'
+])
+
+# Wording typical of explanations
+EDUCATIONAL_INDICATORS = [
+    'because', 'this is', 'the reason', 'actually', 'in fact', 'however',
+    'therefore', 'although', 'since', 'according to', 'research shows',
+    'studies', 'scientists', 'experts', 'discovered', 'found that',
+    'evidence', 'data', 'statistics', 'history', 'historical',
+    'originated', 'invented', 'created', 'established', 'founded'
+]
+EDUCATIONAL_LINE_RE = compile_keywords(EDUCATIONAL_INDICATORS)
+EDUCATIONAL_TEXT_RE = compile_keywords(EDUCATIONAL_INDICATORS + [
+    'named after', 'known for', 'famous for', 'designed by', 'built in'
+])
@@ -9,23 +9,76 @@ This module handles the classification of questions into different types:
 The classifier uses multiple strategies to accurately determine question types.
 """
 
-import re
 import logging
-from typing import List, Dict, Set
+from typing import Any, Iterable, List, Dict, Optional, Tuple
 import sys
 import os
 
+import numpy as np
+import pandas as pd
+
 # Handle imports whether running as module or directly
 try:
     from ..constants import (
-        TRUE_FALSE_SYNONYMS, TRUE_FALSE_PATTERNS, QUESTION_PATTERNS, THRESHOLDS
+        TRUE_FALSE_SYNONYMS, TRUE_FALSE_PATTERNS, THRESHOLDS
     )
+    from .patterns import TRUE_FALSE_INDICATOR_RE, FACTUAL_INDICATOR_RE, SOUND_INDICATOR_RE
 except ImportError:
     # Add parent directory to path for direct execution
     sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
     from constants import (
-        TRUE_FALSE_SYNONYMS, TRUE_FALSE_PATTERNS, QUESTION_PATTERNS, THRESHOLDS
+        TRUE_FALSE_SYNONYMS, TRUE_FALSE_PATTERNS, THRESHOLDS
     )
+    from utils.patterns import TRUE_FALSE_INDICATOR_RE, FACTUAL_INDICATOR_RE, SOUND_INDICATOR_RE
+
+# Synonym and pattern lookups, built once at import
+TRUE_SYNONYMS = frozenset(TRUE_FALSE_SYNONYMS['true'])
+FALSE_SYNONYMS = frozenset(TRUE_FALSE_SYNONYMS['false'])
+ALL_TF_SYNONYMS = TRUE_SYNONYMS | FALSE_SYNONYMS
+TF_OPTION_PAIRS = frozenset(TRUE_FALSE_PATTERNS) | frozenset((false_opt, true_opt) for true_opt, false_opt in TRUE_FALSE_PATTERNS)
+
+# Default option columns of the question CSV files
+OPTION_COLUMNS = ['Option1', 'Option2', 'Option3', 'Option4']
+
+
+def classify_clean(question_lower: str, clean_options: List[str]) -> Tuple[str, str]:
+    """
+    Classify a question from its lowercased text and cleaned options, without logging.
+    
+    Args:
+        question_lower: Lowercased question text
+        clean_options: Stripped, lowercased, non-empty options
+        
+    Returns:
+        Tuple of question type and the strategy that decided it
+    """
+    # Strategy 0: Sound detection (highest priority)
+    if SOUND_INDICATOR_RE.search(question_lower):
+        return 'sound', 'sound indicator'
+    
+    # Only binary questions can be True/False
+    if len(clean_options) == 2:
+        option1, option2 = clean_options
+        
+        # Strategy 1: Direct synonym matching (options from opposite categories)
+        if ((option1 in TRUE_SYNONYMS and option2 in FALSE_SYNONYMS) or
+                (option1 in FALSE_SYNONYMS and option2 in TRUE_SYNONYMS)):
+            return 'true_false', 'direct synonym match'
+        
+        # Strategy 2: Common pattern matching
+        if (option1, option2) in TF_OPTION_PAIRS:
+            return 'true_false', 'pattern match'
+        
+        # Strategy 3: Question text analysis (short options, T/F wording, not factual)
+        if (len(option1) <= THRESHOLDS['short_option_length'] and
+                len(option2) <= THRESHOLDS['short_option_length'] and
+                TRUE_FALSE_INDICATOR_RE.search(question_lower) and
+                not FACTUAL_INDICATOR_RE.search(question_lower)):
+            return 'true_false', 'question pattern + 2 short options'
+        
+        return 'multiple_choice', 'ambiguous binary'
+    
+    return 'multiple_choice', 'default'
 
 
 class QuestionClassifier:
@@ -38,14 +91,7 @@ class QuestionClassifier:
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self._all_tf_synonyms = self._flatten_synonyms()
-    
-    def _flatten_synonyms(self) -> List[str]:
-        """Flatten True/False synonyms into a single list for quick checking."""
-        synonyms = []
-        for category in TRUE_FALSE_SYNONYMS.values():
-            synonyms.extend(category)
-        return synonyms
+        self._all_tf_synonyms = ALL_TF_SYNONYMS
     
     def classify(self, question_text: str, options: List[str]) -> str:
         """
@@ -63,110 +109,137 @@ class QuestionClassifier:
         
         self.logger.debug(f"Classifying question with {len(clean_options)} options: {options}")
         
-        # Strategy 0: Sound detection (highest priority)
-        if self._is_sound_question(question_text):
+        question_type, reason = classify_clean(question_text.lower(), clean_options)
+        
+        if question_type == 'sound':
             self.logger.info(f"Classified as Sound question: {question_text[:50]}...")
-            return "sound"
+            return question_type
+        
+        if question_type == 'true_false':
+            self.logger.info(f"Classified as True/False: {options} ({reason})")
+            return question_type
         
-        # Only process binary questions for True/False classification
-        if len(clean_options) == 2:
-            tf_result = self._classify_binary_question(question_text, clean_options, options)
-            if tf_result:
-                return tf_result
+        # Flag suspicious binary cases before defaulting
+        if reason == 'ambiguous binary':
+            self._check_suspicious_binary(question_text, clean_options, options)
         
         # Default classification
         return self._default_classification(clean_options, question_text, options)
     
-    def _is_sound_question(self, question_text: str) -> bool:
-        """Check if question involves audio/sound content."""
-        question_lower = question_text.lower()
-        return any(indicator in question_lower for indicator in QUESTION_PATTERNS['sound_indicators'])
-    
-    def _classify_binary_question(self, question_text: str, clean_options: List[str], original_options: List[str]) -> str:
+    def classify_batch(self, questions: Iterable[Any]) -> List[str]:
         """
-        Classify a question with exactly 2 options.
+        Classify many questions without per-question logging.
+        
+        Gives the same types as classify(). Identical (question, options) pairs
+        are classified once.
         
+        Args:
+            questions: (question_text, options) pairs or question dicts with
+                'question' and 'options' keys
+            
         Returns:
-            str: 'true_false' if classified as T/F, None if should use default classification
+            List of question types in input order
         """
-        option1, option2 = clean_options
+        results = []
+        seen: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+        for question in questions:
+            if isinstance(question, dict):
+                question_text, options = question.get('question', ''), question.get('options', [])
+            else:
+                question_text, options = question
+            key = (question_text or '', tuple(options or ()))
+            question_type = seen.get(key)
+            if question_type is None:
+                clean_options = [opt.strip().lower() for opt in key[1] if opt and opt.strip()]
+                question_type = classify_clean(key[0].lower(), clean_options)[0]
+                seen[key] = question_type
+            results.append(question_type)
         
-        # Strategy 1: Direct synonym matching
-        if self._is_direct_tf_match(option1, option2, original_options):
-            return "true_false"
+        self.logger.debug(f"Batch-classified {len(results)} questions ({len(seen)} distinct)")
+        return results
+    
+    def classify_series(self, questions: pd.Series, options: Any) -> pd.Series:
+        """
+        Classify a pandas column of questions, e.g. from a historical CSV.
         
-        # Strategy 2: Common pattern matching
-        if self._is_pattern_match(option1, option2, original_options):
-            return "true_false"
+        Same types as classify(), computed with column-wise string operations
+        instead of a per-row loop.
         
-        # Strategy 3: Question text analysis (with factual exclusions)
-        if self._is_question_pattern_match(question_text, clean_options, original_options):
-            return "true_false"
+        Args:
+            questions: pandas Series of question texts
+            options: DataFrame of option columns (such as Option1..Option4) or a
+                Series of option lists, aligned with questions
+            
+        Returns:
+            pandas Series of question types with the index of questions
+        """
+        if isinstance(options, pd.Series):
+            options = pd.DataFrame(options.map(lambda opts: list(opts) if isinstance(opts, (list, tuple)) else []).tolist(),
+                                   index=options.index)
         
-        # Strategy 4: Flag suspicious cases
-        self._check_suspicious_binary(question_text, clean_options, original_options)
+        question_lower = questions.fillna('').astype(str).str.lower()
+        clean = options.apply(lambda column: column.fillna('').astype(str).str.strip().str.lower())
+        option_count = clean.ne('').sum(axis=1)
         
-        return None  # Let default classification handle it
-    
-    def _is_direct_tf_match(self, option1: str, option2: str, original_options: List[str]) -> bool:
-        """Check for direct True/False synonym matches."""
-        if option1 in self._all_tf_synonyms and option2 in self._all_tf_synonyms:
-            # Verify they're from opposite categories
-            is_opposite = (
-                (option1 in TRUE_FALSE_SYNONYMS['true'] and option2 in TRUE_FALSE_SYNONYMS['false']) or
-                (option1 in TRUE_FALSE_SYNONYMS['false'] and option2 in TRUE_FALSE_SYNONYMS['true'])
-            )
-            
-            if is_opposite:
-                self.logger.info(f"Classified as True/False: {original_options} (direct synonym match)")
-                return True
+        result = pd.Series('multiple_choice', index=questions.index, dtype=object)
+        is_sound = question_lower.str.contains(SOUND_INDICATOR_RE.pattern, regex=True)
+        result[is_sound] = 'sound'
+        
+        binary = (~is_sound) & (option_count == 2)
+        if binary.any():
+            result[binary] = self._classify_binary_series(question_lower[binary], clean[binary])
         
-        return False
+        self.logger.debug(f"Classified {len(result)} questions: {result.value_counts().to_dict()}")
+        return result
     
-    def _is_pattern_match(self, option1: str, option2: str, original_options: List[str]) -> bool:
-        """Check for common True/False patterns."""
-        for true_opt, false_opt in TRUE_FALSE_PATTERNS:
-            if ((option1 == true_opt and option2 == false_opt) or 
-                (option1 == false_opt and option2 == true_opt)):
-                self.logger.info(f"Classified as True/False: {original_options} (pattern match)")
-                return True
-        
-        return False
+    def _classify_binary_series(self, question_lower: pd.Series, clean: pd.DataFrame) -> pd.Series:
+        """Vectorized strategies 1-3 of classify_clean() for rows with exactly two options."""
+        values = clean.to_numpy(dtype=object)
+        present = values != ''
+        rows = np.arange(len(values))
+        first = present.argmax(axis=1)
+        present[rows, first] = False
+        second = present.argmax(axis=1)
+        option1 = pd.Series(values[rows, first], index=clean.index, dtype=object)
+        option2 = pd.Series(values[rows, second], index=clean.index, dtype=object)
+        
+        # Strategy 1: Direct synonym matching (options from opposite categories)
+        direct = ((option1.isin(TRUE_SYNONYMS) & option2.isin(FALSE_SYNONYMS)) |
+                  (option1.isin(FALSE_SYNONYMS) & option2.isin(TRUE_SYNONYMS)))
+        
+        # Strategy 2: Common pattern matching
+        pattern = (option1 + '\0' + option2).isin({f"{a}\0{b}" for a, b in TF_OPTION_PAIRS})
+        
+        # Strategy 3: Question text analysis (short options, T/F wording, not factual)
+        short_limit = THRESHOLDS['short_option_length']
+        worded = ((option1.str.len() <= short_limit) & (option2.str.len() <= short_limit) &
+                  question_lower.str.contains(TRUE_FALSE_INDICATOR_RE.pattern, regex=True) &
+                  ~question_lower.str.contains(FACTUAL_INDICATOR_RE.pattern, regex=True))
+        
+        return pd.Series(np.where(direct | pattern | worded, 'true_false', 'multiple_choice'),
+                         index=clean.index, dtype=object)
     
-    def _is_question_pattern_match(self, question_text: str, clean_options: List[str], original_options: List[str]) -> bool:
-        """Check if question text suggests True/False with factual exclusions."""
-        question_lower = question_text.lower()
-        
-        # Check for True/False indicators
-        has_tf_indicators = any(
-            re.search(pattern, question_lower) 
-            for pattern in QUESTION_PATTERNS['true_false_indicators']
-        )
-        
-        # Check for factual question exclusions
-        is_factual = any(
-            re.search(pattern, question_lower) 
-            for pattern in QUESTION_PATTERNS['factual_indicators']
-        )
-        
-        # Must have T/F indicators, not be factual, and have short options
-        if (has_tf_indicators and 
-            not is_factual and 
-            all(len(opt) <= THRESHOLDS['short_option_length'] for opt in clean_options)):
-            
-            self.logger.info(f"Classified as True/False: {original_options} (question pattern + 2 short options)")
-            return True
+    def classify_frame(self, df: pd.DataFrame, question_column: str = 'Question',
+                       option_columns: Optional[List[str]] = None) -> pd.Series:
+        """
+        Classify the questions of a DataFrame loaded from a question CSV.
         
-        return False
+        Args:
+            df: DataFrame with a question column and option columns
+            question_column: Name of the question text column
+            option_columns: Option column names (default: those of Option1..Option4 present in df)
+            
+        Returns:
+            pandas Series of question types aligned with df
+        """
+        if option_columns is None:
+            option_columns = [column for column in OPTION_COLUMNS if column in df.columns]
+        return self.classify_series(df[question_column], df[option_columns])
     
     def _check_suspicious_binary(self, question_text: str, clean_options: List[str], original_options: List[str]) -> None:
         """Check for suspicious binary questions that might be misclassified."""
         # Only check non-factual questions with short options
-        question_lower = question_text.lower()
-        is_factual = any(
-            re.search(pattern, question_lower) 
-            for pattern in QUESTION_PATTERNS['factual_indicators']
-        )
+        is_factual = FACTUAL_INDICATOR_RE.search(question_text.lower()) is not None
         
         if (not is_factual and 
             all(len(opt) <= THRESHOLDS['medium_option_length'] for opt in clean_options)):
@@ -196,6 +269,9 @@ class QuestionClassifier:
         return "multiple_choice"
 
 
+_default_classifier: Optional[QuestionClassifier] = None
+
+
 # Convenience function for backward compatibility
 def detect_question_type(question_text: str, options: List[str]) -> str:
     """
@@ -208,5 +284,7 @@ def detect_question_type(question_text: str, options: List[str]) -> str:
     Returns:
         str: 'true_false', 'multiple_choice', or 'sound'
     """
-    classifier = QuestionClassifier()
-    return classifier.classify(question_text, options) 
\ No newline at end of file
+    global _default_classifier
+    if _default_classifier is None:
+        _default_classifier = QuestionClassifier()
+    return _default_classifier.classify(question_text, options) 
\ No newline at end of file
@@ -0,0 +1,288 @@
+"""
+Asynchronous question writer for the FunTrivia scraper.
+
+This module decouples scraping from storage: scraper workers hand formatted
+rows to a bounded queue, and a single background task batches them per
+question type and performs the file I/O in a worker thread, so the event
+loop driving the browser pages never blocks on disk writes.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Any, Optional
+
+# Marker put on the queue to request a flush; carries a future to resolve
+_FLUSH = object()
+# Marker put on the queue to stop the writer task
+_CLOSE = object()
+
+
+class QuestionWriter:
+    """
+    Single background writer between scraping workers and storage.
+
+    - put() enqueues formatted rows and blocks when the queue is full,
+      applying backpressure to the scrapers instead of growing memory
+    - rows are batched per question type and written with one
+      CSVHandler.append_to_csv call per batch (or one QuestionStore
+      transaction when a store is given), run via asyncio.to_thread
+    - rows are screened for exact (SignatureIndex) and near
+      (NearDuplicateIndex) duplicates in the same worker thread
+    - write durations and producer stalls are tracked in get_stats() and,
+      if a ScrapingMetrics instance is given, recorded there as well
+    """
+
+    def __init__(self, csv_handler, csv_files: Dict[str, str], queue_size: int = 20,
+                 batch_size: int = 100, flush_interval: float = 2.0, metrics=None,
+                 store=None, run_id: Optional[int] = None, signature_index=None,
+                 near_duplicate_index=None):
+        """
+        Initialize the writer.
+
+        Args:
+            csv_handler: CSVHandler used for the actual file writes
+            csv_files: Mapping of question type to CSV filename
+            queue_size: Maximum number of queued batches before put() blocks
+            batch_size: Rows buffered per question type before a write is issued
+            flush_interval: Seconds of queue inactivity after which buffered rows are written
+            metrics: Optional ScrapingMetrics instance to record write timings into
+            store: Optional QuestionStore; when given, batches are upserted into it instead of the CSV files
+            run_id: Run id recorded with rows written to the store
+            signature_index: Optional SignatureIndex; rows whose content is already stored are dropped
+            near_duplicate_index: Optional NearDuplicateIndex; near duplicates are flagged or dropped per its policy
+        """
+        self.logger = logging.getLogger(__name__)
+        self.csv_handler = csv_handler
+        self.csv_files = csv_files
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.metrics = metrics
+        self.store = store
+        self.run_id = run_id
+        self.signature_index = signature_index
+        self.near_duplicate_index = near_duplicate_index
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._pending: Dict[str, List[Dict[str, Any]]] = {question_type: [] for question_type in csv_files}
+        self._task: Optional[asyncio.Task] = None
+
+        self.stats = {
+            'rows_queued': 0,
+            'rows_written': 0,  # New rows actually added to storage (duplicates excluded)
+            'rows_failed': 0,
+            'duplicates_skipped': 0,  # Rows dropped by the content signature index
+            'near_duplicates': 0,  # Rows flagged (or dropped) as near duplicates
+            'batches_written': 0,
+            'batches_failed': 0,
+            'total_write_seconds': 0.0,
+            'max_write_seconds': 0.0,
+            'backpressure_waits': 0,
+            'backpressure_seconds': 0.0
+        }
+
+    @classmethod
+    def from_config(cls, csv_handler, config: Dict[str, Any], metrics=None,
+                    store=None, run_id: Optional[int] = None,
+                    signature_index=None, near_duplicate_index=None) -> 'QuestionWriter':
+        """Create a writer using the storage.writer section of the scraper configuration."""
+        writer_config = config['storage'].get('writer', {})
+        return cls(
+            csv_handler,
+            config['storage']['csv_files'],
+            queue_size=writer_config.get('queue_size', 20),
+            batch_size=writer_config.get('batch_size', 100),
+            flush_interval=writer_config.get('flush_interval', 2.0),
+            metrics=metrics,
+            store=store,
+            run_id=run_id,
+            signature_index=signature_index,
+            near_duplicate_index=near_duplicate_index
+        )
+
+    async def start(self) -> None:
+        """Start the background writer task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            self.logger.info(f"Question writer started (batch size {self.batch_size}, "
+                             f"queue size {self._queue.maxsize})")
+
+    async def put(self, question_type: str, rows: List[Dict[str, Any]]) -> int:
+        """
+        Queue formatted rows for writing.
+
+        Blocks while the queue is full; the time spent waiting is recorded
+        as a backpressure stall.
+
+        Returns:
+            Number of rows queued
+        """
+        if not rows:
+            return 0
+        if self._task is None:
+            await self.start()
+
+        if self._queue.full():
+            wait_start = time.perf_counter()
+            await self._queue.put((question_type, rows))
+            waited = time.perf_counter() - wait_start
+            self.stats['backpressure_waits'] += 1
+            self.stats['backpressure_seconds'] += waited
+            if self.metrics:
+                self.metrics.record_writer_backpressure(waited)
+            self.logger.debug(f"Writer backpressure: producer waited {waited:.2f}s to queue {len(rows)} rows")
+        else:
+            await self._queue.put((question_type, rows))
+
+        self.stats['rows_queued'] += len(rows)
+        return len(rows)
+
+    async def flush(self) -> Dict[str, Any]:
+        """
+        Wait until every row queued so far has been written.
+
+        Returns:
+            Snapshot of the writer statistics
+        """
+        if self._task is None or self._task.done():
+            return self.get_stats()
+
+        done = asyncio.get_running_loop().create_future()
+        await self._queue.put((_FLUSH, done))
+        await done
+        return self.get_stats()
+
+    async def close(self) -> Dict[str, Any]:
+        """Write remaining rows and stop the background task."""
+        if self._task is not None and not self._task.done():
+            await self._queue.put((_CLOSE, None))
+            await self._task
+            self.logger.info(f"Question writer closed: {self.stats['rows_written']} rows written in "
+                             f"{self.stats['batches_written']} batches")
+        self._task = None
+        return self.get_stats()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get a copy of the writer statistics."""
+        stats = self.stats.copy()
+        stats['queued_batches'] = self._queue.qsize()
+        write_count = stats['batches_written'] + stats['batches_failed']
+        stats['avg_write_seconds'] = stats['total_write_seconds'] / write_count if write_count else 0.0
+        return stats
+
+    async def _run(self) -> None:
+        """Background loop: collect queued rows into batches and write them."""
+        while True:
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                # Queue went quiet - write partial batches so rows don't sit in memory
+                await self._flush_all()
+                continue
+
+            question_type, payload = item
+
+            if question_type is _CLOSE:
+                await self._flush_all()
+                return
+
+            if question_type is _FLUSH:
+                await self._flush_all()
+                if not payload.done():
+                    payload.set_result(True)
+                continue
+
+            self._pending.setdefault(question_type, []).extend(payload)
+            if len(self._pending[question_type]) >= self.batch_size:
+                await self._flush_type(question_type)
+
+    def _write_batch(self, rows: List[Dict[str, Any]], question_type: str, target: str):
+        """
+        Deduplicate and write one batch (runs in a worker thread).
+        
+        Returns:
+            (new rows written, rows dropped as content duplicates, near duplicates found)
+        """
+        signatures = []
+        duplicates = 0
+        if self.signature_index is not None:
+            unique_rows, signatures = self.signature_index.filter_new(rows)
+            duplicates = len(rows) - len(unique_rows)
+            rows = unique_rows
+            if not rows:
+                return 0, duplicates, 0
+
+        near_duplicates = 0
+        near_signatures = None
+        if self.near_duplicate_index is not None:
+            distinct_rows, matches, near_signatures = self.near_duplicate_index.screen(rows)
+            near_duplicates = len(matches)
+            self.near_duplicate_index.report(matches)
+            if matches and self.near_duplicate_index.policy == 'drop':
+                kept = {id(row) for row in distinct_rows}
+                keep = [id(row) in kept for row in rows]
+                if signatures:
+                    signatures = [signature for signature, keep_row in zip(signatures, keep) if keep_row]
+                near_signatures = near_signatures[keep]
+                rows = distinct_rows
+                if not rows:
+                    return 0, duplicates, near_duplicates
+
+        # Raises if the rows could not be written, so nothing below is remembered
+        if self.store is not None:
+            new_count = self.store.upsert_questions(rows, question_type, self.run_id)
+        else:
+            new_count = self.csv_handler.append_to_csv(rows, target, question_type)
+
+        # Only remember content once it is safely written
+        if self.signature_index is not None:
+            self.signature_index.commit(signatures)
+        if self.near_duplicate_index is not None:
+            self.near_duplicate_index.commit(rows, near_signatures)
+        return new_count, duplicates, near_duplicates
+
+    async def _flush_all(self) -> None:
+        """Write all buffered rows."""
+        for question_type in list(self._pending):
+            await self._flush_type(question_type)
+
+    async def _flush_type(self, question_type: str) -> None:
+        """Write the buffered rows of one question type off the event loop."""
+        rows = self._pending.get(question_type)
+        if not rows:
+            return
+        self._pending[question_type] = []
+
+        if self.store is not None:
+            target = 'question store'
+        else:
+            target = self.csv_files.get(question_type)
+            if not target:
+                self.logger.error(f"No CSV file configured for question type '{question_type}' - dropping {len(rows)} rows")
+                self.stats['rows_failed'] += len(rows)
+                return
+
+        write_start = time.perf_counter()
+        try:
+            new_count, duplicates, near_duplicates = await asyncio.to_thread(
+                self._write_batch, rows, question_type, target)
+            self.stats['rows_written'] += new_count
+            self.stats['duplicates_skipped'] += duplicates
+            self.stats['near_duplicates'] += near_duplicates
+            self.stats['batches_written'] += 1
+        except Exception as e:
+            self.stats['rows_failed'] += len(rows)
+            self.stats['batches_failed'] += 1
+            self.logger.error(f"Failed to write {len(rows)} {question_type} rows to {target}: {e}")
+            self.logger.debug("Writer error details:", exc_info=True)
+            return
+        finally:
+            duration = time.perf_counter() - write_start
+            self.stats['total_write_seconds'] += duration
+            self.stats['max_write_seconds'] = max(self.stats['max_write_seconds'], duration)
+            if self.metrics:
+                self.metrics.record_storage_write(len(rows), duration)
+
+        self.logger.debug(f"Wrote batch of {len(rows)} {question_type} rows to {target} "
+                          f"({new_count} new, {duplicates} duplicate content, {near_duplicates} near duplicates) "
+                          f"in {duration:.3f}s")
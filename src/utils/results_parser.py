@@ -0,0 +1,145 @@
+"""
+Results Page Tokenizer
+
+Turns the text of a FunTrivia results page into per-question records in a
+single pass over its lines, so extraction does not re-split the whole page
+for every question.
+
+A results page reads, per question:
+
+    3. Which planet is known as the Red Planet?
+    Your Answer: [Venus]
+    The correct answer was Mars.
+    Mars looks red because of iron oxide on its surface.
+    45% of players have answered correctly.
+
+Each record holds the section text (the lines kept for that question), the
+candidate correct answers in pattern priority order, the player's answer and
+the explanation lines that follow the answer line.
+"""
+
+from typing import Any, Dict, List
+import sys
+import os
+
+# Handle imports whether running as module or directly
+try:
+    from .patterns import NUMBERED_LINE_RE, CORRECT_ANSWER_RES, RESULT_BOUNDARY_RE
+except ImportError:
+    # Add parent directory to path for direct execution
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+    from utils.patterns import NUMBERED_LINE_RE, CORRECT_ANSWER_RES, RESULT_BOUNDARY_RE
+
+# Lines that end a question's section (site navigation below the results)
+SECTION_STOP_MARKERS = (
+    'next quiz', 'previous quiz', 'back to', 'home page', 'quiz menu',
+    'browse quizzes', 'quiz categories', 'more quizzes'
+)
+
+# Maximum lines kept per section once the answer line has been seen
+MAX_SECTION_LINES = 20
+
+ANSWER_MARKER = 'the correct answer was'
+YOUR_ANSWER_MARKER = 'your answer:'
+
+
+def _new_record(number: str, question: str) -> Dict[str, Any]:
+    return {
+        'number': number,
+        'question': question,
+        'lines': [],
+        'your_answer': None,
+        'has_answer': False,
+        'explanation_lines': [],
+        'closed': False,
+        'explanation_done': False
+    }
+
+
+def _finish(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Derive the section text and answer candidates of a completed record."""
+    text = '\n'.join(record.pop('lines')).strip()
+    record.pop('closed')
+    record.pop('explanation_done')
+    record['text'] = text
+
+    answers = []
+    for pattern in CORRECT_ANSWER_RES:
+        for match in pattern.findall(text):
+            answer = match.strip()
+            if answer and answer not in answers:
+                answers.append(answer)
+    record['answers'] = answers
+    return record
+
+
+def tokenize_results(page_text: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Split results page text into per-question records in one pass.
+
+    A question starts at a line beginning with its number ("3. ..."). Its
+    section ends at the next question number, at site navigation, or
+    MAX_SECTION_LINES lines after the answer line. When a number occurs more
+    than once (quiz lists under the results), the occurrence with an answer
+    line is kept.
+
+    Args:
+        page_text: inner text of the results page
+
+    Returns:
+        Mapping of question number to a record with keys: number, question,
+        text, answers (candidate correct answers, best first), your_answer,
+        has_answer, explanation_lines
+    """
+    records: Dict[str, Dict[str, Any]] = {}
+    current = None
+
+    def close_current():
+        if current is None:
+            return
+        finished = _finish(current)
+        existing = records.get(finished['number'])
+        if finished['text'] and (existing is None or (finished['has_answer'] and not existing['has_answer'])):
+            records[finished['number']] = finished
+
+    for line in page_text.split('\n'):
+        stripped = line.strip()
+        if not stripped:
+            continue
+
+        header = NUMBERED_LINE_RE.match(stripped)
+        if header and (current is None or header.group(1) != current['number']):
+            close_current()
+            current = _new_record(header.group(1), stripped[header.end():].strip())
+            current['lines'].append(line)
+            continue
+
+        if current is None or current['closed']:
+            continue
+
+        lower = stripped.lower()
+        if any(marker in lower for marker in SECTION_STOP_MARKERS):
+            current['closed'] = True
+            continue
+
+        if ANSWER_MARKER in lower:
+            current['has_answer'] = True
+            current['lines'].append(line)
+            continue
+
+        if not current['has_answer']:
+            current['lines'].append(line)
+            if lower.startswith(YOUR_ANSWER_MARKER) and current['your_answer'] is None:
+                current['your_answer'] = stripped[len(YOUR_ANSWER_MARKER):].strip().strip('[]')
+        elif len(current['lines']) < MAX_SECTION_LINES:
+            current['lines'].append(line)
+            if not current['explanation_done']:
+                if RESULT_BOUNDARY_RE.search(stripped):
+                    current['explanation_done'] = True
+                else:
+                    current['explanation_lines'].append(stripped)
+        else:
+            current['closed'] = True
+
+    close_current()
+    return records
@@ -0,0 +1,353 @@
+"""
+SQLite storage backend for scraped questions.
+
+The database is the source of truth when ``storage.backend`` is ``"sqlite"``:
+questions are upserted in batched transactions during scraping and the CSV
+files described by ``constants.CSV_COLUMNS`` are produced from it by a
+streaming export. WAL mode lets readers (exports, reports) query the
+database while a scrape is writing to it.
+"""
+
+import csv
+import logging
+import os
+import sqlite3
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional, Set
+
+# Handle imports whether running as module or directly
+try:
+    from ..constants import CSV_COLUMNS
+    from .dedup import row_signature
+except ImportError:
+    # Add parent directory to path for direct execution
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+    from constants import CSV_COLUMNS
+    from utils.dedup import row_signature
+
+# CSV column name -> questions table column
+COLUMN_MAP = {
+    'Key': 'key',
+    'Domain': 'domain',
+    'Topic': 'topic',
+    'Difficulty': 'difficulty',
+    'Question': 'question',
+    'Option1': 'option1',
+    'Option2': 'option2',
+    'Option3': 'option3',
+    'Option4': 'option4',
+    'CorrectAnswer': 'correct_answer',
+    'Description': 'description',
+    'ImagePath': 'image_path',
+    'AudioPath': 'audio_path',
+    'SourceURL': 'source_url'
+}
+
+# Columns refreshed when a question that already exists is saved again;
+# empty incoming values never overwrite stored ones
+UPSERT_COLUMNS = ['description', 'image_path', 'audio_path', 'source_url']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    speed_profile TEXT,
+    status TEXT NOT NULL DEFAULT 'running',
+    questions_added INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS quizzes (
+    url TEXT PRIMARY KEY,
+    domain TEXT,
+    topic TEXT,
+    difficulty TEXT,
+    first_run_id INTEGER REFERENCES runs(id),
+    last_scraped_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS questions (
+    key TEXT PRIMARY KEY,
+    question_type TEXT NOT NULL,
+    domain TEXT,
+    topic TEXT,
+    difficulty TEXT,
+    question TEXT,
+    option1 TEXT,
+    option2 TEXT,
+    option3 TEXT,
+    option4 TEXT,
+    correct_answer TEXT,
+    description TEXT,
+    image_path TEXT,
+    audio_path TEXT,
+    source_url TEXT,
+    signature TEXT,
+    run_id INTEGER REFERENCES runs(id),
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_questions_source_url ON questions(source_url);
+CREATE INDEX IF NOT EXISTS idx_questions_signature ON questions(signature);
+CREATE INDEX IF NOT EXISTS idx_questions_type ON questions(question_type, key);
+CREATE INDEX IF NOT EXISTS idx_questions_run ON questions(run_id);
+
+CREATE TABLE IF NOT EXISTS media (
+    path TEXT PRIMARY KEY,
+    question_key TEXT REFERENCES questions(key),
+    media_type TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_media_question ON media(question_key);
+"""
+
+def content_signature(row: Dict[str, Any]) -> str:
+    """
+    Content signature stored with each question.
+
+    Same normalized question text + correct answer signature used for
+    ingest-time deduplication, so it can be looked up via the signature index.
+    """
+    return row_signature(row)
+
+
+class QuestionStore:
+    """
+    SQLite-backed question store.
+
+    - One connection in WAL mode, shared by the writer thread and the event
+      loop behind a lock; all writes for a batch happen in one transaction
+    - Questions are keyed by Key, with indexes on SourceURL and content signature
+    - export_csv() streams rows into the CSV layouts from constants.CSV_COLUMNS
+    """
+
+    def __init__(self, db_path: str = "output/questions.db"):
+        self.logger = logging.getLogger(__name__)
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'QuestionStore':
+        """Create a store from the storage section of the scraper configuration."""
+        storage = config['storage']
+        db_path = storage.get('database') or os.path.join(storage['output_dir'], 'questions.db')
+        return cls(db_path)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def start_run(self, speed_profile: Optional[str] = None) -> int:
+        """Record the start of a scraping run and return its id."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO runs (started_at, speed_profile) VALUES (?, ?)",
+                (datetime.now().isoformat(), speed_profile)
+            )
+        return cursor.lastrowid
+
+    def finish_run(self, run_id: int, status: str = 'completed') -> None:
+        """Record the end of a scraping run together with the number of questions it added."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                """UPDATE runs
+                   SET finished_at = ?, status = ?,
+                       questions_added = (SELECT COUNT(*) FROM questions WHERE run_id = ?)
+                   WHERE id = ?""",
+                (datetime.now().isoformat(), status, run_id, run_id)
+            )
+
+    def upsert_questions(self, rows: List[Dict[str, Any]], question_type: str,
+                         run_id: Optional[int] = None) -> int:
+        """
+        Insert or update a batch of formatted question rows in one transaction.
+
+        New keys are inserted; for existing keys, non-empty description and
+        media/source fields are refreshed. Quizzes and media referenced by the
+        rows are recorded alongside.
+
+        Returns:
+            Number of questions that were not in the store before
+        """
+        if not rows:
+            return 0
+
+        now = datetime.now().isoformat()
+        columns = list(COLUMN_MAP.values()) + ['question_type', 'signature', 'run_id', 'created_at', 'updated_at']
+        placeholders = ', '.join('?' for _ in columns)
+        updates = ', '.join(
+            f"{col} = COALESCE(NULLIF(excluded.{col}, ''), questions.{col})" for col in UPSERT_COLUMNS
+        )
+        question_sql = (
+            f"INSERT INTO questions ({', '.join(columns)}) VALUES ({placeholders}) "
+            f"ON CONFLICT(key) DO UPDATE SET {updates}, updated_at = excluded.updated_at"
+        )
+
+        # Last occurrence of a key within the batch wins, as with repeated upserts
+        by_key = {}
+        for row in rows:
+            key = str(row.get('Key') or '')
+            if key:
+                by_key[key] = row
+
+        question_params = []
+        quiz_params = {}
+        media_params = []
+        for key, row in by_key.items():
+            values = [str(row.get(csv_col) or '') for csv_col in COLUMN_MAP]
+            values[0] = key
+            question_params.append(values + [question_type, content_signature(row), run_id, now, now])
+
+            source_url = row.get('SourceURL')
+            if source_url:
+                quiz_params[source_url] = (source_url, row.get('Domain'), row.get('Topic'),
+                                           row.get('Difficulty'), run_id, now)
+            for path_col, media_type in (('ImagePath', 'image'), ('AudioPath', 'audio')):
+                if row.get(path_col):
+                    media_params.append((row[path_col], key, media_type, now))
+
+        with self._lock, self._conn:
+            existing = self._existing_keys(list(by_key))
+            if quiz_params:
+                self._conn.executemany(
+                    """INSERT INTO quizzes (url, domain, topic, difficulty, first_run_id, last_scraped_at)
+                       VALUES (?, ?, ?, ?, ?, ?)
+                       ON CONFLICT(url) DO UPDATE SET last_scraped_at = excluded.last_scraped_at""",
+                    list(quiz_params.values())
+                )
+            self._conn.executemany(question_sql, question_params)
+            if media_params:
+                self._conn.executemany(
+                    """INSERT INTO media (path, question_key, media_type, created_at) VALUES (?, ?, ?, ?)
+                       ON CONFLICT(path) DO UPDATE SET question_key = excluded.question_key""",
+                    media_params
+                )
+
+        new_count = len(by_key) - len(existing)
+        self.logger.debug(f"Upserted {len(by_key)} {question_type} questions ({new_count} new)")
+        return new_count
+
+    def _existing_keys(self, keys: List[str]) -> Set[str]:
+        """Return which of the given keys are already stored (caller holds the lock)."""
+        found = set()
+        # Stay well below SQLite's bound parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            query = f"SELECT key FROM questions WHERE key IN ({', '.join('?' for _ in chunk)})"
+            found.update(row[0] for row in self._conn.execute(query, chunk))
+        return found
+
+    def has_key(self, key: str) -> bool:
+        """Check whether a question key is stored."""
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM questions WHERE key = ?", (key,)).fetchone() is not None
+
+    def has_signature(self, signature: str) -> bool:
+        """Check whether a question with this content signature is stored."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM questions WHERE signature = ? LIMIT 1", (signature,)
+            ).fetchone() is not None
+
+    def iter_signatures(self) -> Iterator[str]:
+        """Stream the distinct content signatures of stored questions."""
+        reader = sqlite3.connect(str(self.db_path))
+        try:
+            for (signature,) in reader.execute(
+                "SELECT DISTINCT signature FROM questions WHERE signature IS NOT NULL"
+            ):
+                yield signature
+        finally:
+            reader.close()
+
+    def count_questions(self, question_type: Optional[str] = None) -> int:
+        """Count stored questions, optionally for a single question type."""
+        with self._lock:
+            if question_type:
+                row = self._conn.execute(
+                    "SELECT COUNT(*) FROM questions WHERE question_type = ?", (question_type,)
+                ).fetchone()
+            else:
+                row = self._conn.execute("SELECT COUNT(*) FROM questions").fetchone()
+        return row[0]
+
+    def iter_rows(self, question_type: str, run_id: Optional[int] = None,
+                  batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Stream stored questions of one type as CSV-style rows, in key order.
+
+        Rows are fetched in batches on a separate read connection, so
+        exporting does not hold the write lock or load the table into memory.
+        """
+        csv_columns = CSV_COLUMNS.get(question_type, CSV_COLUMNS['multiple_choice'])
+        select = ', '.join(COLUMN_MAP[col] for col in csv_columns)
+        query = f"SELECT {select} FROM questions WHERE question_type = ?"
+        params: List[Any] = [question_type]
+        if run_id is not None:
+            query += " AND run_id = ?"
+            params.append(run_id)
+        query += " ORDER BY key"
+
+        reader = sqlite3.connect(str(self.db_path))
+        try:
+            cursor = reader.execute(query, params)
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    break
+                for values in batch:
+                    yield dict(zip(csv_columns, values))
+        finally:
+            reader.close()
+
+    def export_csv(self, question_type: str, csv_path: str, run_id: Optional[int] = None) -> int:
+        """
+        Write all stored questions of one type to a CSV file.
+
+        The file is written to a temporary path and renamed into place, so
+        readers never see a half-written export.
+
+        Returns:
+            Number of rows exported
+        """
+        csv_path = Path(csv_path)
+        csv_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = csv_path.with_name(csv_path.name + '.tmp')
+        csv_columns = CSV_COLUMNS.get(question_type, CSV_COLUMNS['multiple_choice'])
+
+        count = 0
+        with open(temp_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=csv_columns, lineterminator='\n')
+            writer.writeheader()
+            for row in self.iter_rows(question_type, run_id=run_id):
+                writer.writerow(row)
+                count += 1
+        os.replace(temp_path, csv_path)
+
+        self.logger.info(f"Exported {count} {question_type} questions to {csv_path}")
+        return count
+
+    def export_all(self, output_dir: str, csv_files: Dict[str, str],
+                   run_id: Optional[int] = None) -> Dict[str, int]:
+        """Export every question type to its configured CSV file."""
+        return {
+            question_type: self.export_csv(question_type, os.path.join(output_dir, csv_file), run_id=run_id)
+            for question_type, csv_file in csv_files.items()
+        }
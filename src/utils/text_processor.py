@@ -5,7 +5,6 @@ This module provides centralized text processing functions for cleaning,
 normalizing, and extracting information from scraped content.
 """
 
-import re
 from typing import List, Optional
 import sys
 import os
@@ -13,10 +12,18 @@ import os
 # Handle imports whether running as module or directly
 try:
     from ..constants import TEXT_CLEANUP_PATTERNS
+    from .patterns import (
+        QUESTION_PREFIX_RES, OPTION_MARKER_RE, NUMBERED_OPTION_RE, LETTER_RE,
+        MEDIA_REFERENCE_RE, NUMERIC_ENTITY_RE
+    )
 except ImportError:
     # Add parent directory to path for direct execution
     sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
     from constants import TEXT_CLEANUP_PATTERNS
+    from utils.patterns import (
+        QUESTION_PREFIX_RES, OPTION_MARKER_RE, NUMBERED_OPTION_RE, LETTER_RE,
+        MEDIA_REFERENCE_RE, NUMERIC_ENTITY_RE
+    )
 
 
 class TextProcessor:
@@ -44,8 +51,8 @@ class TextProcessor:
         cleaned = text.strip()
         
         # Remove numbered prefixes (e.g., "1. What is...")
-        for prefix_pattern in TEXT_CLEANUP_PATTERNS['question_prefixes']:
-            cleaned = re.sub(prefix_pattern, '', cleaned).strip()
+        for prefix_pattern in QUESTION_PREFIX_RES:
+            cleaned = prefix_pattern.sub('', cleaned).strip()
         
         return cleaned
     
@@ -110,7 +117,7 @@ class TextProcessor:
             return ""
         
         # Remove leading option markers (a), b), etc.)
-        cleaned = re.sub(r'^[a-d]\)?\s*', '', text.strip(), flags=re.IGNORECASE)
+        cleaned = OPTION_MARKER_RE.sub('', text.strip())
         
         return cleaned.strip()
     
@@ -131,7 +138,7 @@ class TextProcessor:
         for line in lines:
             line = line.strip()
             # Match patterns like "a) Option text" or "A. Option text"
-            match = re.match(r'^[a-d][.)]\s*(.+)', line, re.IGNORECASE)
+            match = NUMBERED_OPTION_RE.match(line)
             if match:
                 options.append(match.group(1).strip())
         
@@ -161,7 +168,7 @@ class TextProcessor:
         
         # Very basic content validation
         # Should contain some letters (not just numbers/symbols)
-        if not re.search(r'[a-zA-Z]', text):
+        if not LETTER_RE.search(text):
             return False
         
         return True
@@ -178,10 +185,7 @@ class TextProcessor:
             List[str]: Found media file references
         """
         # Common image/audio file extensions
-        media_pattern = r'\b\w+\.(jpg|jpeg|png|gif|mp3|wav|ogg|m4a)\b'
-        matches = re.findall(media_pattern, text, re.IGNORECASE)
-        
-        return matches
+        return MEDIA_REFERENCE_RE.findall(text)
     
     @staticmethod
     def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
@@ -235,7 +239,7 @@ class TextProcessor:
             result = result.replace(entity, replacement)
         
         # Handle numeric entities
-        result = re.sub(r'&#(\d+);', lambda m: chr(int(m.group(1))), result)
+        result = NUMERIC_ENTITY_RE.sub(lambda m: chr(int(m.group(1))), result)
         
         return result
 
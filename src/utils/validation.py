@@ -3,8 +3,17 @@ import re
 import os
 from typing import Dict, List, Any, Tuple, Optional, Set
 import logging
+import sys
 from pathlib import Path
 
+# Handle imports whether running as module or directly
+try:
+    from .answer_matcher import match_answer
+except ImportError:
+    # Add parent directory to path for direct execution
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+    from utils.answer_matcher import match_answer
+
 class DataValidator:
     """Comprehensive data validation for scraped questions."""
     
@@ -171,16 +180,9 @@ class DataValidator:
             errors.append("Correct answer is empty")
             return errors
         
-        # Check if correct answer matches any option
-        clean_answer = correct_answer.strip().lower()
-        clean_options = [opt.strip().lower() for opt in options if opt.strip()]
-        
-        # Exact match check
-        if clean_answer not in clean_options:
-            # Partial match check
-            partial_matches = [opt for opt in clean_options if clean_answer in opt or opt in clean_answer]
-            if not partial_matches:
-                errors.append(f"Correct answer '{correct_answer}' doesn't match any option: {options}")
+        # Check if correct answer matches any option, the same way the scraper resolves it
+        if match_answer([opt for opt in options if opt.strip()], correct_answer).option is None:
+            errors.append(f"Correct answer '{correct_answer}' doesn't match any option: {options}")
         
         return errors
     
@@ -357,12 +359,10 @@ class CSVTemplateValidator:
         
         return errors
 
-def validate_scraped_data(questions: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Validate a batch of scraped questions and return summary."""
-    validator = DataValidator()
-    
-    validation_summary = {
-        'total_questions': len(questions),
+def create_validation_summary() -> Dict[str, Any]:
+    """Create an empty validation summary for incremental (streaming) validation."""
+    return {
+        'total_questions': 0,
         'valid_questions': 0,
         'invalid_questions': 0,
         'questions_with_warnings': 0,
@@ -371,28 +371,56 @@ def validate_scraped_data(questions: List[Dict[str, Any]]) -> Dict[str, Any]:
         'error_types': {},
         'warning_types': {}
     }
+
+def update_validation_summary(validation_summary: Dict[str, Any], validator: DataValidator,
+                              question: Dict[str, Any], max_messages: Optional[int] = None) -> bool:
+    """
+    Validate one question and fold the result into an existing summary.
     
-    for i, question in enumerate(questions):
-        is_valid, errors, warnings = validator.validate_question_data(question)
-        
-        if is_valid:
-            validation_summary['valid_questions'] += 1
-        else:
-            validation_summary['invalid_questions'] += 1
-            validation_summary['errors'].extend([f"Question {i+1}: {error}" for error in errors])
-        
-        if warnings:
-            validation_summary['questions_with_warnings'] += 1
-            validation_summary['warnings'].extend([f"Question {i+1}: {warning}" for warning in warnings])
-        
-        # Count error and warning types
-        for error in errors:
-            error_type = error.split(':')[0] if ':' in error else error
-            validation_summary['error_types'][error_type] = validation_summary['error_types'].get(error_type, 0) + 1
-        
-        for warning in warnings:
-            warning_type = warning.split(':')[0] if ':' in warning else warning
-            validation_summary['warning_types'][warning_type] = validation_summary['warning_types'].get(warning_type, 0) + 1
+    Used when questions arrive one at a time from FunTriviaScraper.iter_questions().
+    Pass max_messages to cap the stored error/warning messages so the summary
+    stays bounded on long runs; counts are always exact.
+    
+    Returns:
+        True if the question is valid, False otherwise
+    """
+    validation_summary['total_questions'] += 1
+    question_number = validation_summary['total_questions']
+    is_valid, errors, warnings = validator.validate_question_data(question)
+    
+    def keep(messages: List[str]) -> bool:
+        return max_messages is None or len(messages) < max_messages
+    
+    if is_valid:
+        validation_summary['valid_questions'] += 1
+    else:
+        validation_summary['invalid_questions'] += 1
+        if keep(validation_summary['errors']):
+            validation_summary['errors'].extend([f"Question {question_number}: {error}" for error in errors])
+    
+    if warnings:
+        validation_summary['questions_with_warnings'] += 1
+        if keep(validation_summary['warnings']):
+            validation_summary['warnings'].extend([f"Question {question_number}: {warning}" for warning in warnings])
+    
+    # Count error and warning types
+    for error in errors:
+        error_type = error.split(':')[0] if ':' in error else error
+        validation_summary['error_types'][error_type] = validation_summary['error_types'].get(error_type, 0) + 1
+    
+    for warning in warnings:
+        warning_type = warning.split(':')[0] if ':' in warning else warning
+        validation_summary['warning_types'][warning_type] = validation_summary['warning_types'].get(warning_type, 0) + 1
+    
+    return is_valid
+
+def validate_scraped_data(questions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Validate a batch of scraped questions and return summary."""
+    validator = DataValidator()
+    validation_summary = create_validation_summary()
+    
+    for question in questions:
+        update_validation_summary(validation_summary, validator, question)
     
     return validation_summary
 
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Test script for matching extracted correct answers to question options.
+"""
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from utils.answer_matcher import OptionIndex, match_answer, normalize_answer, NO_MATCH
+
+
+def test_normalize_answer():
+    """Case, accents, punctuation and articles are ignored."""
+    print("🧪 Testing answer normalization...")
+    assert normalize_answer("The Lord of the Rings!") == "lord of rings"
+    assert normalize_answer("Pokémon") == "pokemon"
+    assert normalize_answer("1,000") == "1000"
+    # An option made of just an article keeps it
+    assert normalize_answer("A") == "a"
+    print("✅ Normalization works")
+
+
+def test_ranked_matches():
+    """Matches are ranked exact > normalized > whole-word containment > token overlap."""
+    print("🧪 Testing ranked matching...")
+    options = ['Venus', 'Mars', 'Jupiter', 'Saturn']
+    assert match_answer(options, 'Mars') == ('Mars', 1, 1.0, 'exact')
+    assert match_answer(options, ' mars. ') == ('Mars', 1, 0.95, 'normalized')
+    assert match_answer(['Beatles', 'Rolling Stones'], 'The Beatles').method == 'normalized'
+
+    match = match_answer(['William Shakespeare', 'Christopher Marlowe'], 'Shakespeare')
+    assert match.option == 'William Shakespeare' and match.method == 'contains'
+    assert 0.6 <= match.confidence < 0.9
+
+    match = match_answer(['Gulf of Mexico', 'Bay of Bengal'], 'Mexico Gulf')
+    assert match.option == 'Gulf of Mexico' and match.method == 'tokens'
+    print("✅ Ranked matching works")
+
+
+def test_no_false_partial_matches():
+    """Substrings inside words no longer match, and unrelated answers are rejected."""
+    print("🧪 Testing rejected matches...")
+    assert match_answer(['Mozart', 'Bach'], 'art') == NO_MATCH
+    assert match_answer(['Paris', 'London'], 'Berlin') == NO_MATCH
+    assert match_answer(['Paris', 'London'], '') == NO_MATCH
+    assert match_answer([], 'Paris') == NO_MATCH
+    print("✅ Rejected matches work")
+
+
+def test_deterministic_and_cached():
+    """Ties go to the earlier option and one index is shared per option list."""
+    print("🧪 Testing tie-breaking and index reuse...")
+    assert match_answer(['Java Sea', 'Ross Sea'], 'sea').option == 'Java Sea'
+    assert match_answer(['Ross Sea', 'Java Sea'], 'sea').option == 'Ross Sea'
+    assert OptionIndex.for_options(['True', 'False']) is OptionIndex.for_options(('True', 'False'))
+    print("✅ Tie-breaking and index reuse work")
+
+
+if __name__ == "__main__":
+    test_normalize_answer()
+    test_ranked_matches()
+    test_no_false_partial_matches()
+    test_deterministic_and_cached()
+    print("\n🎉 All answer matcher tests passed!")
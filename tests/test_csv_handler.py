@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test script for the append-only CSVHandler (key index, header handling, duplicates).
+"""
+import csv
+import sys
+import os
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from utils.csv_handler import CSVHandler
+
+
+def read_rows(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.reader(f))
+
+
+def test_append_only_writes():
+    """Header is written once, duplicates are skipped, and existing rows are kept."""
+    print("🧪 Testing append-only CSV writes...")
+    with tempfile.TemporaryDirectory() as tmp:
+        handler = CSVHandler(tmp)
+        batch = [{'Key': f'Question_MQ_Parsed_General_Normal_{i:04d}', 'Question': f'Question {i}, "quoted"'}
+                 for i in range(1, 4)]
+
+        # Repeated key inside the batch is only written once
+        assert handler.append_to_csv(batch + [batch[0]], 'mc.csv', 'multiple_choice') == 3
+        # Second save of the same batch adds nothing
+        assert handler.append_to_csv(batch, 'mc.csv', 'multiple_choice') == 0
+
+        rows = read_rows(os.path.join(tmp, 'mc.csv'))
+        assert rows[0] == handler.get_csv_columns('multiple_choice')
+        assert len(rows) == 4
+        assert rows[1][4] == 'Question 1, "quoted"'
+
+        # A fresh handler indexes the existing file instead of duplicating rows
+        fresh = CSVHandler(tmp)
+        assert fresh.append_to_csv(batch + [{'Key': 'new_key'}], 'mc.csv', 'multiple_choice') == 1
+        rows = read_rows(os.path.join(tmp, 'mc.csv'))
+        assert len(rows) == 5
+        assert rows.count(rows[0]) == 1, "header must only be written once"
+    print("✅ Append-only writes work")
+
+
+def test_external_changes_are_reindexed():
+    """Files modified outside the handler are re-read before deduplicating."""
+    print("🧪 Testing re-indexing after external changes...")
+    with tempfile.TemporaryDirectory() as tmp:
+        handler = CSVHandler(tmp)
+        handler.append_to_csv([{'Key': 'a'}], 'tf.csv', 'true_false')
+
+        with open(os.path.join(tmp, 'tf.csv'), 'a', encoding='utf-8') as f:
+            f.write('b,General')  # no trailing newline
+
+        assert handler.append_to_csv([{'Key': 'b'}, {'Key': 'c'}], 'tf.csv', 'true_false') == 1
+        keys = [row[0] for row in read_rows(os.path.join(tmp, 'tf.csv'))[1:]]
+        assert keys == ['a', 'b', 'c'], keys
+
+        handler.reset_csv('tf.csv', 'true_false')
+        assert handler.get_existing_keys('tf.csv') == set()
+        assert handler.append_to_csv([{'Key': 'a'}], 'tf.csv', 'true_false') == 1
+    print("✅ Re-indexing works")
+
+
+if __name__ == "__main__":
+    test_append_only_writes()
+    test_external_changes_are_reindexed()
+    print("\n🎉 All CSV handler tests passed!")
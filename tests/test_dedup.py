@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test script for ingest-time content-signature deduplication.
+"""
+import asyncio
+import csv
+import sys
+import os
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import pandas as pd
+
+from utils.dedup import SignatureIndex, question_signature, row_signature, signature_series
+from utils.csv_handler import CSVHandler
+from utils.question_writer import QuestionWriter
+
+
+def test_signature_normalization():
+    """Case, punctuation and spacing do not change the signature; the answer does."""
+    print("🧪 Testing signature normalization...")
+    assert question_signature("What is the capital of France?", "Paris") == \
+        question_signature("  what is the CAPITAL of france ", "paris.")
+    assert question_signature("What is the capital of France?", "Paris") != \
+        question_signature("What is the capital of France?", "Lyon")
+
+    questions = pd.Series(["What's 2+2?", "", "Name   the planet"])
+    answers = pd.Series(["4", "True", "Mars!"])
+    expected = [question_signature(q, a) for q, a in zip(questions, answers)]
+    assert signature_series(questions, answers) == expected
+    print("✅ Signature normalization works")
+
+
+def test_index_persistence():
+    """The index is rebuilt from CSV files once, then appended to as rows are committed."""
+    print("🧪 Testing signature index persistence...")
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'mc.csv')
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=['Key', 'Question', 'CorrectAnswer'])
+            writer.writeheader()
+            writer.writerow({'Key': 'a', 'Question': 'Old question?', 'CorrectAnswer': 'Yes'})
+
+        index_file = os.path.join(tmp, 'signatures.txt')
+        index = SignatureIndex(index_file)
+        assert index.load([csv_path]) == 1
+
+        rows = [{'Key': 'b', 'Question': 'old question', 'CorrectAnswer': 'yes'},
+                {'Key': 'c', 'Question': 'New question?', 'CorrectAnswer': 'No'},
+                {'Key': 'd', 'Question': 'New question', 'CorrectAnswer': 'no'}]
+        new_rows, signatures = index.filter_new(rows)
+        assert [row['Key'] for row in new_rows] == ['c']
+        index.commit(signatures)
+
+        reloaded = SignatureIndex(index_file)
+        assert reloaded.load([]) == 2
+        assert row_signature(rows[1]) in reloaded
+
+        # Rebuilding ignores the index file: only what the CSV files still hold is kept
+        assert reloaded.rebuild([csv_path]) == 1
+        assert row_signature(rows[1]) not in reloaded
+        assert SignatureIndex(index_file).load([]) == 1
+    print("✅ Signature index persistence works")
+
+
+def test_writer_drops_duplicate_content():
+    """Repeated quizzes with new keys never reach the CSV file."""
+    print("🧪 Testing ingest-time dedup in the writer...")
+
+    async def run(tmp):
+        index = SignatureIndex(os.path.join(tmp, 'signatures.txt'))
+        index.load([])
+        writer = QuestionWriter(CSVHandler(tmp), {'multiple_choice': 'mc.csv'}, batch_size=2,
+                                signature_index=index)
+        quiz = [{'Question': f'Question {i}?', 'CorrectAnswer': 'A'} for i in range(3)]
+        # Same quiz scraped in two runs gets fresh keys each time
+        await writer.put('multiple_choice', [dict(q, Key=f'run1_{i}') for i, q in enumerate(quiz)])
+        await writer.put('multiple_choice', [dict(q, Key=f'run2_{i}') for i, q in enumerate(quiz)])
+        return await writer.close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = asyncio.run(run(tmp))
+        assert stats['rows_written'] == 3, stats
+        assert stats['duplicates_skipped'] == 3, stats
+        with open(os.path.join(tmp, 'mc.csv'), newline='', encoding='utf-8') as f:
+            keys = [row['Key'] for row in csv.DictReader(f)]
+        assert keys == ['run1_0', 'run1_1', 'run1_2'], keys
+    print("✅ Ingest-time dedup works")
+
+
+def test_failed_write_is_not_remembered():
+    """Rows that could not be written are counted as failed and stay writable later."""
+    print("🧪 Testing that failed writes leave the signature index alone...")
+
+    async def run(tmp, rows):
+        index = SignatureIndex(os.path.join(tmp, 'signatures.txt'))
+        index.load([])
+        writer = QuestionWriter(CSVHandler(tmp), {'multiple_choice': 'mc.csv'}, signature_index=index)
+        await writer.put('multiple_choice', rows)
+        return await writer.close(), index
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = [{'Key': 'k1', 'Question': 'Question 1?', 'CorrectAnswer': 'A'}]
+        os.mkdir(os.path.join(tmp, 'mc.csv'))  # Unwritable target
+        stats, index = asyncio.run(run(tmp, rows))
+        assert stats['rows_failed'] == 1 and stats['batches_failed'] == 1, stats
+        assert row_signature(rows[0]) not in index
+        reloaded = SignatureIndex(os.path.join(tmp, 'signatures.txt'))
+        assert reloaded.load([]) == 0
+
+        os.rmdir(os.path.join(tmp, 'mc.csv'))
+        stats, index = asyncio.run(run(tmp, rows))
+        assert stats['rows_written'] == 1, stats
+        assert row_signature(rows[0]) in index
+    print("✅ Failed writes are not remembered")
+
+
+if __name__ == "__main__":
+    test_signature_normalization()
+    test_index_persistence()
+    test_writer_drops_duplicate_content()
+    test_failed_write_is_not_remembered()
+    print("\n🎉 All dedup tests passed!")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test script for results page parsing on text snapshots and the parse pool.
+"""
+import asyncio
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from utils.explanation_parser import ResultsParsePool, parse_full_page_text, parse_text_results
+
+PAGE = """Quiz Results
+1. Which planet is known as the Red Planet?
+Your Answer: [Venus]
+The correct answer was Mars.
+Mars looks red because of the iron oxide that covers much of its dusty surface.
+45% of players have answered correctly.
+2. Who wrote Hamlet?
+Your Answer: [William Shakespeare]
+The correct answer was William Shakespeare.
+80% of players have answered correctly.
+Next Quiz
+"""
+
+QUESTIONS = [
+    {'questionNumber': '1', 'question': 'Which planet is known as the Red Planet?',
+     'options': ['Venus', 'Mars', 'Jupiter', 'Saturn']},
+    {'questionNumber': '2', 'question': 'Who wrote Hamlet?', 'options': ['Marlowe', 'William Shakespeare']},
+]
+
+
+def test_parse_snapshot():
+    """Descriptions and correct answers come from the page text alone."""
+    print("🧪 Testing results parsing on a text snapshot...")
+    enhanced = parse_full_page_text(PAGE, QUESTIONS)
+    assert [q['correct_answer'] for q in enhanced] == ['Mars', 'William Shakespeare']
+    assert enhanced[0]['description'].startswith('Mars looks red because')
+    assert enhanced[1]['description'] == ''
+    assert 'description' not in QUESTIONS[0]
+
+    enhanced, stats = parse_text_results(PAGE, QUESTIONS)
+    # The correct answer, not the "Your Answer:" line
+    assert [q['correct_answer'] for q in enhanced] == ['Mars', 'William Shakespeare']
+    assert stats == {'correct_answers_found': 2, 'explanations_found': 0, 'missing_explanations': ['1', '2']}, stats
+    print("✅ Results parsing on a text snapshot works")
+
+
+def test_missing_answers_stay_empty():
+    """Questions the page has no answer for get '' rather than a made-up first option."""
+    print("🧪 Testing results parsing without answer lines...")
+    page = "Quiz Results\n1. Which planet is known as the Red Planet?\nYour Answer: [Venus]\nNext Quiz\n"
+    assert parse_full_page_text(page, QUESTIONS[:1])[0]['correct_answer'] == ''
+    enhanced, stats = parse_text_results(page, QUESTIONS[:1])
+    assert enhanced[0]['correct_answer'] == '' and stats['correct_answers_found'] == 0
+    print("✅ Missing answers stay empty")
+
+
+def test_parse_pool():
+    """Worker processes return the same results as inline parsing."""
+    print("🧪 Testing results parse pool...")
+
+    async def run():
+        inline = ResultsParsePool(workers=0)
+        pooled = ResultsParsePool(workers=1)
+        try:
+            expected = await inline.run(parse_full_page_text, PAGE, QUESTIONS)
+            assert await pooled.run(parse_full_page_text, PAGE, QUESTIONS) == expected
+            assert await pooled.run(parse_text_results, PAGE, QUESTIONS) == parse_text_results(PAGE, QUESTIONS)
+        finally:
+            pooled.close()
+        assert inline.get_stats() == {'offloaded': 0, 'inline': 1, 'fallbacks': 0}
+        assert pooled.get_stats() == {'offloaded': 2, 'inline': 0, 'fallbacks': 0}
+
+    asyncio.run(run())
+    assert ResultsParsePool.from_config({'scraper': {'parse_pool': {'enabled': False}}}).workers == 0
+    print("✅ Results parse pool works")
+
+
+if __name__ == "__main__":
+    test_parse_snapshot()
+    test_missing_answers_stay_empty()
+    test_parse_pool()
+    print("\n🎉 All explanation parser tests passed!")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script for the golden extraction corpus, its scoring and latency summaries.
+"""
+import html
+import re
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from utils.answer_matcher import normalize_answer
+from utils.benchmark import LatencyRecorder, percentile
+from utils.extraction_corpus import load_corpus, score_questions, score_results
+
+
+def page_text(page_html):
+    """Rough visible text of a saved page, good enough to look labels up in."""
+    page_html = re.sub(r'<(script|style)\b.*?</\1>', ' ', page_html, flags=re.DOTALL | re.IGNORECASE)
+    return normalize_answer(html.unescape(re.sub(r'<[^>]+>', ' ', page_html)))
+
+
+def test_corpus_labels():
+    """Every layout is covered and every label can be found on its pages."""
+    print("🧪 Testing extraction corpus labels...")
+    fixtures = load_corpus()
+    assert {fixture['layout'] for fixture in fixtures} == \
+        {'standard', 'photo', 'audio', 'multi-page', 'login-wall'}
+
+    for fixture in fixtures:
+        quiz_text = ' '.join(page_text(page) for page in fixture['quiz_html'])
+        results_text = page_text(fixture['results_html']) if fixture['results_html'] else ''
+        for label in fixture['questions']:
+            assert label['correct_answer'] in label['options'], (fixture['name'], label['number'])
+            assert normalize_answer(label['question']) in quiz_text, (fixture['name'], label['number'])
+            assert normalize_answer(label['correct_answer']) in results_text, (fixture['name'], label['number'])
+            assert normalize_answer(label['description']) in results_text, (fixture['name'], label['number'])
+
+    login_wall = [fixture for fixture in fixtures if fixture['layout'] == 'login-wall'][0]
+    assert login_wall['questions'] == [] and login_wall['results_html'] is None
+    assert len(load_corpus(names=['multi_page'])[0]['quiz_html']) == 2
+    print("✅ Corpus labels are consistent")
+
+
+def test_scoring():
+    """Raw answers count when they resolve to the labelled option; descriptions when they contain the label."""
+    print("🧪 Testing extraction scoring...")
+    labels = [
+        {'number': '1', 'question': 'Which planet is red?', 'options': ['Venus', 'Mars'],
+         'correct_answer': 'Mars', 'description': 'Iron oxide'},
+        {'number': '2', 'question': 'Which ship sank in 1912?', 'options': ['Titanic', 'Olympic'],
+         'correct_answer': 'Titanic', 'description': ''},
+    ]
+    extracted = [
+        {'questionNumber': '1', 'question': 'Which planet is red?', 'options': ['Venus', 'Mars']},
+        {'questionNumber': '1', 'question': 'Duplicate', 'options': ['Venus', 'Mars']},
+        {'questionNumber': '2', 'question': 'Which ship sank in 1912?', 'options': ['Olympic', 'Titanic']},
+    ]
+    assert score_questions(extracted, labels) == {'expected': 2, 'extracted': 3, 'matched': 1}
+
+    enhanced = [
+        {'questionNumber': '1', 'correct_answer': 'mars.', 'description': 'Mars looks red because of iron oxide.'},
+        {'questionNumber': '2', 'correct_answer': 'Olympic', 'description': ''},
+    ]
+    assert score_results(enhanced, labels) == \
+        {'questions': 2, 'answers_correct': 1, 'answers_missing': 0, 'descriptions_correct': 2}
+    assert score_results([], labels) == \
+        {'questions': 2, 'answers_correct': 0, 'answers_missing': 2, 'descriptions_correct': 0}
+
+    # Titanic is the first option: an empty extraction must not score as if it fell back to it
+    nothing_found = [{'questionNumber': '2', 'options': ['Titanic', 'Olympic'], 'correct_answer': '', 'description': ''}]
+    assert score_results(nothing_found, labels[1:]) == \
+        {'questions': 1, 'answers_correct': 0, 'answers_missing': 1, 'descriptions_correct': 1}
+    print("✅ Extraction scoring works")
+
+
+def test_latency_summary():
+    """Nearest-rank percentiles in milliseconds per stage."""
+    print("🧪 Testing latency summaries...")
+    assert percentile([], 0.5) == 0.0
+    assert percentile([1, 2, 3, 4], 0.5) == 2
+    recorder = LatencyRecorder()
+    for i in range(1, 101):
+        recorder.record('parse', i / 1000)
+    with recorder.measure('load'):
+        pass
+    summary = recorder.summary()
+    assert list(summary) == ['parse', 'load']
+    assert summary['parse']['count'] == 100
+    assert (summary['parse']['p50_ms'], summary['parse']['p95_ms'], summary['parse']['p99_ms']) == (50.0, 95.0, 99.0)
+    assert summary['parse']['max_ms'] == 100.0
+    assert summary['load']['count'] == 1
+    print("✅ Latency summaries work")
+
+
+if __name__ == "__main__":
+    test_corpus_labels()
+    test_scoring()
+    test_latency_summary()
+    print("\n🎉 All extraction corpus tests passed!")
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Test script for the trigram index used to resolve unmapped values.
+"""
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from utils.fuzzy_index import TrigramIndex, trigrams
+
+SYNONYMS = {
+    'animals': 'Animals',
+    'pets': 'Animals',
+    'video games': 'Games',
+    'television': 'Television',
+    'economics': 'Business',
+}
+
+
+def test_resolve_with_threshold():
+    """Close variants resolve; distant ones are only suggested."""
+    print("🧪 Testing trigram resolution...")
+    assert trigrams('Video-Game') == trigrams('video game')
+    index = TrigramIndex(SYNONYMS, threshold=0.75)
+    assert len(index) == len(SYNONYMS)
+
+    match = index.resolve('Televison')
+    assert match.value == 'Television' and match.synonym == 'television', match
+    assert index.resolve('Video_Game').value == 'Games'
+    assert index.resolve('Animal').value == 'Animals'
+
+    # Below the threshold: best() still reports the candidate for review
+    assert index.resolve('Comics') is None
+    assert index.best('Comics').value == 'Business'
+    assert index.best('???') is None
+    assert index.best('zzzz') is None
+    print("✅ Trigram resolution works")
+
+
+if __name__ == "__main__":
+    test_resolve_with_threshold()
+    print("\n🎉 All fuzzy index tests passed!")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test script for block-reserved question ID allocation in QuestionIndexer.
+"""
+import json
+import multiprocessing
+import sys
+import os
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from utils.indexing import QuestionIndexer
+
+
+def allocate_ids(index_file, count, results):
+    """Worker: allocate IDs from a separate process."""
+    indexer = QuestionIndexer(index_file, block_size=7)
+    ids = [indexer.get_next_id('multiple_choice', 'Culture', 'Normal') for _ in range(count)]
+    indexer.release()
+    results.extend(ids)
+
+
+def test_block_reservation():
+    """IDs are sequential, the file only changes per block, and release() returns the unused tail."""
+    print("🧪 Testing block reservation...")
+    with tempfile.TemporaryDirectory() as tmp:
+        index_file = os.path.join(tmp, 'question_indices.json')
+        indexer = QuestionIndexer(index_file, block_size=10)
+
+        ids = [indexer.get_next_id('true_false', 'Science', 'Hard') for _ in range(3)]
+        assert ids == [f'Question_TF_Parsed_Science_Hard_{i:04d}' for i in range(1, 4)], ids
+
+        with open(index_file) as f:
+            assert json.load(f)['true_false'] == 10  # whole block reserved up front
+
+        indexer.release()
+        with open(index_file) as f:
+            assert json.load(f)['true_false'] == 3
+
+        # A new indexer continues after the released block
+        assert QuestionIndexer(index_file).get_next_id('true_false', 'Science', 'Hard').endswith('_0004')
+    print("✅ Block reservation works")
+
+
+def test_unique_across_processes():
+    """Concurrent processes sharing one index file never receive the same ID."""
+    print("🧪 Testing ID uniqueness across processes...")
+    with tempfile.TemporaryDirectory() as tmp:
+        index_file = os.path.join(tmp, 'question_indices.json')
+        with multiprocessing.Manager() as manager:
+            results = manager.list()
+            workers = [multiprocessing.Process(target=allocate_ids, args=(index_file, 25, results))
+                       for _ in range(4)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            ids = list(results)
+
+        assert len(ids) == 100
+        assert len(set(ids)) == 100, "duplicate IDs issued"
+    print("✅ IDs are unique across processes")
+
+
+if __name__ == "__main__":
+    test_block_reservation()
+    test_unique_across_processes()
+    print("\n🎉 All indexing tests passed!")
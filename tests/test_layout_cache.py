@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test script for layout fingerprints and the learned layout cache.
+"""
+import json
+import sys
+import os
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from utils.layout_cache import LayoutCache, layout_fingerprint
+
+
+def test_learn_expire_persist():
+    """Choices are learned, reused across runs and expired on failure."""
+    print("🧪 Testing layout cache...")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = os.path.join(tmp, 'layout_cache.json')
+        fingerprint = layout_fingerprint([[True, False, True], True, False])
+        assert fingerprint == layout_fingerprint([[True, False, True], True, False])
+        assert fingerprint != layout_fingerprint([[False, False, True], True, False])
+
+        cache = LayoutCache(cache_file)
+        assert cache.lookup('results', fingerprint) is None
+        cache.record_success('results', fingerprint, {'strategy': 2, 'selector': '.questionReview'})
+        cache.save()
+
+        reopened = LayoutCache(cache_file)
+        choice = reopened.lookup('results', fingerprint)
+        assert choice == {'strategy': 2, 'selector': '.questionReview'}
+        assert reopened.lookup('submit', fingerprint) is None
+
+        reopened.record_failure('results', fingerprint)
+        assert reopened.lookup('results', fingerprint) is None
+        reopened.save()
+        with open(cache_file) as f:
+            assert json.load(f) == {}
+
+        stats = reopened.get_stats()
+        assert stats['results'] == {'hits': 1, 'misses': 1, 'expired': 1, 'learned': 0, 'hit_rate': 0.5}, stats
+    print("✅ Layout cache works")
+
+
+def test_rank_selectors():
+    """The selector that last worked on a layout is tried first; uses are counted."""
+    print("🧪 Testing selector ranking...")
+    selectors = ['input[type="submit"]', 'button[type="submit"]', '.submit-button']
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = LayoutCache(os.path.join(tmp, 'layout_cache.json'))
+        assert cache.rank('submit', 'quiz', selectors) == selectors
+        cache.record_success('submit', 'quiz', {'selector': '.submit-button'})
+        cache.record_selector('submit', '.submit-button', True)
+        cache.record_selector('submit', '.submit-button', False)
+        assert cache.rank('submit', 'quiz', selectors) == \
+            ['.submit-button', 'input[type="submit"]', 'button[type="submit"]']
+        assert cache.rank('submit', 'other', selectors) == selectors
+        assert cache.get_stats()['submit']['selectors'] == {'.submit-button': {'used': 2, 'failed': 1}}
+    print("✅ Selector ranking works")
+
+
+def test_from_config():
+    """The cache can be disabled in the configuration."""
+    assert LayoutCache.from_config({'scraper': {'layout_cache': {'enabled': False}}}) is None
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = LayoutCache.from_config({'storage': {'output_dir': tmp}})
+        assert cache.cache_file == os.path.join(tmp, 'layout_cache.json')
+
+
+if __name__ == "__main__":
+    test_learn_expire_persist()
+    test_rank_selectors()
+    test_from_config()
+    print("\n🎉 All layout cache tests passed!")
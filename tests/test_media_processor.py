@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test script for process-pool media post-processing.
+"""
+import asyncio
+import sys
+import os
+import tempfile
+import wave
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from utils.media_processor import MediaProcessor, verify_audio, iter_media_files
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz: 417-byte frames
+MP3_FRAME = b'\xff\xfb\x90\x00' + b'\x00' * 413
+
+
+def _write_files(audio_dir):
+    os.makedirs(audio_dir)
+    with wave.open(os.path.join(audio_dir, 'Question_1.wav'), 'wb') as audio:
+        audio.setnchannels(1)
+        audio.setsampwidth(2)
+        audio.setframerate(8000)
+        audio.writeframes(b'\x00\x01' * 800)
+    with open(os.path.join(audio_dir, 'Question_2.mp3'), 'wb') as f:
+        f.write(b'ID3\x03\x00\x00\x00\x00\x00\x0a' + b'\x00' * 10 + MP3_FRAME * 5)
+    with open(os.path.join(audio_dir, 'Question_3.mp3'), 'wb') as f:
+        f.write(b'<html>Not Found</html>')
+
+
+def test_verify_audio():
+    """Decodable audio passes; an error page saved as .mp3 fails."""
+    print("🧪 Testing audio verification...")
+    with tempfile.TemporaryDirectory() as tmp:
+        audio_dir = os.path.join(tmp, 'audio')
+        _write_files(audio_dir)
+        statuses = [verify_audio(os.path.join(audio_dir, name))['status']
+                    for name in ('Question_1.wav', 'Question_2.mp3', 'Question_3.mp3')]
+    assert statuses == ['ok', 'ok', 'failed'], statuses
+    print("✅ Audio verification works")
+
+
+def test_done_markers():
+    """Files are processed in the pool once; re-runs and restarts skip them."""
+    print("🧪 Testing media post-processing done-markers...")
+
+    async def run(output_dir, files):
+        processor = MediaProcessor(output_dir, workers=2)
+        try:
+            first = dict(await processor.process_files(files))
+            second = await processor.process_files(files)
+        finally:
+            await processor.close()
+        return first, second
+
+    with tempfile.TemporaryDirectory() as tmp:
+        audio_dir = os.path.join(tmp, 'audio')
+        _write_files(audio_dir)
+        files = iter_media_files({'audio': audio_dir, 'image': os.path.join(tmp, 'missing')})
+        output_dir = os.path.join(tmp, 'processed')
+
+        first, second = asyncio.run(run(output_dir, files))
+        assert first['processed'] == 2 and first['failed'] == 1, first
+        assert second['already_done'] == 3, second
+
+        restarted = MediaProcessor(output_dir)
+        assert all(restarted.is_done(path) for path, _ in files)
+
+        # A changed file is processed again
+        with open(files[0][0], 'ab') as f:
+            f.write(b'\x00\x00')
+        assert not restarted.is_done(files[0][0])
+    print("✅ Media post-processing done-markers work")
+
+
+if __name__ == "__main__":
+    test_verify_audio()
+    test_done_markers()
+    print("\n🎉 All media post-processing tests passed!")
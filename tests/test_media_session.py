@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Test script for media downloads: shared session, asset reuse, skip-if-present,
+browser capture and size limits.
+"""
+import asyncio
+import hashlib
+import sys
+import os
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from aiohttp import web
+
+from scraper.media import MediaHandler, MediaCapture
+
+
+async def check_shared_session(tmp):
+    """Downloads reuse one pooled connection and record latency and bytes."""
+    peers = set()
+
+    async def serve_image(request):
+        peers.add(request.transport.get_extra_info('peername'))
+        return web.Response(body=b'x' * 1024, content_type='image/png')
+
+    app = web.Application()
+    app.router.add_get('/{name}.png', serve_image)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    config = {'storage': {'images_dir': os.path.join(tmp, 'images'), 'audio_dir': os.path.join(tmp, 'audio')}}
+    handler = MediaHandler(config)
+    try:
+        await handler.open()
+        for i in range(3):
+            filename = await handler.download_media(f'http://127.0.0.1:{port}/q{i}.png', f'Question_{i}', 'image')
+            assert filename == f'Question_{i}.png'
+        stats = handler.get_download_stats()
+    finally:
+        await handler.close()
+        await runner.cleanup()
+
+    assert handler.session is None
+    assert len(peers) == 1, f"Expected one kept-alive connection, got {len(peers)}"
+    assert stats['downloads'] == 3 and stats['bytes'] == 3 * 1024, stats
+    assert [record['bytes'] for record in stats['recent']] == [1024] * 3
+    assert all(record['seconds'] >= 0 for record in stats['recent'])
+    assert stats['recent'][0]['checksum'] == hashlib.sha256(b'x' * 1024).hexdigest()
+
+
+async def check_shared_assets(tmp):
+    """Questions sharing an asset URL download it once and link to one copy."""
+    hits = []
+
+    async def serve_audio(request):
+        hits.append(request.path)
+        return web.Response(body=b'clip' * 256, content_type='audio/mpeg')
+
+    app = web.Application()
+    app.router.add_get('/clip.mp3', serve_audio)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    audio_dir = os.path.join(tmp, 'audio')
+    config = {'storage': {'images_dir': os.path.join(tmp, 'images'), 'audio_dir': audio_dir}}
+    handler = MediaHandler(config)
+    url = f'http://127.0.0.1:{port}/clip.mp3'
+    try:
+        # Two concurrent downloads and one later one of the same URL
+        filenames = await asyncio.gather(handler.download_media(url, 'Question_1', 'audio'),
+                                         handler.download_media(url, 'Question_2', 'audio'))
+        filenames.append(await handler.download_media(url, 'Question_3', 'audio'))
+    finally:
+        await handler.close()
+        await runner.cleanup()
+
+    assert filenames == ['Question_1.mp3', 'Question_2.mp3', 'Question_3.mp3']
+    assert hits == ['/clip.mp3'], hits
+    paths = [os.path.join(audio_dir, filename) for filename in filenames]
+    assert os.path.samefile(paths[0], paths[1]) and os.path.samefile(paths[0], paths[2])
+
+
+async def check_skip_if_present(tmp):
+    """Files in the manifest are not downloaded again unless refreshing."""
+    hits = []
+
+    async def serve_image(request):
+        hits.append(request.path)
+        return web.Response(body=b'img' * 100, content_type='image/png')
+
+    app = web.Application()
+    app.router.add_get('/pic.png', serve_image)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    config = {'storage': {'images_dir': os.path.join(tmp, 'images'), 'audio_dir': os.path.join(tmp, 'audio'),
+                          'media': {'content_addressed': False}}}
+    url = f'http://127.0.0.1:{port}/pic.png'
+    try:
+        for refresh in (False, False, True):
+            # A new handler per run, as on a re-run of the scraper
+            handler = MediaHandler(config, refresh=refresh)
+            assert await handler.download_media(url, 'Question_1', 'image') == 'Question_1.png'
+            await handler.close()
+    finally:
+        await runner.cleanup()
+
+    assert len(hits) == 2, hits
+    stats = handler.get_media_stats()
+    assert stats['images']['count'] == 1, stats
+
+
+async def check_size_limit(tmp):
+    """Oversized downloads are rejected without leaving partial files."""
+    async def serve_audio(request):
+        response = web.StreamResponse()
+        await response.prepare(request)
+        for _ in range(4):
+            await response.write(b'a' * 512 * 1024)
+        return response
+
+    app = web.Application()
+    app.router.add_get('/clip.mp3', serve_audio)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    audio_dir = os.path.join(tmp, 'audio')
+    config = {'storage': {'images_dir': os.path.join(tmp, 'images'), 'audio_dir': audio_dir,
+                          'media': {'max_file_size_mb': 1}}}
+    handler = MediaHandler(config)
+    try:
+        result = await handler.download_media(f'http://127.0.0.1:{port}/clip.mp3', 'Question_1', 'audio')
+    finally:
+        await handler.close()
+        await runner.cleanup()
+
+    assert result is None
+    assert os.listdir(audio_dir) == [], os.listdir(audio_dir)
+    assert handler.get_download_stats()['failures'] == 1
+
+
+class FakeRequest:
+    def __init__(self, resource_type):
+        self.resource_type = resource_type
+
+
+class FakeResponse:
+    """Minimal stand-in for a Playwright response."""
+
+    def __init__(self, url, body, status=200, resource_type='image'):
+        self.url = url
+        self.status = status
+        self.request = FakeRequest(resource_type)
+        self._body = body
+
+    async def body(self):
+        return self._body
+
+
+class FakePage:
+    def __init__(self):
+        self.listeners = []
+
+    def on(self, event, callback):
+        self.listeners.append(callback)
+
+    def remove_listener(self, event, callback):
+        self.listeners.remove(callback)
+
+    def emit(self, response):
+        for callback in self.listeners:
+            callback(response)
+
+
+async def check_browser_capture(tmp):
+    """Media the page loaded is saved without any HTTP request."""
+    page = FakePage()
+    capture = MediaCapture()
+    capture.attach(page)
+    page.emit(FakeResponse('http://quiz/photo.png', b'png bytes'))
+    page.emit(FakeResponse('http://quiz/clip.mp3', b'partial', status=206, resource_type='media'))
+    page.emit(FakeResponse('http://quiz/app.js', b'script', resource_type='script'))
+
+    config = {'storage': {'images_dir': os.path.join(tmp, 'images'), 'audio_dir': os.path.join(tmp, 'audio')}}
+    handler = MediaHandler(config)
+    filename = await handler.download_media('http://quiz/photo.png', 'Question_1', 'image', capture=capture)
+    assert await capture.get('http://quiz/clip.mp3') is None
+    assert await capture.get('http://quiz/app.js') is None
+    await capture.close()
+
+    assert filename == 'Question_1.png'
+    assert handler.session is None, "No HTTP session should be needed"
+    with open(os.path.join(tmp, 'images', filename), 'rb') as f:
+        assert f.read() == b'png bytes'
+    stats = handler.get_download_stats()
+    assert stats['captured'] == 1 and stats['recent'][0]['source'] == 'browser', stats
+    assert page.listeners == []
+
+
+def test_shared_session():
+    print("🧪 Testing shared media download session...")
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(check_shared_session(tmp))
+    print("✅ Media downloads share one pooled connection")
+
+
+def test_shared_assets():
+    print("🧪 Testing shared media assets...")
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(check_shared_assets(tmp))
+    print("✅ Shared assets are downloaded once")
+
+
+def test_skip_if_present():
+    print("🧪 Testing skip-if-present media cache...")
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(check_skip_if_present(tmp))
+    print("✅ Present media is not downloaded again")
+
+
+def test_browser_capture():
+    print("🧪 Testing media capture from browser responses...")
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(check_browser_capture(tmp))
+    print("✅ Captured media is saved without downloading")
+
+
+def test_size_limit():
+    print("🧪 Testing media size limit...")
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(check_size_limit(tmp))
+    print("✅ Oversized media is rejected")
+
+
+if __name__ == "__main__":
+    test_shared_session()
+    test_shared_assets()
+    test_skip_if_present()
+    test_browser_capture()
+    test_size_limit()
+    print("\n🎉 All media session tests passed!")
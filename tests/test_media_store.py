@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test script for the content-addressed media blob store and media manifest.
+"""
+import hashlib
+import sys
+import os
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from utils.media_store import MediaBlobStore, MediaManifest
+
+
+def _download(store, content):
+    """Simulate a finished download into the store's staging area."""
+    path = store.staging_path()
+    with open(path, 'wb') as f:
+        f.write(content)
+    return path, hashlib.sha256(content).hexdigest()
+
+
+def test_content_dedup_and_links():
+    """Identical content is stored once; question files are links to it."""
+    print("🧪 Testing content-addressed media store...")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = MediaBlobStore(os.path.join(tmp, 'blobs'))
+        images_dir = os.path.join(tmp, 'images')
+        os.makedirs(images_dir)
+
+        for i, url in enumerate(['http://a/cat.jpg', 'http://b/same-cat.jpg']):
+            path, digest = _download(store, b'cat picture')
+            store.add(path, digest, 'jpg', url)
+            store.link(digest, 'jpg', os.path.join(images_dir, f'Question_{i}.jpg'))
+
+        first, second = (os.path.join(images_dir, f'Question_{i}.jpg') for i in range(2))
+        assert os.path.samefile(first, second)
+        with open(first, 'rb') as f:
+            assert f.read() == b'cat picture'
+        stats = store.get_stats()
+        assert stats['blobs_added'] == 1 and stats['content_hits'] == 1, stats
+        assert not [name for name in os.listdir(store.blob_dir) if name.startswith('incoming_')]
+    print("✅ Content-addressed media store works")
+
+
+def test_url_index_persistence():
+    """Known URLs resolve to their blob after a restart."""
+    print("🧪 Testing media URL index persistence...")
+    with tempfile.TemporaryDirectory() as tmp:
+        blob_dir = os.path.join(tmp, 'blobs')
+        store = MediaBlobStore(blob_dir)
+        path, digest = _download(store, b'audio clip')
+        store.add(path, digest, 'mp3', 'http://a/clip.mp3')
+
+        reopened = MediaBlobStore(blob_dir)
+        assert reopened.lookup_url('http://a/clip.mp3') == (digest, 'mp3')
+        assert reopened.lookup_url('http://a/other.mp3') is None
+
+        os.remove(reopened.blob_path(digest, 'mp3'))
+        assert reopened.lookup_url('http://a/clip.mp3') is None
+    print("✅ Media URL index persistence works")
+
+
+def test_manifest():
+    """The manifest tracks saved files and seeds itself from existing directories."""
+    print("🧪 Testing media manifest...")
+    with tempfile.TemporaryDirectory() as tmp:
+        audio_dir = os.path.join(tmp, 'audio')
+        os.makedirs(audio_dir)
+        with open(os.path.join(audio_dir, 'Question_old.mp3'), 'wb') as f:
+            f.write(b'old clip')
+
+        manifest_file = os.path.join(tmp, 'media_manifest.jsonl')
+        manifest = MediaManifest(manifest_file)
+        assert manifest.bootstrap({'audio': audio_dir}) == 1
+
+        path = os.path.join(audio_dir, 'Question_1.mp3')
+        with open(path, 'wb') as f:
+            f.write(b'new clip')
+        manifest.record('Question_1.mp3', 'http://a/clip.mp3', 'audio', 8, 'abc')
+
+        reopened = MediaManifest(manifest_file)
+        assert reopened.is_present('Question_1.mp3', 'http://a/clip.mp3', path)
+        assert not reopened.is_present('Question_1.mp3', 'http://a/other.mp3', path)
+        assert sorted(entry['filename'] for entry in reopened.iter_entries('audio')) == \
+            ['Question_1.mp3', 'Question_old.mp3']
+
+        os.remove(path)
+        assert not reopened.is_present('Question_1.mp3', 'http://a/clip.mp3', path)
+
+        # Bootstrapped files have no URL: accepted by name and size, then the URL is filled in
+        old_path = os.path.join(audio_dir, 'Question_old.mp3')
+        assert reopened.get('Question_old.mp3')['url'] is None
+        assert reopened.is_present('Question_old.mp3', 'http://a/old.mp3', old_path)
+        assert MediaManifest(manifest_file).get('Question_old.mp3')['url'] == 'http://a/old.mp3'
+        assert not reopened.is_present('Question_old.mp3', 'http://a/changed.mp3', old_path)
+
+        with open(os.path.join(audio_dir, 'Question_empty.mp3'), 'wb'):
+            pass
+        assert manifest.bootstrap({'audio': audio_dir}) == 2
+        assert not manifest.is_present('Question_empty.mp3', 'http://a/empty.mp3',
+                                       os.path.join(audio_dir, 'Question_empty.mp3'))
+    print("✅ Media manifest works")
+
+
+if __name__ == "__main__":
+    test_content_dedup_and_links()
+    test_url_index_persistence()
+    test_manifest()
+    print("\n🎉 All media store tests passed!")
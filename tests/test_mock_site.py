@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test script for the local mock FunTrivia site used by the end-to-end benchmark.
+"""
+import asyncio
+import re
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+from utils.explanation_parser import parse_full_page_text
+from utils.mock_site import MockFunTriviaSite
+
+
+def test_site_navigation():
+    """Category index -> category page -> quiz page -> results page, as the scraper walks it."""
+    print("🧪 Testing mock site navigation...")
+
+    async def walk():
+        async with MockFunTriviaSite(latency_ms=0, jitter_ms=0, page_padding_kb=8, categories=3,
+                                     quizzes_per_category=4, seed=7) as site:
+            async with aiohttp.ClientSession() as session:
+                async def get(path):
+                    async with session.get(site.base_url + path) as response:
+                        return response.status, await response.text()
+
+                status, index = await get('/quizzes/')
+                assert status == 200
+                categories = re.findall(r'href="(/quizzes/[^"]+/)"', index)
+                assert len(categories) == 3
+
+                status, category = await get(categories[0])
+                quiz_links = re.findall(r'href="(/quiz/[^"]+)"', category)
+                assert status == 200 and len(quiz_links) == 4
+
+                status, quiz_page = await get(quiz_links[0])
+                assert status == 200 and len(quiz_page) > 8 * 1024
+                qid = int(re.search(r'name="qid" value="(\d+)"', quiz_page).group(1))
+                quiz = site.quiz(qid)
+                assert quiz['url'] == quiz_links[0]
+                for question in quiz['questions']:
+                    assert f"{question['number']}. {question['question']}" in quiz_page
+                    assert len(re.findall(f'name="q{question["number"]}"', quiz_page)) == len(question['options'])
+
+                first = quiz['questions'][0]
+                async with session.post(site.base_url + '/submitquiz.cfm',
+                                        data={'qid': str(qid), 'q1': first['correct_answer']}) as response:
+                    results_page = await response.text()
+                assert 'class="questionReview"' in results_page
+                assert f"Your Answer: [{first['correct_answer']}]" in results_page
+
+                assert (await get('/quiz/geography/missing-5.html'))[0] == 404
+                stats = site.get_stats()
+                assert stats['requests'] == 5 and stats['errors_injected'] == 0
+                assert stats['by_route']['quiz'] == 2
+
+    asyncio.run(walk())
+    print("✅ Mock site navigation works")
+
+
+def test_deterministic_content():
+    """The same seed gives the same quizzes; question texts never repeat across quizzes."""
+    print("🧪 Testing mock site content...")
+    site = MockFunTriviaSite(seed=3)
+    again = MockFunTriviaSite(seed=3)
+    assert [site.quiz(qid) for qid in site.quiz_ids()][:5] == [again.quiz(qid) for qid in again.quiz_ids()][:5]
+
+    questions = [question for qid in site.quiz_ids() for question in site.quiz(qid)['questions']]
+    assert len({question['question'] for question in questions}) == len(questions)
+    assert all(question['correct_answer'] in question['options'] for question in questions)
+    assert {site.quiz(qid)['quiz_type'] for qid in site.quiz_ids()} == {'Multiple Choice', 'Photo Quiz', 'Audio Quiz'}
+    print("✅ Mock site content is deterministic")
+
+
+def test_results_page_parses():
+    """The scraper's results text parser recovers every answer and explanation."""
+    print("🧪 Testing mock results pages with the results parser...")
+    site = MockFunTriviaSite(page_padding_kb=0)
+    quiz = site.quiz(site.quiz_ids()[0])
+    page_text = BeautifulSoup(site.render_results_page(quiz, {}), 'html.parser').get_text('\n')
+    page_text = re.sub(r'\n\s*\n+', '\n', page_text)
+    questions = [{'questionNumber': question['number'], 'question': question['question'],
+                  'options': list(question['options'])} for question in quiz['questions']]
+
+    for parsed, question in zip(parse_full_page_text(page_text, questions), quiz['questions']):
+        assert parsed['correct_answer'] == question['correct_answer']
+        assert parsed['description'] == question['explanation']
+    print("✅ Mock results pages parse")
+
+
+def test_error_injection():
+    """error_rate=1 answers every page with 503; robots.txt stays reachable."""
+    print("🧪 Testing mock site error injection...")
+
+    async def fetch():
+        async with MockFunTriviaSite(latency_ms=0, jitter_ms=0, error_rate=1.0) as site:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(site.base_url + '/quizzes/') as response:
+                    assert response.status == 503
+                async with session.get(site.base_url + '/robots.txt') as response:
+                    assert response.status == 200
+            assert site.get_stats()['errors_injected'] == 1
+
+    asyncio.run(fetch())
+    try:
+        MockFunTriviaSite(error_rate=1.5)
+        assert False, "error_rate above 1 should be rejected"
+    except ValueError:
+        pass
+    print("✅ Error injection works")
+
+
+if __name__ == "__main__":
+    test_site_navigation()
+    test_deterministic_content()
+    test_results_page_parses()
+    test_error_injection()
+    print("\n🎉 All mock site tests passed!")
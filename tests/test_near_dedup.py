@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test script for MinHash/LSH near-duplicate detection.
+"""
+import asyncio
+import csv
+import sys
+import os
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import pandas as pd
+
+from utils.near_dedup import NearDuplicateIndex, near_duplicate_text, near_duplicate_text_series
+from utils.csv_handler import CSVHandler
+from utils.question_writer import QuestionWriter
+
+ROWS = [
+    {'Key': 'a', 'Question': 'Which planet is known as the Red Planet?', 'CorrectAnswer': 'Mars'},
+    {'Key': 'b', 'Question': 'Which planet is commonly known as the Red Planet?', 'CorrectAnswer': 'Mars'},
+    {'Key': 'c', 'Question': 'Who wrote the play Hamlet?', 'CorrectAnswer': 'William Shakespeare'},
+    {'Key': 'd', 'Question': 'Which planet has the Great Red Spot?', 'CorrectAnswer': 'Jupiter'},
+]
+
+
+def test_screen_and_cluster():
+    """Paraphrases are matched; different questions are not."""
+    print("🧪 Testing near-duplicate screening...")
+    index = NearDuplicateIndex()
+    unique_rows, matches, signatures = index.screen(ROWS)
+    assert [row['Key'] for row in unique_rows] == ['a', 'c', 'd'], unique_rows
+    assert [(match['Key'], match['MatchedKey']) for match in matches] == [('b', 'a')], matches
+    # Screening alone does not index; rows are indexed once they are written
+    assert len(index) == 0
+    index.commit(ROWS, signatures)
+    assert index.clusters() == [['a', 'b']]
+    assert index.query('who wrote the play hamlet | william shakespeare')[0][0] == 'c'
+    print("✅ Near-duplicate screening works")
+
+
+def test_writer_drop_policy():
+    """With the drop policy near duplicates are reported but not written."""
+    print("🧪 Testing near-duplicate drop policy in the writer...")
+
+    async def run(tmp):
+        index = NearDuplicateIndex(policy='drop', report_file=os.path.join(tmp, 'near.csv'))
+        writer = QuestionWriter(CSVHandler(tmp), {'multiple_choice': 'mc.csv'}, near_duplicate_index=index)
+        await writer.put('multiple_choice', ROWS)
+        return await writer.close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = asyncio.run(run(tmp))
+        assert stats['rows_written'] == 3, stats
+        assert stats['near_duplicates'] == 1, stats
+        with open(os.path.join(tmp, 'mc.csv'), newline='', encoding='utf-8') as f:
+            assert [row['Key'] for row in csv.DictReader(f)] == ['a', 'c', 'd']
+        with open(os.path.join(tmp, 'near.csv'), newline='', encoding='utf-8') as f:
+            report = list(csv.DictReader(f))
+        assert report[0]['Key'] == 'b' and report[0]['MatchedKey'] == 'a' and report[0]['Policy'] == 'drop'
+    print("✅ Near-duplicate drop policy works")
+
+
+def test_failed_write_is_not_indexed():
+    """Rows of a failed write are not indexed, so a later write of them is not flagged."""
+    print("🧪 Testing that failed writes leave the near-duplicate index alone...")
+
+    async def run(tmp):
+        index = NearDuplicateIndex(report_file=os.path.join(tmp, 'near.csv'))
+        writer = QuestionWriter(CSVHandler(tmp), {'multiple_choice': 'mc.csv'}, near_duplicate_index=index)
+        await writer.put('multiple_choice', ROWS[:1])
+        return await writer.close(), index
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.mkdir(os.path.join(tmp, 'mc.csv'))  # Unwritable target
+        stats, index = asyncio.run(run(tmp))
+        assert stats['rows_failed'] == 1, stats
+        assert len(index) == 0
+    print("✅ Failed writes are not indexed")
+
+
+
+def test_series_text_matches_rows():
+    """The vectorized texts used for bulk indexing equal the per-row texts."""
+    print("🧪 Testing vectorized near-duplicate texts...")
+    rows = ROWS + [{'Key': 'e', 'Question': None, 'CorrectAnswer': "  It's   42! "}]
+    frame = pd.DataFrame(rows)
+    assert near_duplicate_text_series(frame['Question'], frame['CorrectAnswer']) == \
+        [near_duplicate_text(row) for row in rows]
+    print("✅ Vectorized texts match")
+
+
+if __name__ == "__main__":
+    test_screen_and_cluster()
+    test_writer_drop_policy()
+    test_failed_write_is_not_indexed()
+    test_series_text_matches_rows()
+    print("\n🎉 All near-duplicate tests passed!")
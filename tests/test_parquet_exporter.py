@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Test script for the partitioned Parquet exporter (requires the optional pyarrow package).
+"""
+import sys
+import os
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from utils.parquet_exporter import ParquetExporter
+
+
+def make_rows(start, count):
+    return [{
+        'Key': f'Question_MQ_Parsed_Culture_Normal_{i:04d}',
+        'Domain': 'Science' if i % 2 else 'Culture',
+        'Topic': 'General',
+        'Difficulty': 'Normal',
+        'Question': f'Question {i}?',
+        'CorrectAnswer': 'A'
+    } for i in range(start, start + count)]
+
+
+def test_incremental_partitioned_export():
+    """New keys are appended per run into question_type/Domain partitions."""
+    if not ParquetExporter.is_available():
+        print("⏭️  pyarrow not installed - skipping Parquet export test")
+        return
+
+    import pyarrow.dataset as ds
+
+    print("🧪 Testing Parquet export...")
+    with tempfile.TemporaryDirectory() as tmp:
+        exporter = ParquetExporter(os.path.join(tmp, 'parquet'))
+
+        assert exporter.append('multiple_choice', make_rows(1, 10), run_tag='first') == 10
+        # Second run: 5 already exported, 5 new
+        assert exporter.append('multiple_choice', make_rows(6, 10), run_tag='second') == 5
+
+        partition = os.path.join(tmp, 'parquet', 'question_type=multiple_choice')
+        assert sorted(os.listdir(partition)) == ['Domain=Culture', 'Domain=Science']
+
+        dataset = ds.dataset(os.path.join(tmp, 'parquet'), format='parquet', partitioning='hive')
+        table = dataset.to_table()
+        assert table.num_rows == 15
+        assert str(table.schema.field('Topic').type).startswith('dictionary')
+
+        science = dataset.to_table(filter=ds.field('Domain') == 'Science')
+        assert science.num_rows == 8
+    print("✅ Parquet export works")
+
+
+if __name__ == "__main__":
+    test_incremental_partitioned_export()
+    print("\n🎉 All Parquet exporter tests passed!")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test script for the precompiled pattern registry.
+"""
+import re
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from constants import QUESTION_PATTERNS
+from utils.patterns import (
+    TRUE_FALSE_INDICATOR_RE, FACTUAL_INDICATOR_RE, SOUND_INDICATOR_RE, EDUCATIONAL_LINE_RE,
+    EDUCATIONAL_INDICATORS, BLOCK_ANSWER_RES, CORRECT_ANSWER_RES, question_context_res
+)
+from utils.question_classifier import QuestionClassifier
+from utils.text_processor import TextProcessor
+
+SAMPLES = [
+    'Is it true that cats can see in the dark?',
+    'What year was the Eiffel Tower completed?',
+    'True or false: the sun is a star.',
+    'Listen to this sound clip and name the instrument.',
+    'Which is the largest ocean on Earth?',
+    'Who was the first person to walk on the moon?',
+    'Dogs have four legs.',
+    'Canada is north of the USA.',
+    'It was named after its founder because of history.',
+]
+
+
+def test_merged_patterns_match_originals():
+    """Merged alternations agree with checking each pattern separately."""
+    print("🧪 Testing merged indicator patterns...")
+    for sample in SAMPLES:
+        text = sample.lower()
+        for merged, key in ((TRUE_FALSE_INDICATOR_RE, 'true_false_indicators'),
+                            (FACTUAL_INDICATOR_RE, 'factual_indicators')):
+            expected = any(re.search(pattern, text) for pattern in QUESTION_PATTERNS[key])
+            assert (merged.search(text) is not None) == expected, (key, sample)
+        expected = any(indicator in text for indicator in QUESTION_PATTERNS['sound_indicators'])
+        assert (SOUND_INDICATOR_RE.search(text) is not None) == expected, sample
+        expected = any(indicator in text for indicator in EDUCATIONAL_INDICATORS)
+        assert (EDUCATIONAL_LINE_RE.search(text) is not None) == expected, sample
+    assert question_context_res('3') is question_context_res('3')
+    print("✅ Merged indicator patterns match the originals")
+
+
+def test_users_of_registry():
+    """Classifier and text processor behave as before."""
+    print("🧪 Testing classifier and text processor with precompiled patterns...")
+    classifier = QuestionClassifier()
+    assert classifier.classify('Listen to this clip', ['A', 'B', 'C', 'D']) == 'sound'
+    assert classifier.classify('Is it a mammal?', ['Yes', 'No']) == 'true_false'
+    assert classifier.classify('What year was it?', ['1990', '1991']) == 'multiple_choice'
+    assert TextProcessor.clean_question_text('12. What is the capital?') == 'What is the capital?'
+    assert TextProcessor.normalize_option_text('b) Paris') == 'Paris'
+    assert TextProcessor.extract_numbered_options('a) One\nB. Two\nnot an option') == ['One', 'Two']
+    assert TextProcessor.remove_html_entities('Tom &amp; Jerry&#33;') == 'Tom & Jerry!'
+    assert not TextProcessor.is_valid_question_text('1234567890123')
+    print("✅ Classifier and text processor work with precompiled patterns")
+
+
+def test_answer_patterns_skip_player_answer():
+    """The player's "Your Answer:" line is never taken for the correct answer."""
+    print("🧪 Testing answer patterns...")
+    block = "1. Which planet is red?\nYour Answer: [Venus]\nThe correct answer was Mars.\nIron oxide."
+
+    def first_match(patterns, text):
+        return next((match.group(1).strip() for match in (p.search(text) for p in patterns) if match), None)
+
+    assert first_match(BLOCK_ANSWER_RES, block) == 'Mars'
+    assert first_match(CORRECT_ANSWER_RES, block) == 'Mars'
+    assert first_match(BLOCK_ANSWER_RES, "Your Answer: [Venus]") is None
+    assert first_match(CORRECT_ANSWER_RES, "Your Answer: [Venus]\nAnswer: Mars") == 'Mars'
+    print("✅ Answer patterns skip the player's answer")
+
+
+if __name__ == "__main__":
+    test_merged_patterns_match_originals()
+    test_users_of_registry()
+    test_answer_patterns_skip_player_answer()
+    print("\n🎉 All pattern tests passed!")
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Test script for batch and pandas question classification.
+"""
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import pandas as pd
+
+from utils.question_classifier import QuestionClassifier
+
+QUESTIONS = [
+    ('Is it true that cats purr?', ['True', 'False']),
+    ('Listen to this clip and name the bird.', ['Robin', 'Crow', 'Owl', 'Wren']),
+    ('Can dogs swim?', ['Yes', 'No']),
+    ('Does the sun rise in the east?', [' T ', 'f']),
+    ('What year was the war over?', ['1918', '1919']),
+    ('Which is the largest ocean?', ['Pacific', 'Atlantic', 'Indian', 'Arctic']),
+    ('Are these the same?', ['', 'Same', 'Different']),
+    ('Who painted it?', ['Monet', 'Manet', '  ']),
+]
+
+
+def test_batch_matches_classify():
+    """classify_batch() gives the same types as classify(), in order."""
+    print("🧪 Testing batch classification...")
+    classifier = QuestionClassifier()
+    expected = [classifier.classify(question, options) for question, options in QUESTIONS]
+    assert expected[:3] == ['true_false', 'sound', 'true_false'], expected
+
+    assert classifier.classify_batch(QUESTIONS) == expected
+    as_dicts = [{'question': question, 'options': options} for question, options in QUESTIONS]
+    assert classifier.classify_batch(as_dicts + as_dicts) == expected + expected
+    print("✅ Batch classification works")
+
+
+def test_series_matches_classify():
+    """The pandas path agrees with classify() for option columns and option lists."""
+    print("🧪 Testing pandas classification...")
+    classifier = QuestionClassifier()
+    expected = [classifier.classify(question, options) for question, options in QUESTIONS]
+
+    df = pd.DataFrame({'Question': [question for question, _ in QUESTIONS]}, index=range(10, 10 + len(QUESTIONS)))
+    for i in range(4):
+        df[f'Option{i + 1}'] = [options[i] if i < len(options) else None for _, options in QUESTIONS]
+
+    types = classifier.classify_frame(df)
+    assert types.tolist() == expected, types.tolist()
+    assert list(types.index) == list(df.index)
+
+    lists = pd.Series([options for _, options in QUESTIONS], index=df.index)
+    assert classifier.classify_series(df['Question'], lists).tolist() == expected
+    print("✅ Pandas classification works")
+
+
+if __name__ == "__main__":
+    test_batch_matches_classify()
+    test_series_matches_classify()
+    print("\n🎉 All question classifier tests passed!")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test script for the background QuestionWriter (batching, flush and backpressure).
+"""
+import asyncio
+import sys
+import os
+import time
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from utils.question_writer import QuestionWriter
+
+
+class SlowCSVHandler:
+    """Stand-in for CSVHandler that records batches and simulates slow disk writes."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.batches = []
+
+    def append_to_csv(self, questions, filename, question_type):
+        time.sleep(self.delay)
+        self.batches.append((filename, question_type, len(questions)))
+        return len(questions)
+
+
+CSV_FILES = {'multiple_choice': 'mc.csv', 'true_false': 'tf.csv', 'sound': 'sound.csv'}
+
+
+async def check_batching_and_flush():
+    """Rows are grouped per type and written in batch_size chunks; flush writes the rest."""
+    print("🧪 Testing writer batching...")
+    handler = SlowCSVHandler()
+    writer = QuestionWriter(handler, CSV_FILES, batch_size=10, flush_interval=60)
+    await writer.start()
+
+    for i in range(25):
+        await writer.put('multiple_choice', [{'Key': f'mc_{i}'}])
+    await writer.put('true_false', [{'Key': 'tf_0'}])
+
+    stats = await writer.flush()
+    assert stats['rows_written'] == 26, stats
+    assert ('mc.csv', 'multiple_choice', 10) in handler.batches
+    assert ('tf.csv', 'true_false', 1) in handler.batches
+    assert sum(count for _, qtype, count in handler.batches if qtype == 'multiple_choice') == 25
+
+    await writer.close()
+    print("✅ Batching works")
+
+
+async def check_backpressure():
+    """A full queue makes put() wait for the writer instead of buffering without bound."""
+    print("🧪 Testing writer backpressure...")
+    handler = SlowCSVHandler(delay=0.05)
+    writer = QuestionWriter(handler, CSV_FILES, queue_size=1, batch_size=1, flush_interval=60)
+    await writer.start()
+
+    for i in range(5):
+        await writer.put('sound', [{'Key': f'sound_{i}'}])
+
+    stats = await writer.close()
+    assert stats['rows_written'] == 5, stats
+    assert stats['backpressure_waits'] > 0, stats
+    assert stats['max_write_seconds'] >= 0.05, stats
+    print("✅ Backpressure works")
+
+
+async def check_failed_write_does_not_stop_writer():
+    """A failing batch is counted and later batches are still written."""
+    print("🧪 Testing writer error handling...")
+
+    class FlakyHandler(SlowCSVHandler):
+        def append_to_csv(self, questions, filename, question_type):
+            if question_type == 'true_false':
+                raise IOError("disk full")
+            return super().append_to_csv(questions, filename, question_type)
+
+    writer = QuestionWriter(FlakyHandler(), CSV_FILES, batch_size=1, flush_interval=60)
+    await writer.put('true_false', [{'Key': 'tf_0'}])
+    await writer.put('multiple_choice', [{'Key': 'mc_0'}])
+
+    stats = await writer.close()
+    assert stats['rows_failed'] == 1 and stats['batches_failed'] == 1, stats
+    assert stats['rows_written'] == 1, stats
+    print("✅ Error handling works")
+
+
+def test_batching_and_flush():
+    asyncio.run(check_batching_and_flush())
+
+
+def test_backpressure():
+    asyncio.run(check_backpressure())
+
+
+def test_failed_write_does_not_stop_writer():
+    asyncio.run(check_failed_write_does_not_stop_writer())
+
+
+if __name__ == "__main__":
+    test_batching_and_flush()
+    test_backpressure()
+    test_failed_write_does_not_stop_writer()
+    print("\n🎉 All question writer tests passed!")
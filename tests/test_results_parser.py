@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Test script for the single-pass results page tokenizer.
+"""
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from utils.results_parser import tokenize_results
+
+PAGE = """Quiz Results
+Your Score: 2 of 3
+
+1. Which planet is known as the Red Planet?
+Your Answer: [Venus]
+The correct answer was Mars.
+Mars looks red because of iron oxide. It was first observed by telescope in 1610. Galileo saw it.
+45% of players have answered correctly.
+2. Who wrote Hamlet?
+Your Answer: [William Shakespeare]
+The correct answer was William Shakespeare.
+Hamlet was written around 1600 and is one of his longest plays.
+80% of players have answered correctly.
+3. Which is the largest ocean?
+Your Answer: [No Answer]
+Correct answer: Pacific
+The Pacific covers about a third of the Earth's surface.
+Next Quiz
+More Quizzes
+1. Space Trivia Quiz Average
+2. Famous Playwrights Hard
+"""
+
+
+def test_tokenize_results():
+    """Per-question records come from one pass over the page."""
+    print("🧪 Testing results page tokenizer...")
+    records = tokenize_results(PAGE)
+    assert sorted(records) == ['1', '2', '3'], records.keys()
+
+    first = records['1']
+    assert first['question'] == 'Which planet is known as the Red Planet?'
+    assert first['your_answer'] == 'Venus'
+    assert first['answers'][0] == 'Mars'
+    assert first['explanation_lines'] == [
+        'Mars looks red because of iron oxide. It was first observed by telescope in 1610. Galileo saw it.'
+    ]
+
+    # Quiz lists below the results do not replace the question sections
+    assert records['2']['answers'][0] == 'William Shakespeare'
+    assert 'Playwrights' not in records['2']['text']
+
+    # Navigation ends the last section
+    assert records['3']['answers'][0] == 'Pacific'
+    assert 'More Quizzes' not in records['3']['text']
+    assert records['3']['your_answer'] == 'No Answer'
+    print("✅ Results page tokenizer works")
+
+
+if __name__ == "__main__":
+    test_tokenize_results()
+    print("\n🎉 All results parser tests passed!")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test script for the indexed ScraperConfig mapping lookups.
+"""
+import json
+import sys
+import os
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from scraper.config import ScraperConfig
+
+MAPPINGS = {
+    'difficulty_mapping': {'Easy': ['easy', 'Beginner'], 'Hard': ['difficult', 'tough']},
+    'domain_mapping': {'Nature': ['animals', 'nature'], 'Science': ['science', 'Nature']},
+    'topic_mapping': {'Animals': ['animals', 'pets'], 'General': ['general']}
+}
+
+
+def write_mappings(directory, mappings):
+    path = os.path.join(directory, 'mappings.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(mappings, f)
+    return path
+
+
+def test_indexed_lookups():
+    """Lookups are case-insensitive, first category wins and misses fall back."""
+    print("🧪 Testing indexed mapping lookups...")
+    with tempfile.TemporaryDirectory() as tmp:
+        config = ScraperConfig(write_mappings(tmp, MAPPINGS))
+        assert config.map_difficulty('BEGINNER') == 'Easy'
+        assert config.map_domain('NATURE') == 'Nature'
+        assert config.map_topic('Pets') == 'Animals'
+        assert config.map_topic('Comics') == 'Comics'
+        assert config.map_topic('Comics') == 'Comics'
+        assert config.get_unmapped_values()['topic'] == {'Comics'}
+    print("✅ Indexed mapping lookups work")
+
+
+def test_map_many_and_reload():
+    """Batches map each value once; reload swaps in the new mappings."""
+    print("🧪 Testing batch mapping and reload...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_mappings(tmp, MAPPINGS)
+        config = ScraperConfig(path)
+        assert config.map_many('topic', ['pets', 'Comics', 'pets', None]) == ['Animals', 'Comics', 'Animals', None]
+
+        updated = json.loads(json.dumps(MAPPINGS))
+        updated['topic_mapping']['Culture'] = ['comics']
+        write_mappings(tmp, updated)
+        config.reload_mappings()
+        assert config.map_topic('Comics') == 'Culture'
+        assert config.get_unmapped_values()['topic'] == set()
+
+        try:
+            config.map_many('colour', ['red'])
+            assert False, "unknown kind should raise"
+        except ValueError:
+            pass
+    print("✅ Batch mapping and reload work")
+
+
+def test_fuzzy_fallback():
+    """Exact misses resolve to the closest synonym only when fuzzy matching is enabled."""
+    print("🧪 Testing fuzzy fallback...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_mappings(tmp, MAPPINGS)
+        assert ScraperConfig(path).map_topic('Animal') == 'Animal'
+
+        config = ScraperConfig(path, fuzzy_threshold=0.75)
+        assert config.map_topic('Animal') == 'Animals'
+        assert config.map_topic('Comics') == 'Comics'
+        assert config.get_fuzzy_matches()['topic']['Animal'].synonym == 'animals'
+        assert config.get_unmapped_values()['topic'] == {'Comics'}
+        assert not config.is_mapped('topic', 'Animal')
+        assert config.suggest('topic', 'Animal').value == 'Animals'
+    print("✅ Fuzzy fallback works")
+
+
+if __name__ == "__main__":
+    test_indexed_lookups()
+    test_map_many_and_reload()
+    test_fuzzy_fallback()
+    print("\n🎉 All scraper config tests passed!")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test script for the SQLite question store (upserts, dedup and CSV export).
+"""
+import csv
+import sys
+import os
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from utils.dedup import row_signature
+from utils.storage import QuestionStore, content_signature
+from constants import CSV_COLUMNS
+
+
+def make_row(number, **overrides):
+    row = {
+        'Key': f'Question_MQ_Parsed_General_Normal_{number:04d}',
+        'Domain': 'Culture',
+        'Topic': 'General',
+        'Difficulty': 'Normal',
+        'Question': f'Which answer is number {number}?',
+        'Option1': 'One', 'Option2': 'Two', 'Option3': 'Three', 'Option4': 'Four',
+        'CorrectAnswer': 'One',
+        'Description': '',
+        'ImagePath': '',
+        'SourceURL': 'https://www.funtrivia.com/quiz/general/example-1.html'
+    }
+    row.update(overrides)
+    return row
+
+
+def test_upserts_and_runs():
+    """New keys are counted once and re-saved keys only fill in missing fields."""
+    print("🧪 Testing question store upserts...")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = QuestionStore(os.path.join(tmp, 'questions.db'))
+        run_id = store.start_run('fast')
+
+        assert store.upsert_questions([make_row(1), make_row(2), make_row(1)], 'multiple_choice', run_id) == 2
+        assert store.upsert_questions([make_row(2, Description='Two is correct.')], 'multiple_choice', run_id) == 0
+        assert store.count_questions('multiple_choice') == 2
+        assert store.has_key(make_row(1)['Key'])
+        assert store.has_signature(content_signature(make_row(1)))
+
+        # Empty values never wipe stored ones
+        store.upsert_questions([make_row(2, Description='')], 'multiple_choice', run_id)
+        rows = {row['Key']: row for row in store.iter_rows('multiple_choice')}
+        assert rows[make_row(2)['Key']]['Description'] == 'Two is correct.'
+
+        store.finish_run(run_id)
+        store.close()
+    print("✅ Upserts work")
+
+
+def test_streaming_export():
+    """Export produces CSV files with the constants.CSV_COLUMNS layout."""
+    print("🧪 Testing CSV export...")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = QuestionStore(os.path.join(tmp, 'questions.db'))
+        first_run = store.start_run()
+        store.upsert_questions([make_row(i) for i in range(1, 6)], 'multiple_choice', first_run)
+        second_run = store.start_run()
+        store.upsert_questions([make_row(i) for i in range(6, 8)], 'multiple_choice', second_run)
+        store.upsert_questions([{'Key': 'Question_TF_Parsed_General_Normal_0001', 'Question': 'True?',
+                                 'Option1': 'True', 'Option2': 'False', 'CorrectAnswer': 'True'}],
+                               'true_false', second_run)
+
+        counts = store.export_all(tmp, {'multiple_choice': 'mc.csv', 'true_false': 'tf.csv'})
+        assert counts == {'multiple_choice': 7, 'true_false': 1}, counts
+
+        with open(os.path.join(tmp, 'tf.csv'), newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == CSV_COLUMNS['true_false']
+        assert rows[1][0] == 'Question_TF_Parsed_General_Normal_0001'
+
+        # Exporting a single run only includes that run's questions
+        assert store.export_csv('multiple_choice', os.path.join(tmp, 'mc_run.csv'), run_id=second_run) == 2
+        store.close()
+    print("✅ CSV export works")
+
+
+def test_content_signature():
+    """Signatures cover the question and correct answer only, ignoring case and punctuation."""
+    a = make_row(1, Question='What is the capital of France?', CorrectAnswer='Paris')
+    b = make_row(2, Question='what is the capital of france', CorrectAnswer='paris.',
+                 Option1='Lyon', Option4='Nice', Description='Other wording')
+    c = make_row(3, Question='What is the capital of Spain?', CorrectAnswer='Paris')
+    d = make_row(4, Question='What is the capital of France?', CorrectAnswer='Lyon')
+    assert content_signature(a) == content_signature(b) == row_signature(a)
+    assert content_signature(a) != content_signature(c)
+    assert content_signature(a) != content_signature(d)
+    print("✅ Content signatures work")
+
+
+if __name__ == "__main__":
+    test_upserts_and_runs()
+    test_streaming_export()
+    test_content_signature()
+    print("\n🎉 All question store tests passed!")
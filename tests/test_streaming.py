@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Test script for the streaming question pipeline (FunTriviaScraper.iter_questions).
+
+Category discovery, quiz links and quiz scraping are stubbed, so no browser
+or network is needed.
+"""
+import asyncio
+import contextlib
+import sys
+import os
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(os.path.join(ROOT, 'src'))
+
+from scraper.funtrivia import FunTriviaScraper
+
+
+def make_scraper(quizzes, concurrency=1, queue_size=100):
+    """
+    Scraper whose categories, quiz links and quizzes come from a dict.
+
+    quizzes maps category -> {quiz_link: questions or a coroutine function
+    producing them}, or to an exception raised when its quiz links are read.
+    """
+    scraper = FunTriviaScraper(os.path.join(ROOT, 'config', 'settings.json'))
+    scraper.browser = object()
+    scraper.config['scraper']['concurrency'] = concurrency
+    scraper.stream_queue_size = queue_size
+    scraper.rate_limiter = contextlib.nullcontext()
+    links = {link: category for category, category_quizzes in quizzes.items()
+             if not isinstance(category_quizzes, Exception) for link in category_quizzes}
+
+    async def get_categories():
+        return list(quizzes)
+
+    async def get_quiz_links(category):
+        if isinstance(quizzes[category], Exception):
+            raise quizzes[category]
+        return list(quizzes[category])
+
+    async def scrape_quiz(quiz_url, stats=None):
+        result = quizzes[links[quiz_url]][quiz_url]
+        return await result() if callable(result) else list(result)
+
+    async def no_delay():
+        pass
+
+    scraper._get_categories = get_categories
+    scraper._get_quiz_links = get_quiz_links
+    scraper._scrape_quiz = scrape_quiz
+    scraper._random_delay = no_delay
+    return scraper
+
+
+def questions(prefix, count):
+    return [{'question': f'{prefix}-{i}'} for i in range(1, count + 1)]
+
+
+QUIZZES = {
+    'history': {'h1': questions('h1', 2), 'h2': questions('h2', 3)},
+    'science': {'s1': questions('s1', 2)},
+}
+
+
+async def drain(scraper, max_questions=None):
+    return [question async for question in scraper.iter_questions(max_questions=max_questions)]
+
+
+def test_stream_order_and_wrapper():
+    """scrape_questions() returns what iter_questions() yields, in quiz order."""
+    print("🧪 Testing streamed question order...")
+    streamed = asyncio.run(drain(make_scraper(QUIZZES)))
+    assert [q['question'] for q in streamed] == \
+        ['h1-1', 'h1-2', 'h2-1', 'h2-2', 'h2-3', 's1-1', 's1-2']
+    assert asyncio.run(make_scraper(QUIZZES).scrape_questions()) == streamed
+    print("✅ Stream order works")
+
+
+def test_max_questions():
+    """The stream stops at max_questions, also mid-quiz and with concurrent categories."""
+    print("🧪 Testing max_questions early stop...")
+    limited = asyncio.run(drain(make_scraper(QUIZZES), max_questions=3))
+    assert [q['question'] for q in limited] == ['h1-1', 'h1-2', 'h2-1']
+    assert len(asyncio.run(drain(make_scraper(QUIZZES, concurrency=2, queue_size=1), max_questions=4))) == 4
+    print("✅ max_questions stops the stream")
+
+
+def test_consumer_break_cancels_workers():
+    """Breaking out of the stream cancels category workers still scraping."""
+    print("🧪 Testing worker cancellation...")
+    started = asyncio.Event()
+    cancelled = []
+
+    async def never_finishes():
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    quizzes = {'history': {'h1': questions('h1', 2)}, 'science': {'s1': never_finishes}}
+
+    async def consume():
+        stream = make_scraper(quizzes, concurrency=2).iter_questions()
+        async for question in stream:
+            await started.wait()
+            break
+        await stream.aclose()
+        return question
+
+    assert asyncio.run(asyncio.wait_for(consume(), timeout=5))['question'] == 'h1-1'
+    assert cancelled == [True]
+    print("✅ Category workers are cancelled")
+
+
+def test_failures_end_the_stream():
+    """Failing categories, quizzes or worker setup end the stream instead of hanging it."""
+    print("🧪 Testing stream end on failures...")
+
+    async def broken_quiz():
+        raise RuntimeError("quiz page changed")
+
+    quizzes = {
+        'history': RuntimeError("category page changed"),
+        'science': {'s1': broken_quiz, 's2': questions('s2', 1)},
+    }
+    streamed = asyncio.run(asyncio.wait_for(drain(make_scraper(quizzes, concurrency=2)), timeout=5))
+    assert [q['question'] for q in streamed] == ['s2-1']
+
+    # The workers cannot even start: the sentinel still reaches the consumer
+    streamed = asyncio.run(asyncio.wait_for(drain(make_scraper(QUIZZES, concurrency=None)), timeout=5))
+    assert streamed == []
+    print("✅ Failures end the stream")
+
+
+if __name__ == "__main__":
+    test_stream_order_and_wrapper()
+    test_max_questions()
+    test_consumer_break_cancels_workers()
+    test_failures_end_the_stream()
+    print("\n🎉 All streaming tests passed!")